@@ -13,11 +13,14 @@ import os
 import sys
 import json
 import time
+import asyncio
+import threading
 import pytz
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append('/home/ubuntu/spac-research')
 
@@ -39,6 +42,65 @@ AI_CLIENT = OpenAI(
 )
 
 
+# Threads running filing agents concurrently (shared by all filings)
+FILING_AGENT_WORKERS = int(os.getenv('FILING_AGENT_WORKERS', '8'))
+
+# Filing agents that must see another agent's writes for the same filing
+# (same SPAC columns) - run after it instead of concurrently
+FILING_AGENT_RUN_AFTER = {
+    'PipeExtractor': ['DealDetector'],           # Refines pipe_* set from the deal press release
+    'RedemptionExtractor': ['ExtensionMonitor'],  # Both update shares / trust after extension votes
+    'CompletionMonitor': ['DelistingDetector'],  # Both set deal_status on Form 25
+}
+
+_thread_loops = threading.local()
+
+
+def run_async(coro):
+    """
+    Run an async agent coroutine from a worker thread
+
+    Each thread keeps one event loop for its lifetime instead of creating and
+    tearing one down per dispatch (asyncio.run), so loop-bound resources such
+    as the async SEC fetcher's HTTP client are reused across filings.
+    """
+    loop = getattr(_thread_loops, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+
+    if loop.is_running():
+        # Called from inside a coroutine on this thread - run on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as helper:
+            return helper.submit(asyncio.run, coro).result()
+    return loop.run_until_complete(coro)
+
+
+def filing_agent_waves(agents: List[str]) -> List[List[str]]:
+    """
+    Group filing agents into waves that can run concurrently
+
+    Agents in the same wave are independent; an agent listed in
+    FILING_AGENT_RUN_AFTER runs in a later wave than the agents it depends on
+    (when they are part of the same filing).
+    """
+    wave_of = {}
+
+    def wave(agent: str) -> int:
+        if agent not in wave_of:
+            depends = [dep for dep in FILING_AGENT_RUN_AFTER.get(agent, []) if dep in agents]
+            wave_of[agent] = 1 + max((wave(dep) for dep in depends), default=-1)
+        return wave_of[agent]
+
+    for agent in agents:
+        wave(agent)
+
+    waves = [[] for _ in range(max(wave_of.values(), default=-1) + 1)]
+    for agent in agents:
+        waves[wave_of[agent]].append(agent)
+    return waves
+
+
 class TaskPriority(Enum):
     CRITICAL = 1  # Votes in <7 days, new deals detected
     HIGH = 2      # Deadline approaching, price anomalies
@@ -82,54 +144,82 @@ class AgentTask:
 
 
 class StateManager:
-    """Manages agent execution state and history"""
+    """
+    Manages agent execution state and history
+
+    Backed by utils/agent_state_store.py (SQLite WAL):
+    - state: small key/value state (last_run timestamps, counters) kept in
+      memory; save_state() upserts only the keys that changed
+    - task history / decisions: append-only with retention windows
+    - agent_stats: runs, successes, failures, avg/p95 duration per agent,
+      maintained incrementally
+    """
 
     def __init__(self, state_file: str = "/home/ubuntu/spac-research/agent_state.json"):
-        self.state_file = state_file
+        from utils.agent_state_store import AgentStateStore
+
+        self.state_file = state_file  # Legacy JSON state (imported once)
+        db_path = os.getenv('AGENT_STATE_DB', os.path.splitext(state_file)[0] + '.db')
+        self.store = AgentStateStore(db_path)
         self.state = self.load_state()
+        self._saved = self._flatten(self.state)
+        self._lock = threading.RLock()  # Filing agents record tasks from worker threads
+
+    @staticmethod
+    def _flatten(state: Dict) -> Dict:
+        """One store key per last_run entry, so a timestamp update writes one row"""
+        items = {}
+        for key, value in state.items():
+            if key == 'last_run':
+                for run_key, timestamp in value.items():
+                    items[f"last_run:{run_key}"] = timestamp
+            elif key not in ('task_history', 'decisions', 'agent_stats'):
+                items[key] = value
+        return json.loads(json.dumps(items, default=str))
 
     def load_state(self) -> Dict:
-        """Load state from disk"""
-        if os.path.exists(self.state_file):
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
-        return {
-            'last_run': {},
-            'task_history': [],
-            'agent_stats': {},
-            'decisions': []
-        }
+        """Load key/value state (imports legacy JSON state file on first run)"""
+        if self.store.is_empty() and os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r') as f:
+                    legacy = json.load(f)
+                self.store.set_values(self._flatten(legacy))
+                counts = self.store.import_legacy_json(legacy)
+                os.replace(self.state_file, self.state_file + '.migrated')
+                print(f"[STATE] Imported legacy state: {len(legacy.get('last_run', {}))} last runs, "
+                      f"{counts['tasks']} tasks, {counts['decisions']} decisions")
+            except Exception as e:
+                print(f"[STATE] ⚠️  Could not import legacy state file: {e}")
+
+        state = {'last_run': {}}
+        for key, value in self.store.get_values().items():
+            if key.startswith('last_run:'):
+                state['last_run'][key[len('last_run:'):]] = value
+            else:
+                state[key] = value
+        return state
 
     def save_state(self):
-        """Save state to disk"""
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2, default=str)
+        """Persist key/value state (only keys changed since the last save)"""
+        with self._lock:
+            current = self._flatten(self.state)
+            changed = {key: value for key, value in current.items() if self._saved.get(key) != value}
+            removed = [key for key in self._saved if key not in current]
+            self.store.set_values(changed)
+            if removed:
+                self.store.delete_values(removed)
+            self._saved = current
+
+    @property
+    def agent_stats(self) -> Dict[str, Dict]:
+        """Per-agent aggregates (total_runs, successes, failures, avg_duration, p95_duration)"""
+        return self.store.agent_stats()
 
     def record_task(self, task: AgentTask):
-        """Record task execution"""
-        self.state['task_history'].append(task.to_dict())
-
-        # Update agent stats (defensive: ensure key exists)
-        if 'agent_stats' not in self.state:
-            self.state['agent_stats'] = {}
-
-        if task.agent_name not in self.state['agent_stats']:
-            self.state['agent_stats'][task.agent_name] = {
-                'total_runs': 0,
-                'successes': 0,
-                'failures': 0,
-                'avg_duration': 0
-            }
-
-        stats = self.state['agent_stats'][task.agent_name]
-        stats['total_runs'] += 1
-
-        if task.status == TaskStatus.COMPLETED:
-            stats['successes'] += 1
-        elif task.status == TaskStatus.FAILED:
-            stats['failures'] += 1
-
-        self.save_state()
+        """Record task execution (one append + incremental agent stats update)"""
+        data = task.to_dict()
+        data['status'] = getattr(task.status, 'value', task.status)
+        self.store.append_task(data)
 
     def get_last_run(self, agent_name: str, task_type: str) -> Optional[datetime]:
         """Get timestamp of last successful run for agent/task"""
@@ -142,14 +232,14 @@ class StateManager:
     def set_last_run(self, agent_name: str, task_type: str, timestamp: datetime):
         """Update last run timestamp"""
         key = f"{agent_name}:{task_type}"
-        self.state['last_run'][key] = timestamp.isoformat()
-        self.save_state()
+        with self._lock:
+            self.state['last_run'][key] = timestamp.isoformat()
+            self.save_state()
 
     def record_decision(self, decision: Dict):
         """Record orchestrator decision"""
         decision['timestamp'] = datetime.now().isoformat()
-        self.state['decisions'].append(decision)
-        self.save_state()
+        self.store.append_decision(decision)
 
 
 class BaseAgent:
@@ -196,7 +286,6 @@ class FilingProcessorWrapper(BaseAgent):
         self._start_task(task)
 
         try:
-            import asyncio
             from agents.filing_processor import FilingProcessor
 
             filing = task.parameters['filing']
@@ -215,7 +304,7 @@ class FilingProcessorWrapper(BaseAgent):
 
             # Process filing with unified processor
             processor = FilingProcessor()
-            result = asyncio.run(processor.process(filing))
+            result = run_async(processor.process(filing))
 
             db.close()
 
@@ -449,6 +538,19 @@ class Orchestrator:
         self.task_queue: List[AgentTask] = []
         self.db = SessionLocal()
 
+        # Worker threads for filing agents (created on first multi-agent filing)
+        self._agent_pool: Optional[ThreadPoolExecutor] = None
+        self._agent_pool_lock = threading.Lock()
+
+    def _get_agent_pool(self) -> ThreadPoolExecutor:
+        """Shared thread pool running independent filing agents concurrently"""
+        with self._agent_pool_lock:
+            if self._agent_pool is None:
+                self._agent_pool = ThreadPoolExecutor(
+                    max_workers=FILING_AGENT_WORKERS, thread_name_prefix='filing-agent'
+                )
+            return self._agent_pool
+
     def _ensure_cik(self, ticker: str, spac: Optional[SPAC] = None) -> Optional[str]:
         """
         Auto-fetch and save missing CIK for a SPAC
@@ -644,45 +746,31 @@ class Orchestrator:
             return None
 
         try:
-            import requests
-            from utils.sec_filing_fetcher import SECFilingFetcher
+            from utils.sec_async_fetcher import fetch_filing_bundle, KEY_EXHIBIT_NUMBERS
 
-            # Use SECFilingFetcher for consistent handling
-            fetcher = SECFilingFetcher()
+            # Index page fetched once; main document and key exhibits
+            # downloaded concurrently (shared SEC rate limit + document cache)
+            bundle = fetch_filing_bundle(url, exhibit_numbers=KEY_EXHIBIT_NUMBERS)
 
-            # Extract document URL from index page
-            doc_url = fetcher.extract_document_url(url)
-            if not doc_url:
+            if not bundle['document_url']:
                 print(f"      ⚠️  Could not extract document URL from {url}")
                 return None
 
-            # Fetch main document content
-            content = fetcher.fetch_document(doc_url)
+            content = bundle['document']
             if not content:
                 return None
 
-            # Extract exhibits from filing index
-            exhibits = fetcher.extract_exhibits(url)
-
-            # Key exhibits to fetch (these typically contain detailed information)
-            key_exhibit_numbers = ['99.1', '10.1', '2.1', '99.2', '10.2']
+            if bundle['exhibits']:
+                print(f"      📎 Fetched {len(bundle['exhibits'])} key exhibit(s)")
 
-            if exhibits:
-                print(f"      📎 Found {len(exhibits)} exhibits")
-
-                # Fetch key exhibits and append to content
-                for exhibit in exhibits:
-                    if exhibit['exhibit_number'] in key_exhibit_numbers:
-                        print(f"         → Fetching Exhibit {exhibit['exhibit_number']}: {exhibit['description'][:60]}...")
-                        exhibit_content = fetcher.fetch_document(exhibit['url'])
-
-                        if exhibit_content:
-                            # Append exhibit to combined content with clear delimiter
-                            content += f"\n\n{'='*80}\n"
-                            content += f"EXHIBIT {exhibit['exhibit_number']}: {exhibit['description']}\n"
-                            content += f"{'='*80}\n\n"
-                            content += exhibit_content
-                            print(f"         ✓ Exhibit {exhibit['exhibit_number']} fetched ({len(exhibit_content):,} chars)")
+                # Append exhibits to combined content with clear delimiter
+                for exhibit in bundle['exhibits']:
+                    exhibit_content = exhibit['content']
+                    content += f"\n\n{'='*80}\n"
+                    content += f"EXHIBIT {exhibit['exhibit_number']}: {exhibit['description']}\n"
+                    content += f"{'='*80}\n\n"
+                    content += exhibit_content
+                    print(f"         ✓ Exhibit {exhibit['exhibit_number']} fetched ({len(exhibit_content):,} chars)")
 
             return content
 
@@ -736,164 +824,12 @@ class Orchestrator:
         except Exception as e:
             print(f"   ❌ Extraction retry failed: {e}")
 
-    def _analyze_filing_relevance(self, content: str, agents_needed: List[str], classification: Dict, filing: Dict) -> Dict[str, bool]:
-        """
-        Use AI to analyze if filing contains pertinent information for each agent
-
-        OPTIMIZATION: Prevents agents from processing irrelevant filings
-        - Creates intelligent summary of filing
-        - Determines which agents actually need to process it
-        - Returns relevance map: {agent_name: bool}
-
-        Example:
-        - 8-K Item 5.03 (extension) → ExtensionMonitor: True, DealDetector: False
-        - 8-K Item 1.01 (deal) → DealDetector: True, ExtensionMonitor: False
-        """
-        if not content or not agents_needed:
-            # Default: all agents relevant (safe fallback)
-            return {agent: True for agent in agents_needed}
-
-        try:
-            # Smart content sampling: Get beginning + exhibits if present
-            # Strategy: First 5000 chars (main filing summary) + exhibit sections
-            content_sample = ""
-
-            # Check if content contains exhibits (appended by _fetch_filing_content)
-            if "EXHIBIT " in content:
-                # Split into main filing and exhibits
-                parts = content.split("="*80)
-                main_filing = parts[0][:5000] if len(parts[0]) > 5000 else parts[0]
-                content_sample = main_filing
-
-                # Add exhibit sections (these often have the key details)
-                for part in parts[1:]:
-                    if "EXHIBIT " in part:
-                        # Add first 2000 chars of each exhibit
-                        exhibit_sample = part[:2000] if len(part) > 2000 else part
-                        content_sample += "\n" + "="*80 + "\n" + exhibit_sample
-
-                # Limit total sample size
-                if len(content_sample) > 15000:
-                    content_sample = content_sample[:15000]
-            else:
-                # No exhibits, just use first 8000 chars
-                content_sample = content[:8000] if len(content) > 8000 else content
-
-            # Build agent descriptions for AI
-            agent_descriptions = {
-                'DealDetector': 'Detects deal announcements - looks for business combination agreements, merger terms, target companies, deal values',
-                'PipeExtractor': 'Extracts PIPE financing data from deal announcements - institutional investment amounts, prices, lock-up terms',
-                'TrustAccountProcessor': 'Extracts trust account financial data - balance sheets, trust cash, shares outstanding from 10-Q/10-K',
-                'ExtensionMonitor': 'Detects deadline extensions - charter amendments, new termination dates, sponsor deposits',
-                'RedemptionExtractor': 'Extracts redemption data from all filings - 8-K votes, DEFM14A proxies, 10-Q notes, extensions',
-                'S4Processor': 'Analyzes S-4 merger registrations - detailed deal structure, pro forma financials',
-                'ProxyProcessor': 'Processes proxy materials - shareholder vote dates, deal terms, management recommendations',
-                'DelistingDetector': 'Detects delisting events - Form 25 filings indicating liquidation or completion',
-                'CompletionMonitor': 'Detects deal closings - completion of acquisition, final share counts',
-                'FilingProcessor': 'Processes proxy statements and tender offers - vote details, deal terms',
-                'IPODetector': 'Detects IPO closings (424B4) for pre-IPO SPACs - graduates SPACs to main pipeline when IPO completes',
-                'EffectivenessMonitor': 'Tracks S-4 effectiveness - when merger registration becomes effective',
-                'ComplianceMonitor': 'Monitors compliance issues - late filing notices, accounting changes'
-            }
-
-            agents_list = '\n'.join([f"- {agent}: {agent_descriptions.get(agent, 'Specialized filing processor')}"
-                                      for agent in agents_needed])
-
-            prompt = f"""Analyze this SEC filing to determine which agents need to process it.
-
-Filing Type: {filing.get('type', 'Unknown')}
-Filing Summary: {filing.get('summary', 'N/A')}
-Classification Priority: {classification.get('priority', 'MEDIUM')}
-Classification Reason: {classification.get('reason', 'N/A')}
-
-IMPORTANT: This content includes the main filing summary AND key exhibits (99.1, 10.1, 2.1).
-8-K exhibits often contain the most detailed information:
-- Exhibit 99.1: Press releases (deal announcements, redemption results)
-- Exhibit 10.1: Material agreements (business combination terms)
-- Exhibit 2.1: Merger agreements (detailed deal structure)
-
-Filing Content (main filing + exhibits):
-{content_sample}
-
-Agents to evaluate:
-{agents_list}
-
-For EACH agent listed above, determine if this filing (including exhibits) contains pertinent information that the agent should process.
-
-Respond with ONLY valid JSON in this exact format:
-{{
-    "summary": "Brief 1-2 sentence summary of filing content",
-    "relevance": {{
-        "AgentName1": true,
-        "AgentName2": false,
-        ...
-    }},
-    "reasoning": {{
-        "AgentName1": "Why this agent should/shouldn't process",
-        "AgentName2": "Why this agent should/shouldn't process",
-        ...
-    }}
-}}
-
-Be conservative - if unsure, mark as true (let agent process). Only mark false if clearly irrelevant."""
-
-            response = AI_CLIENT.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {"role": "system", "content": "You are a SEC filing analysis expert. Analyze filings and determine agent relevance. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=1000
-            )
-
-            response_text = response.choices[0].message.content.strip()
-
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                # Remove ```json and ``` markers
-                lines = response_text.split('\n')
-                if lines[0].startswith('```'):
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == '```':
-                    lines = lines[:-1]
-                response_text = '\n'.join(lines).strip()
-
-            # Parse JSON response
-            try:
-                analysis = json.loads(response_text)
-                relevance_map = analysis.get('relevance', {})
-
-                print(f"   🤖 AI Filing Analysis:")
-                print(f"      Summary: {analysis.get('summary', 'N/A')}")
-                print(f"      Relevant agents: {[k for k, v in relevance_map.items() if v]}")
-
-                # Show reasoning for agents marked as irrelevant (interesting insight)
-                for agent, relevant in relevance_map.items():
-                    if not relevant:
-                        reason = analysis.get('reasoning', {}).get(agent, 'No reason provided')
-                        print(f"      ⊘ Skipping {agent}: {reason}")
-
-                return relevance_map
-
-            except json.JSONDecodeError as e:
-                print(f"      ⚠️  AI response parsing failed: {e}")
-                print(f"      Raw response: {response_text[:200]}...")
-                # Default: all relevant (safe fallback)
-                return {agent: True for agent in agents_needed}
-
-        except Exception as e:
-            print(f"      ⚠️  Error analyzing filing relevance: {e}")
-            # Default: all relevant (safe fallback)
-            return {agent: True for agent in agents_needed}
-
     # ========================================================================
     # Filing Agent Dispatch Methods
     # ========================================================================
 
     def _dispatch_deal_detector(self, filing: Dict, classification: Dict) -> Dict:
         """Dispatch to DealDetector agent"""
-        import asyncio
         from agents.deal_detector_agent import DealDetectorAgent
 
         ticker = filing.get('ticker')
@@ -908,7 +844,7 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
             return {'success': False, 'error': f'SPAC {ticker} not found'}
 
         agent = DealDetectorAgent()
-        result = asyncio.run(agent.process(filing))
+        result = run_async(agent.process(filing))
 
         if result:
             return {'success': True, 'findings': result}
@@ -917,7 +853,6 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
 
     def _dispatch_filing_processor(self, filing: Dict, classification: Dict) -> Dict:
         """Dispatch to FilingProcessor (DEFM14A, PREM14A, etc.)"""
-        import asyncio
         from agents.filing_processor import FilingProcessor
 
         ticker = filing.get('ticker')
@@ -925,13 +860,12 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
             return {'success': False, 'error': 'No ticker in filing'}
 
         processor = FilingProcessor()
-        result = asyncio.run(processor.process(filing))
+        result = run_async(processor.process(filing))
 
         return result if result else {'success': False, 'findings': 'No data extracted'}
 
     def _dispatch_trust_processor(self, filing: Dict, classification: Dict) -> Dict:
         """Dispatch to TrustAccountProcessor (10-Q, 10-K)"""
-        import asyncio
         from agents.quarterly_report_extractor import QuarterlyReportExtractor
 
         ticker = filing.get('ticker')
@@ -939,7 +873,7 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
             return {'success': False, 'error': 'No ticker in filing'}
 
         processor = QuarterlyReportExtractor()
-        result = asyncio.run(processor.process_filing(filing, ticker))
+        result = run_async(processor.process_filing(filing, ticker))
 
         return result if result else {'success': False, 'findings': 'No trust data extracted'}
 
@@ -977,14 +911,8 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
 
             extractor = RedemptionExtractor()
 
-            # Run async extraction using asyncio
-            import asyncio
-            if asyncio.get_event_loop().is_running():
-                # If already in event loop, create task
-                result = asyncio.ensure_future(extractor.process(filing))
-            else:
-                # Create new event loop
-                result = asyncio.run(extractor.process(filing))
+            # Run async extraction on this worker's event loop
+            result = run_async(extractor.process(filing))
 
             return result if result else {'success': False, 'findings': 'No redemption data'}
         except ImportError as e:
@@ -994,7 +922,6 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
         """Dispatch to PipeExtractor"""
         try:
             from agents.pipe_extractor_agent import PIPEExtractorAgent
-            import asyncio
 
             ticker = filing.get('ticker')
             if not ticker:
@@ -1002,11 +929,8 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
 
             extractor = PIPEExtractorAgent()
 
-            # Run async extraction
-            if asyncio.get_event_loop().is_running():
-                result = asyncio.ensure_future(extractor.process_filing(filing, ticker))
-            else:
-                result = asyncio.run(extractor.process_filing(filing, ticker))
+            # Run async extraction on this worker's event loop
+            result = run_async(extractor.process_filing(filing, ticker))
 
             return result if result else {'success': False, 'findings': 'No PIPE data'}
         except ImportError as e:
@@ -1102,14 +1026,13 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
 
     def _dispatch_completion_monitor(self, filing: Dict, classification: Dict) -> Dict:
         """Dispatch to CompletionMonitor (deal closing detector)"""
-        import asyncio
         from agents.completion_monitor_agent import CompletionMonitorAgent
 
         try:
             agent = CompletionMonitorAgent()
 
-            # Run async agent in sync context
-            result = asyncio.run(agent.process(filing))
+            # Run async agent on this worker's event loop
+            result = run_async(agent.process(filing))
 
             if result:
                 return {
@@ -1130,14 +1053,13 @@ Be conservative - if unsure, mark as true (let agent process). Only mark false i
 
     def _dispatch_ipo_detector(self, filing: Dict, classification: Dict) -> Dict:
         """Dispatch to IPODetector agent for 424B4 filings (IPO close)"""
-        import asyncio
         from agents.ipo_detector_agent import IPODetectorAgent
 
         try:
             agent = IPODetectorAgent()
 
-            # Run async agent in sync context
-            result = asyncio.run(agent.execute(filing))
+            # Run async agent on this worker's event loop
+            result = run_async(agent.execute(filing))
 
             agent.close()
 
@@ -1578,9 +1500,11 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
         """
         Process a new SEC filing by routing to appropriate agents
 
-        Called by SEC filing monitor when new filing detected
+        Called by SEC filing monitor when new filing detected (usually from a
+        FilingProcessingService worker - see filing_processing_service.py)
 
         OPTIMIZATION: Downloads filing content ONCE, then passes to all agents
+        Independent agents run concurrently on the shared agent pool
 
         Returns:
             True if filing was successfully logged to database, False otherwise
@@ -1628,6 +1552,8 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
         try:
             from utils.filing_logger import log_filing
             filing['classification'] = classification
+            if classification.get('item_number') and not filing.get('item_number'):
+                filing['item_number'] = classification['item_number']
             logging_success = log_filing(filing)  # Returns True/False
             if show_verbose_logs:
                 if logging_success:
@@ -1650,68 +1576,44 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
                 else:
                     print(f"   ⚠️  Content fetch failed - agents will fetch individually")
 
-        # OPTIMIZATION 2: AI-powered relevance analysis (skip irrelevant agents)
-        relevance_map = {}
-        if filing.get('content') and len(agents_needed) > 1:
-            if show_verbose_logs:
-                print(f"   🔍 Analyzing filing content for agent relevance...")
-            relevance_map = self._analyze_filing_relevance(
-                content=filing['content'],
-                agents_needed=agents_needed,
-                classification=classification,
-                filing=filing
-            )
-        else:
-            # Default: all agents relevant (single agent or no content)
-            relevance_map = {agent: True for agent in agents_needed}
+        # OPTIMIZATION 2: Skip irrelevant agents using the shared FilingAnalysis
+        # (produced once during classification - no extra LLM call here)
+        # 8-Ks routed by their EDGAR items need no relevance check (rule table is item-specific)
+        relevant_agents = agents_needed
+        if len(agents_needed) > 1 and classification.get('source') != 'edgar_items':
+            analysis = None
+            try:
+                from utils.filing_analysis import get_filing_analysis
+                analysis = get_filing_analysis(filing)
+            except Exception as e:
+                print(f"      ⚠️  Error loading filing analysis: {e}")
 
-        # Filter to only relevant agents
-        relevant_agents = [agent for agent in agents_needed if relevance_map.get(agent, True)]
+            if analysis:
+                relevant_agents = analysis.relevant_agents(agents_needed)
+                if show_verbose_logs:
+                    print(f"   🤖 Filing Analysis: {analysis.summary or 'N/A'}")
+                    for agent in agents_needed:
+                        if agent not in relevant_agents:
+                            reason = analysis.relevance_reasoning.get(agent, 'No reason provided')
+                            print(f"      ⊘ Skipping {agent}: {reason}")
 
         if len(relevant_agents) < len(agents_needed):
             skipped = set(agents_needed) - set(relevant_agents)
             if show_verbose_logs:
                 print(f"   ⏭️  Skipping {len(skipped)} irrelevant agents: {', '.join(skipped)}")
 
+        # Independent agents run concurrently; dependent ones (FILING_AGENT_RUN_AFTER) in later waves
         results = []
-
-        for agent_name in relevant_agents:
-            if agent_name in self.filing_agents:
-                task = AgentTask(
-                    task_id=f"{agent_name}_{ticker}_{int(time.time())}",
-                    agent_name=agent_name,
-                    task_type='filing_processing',
-                    priority=TaskPriority[classification['priority']],
-                    status=TaskStatus.PENDING,
-                    created_at=datetime.now(),
-                    parameters={
-                        'filing': filing,
-                        'classification': classification
-                    }
-                )
-
-                # Execute immediately (filing processing is real-time)
-                completed_task = self.filing_agents[agent_name].execute(task)
-                results.append({
-                    'agent': agent_name,
-                    'status': completed_task.status.value,
-                    'result': completed_task.result
-                })
-
-                if show_verbose_logs:
-                    if completed_task.status == TaskStatus.COMPLETED:
-                        print(f"   ✅ {agent_name} completed")
-                    elif completed_task.status == TaskStatus.FAILED:
-                        print(f"   ❌ {agent_name} failed: {completed_task.error}")
-
+        for wave in filing_agent_waves(relevant_agents):
+            if len(wave) == 1:
+                results.append(self._run_filing_agent(wave[0], filing, classification, ticker, show_verbose_logs))
             else:
-                if show_verbose_logs:
-                    print(f"   ⚠️  Agent '{agent_name}' not found in filing_agents")
-                results.append({
-                    'agent': agent_name,
-                    'status': 'NOT_FOUND',
-                    'error': f'{agent_name} not registered'
-                })
+                pool = self._get_agent_pool()
+                futures = [
+                    pool.submit(self._run_filing_agent, agent_name, dict(filing), classification, ticker, show_verbose_logs)
+                    for agent_name in wave
+                ]
+                results.extend(future.result() for future in futures)
 
         # Summary with AI optimization stats (only for MEDIUM/HIGH priority)
         if show_verbose_logs:
@@ -1726,6 +1628,46 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
         # Return logging success status (for SEC monitor to track which filings were successfully processed)
         return logging_success
 
+    def _run_filing_agent(self, agent_name: str, filing: Dict, classification: Dict, ticker: str,
+                          show_verbose_logs: bool) -> Dict:
+        """Execute one filing agent task (called inline or from the agent pool)"""
+        if agent_name not in self.filing_agents:
+            if show_verbose_logs:
+                print(f"   ⚠️  Agent '{agent_name}' not found in filing_agents")
+            return {
+                'agent': agent_name,
+                'status': 'NOT_FOUND',
+                'error': f'{agent_name} not registered'
+            }
+
+        task = AgentTask(
+            task_id=f"{agent_name}_{ticker}_{int(time.time())}",
+            agent_name=agent_name,
+            task_type='filing_processing',
+            priority=TaskPriority[classification['priority']],
+            status=TaskStatus.PENDING,
+            created_at=datetime.now(),
+            parameters={
+                'filing': filing,
+                'classification': classification
+            }
+        )
+
+        # Execute immediately (filing processing is real-time)
+        completed_task = self.filing_agents[agent_name].execute(task)
+
+        if show_verbose_logs:
+            if completed_task.status == TaskStatus.COMPLETED:
+                print(f"   ✅ {agent_name} completed")
+            elif completed_task.status == TaskStatus.FAILED:
+                print(f"   ❌ {agent_name} failed: {completed_task.error}")
+
+        return {
+            'agent': agent_name,
+            'status': completed_task.status.value,
+            'result': completed_task.result
+        }
+
     def process_approved_validation_issues(self):
         """Process approved validation issues automatically"""
         from validation_issue_queue import ValidationIssueQueue
@@ -2596,6 +2538,7 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
                 if filings:
                     print(f"[ORCHESTRATOR]   ✓ Found {len(filings)} new filing(s)")
 
+                    to_process = []
                     for filing in filings:
                         # Classify and route through process_filing
                         classification = monitor.classify_filing(filing)
@@ -2603,11 +2546,16 @@ Return JSON with tasks to run NOW (be selective - don't run everything):
                         print(f"[ORCHESTRATOR]   📄 {filing['type']} for {filing.get('ticker', filing.get('cik', 'UNKNOWN'))}")
                         print(f"      Priority: {classification['priority']}, Agents: {', '.join(classification['agents_needed'])}")
 
-                        # Route to process_filing (returns True if successfully logged)
                         if classification['agents_needed']:
-                            success = self.process_filing(filing, classification)
-                            if success:
-                                processed_filing_ids.append(filing['id'])
+                            to_process.append((filing, classification))
+
+                    # Process filings in parallel, most urgent first (returns True per successfully logged filing)
+                    if to_process:
+                        from filing_processing_service import get_filing_service
+                        results = get_filing_service(self).process_batch(to_process)
+                        processed_filing_ids.extend(
+                            filing['id'] for (filing, _), success in zip(to_process, results) if success
+                        )
                 else:
                     print(f"[ORCHESTRATOR]   No new filings")
 
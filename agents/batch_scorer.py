@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Batch Opportunity Scorer
+========================
+Phase 1 "Loaded Gun", Phase 2 "Deal Quality" and "Lit Fuse" scores for the
+whole universe in one pass.
+
+The per-SPAC scorers (phase1_scorer, phase2_scorer, lit_fuse_scorer) call
+calculate_*_score(spac, db) and save_*_score one row at a time.
+This engine instead:
+
+1. Loads spacs, sponsor_performance, social_sentiment, pipe_investors counts
+   and stored loaded_gun_score into DataFrames (five queries total)
+2. Computes every sub-score as a column expression (np.select over the same
+   thresholds as the scalar score_* functions)
+3. Upserts all rows with a single INSERT ... ON CONFLICT (ticker) statement;
+   NULL columns keep their stored value, so phases only touch their own columns
+
+Phase 2 and Lit Fuse both write sector_score / volume_score for announced
+deals; when both run together the Lit Fuse components are stored (Phase 2
+only keeps its total in deal_quality_score).
+
+Usage:
+    python3 agents/batch_scorer.py                    # Rescore everything
+    python3 agents/batch_scorer.py --phase phase1     # Only Phase 1
+    python3 agents/batch_scorer.py --dry-run          # Compute, don't write
+"""
+
+import sys
+sys.path.append('/home/ubuntu/spac-research')
+
+import json
+import time
+import logging
+import argparse
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from database import SessionLocal
+from agents.phase2_scorer import HOT_SECTORS
+from agents.lit_fuse_scorer import ELITE_SECTORS, STRONG_SECTORS, GOOD_SECTORS
+from utils.expected_close_normalizer import normalize_expected_close
+from utils.sponsor_resolver import SponsorResolver, get_sponsor_families
+
+logger = logging.getLogger(__name__)
+
+PHASES = ('phase1', 'phase2', 'lit_fuse')
+PHASE1_VERSION = '1.2'
+
+PHASE1_COLUMNS = ['market_cap_score', 'banker_score', 'sponsor_score', 'sector_score',
+                  'dilution_score', 'promote_score', 'buzz_score', 'loaded_gun_score']
+PHASE2_COLUMNS = ['market_reception_score', 'financing_score', 'valuation_score', 'timeline_score',
+                  'redemption_score', 'loaded_gun_carryover', 'sector_score', 'volume_score',
+                  'deal_quality_score']
+
+
+def _select(conditions, points, default=0) -> np.ndarray:
+    """First matching condition wins (NaN comparisons are False)"""
+    return np.select([np.asarray(c, dtype=bool) for c in conditions], points, default).astype(int)
+
+
+def _numeric(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors='coerce')
+
+
+def _truthy(series: pd.Series) -> pd.Series:
+    """Python truthiness for numeric columns (None/NaN/0 → False)"""
+    values = _numeric(series)
+    return values.notna() & (values != 0)
+
+
+def _parse_millions(series: pd.Series, pattern: str, strip: str = '$') -> pd.Series:
+    """Vectorized "$300M" / "$1.2B" → millions (see parse_ipo_proceeds / parse_deal_value)"""
+    values = series.astype('string')
+    for char in strip:
+        values = values.str.replace(char, '', regex=False)
+    parts = values.str.strip().str.upper().str.extract(pattern)
+    amount = pd.to_numeric(parts[0], errors='coerce')
+    return amount.where(parts[1] != 'B', amount * 1000).astype(float)
+
+
+def sponsor_scores(names: Iterable[str], sponsors: pd.DataFrame) -> Dict[str, int]:
+    """
+    sponsor_score for each distinct sponsor name, matched like phase1_scorer.score_sponsor
+
+    Uses a SponsorResolver over the loaded frame, so the batch sees the same
+    sponsor_performance snapshot as the rest of the run.
+    """
+    resolver = SponsorResolver(rows=sponsors.to_dict('records'), families=get_sponsor_families())
+    return resolver.scores(names)
+
+
+class BatchScorer:
+    """Scores every SEARCHING / ANNOUNCED SPAC from in-memory frames"""
+
+    def __init__(self, db=None):
+        self._owns_session = db is None
+        self.db = db or SessionLocal()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _read(self, query: str, optional: bool = False) -> pd.DataFrame:
+        try:
+            return pd.read_sql(text(query), self.db.bind)
+        except Exception as e:
+            if not optional:
+                raise
+            # Table doesn't exist yet - score as if it were empty
+            logger.warning(f"Scoring without optional data: {e}")
+            return pd.DataFrame()
+
+    def load(self) -> pd.DataFrame:
+        """One row per SPAC with every input column, joined with side tables"""
+        spacs = self._read("""
+            SELECT ticker, deal_status, ipo_proceeds, banker_tier, sponsor, is_hot_sector,
+                   founder_shares, shares_outstanding_base, promote_vesting_type,
+                   premium, return_since_announcement, pipe_size, min_cash, trust_cash,
+                   deal_value, expected_close, estimated_redemptions, sector_classified,
+                   volume, public_float, announced_date
+            FROM spacs
+            WHERE deal_status IN ('SEARCHING', 'ANNOUNCED')
+        """).drop_duplicates('ticker').set_index('ticker')
+
+        sponsors = self._read("SELECT * FROM sponsor_performance ORDER BY id", optional=True)
+        if not sponsors.empty and 'sponsor_aliases' not in sponsors:
+            sponsors['sponsor_aliases'] = None
+        buzz = self._read("SELECT ticker, buzz_score FROM social_sentiment", optional=True)
+        pipes = self._read("""
+            SELECT ticker,
+                   COUNT(*) FILTER (WHERE is_tier1 = TRUE) AS tier1_count,
+                   COUNT(*) AS total_pipe_investors
+            FROM pipe_investors
+            GROUP BY ticker
+        """, optional=True)
+        stored = self._read("SELECT ticker, loaded_gun_score AS stored_loaded_gun_score FROM opportunity_scores",
+                            optional=True)
+
+        for frame in (buzz, pipes, stored):
+            if not frame.empty:
+                spacs = spacs.join(frame.drop_duplicates('ticker').set_index('ticker'))
+
+        if sponsors.empty:
+            spacs['sponsor_lookup'] = 0
+        else:
+            lookup = sponsor_scores(spacs['sponsor'].dropna().unique(), sponsors)
+            spacs['sponsor_lookup'] = spacs['sponsor'].map(lookup).fillna(0)
+
+        for column in ('buzz_score', 'tier1_count', 'total_pipe_investors', 'stored_loaded_gun_score'):
+            if column not in spacs:
+                spacs[column] = np.nan
+        return spacs
+
+    # ------------------------------------------------------------------
+    # Scoring (same thresholds as the scalar score_* functions)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def score_phase1(spacs: pd.DataFrame) -> pd.DataFrame:
+        """Phase 1 Loaded Gun components (see phase1_scorer.calculate_phase1_score)"""
+        ipo = _parse_millions(spacs['ipo_proceeds'], r'^([\d.]+)([MB]?)')
+
+        founder = _numeric(spacs['founder_shares'])
+        base = _numeric(spacs['shares_outstanding_base'])
+        has_dilution = _truthy(founder) & _truthy(base)
+        dilution_pct = founder / base * 100
+
+        vesting = spacs['promote_vesting_type'].fillna('').astype(str).str.lower()
+
+        scores = pd.DataFrame({
+            'market_cap_score': _select([ipo >= 500, ipo >= 300, ipo >= 150, ipo >= 100, ipo >= 50],
+                                        [10, 8, 6, 4, 2]),
+            'banker_score': spacs['banker_tier'].map({'Tier 1': 15, 'Tier 2': 10, 'Tier 3': 5}).fillna(0).astype(int),
+            'sponsor_score': spacs['sponsor_lookup'].astype(int),
+            'sector_score': np.where(spacs['is_hot_sector'].fillna(False).astype(bool), 10, 0),
+            'dilution_score': _select([has_dilution & (dilution_pct < 15), has_dilution & (dilution_pct < 20),
+                                       has_dilution & (dilution_pct < 25), has_dilution & (dilution_pct < 30)],
+                                      [15, 12, 8, 4]),
+            'promote_score': _select([vesting.str.contains('performance'),
+                                      vesting.str.contains('time') | vesting.str.contains('standard')],
+                                     [10, 5]),
+            'buzz_score': _numeric(spacs['buzz_score']).fillna(0).round().astype(int),
+        }, index=spacs.index)
+        scores['loaded_gun_score'] = scores[PHASE1_COLUMNS[:-1]].sum(axis=1)
+        return scores
+
+    @staticmethod
+    def _days_to_close(expected_close: pd.Series) -> pd.Series:
+        """Days until the normalized expected close (NaN if unknown), one parse per distinct value"""
+        today = date.today()
+
+        def days(value):
+            if not value:
+                return np.nan
+            normalized = normalize_expected_close(value)
+            if not normalized:
+                return np.nan
+            try:
+                return (datetime.strptime(normalized, '%Y-%m-%d').date() - today).days
+            except ValueError:
+                return np.nan
+
+        distinct = {value: days(value) for value in expected_close.dropna().unique()}
+        return expected_close.map(distinct).astype(float)
+
+    @classmethod
+    def score_phase2(cls, spacs: pd.DataFrame) -> pd.DataFrame:
+        """Phase 2 Deal Quality components (see phase2_scorer.calculate_phase2_score)"""
+        premium = _numeric(spacs['premium'])
+        returns = _numeric(spacs['return_since_announcement'])
+        pipe = _numeric(spacs['pipe_size'])
+        min_cash = _numeric(spacs['min_cash'])
+        trust = _numeric(spacs['trust_cash'])
+        trust_known = trust.notna() & (trust > 0)
+        deal_value = _parse_millions(spacs['deal_value'], r'^([\d.]+)\s*([MB])?', strip='$,')
+        redemptions = _numeric(spacs['estimated_redemptions'])
+        days_to_close = cls._days_to_close(spacs['expected_close'])
+        loaded_gun = _numeric(spacs['stored_loaded_gun_score'])
+
+        pipe_ratio = pipe / trust * 100
+        min_cash_ratio = min_cash / trust * 100
+        leverage = deal_value / trust
+        redemption_pct = redemptions / trust * 100
+
+        volume = _numeric(spacs['volume'])
+        public_float = _numeric(spacs['public_float'])
+        has_turnover = _truthy(volume) & public_float.notna() & (public_float > 0)
+        turnover_pct = volume / public_float * 100
+
+        market_reception = (
+            _select([premium >= 40, premium >= 30, premium >= 20, premium >= 10, premium >= 0], [15, 12, 9, 6, 3]) +
+            _select([returns >= 20, returns >= 10, returns >= 0, returns >= -10], [5, 4, 3, 1])
+        )
+        financing = (
+            _select([~_truthy(pipe), ~trust_known, pipe_ratio < 20, pipe_ratio < 50, pipe_ratio < 100],
+                    [12, 6, 9, 6, 3]) +
+            _select([~_truthy(min_cash), ~trust_known, min_cash_ratio < 50, min_cash_ratio < 80],
+                    [8, 3, 6, 3])
+        )
+
+        scores = pd.DataFrame({
+            'market_reception_score': market_reception,
+            'financing_score': financing,
+            'valuation_score': _select([
+                deal_value.isna() | ~_truthy(trust),
+                (leverage >= 5) & (leverage <= 15),
+                ((leverage >= 3) & (leverage < 5)) | ((leverage > 15) & (leverage <= 25)),
+                ((leverage >= 1) & (leverage < 3)) | ((leverage > 25) & (leverage <= 50)),
+            ], [7, 15, 12, 6]),
+            'timeline_score': _select([days_to_close.isna(), days_to_close < 0, days_to_close < 90,
+                                       days_to_close < 180, days_to_close < 270, days_to_close < 365],
+                                      [3, 0, 15, 12, 9, 6], default=3),
+            'redemption_score': _select([
+                redemptions.isna(), ~trust_known,
+                _truthy(min_cash) & ((trust - redemptions) < min_cash),
+                redemption_pct < 10, redemption_pct < 30, redemption_pct < 50, redemption_pct < 70,
+            ], [10, 10, 0, 15, 12, 9, 6]),
+            'loaded_gun_carryover': _select([loaded_gun.isna(), loaded_gun >= 60, loaded_gun >= 40,
+                                             loaded_gun >= 25, loaded_gun >= 15], [7, 15, 12, 9, 6], default=3),
+            'sector_score': np.where(spacs['sector_classified'].isin(HOT_SECTORS), 10, 0),
+            'volume_score': _select([has_turnover & (turnover_pct >= 5), has_turnover & (turnover_pct >= 3),
+                                     has_turnover & (turnover_pct >= 2), has_turnover & (turnover_pct >= 1),
+                                     has_turnover & (turnover_pct >= 0.5)], [10, 8, 6, 4, 2]),
+        }, index=spacs.index)
+        scores['deal_quality_score'] = scores[PHASE2_COLUMNS[:-1]].sum(axis=1)
+        return scores
+
+    @staticmethod
+    def score_lit_fuse(spacs: pd.DataFrame) -> pd.DataFrame:
+        """Lit Fuse early momentum components (see lit_fuse_scorer.calculate_lit_fuse_score)"""
+        pipe = _numeric(spacs['pipe_size']).where(lambda p: p != 0)
+        pipe_millions = pipe.where(pipe <= 1_000_000, pipe / 1_000_000)
+        trust_millions = (_numeric(spacs['trust_cash']) / 1_000_000).where(_truthy(spacs['trust_cash']))
+        has_pipe = _truthy(pipe_millions) & trust_millions.notna() & (trust_millions > 0)
+        pipe_pct = pipe_millions / trust_millions * 100
+
+        tier1 = _numeric(spacs['tier1_count']).fillna(0)
+        investors = _numeric(spacs['total_pipe_investors']).fillna(0)
+
+        sector = spacs['sector_classified']
+        volume = _numeric(spacs['volume'])
+        public_float = _numeric(spacs['public_float'])
+        has_turnover = _truthy(volume) & public_float.notna() & (public_float > 0)
+        turnover_pct = volume / public_float * 100
+        loaded_gun = _numeric(spacs['stored_loaded_gun_score'])
+
+        scores = pd.DataFrame({
+            'pipe_size_score': _select([has_pipe & (pipe_pct >= 100), has_pipe & (pipe_pct >= 75),
+                                        has_pipe & (pipe_pct >= 50), has_pipe & (pipe_pct >= 25),
+                                        has_pipe & (pipe_pct >= 10), has_pipe], [20, 17, 14, 10, 5, 2]),
+            'pipe_quality_score': _select([tier1 >= 3, tier1 == 2, tier1 == 1, investors >= 5, investors >= 3],
+                                          [20, 17, 14, 10, 5]),
+            'sector_score': _select([sector.isin(ELITE_SECTORS), sector.isin(STRONG_SECTORS),
+                                     sector.isin(GOOD_SECTORS), sector.fillna('').astype(bool)],
+                                    [20, 17, 14, 5]),
+            'volume_score': _select([has_turnover & (turnover_pct >= 10), has_turnover & (turnover_pct >= 7),
+                                     has_turnover & (turnover_pct >= 5), has_turnover & (turnover_pct >= 3),
+                                     has_turnover & (turnover_pct >= 2), has_turnover & (turnover_pct >= 1),
+                                     has_turnover], [20, 17, 14, 10, 7, 4, 2]),
+            'loaded_gun_bonus': _select([~_truthy(loaded_gun), loaded_gun >= 70, loaded_gun >= 60,
+                                         loaded_gun >= 50, loaded_gun >= 40, loaded_gun >= 30],
+                                        [0, 20, 17, 14, 10, 5], default=2),
+        }, index=spacs.index)
+        scores['lit_fuse_score'] = scores.sum(axis=1)
+        return scores
+
+    def compute(self, phases: Sequence[str] = PHASES, spacs: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Scores for the requested phases, one row per ticker
+
+        Phase 1 rows are SEARCHING SPACs, Phase 2 / Lit Fuse rows are ANNOUNCED
+        deals. Columns a row's phase doesn't produce are NaN (left unchanged on write).
+        """
+        unknown = set(phases) - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown scoring phase(s): {', '.join(sorted(unknown))}")
+
+        spacs = self.load() if spacs is None else spacs
+        searching = spacs[spacs['deal_status'] == 'SEARCHING']
+        announced = spacs[spacs['deal_status'] == 'ANNOUNCED']
+
+        frames = []
+        if 'phase1' in phases and not searching.empty:
+            phase1 = self.score_phase1(searching)
+            phase1['calculation_version'] = PHASE1_VERSION
+            frames.append(phase1)
+
+        if not announced.empty:
+            deal_scores = pd.DataFrame(index=announced.index)
+            if 'phase2' in phases:
+                deal_scores = deal_scores.join(self.score_phase2(announced))
+            if 'lit_fuse' in phases:
+                lit_fuse = self.score_lit_fuse(announced).drop(columns=['loaded_gun_bonus'])
+                # Shared sector_score / volume_score: Lit Fuse components win
+                deal_scores = deal_scores.drop(columns=[c for c in lit_fuse if c in deal_scores]).join(lit_fuse)
+            if len(deal_scores.columns):
+                frames.append(deal_scores)
+
+        if not frames:
+            return pd.DataFrame(index=pd.Index([], name='ticker'))
+        scores = pd.concat(frames)
+        scores.index.name = 'ticker'
+        return scores
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write(self, scores: pd.DataFrame) -> int:
+        """
+        Upsert every row with one INSERT ... ON CONFLICT (ticker) statement
+
+        NULL values keep the stored column value (COALESCE).
+
+        Returns:
+            Number of rows written
+        """
+        if scores.empty:
+            return 0
+
+        columns = list(scores.columns)
+        records = []
+        for ticker, row in zip(scores.index, scores.itertuples(index=False)):
+            record = {'ticker': ticker}
+            for column, value in zip(columns, row):
+                if pd.isna(value):
+                    record[column] = None
+                elif column == 'calculation_version':
+                    record[column] = str(value)
+                else:
+                    record[column] = int(value)
+            records.append(record)
+
+        column_types = ', '.join(
+            ['ticker varchar'] +
+            [f"{c} {'varchar' if c == 'calculation_version' else 'integer'}" for c in columns]
+        )
+        update_clause = ',\n                '.join(
+            f"{c} = COALESCE(EXCLUDED.{c}, opportunity_scores.{c})" for c in columns
+        )
+
+        result = self.db.execute(text(f"""
+            INSERT INTO opportunity_scores (ticker, {', '.join(columns)}, last_calculated)
+            SELECT ticker, {', '.join(columns)}, :now
+            FROM json_to_recordset(CAST(:rows AS json)) AS v({column_types})
+            ON CONFLICT (ticker) DO UPDATE SET
+                {update_clause},
+                last_calculated = EXCLUDED.last_calculated
+        """), {'rows': json.dumps(records), 'now': datetime.now()})
+        self.db.commit()
+        return result.rowcount
+
+    def run(self, phases: Sequence[str] = PHASES, dry_run: bool = False) -> pd.DataFrame:
+        """Load → score → upsert; returns the computed scores"""
+        start = time.time()
+        scores = self.compute(phases)
+        written = 0 if dry_run else self.write(scores)
+        logger.info(f"📊 Scored {len(scores)} SPACs ({', '.join(phases)}) in {time.time() - start:.2f}s"
+                    f"{' (dry run)' if dry_run else f', {written} rows written'}")
+        return scores
+
+    def close(self):
+        if self._owns_session:
+            self.db.close()
+
+
+def rescore_all(phases: Sequence[str] = PHASES, db=None) -> pd.DataFrame:
+    """Rescore the universe (used after price updates)"""
+    scorer = BatchScorer(db=db)
+    try:
+        return scorer.run(phases)
+    finally:
+        scorer.close()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Batch opportunity scoring (Phase 1, Phase 2, Lit Fuse)')
+    parser.add_argument('--phase', action='append', choices=PHASES, help='Phase to score (repeatable, default: all)')
+    parser.add_argument('--dry-run', action='store_true', help='Compute scores without writing them')
+    parser.add_argument('--top', type=int, default=10, help='Show the top N per total score')
+    args = parser.parse_args()
+
+    scorer = BatchScorer()
+    try:
+        scores = scorer.run(args.phase or PHASES, dry_run=args.dry_run)
+        for total in ('loaded_gun_score', 'deal_quality_score', 'lit_fuse_score'):
+            if total in scores:
+                top = scores[total].dropna().sort_values(ascending=False).head(args.top)
+                print(f"\nTop {len(top)} by {total}:")
+                for ticker, value in top.items():
+                    print(f"  {ticker:6s} {int(value):3d}")
+    finally:
+        scorer.close()
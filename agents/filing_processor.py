@@ -17,7 +17,6 @@ Workflow:
 import os
 import sys
 import re
-import requests
 from datetime import datetime, date
 from typing import Dict, Optional
 from bs4 import BeautifulSoup
@@ -27,11 +26,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents.base_agent import BaseAgent
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
 from utils.deal_value_tracker import update_deal_value
 from utils.deal_structure_tracker import update_deal_structure
 from utils.trust_account_tracker import update_trust_cash, update_trust_value, update_shares_outstanding
 from utils.redemption_tracker import add_redemption_event, mark_no_redemptions_found
 from utils.expected_close_normalizer import normalize_expected_close
+from utils.sec_async_fetcher import get_async_fetcher, fetch_documents
+from utils.section_index import get_section_index
+from utils.html_text import html_to_text
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -96,12 +99,12 @@ class FilingProcessor(BaseAgent):
     # COMMON UTILITIES (used by all processors)
     # ========================================================================
 
-    def _get_document_url(self, filing_url: str, filing_type: str) -> Optional[str]:
+    async def _get_document_url(self, filing_url: str, filing_type: str) -> Optional[str]:
         """Get actual document URL from filing index page"""
 
         try:
-            response = requests.get(filing_url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            index_html = await get_async_fetcher().fetch_document(filing_url)
+            soup = BeautifulSoup(index_html or '', 'html.parser')
 
             # Search patterns based on filing type
             if '14A' in filing_type:
@@ -136,50 +139,44 @@ class FilingProcessor(BaseAgent):
             print(f"   ⚠️  Error getting document URL: {e}")
             return None
 
-    def _fetch_document(self, doc_url: str) -> Optional[str]:
-        """Fetch and parse document content"""
+    async def _fetch_document_async(self, doc_url: str) -> Optional[str]:
+        """Fetch and parse document content (async - shares SEC rate limit and cache)"""
 
         try:
-            response = requests.get(doc_url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            html = await get_async_fetcher().fetch_document(doc_url)
+            return self._html_to_text(html) if html else None
 
-            # Get text content
-            text = soup.get_text()
+        except Exception as e:
+            print(f"   ⚠️  Error fetching document: {e}")
+            return None
 
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            text = '\n'.join(line for line in lines if line)
+    def _fetch_document(self, doc_url: str) -> Optional[str]:
+        """Fetch and parse document content (sync facade for scripts)"""
 
-            return text
+        try:
+            html = fetch_documents([doc_url])[0]
+            return self._html_to_text(html) if html else None
 
         except Exception as e:
             print(f"   ⚠️  Error fetching document: {e}")
             return None
 
-    def _extract_section(self, text: str, start_markers: list, max_length: int = 10000) -> Optional[str]:
-        """Extract a specific section by finding start marker"""
-
-        text_upper = text.upper()
+    def _html_to_text(self, html: str) -> str:
+        """Convert document HTML to newline-separated text"""
 
-        for marker in start_markers:
-            marker_upper = marker.upper()
-            start_pos = text_upper.find(marker_upper)
+        return html_to_text(html, keep_lines=True)
 
-            if start_pos != -1:
-                section = text[start_pos:start_pos + max_length]
-                return section
+    def _extract_section(self, text: str, start_markers: list, max_length: int = 10000) -> Optional[str]:
+        """Extract a specific section by finding start marker"""
 
-        return None
+        return get_section_index(text).section(start_markers, max_length)
 
     def _call_ai(self, prompt: str) -> Optional[Dict]:
         """Call AI with structured extraction prompt"""
 
         try:
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'filing_processor',
                 model="deepseek-chat",
                 messages=[
                     {"role": "system", "content": "You are a financial document extraction expert specializing in SEC filings."},
@@ -211,12 +208,12 @@ class FilingProcessor(BaseAgent):
         print(f"\n🗳️  {ticker} - Extracting vote date from DEF 14A...")
 
         # Get document
-        doc_url = self._get_document_url(filing_url, 'DEF 14A')
+        doc_url = await self._get_document_url(filing_url, 'DEF 14A')
         if not doc_url:
             print(f"   ❌ Could not find DEF 14A document")
             return None
 
-        content = self._fetch_document(doc_url)
+        content = await self._fetch_document_async(doc_url)
         if not content:
             print(f"   ❌ Could not fetch document")
             return None
@@ -375,12 +372,12 @@ If cannot find vote date, return {{"vote_date": null}}.
         print(f"\n📋 {ticker} - Extracting deal terms from DEFM14A...")
 
         # Get document
-        doc_url = self._get_document_url(filing_url, 'DEFM14A')
+        doc_url = await self._get_document_url(filing_url, 'DEFM14A')
         if not doc_url:
             print(f"   ❌ Could not find DEFM14A document")
             return None
 
-        content = self._fetch_document(doc_url)
+        content = await self._fetch_document_async(doc_url)
         if not content:
             print(f"   ❌ Could not fetch document")
             return None
@@ -782,12 +779,12 @@ If any field is not found, return null for that field.
         print(f"\n📄 {ticker} - Extracting deal terms from S-4...")
 
         # Get document
-        doc_url = self._get_document_url_s4(filing_url)
+        doc_url = await self._get_document_url_s4(filing_url)
         if not doc_url:
             print(f"   ❌ Could not find S-4 document")
             return None
 
-        content = self._fetch_document(doc_url)
+        content = await self._fetch_document_async(doc_url)
         if not content:
             print(f"   ❌ Could not fetch document")
             return None
@@ -816,12 +813,12 @@ If any field is not found, return null for that field.
         self.processed_count += 1
         return deal_terms
 
-    def _get_document_url_s4(self, filing_url: str) -> Optional[str]:
+    async def _get_document_url_s4(self, filing_url: str) -> Optional[str]:
         """Get S-4 document URL from filing index page"""
 
         try:
-            response = requests.get(filing_url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            index_html = await get_async_fetcher().fetch_document(filing_url)
+            soup = BeautifulSoup(index_html or '', 'html.parser')
 
             # Look for the main S-4 document
             for link in soup.find_all('a', href=True):
@@ -991,12 +988,12 @@ If any field is not found, return null for that field.
         print(f"\n🤝 {ticker} - Extracting tender offer terms...")
 
         # Get document
-        doc_url = self._get_document_url(filing_url, 'SC TO')
+        doc_url = await self._get_document_url(filing_url, 'SC TO')
         if not doc_url:
             print(f"   ❌ Could not find Schedule TO document")
             return None
 
-        content = self._fetch_document(doc_url)
+        content = await self._fetch_document_async(doc_url)
         if not content:
             print(f"   ❌ Could not fetch document")
             return None
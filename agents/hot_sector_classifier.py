@@ -15,6 +15,7 @@ import sys
 sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
+from utils.keyword_matcher import KeywordMatcher
 import argparse
 import re
 
@@ -57,6 +58,20 @@ HOT_SECTORS = {
     ]
 }
 
+# Fallback categories for text without hot-sector keywords (checked in order)
+GENERAL_CATEGORIES = {
+    'Technology': ['tech', 'software', 'digital', 'internet'],
+    'Healthcare': ['health', 'medical', 'pharma', 'bio'],
+    'Energy': ['energy', 'oil', 'gas', 'power'],
+    'Financial Services': ['financial', 'bank', 'insurance', 'capital'],
+    'Industrial': ['industrial', 'manufacturing', 'infrastructure'],
+    'Consumer': ['consumer', 'retail', 'e-commerce'],
+    'Real Estate': ['real estate', 'property', 'reits'],
+}
+
+# Hot sectors first, then general categories - one pass over the text
+SECTOR_MATCHER = KeywordMatcher(list(HOT_SECTORS.items()) + list(GENERAL_CATEGORIES.items()))
+
 
 def classify_sector(sector_text: str) -> tuple[str, bool]:
     """
@@ -71,32 +86,12 @@ def classify_sector(sector_text: str) -> tuple[str, bool]:
     if not sector_text:
         return ('General', False)
 
-    # Normalize text
-    text_lower = sector_text.lower()
-
-    # Check each hot sector
-    for sector_name, keywords in HOT_SECTORS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                return (sector_name, True)
-
-    # Not a hot sector - try to extract general category
-    if any(word in text_lower for word in ['tech', 'software', 'digital', 'internet']):
-        return ('Technology', False)
-    elif any(word in text_lower for word in ['health', 'medical', 'pharma', 'bio']):
-        return ('Healthcare', False)
-    elif any(word in text_lower for word in ['energy', 'oil', 'gas', 'power']):
-        return ('Energy', False)
-    elif any(word in text_lower for word in ['financial', 'bank', 'insurance', 'capital']):
-        return ('Financial Services', False)
-    elif any(word in text_lower for word in ['industrial', 'manufacturing', 'infrastructure']):
-        return ('Industrial', False)
-    elif any(word in text_lower for word in ['consumer', 'retail', 'e-commerce']):
-        return ('Consumer', False)
-    elif any(word in text_lower for word in ['real estate', 'property', 'reits']):
-        return ('Real Estate', False)
-    else:
+    # First hot sector (in HOT_SECTORS order) with a keyword in the text,
+    # otherwise the first matching general category
+    match = SECTOR_MATCHER.first(sector_text)
+    if match is None:
         return ('General', False)
+    return (match.label, match.label in HOT_SECTORS)
 
 
 def classify_spac(spac):
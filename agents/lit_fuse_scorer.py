@@ -29,6 +29,10 @@ import re
 from datetime import datetime
 import argparse
 
+ELITE_SECTORS = ['AI & Machine Learning']
+STRONG_SECTORS = ['Healthcare Technology', 'Electric Vehicles']
+GOOD_SECTORS = ['FinTech', 'Cybersecurity', 'Space Technology', 'Clean Energy', 'Blockchain & Crypto']
+
 
 def parse_pipe_size(pipe_str):
     """
@@ -145,15 +149,11 @@ def score_hot_sector(sector_classified):
     if not sector_classified:
         return 0
 
-    elite_sectors = ['AI & Machine Learning']
-    strong_sectors = ['Healthcare Technology', 'Electric Vehicles']
-    good_sectors = ['FinTech', 'Cybersecurity', 'Space Technology', 'Clean Energy', 'Blockchain & Crypto']
-
-    if sector_classified in elite_sectors:
+    if sector_classified in ELITE_SECTORS:
         return 20
-    elif sector_classified in strong_sectors:
+    elif sector_classified in STRONG_SECTORS:
         return 17
-    elif sector_classified in good_sectors:
+    elif sector_classified in GOOD_SECTORS:
         return 14
     else:
         return 5  # Baseline for any identified sector
@@ -373,23 +373,15 @@ def score_all_announced():
     """
     db = SessionLocal()
     try:
-        # Get all announced SPACs
-        spacs = db.query(SPAC).filter(SPAC.deal_status == 'ANNOUNCED').all()
-
-        print(f"\n🔥 Scoring {len(spacs)} announced deals for 'Lit Fuse' early momentum...\n")
-
-        scored_count = 0
-        total_scores = []
-
-        for spac in spacs:
-            scores = calculate_lit_fuse_score(spac, db)
-            save_lit_fuse_score(db, spac.ticker, scores)
+        from agents.batch_scorer import BatchScorer
 
-            total_scores.append(scores['lit_fuse_score'])
-            scored_count += 1
+        print("\n🔥 Scoring announced deals for 'Lit Fuse' early momentum...\n")
 
-            if scored_count % 10 == 0:
-                print(f"✅ Scored {scored_count}/{len(spacs)} deals...")
+        # All announced deals scored from in-memory frames, one upsert
+        scores = BatchScorer(db=db).run(phases=['lit_fuse'])
+        print(f"✅ Scored {len(scores)} announced deals")
+        total_scores = scores['lit_fuse_score'].dropna().astype(int).tolist() if 'lit_fuse_score' in scores else []
+        scored_count = len(total_scores)
 
         print(f"\n✅ Scoring complete!\n")
         print(f"Results:")
@@ -131,64 +131,12 @@ def score_sponsor(sponsor_name):
     if not sponsor_name:
         return 0
 
-    from database import engine
-    from sqlalchemy import text
-
-    # Normalize sponsor name for matching (case-insensitive, strip whitespace)
-    sponsor_normalized = sponsor_name.strip().lower()
+    # In-memory lookup over sponsor_performance names and aliases (exact, alias,
+    # contains, normalized, family, fuzzy) - no per-SPAC LIKE scans
+    from utils.sponsor_resolver import get_sponsor_resolver
 
     try:
-        with engine.connect() as conn:
-            # Try exact match first
-            result = conn.execute(
-                text("SELECT sponsor_score FROM sponsor_performance WHERE LOWER(sponsor_name) = :name"),
-                {'name': sponsor_normalized}
-            ).fetchone()
-
-            if result:
-                return result[0] or 0
-
-            # Try alias match (check if sponsor name matches any alias)
-            result = conn.execute(
-                text("""
-                    SELECT sponsor_score FROM sponsor_performance
-                    WHERE :name = ANY(SELECT LOWER(unnest(sponsor_aliases)))
-                    LIMIT 1
-                """),
-                {'name': sponsor_normalized}
-            ).fetchone()
-
-            if result:
-                return result[0] or 0
-
-            # Try fuzzy match (contains) on sponsor_name
-            result = conn.execute(
-                text("SELECT sponsor_score FROM sponsor_performance WHERE LOWER(sponsor_name) LIKE :pattern LIMIT 1"),
-                {'pattern': f'%{sponsor_normalized}%'}
-            ).fetchone()
-
-            if result:
-                return result[0] or 0
-
-            # Try fuzzy match on aliases
-            result = conn.execute(
-                text("""
-                    SELECT sponsor_score FROM sponsor_performance
-                    WHERE EXISTS (
-                        SELECT 1 FROM unnest(sponsor_aliases) AS alias
-                        WHERE LOWER(alias) LIKE :pattern
-                    )
-                    LIMIT 1
-                """),
-                {'pattern': f'%{sponsor_normalized}%'}
-            ).fetchone()
-
-            if result:
-                return result[0] or 0
-
-            # No match found - first-time sponsor
-            return 0
-
+        return get_sponsor_resolver().score(sponsor_name)
     except Exception as e:
         print(f"Warning: Error looking up sponsor '{sponsor_name}': {e}")
         return 0
@@ -391,24 +339,15 @@ def score_all_predeal():
     """
     db = SessionLocal()
     try:
-        # Get all pre-deal SPACs
-        spacs = db.query(SPAC).filter(SPAC.deal_status == 'SEARCHING').all()
-
-        print(f"\n📊 Scoring {len(spacs)} pre-deal SPACs for Phase 1 'Loaded Gun'...\n")
-
-        scored_count = 0
-        total_scores = []
-
-        for spac in spacs:
-            scores = calculate_phase1_score(spac, db)
-            save_score(db, spac.ticker, scores)
+        from agents.batch_scorer import BatchScorer
 
-            total_scores.append(scores['loaded_gun_score'])
-            scored_count += 1
+        print("\n📊 Scoring pre-deal SPACs for Phase 1 'Loaded Gun'...\n")
 
-            # Print progress every 10 SPACs
-            if scored_count % 10 == 0:
-                print(f"✅ Scored {scored_count}/{len(spacs)} SPACs...")
+        # All pre-deal SPACs scored from in-memory frames, one upsert
+        scores = BatchScorer(db=db).run(phases=['phase1'])
+        print(f"✅ Scored {len(scores)} pre-deal SPACs")
+        total_scores = scores['loaded_gun_score'].dropna().astype(int).tolist() if 'loaded_gun_score' in scores else []
+        scored_count = len(total_scores)
 
         print(f"\n✅ Scoring complete!")
         print(f"\nResults:")
@@ -30,6 +30,17 @@ from datetime import datetime, date
 import argparse
 from utils.expected_close_normalizer import normalize_expected_close
 
+HOT_SECTORS = [
+    'AI & Machine Learning',
+    'Healthcare Technology',
+    'Electric Vehicles',
+    'FinTech',
+    'Cybersecurity',
+    'Space Technology',
+    'Clean Energy',
+    'Blockchain & Crypto'
+]
+
 
 def parse_deal_value(deal_value_str):
     """
@@ -301,18 +312,7 @@ def score_sector(sector_classified):
     if not sector_classified:
         return 0
 
-    hot_sectors = [
-        'AI & Machine Learning',
-        'Healthcare Technology',
-        'Electric Vehicles',
-        'FinTech',
-        'Cybersecurity',
-        'Space Technology',
-        'Clean Energy',
-        'Blockchain & Crypto'
-    ]
-
-    return 10 if sector_classified in hot_sectors else 0
+    return 10 if sector_classified in HOT_SECTORS else 0
 
 
 def score_volume_liquidity(volume, public_float, announced_date):
@@ -475,24 +475,15 @@ def score_all_announced():
     """
     db = SessionLocal()
     try:
-        # Get all announced SPACs
-        spacs = db.query(SPAC).filter(SPAC.deal_status == 'ANNOUNCED').all()
-
-        print(f"\n📊 Scoring {len(spacs)} announced deals for Phase 2 'Deal Quality'...\n")
-
-        scored_count = 0
-        total_scores = []
-
-        for spac in spacs:
-            scores = calculate_phase2_score(spac, db)
-            save_phase2_score(db, spac.ticker, scores)
+        from agents.batch_scorer import BatchScorer
 
-            total_scores.append(scores['deal_quality_score'])
-            scored_count += 1
+        print("\n📊 Scoring announced deals for Phase 2 'Deal Quality'...\n")
 
-            # Print progress every 10
-            if scored_count % 10 == 0:
-                print(f"✅ Scored {scored_count}/{len(spacs)} deals...")
+        # All announced deals scored from in-memory frames, one upsert
+        scores = BatchScorer(db=db).run(phases=['phase2'])
+        print(f"✅ Scored {len(scores)} announced deals")
+        total_scores = scores['deal_quality_score'].dropna().astype(int).tolist() if 'deal_quality_score' in scores else []
+        scored_count = len(total_scores)
 
         print(f"\n✅ Scoring complete!")
         print(f"\nResults:")
@@ -26,9 +26,8 @@ class PriceMonitorAgent(OrchestratorAgentBase):
 
             # Use optimized batch updater (62-165x faster than sequential)
             # Old: ~22 seconds per SPAC × 145 = ~53 minutes
-            # New: ~0.35 seconds per SPAC × 145 = ~51 seconds
-            # Batch size 20 with 3-second delays to avoid Yahoo Finance rate limits
-            updates = batch_update_prices(batch_size=20, delay_seconds=3)
+            # New: a few yf.download calls + vectorized metrics + one bulk UPDATE
+            updates = batch_update_prices()
 
             # Now check for price spikes in updated SPACs
             db = SessionLocal()
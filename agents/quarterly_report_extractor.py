@@ -27,7 +27,12 @@ from bs4 import BeautifulSoup
 
 from utils.sec_filing_fetcher import SECFilingFetcher
 from database import SessionLocal, SPAC
-from utils.trust_account_tracker import update_trust_cash, update_shares_outstanding
+from utils.llm_cache import cached_completion
+from utils.trust_account_tracker import (
+    update_trust_cash, update_shares_outstanding, quarter_for_period, latest_period_end
+)
+from utils.xbrl_facts import extract_trust_facts
+from utils.section_index import get_section_index
 
 # DeepSeek AI for extraction fallback
 try:
@@ -75,7 +80,7 @@ class QuarterlyReportExtractor:
         print(f"\n📊 {ticker} - Processing {filing['type']} filed {filing['date'].strftime('%Y-%m-%d')}")
 
         # Extract actual document URL from index page
-        doc_url = self.sec_fetcher.extract_document_url(filing['url'])
+        doc_url = filing.get('document_url') or self.sec_fetcher.extract_document_url(filing['url'])
         if not doc_url:
             print(f"   ⚠️  Could not extract document URL from index page")
             return {'success': False, 'error': 'Could not extract document URL'}
@@ -99,8 +104,8 @@ class QuarterlyReportExtractor:
         # Extract redemption data
         redemption_data = self._extract_redemption_info(sections, ticker)
 
-        # Extract trust balance
-        trust_data = self._extract_trust_balance(sections, ticker)
+        # Extract trust balance (inline XBRL facts first, AI fallback)
+        trust_data = self._extract_trust_balance(sections, ticker, doc_content)
 
         # Check for deal completion/liquidation indicators
         status_data = self._check_deal_status(sections, ticker)
@@ -110,6 +115,7 @@ class QuarterlyReportExtractor:
             'success': True,
             'filing_type': filing['type'],
             'filing_date': filing['date'],
+            'period_end': filing.get('report_date'),  # From local submissions index (if known)
             **extension_data,
             **redemption_data,
             **trust_data,
@@ -177,7 +183,7 @@ class QuarterlyReportExtractor:
                 print(f"      Checking 8-K filed {eight_k['date'].strftime('%Y-%m-%d')}...")
 
                 # Extract actual document URL from index page (same as 10-Q/10-K handling)
-                doc_url = self.sec_fetcher.extract_document_url(eight_k['url'])
+                doc_url = eight_k.get('document_url') or self.sec_fetcher.extract_document_url(eight_k['url'])
                 if not doc_url:
                     print(f"         ⚠️  Could not extract document URL")
                     continue
@@ -368,20 +374,8 @@ class QuarterlyReportExtractor:
         Returns:
             Section text or None if not found
         """
-        text_upper = text.upper()
-
-        for marker in start_markers:
-            marker_upper = marker.upper()
-
-            # Find marker position
-            pos = text_upper.find(marker_upper)
-
-            if pos != -1:
-                # Extract from marker onwards
-                section_text = text[pos:pos + max_length]
-                return section_text
-
-        return None
+        # Shared per-document index: the text is upper-cased once for all sections
+        return get_section_index(text).section(start_markers, max_length)
 
     def _extract_extension_info(self, sections: Dict[str, str], ticker: str) -> Dict:
         """
@@ -633,7 +627,8 @@ FULL TEXT SEARCH (for "redemption" keyword):
 Return JSON only, no explanation."""
 
         try:
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'quarterly_report',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -678,9 +673,13 @@ Return JSON only, no explanation."""
             print(f"      ⚠️  AI redemption extraction error: {e}")
             return {}
 
-    def _extract_trust_balance(self, sections: Dict[str, str], ticker: str) -> Dict:
+    def _extract_trust_balance(self, sections: Dict[str, str], ticker: str, doc_content: Optional[str] = None) -> Dict:
         """
-        Extract current trust account balance using AI
+        Extract current trust account balance
+
+        Inline XBRL filings carry the balance sheet values as tagged facts
+        (exact, with the balance sheet date) - those are used when present.
+        Otherwise falls back to AI extraction.
 
         AI-based extraction is more reliable than regex because:
         - Understands balance sheet context (assets vs expenses)
@@ -688,6 +687,18 @@ Return JSON only, no explanation."""
         - Handles pre-IPO filings (checks balance sheet date vs IPO date)
         - Validates data before returning
         """
+        xbrl = extract_trust_facts(doc_content) if doc_content else None
+        if xbrl and xbrl.get('trust_cash'):
+            print(f"      ✓ Trust cash (XBRL, {xbrl['period_end']}): ${xbrl['trust_cash']:,.0f}")
+            if xbrl.get('shares_outstanding'):
+                print(f"      ✓ Shares outstanding (XBRL): {xbrl['shares_outstanding']:,}")
+            if xbrl.get('nav_per_share'):
+                print(f"      ✓ NAV per share (XBRL): ${xbrl['nav_per_share']:.2f}")
+            return {
+                k: v for k, v in xbrl.items()
+                if k in ['trust_cash', 'shares_outstanding', 'nav_per_share', 'period_end'] and v is not None
+            }
+
         if not AI_AVAILABLE:
             print(f"      ⚠️  AI not available, skipping trust balance extraction")
             return {}
@@ -777,7 +788,8 @@ TRUST ACCOUNT NOTE:
 Return null for values you cannot find confidently. DO NOT guess or extract wrong numbers."""
 
         try:
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'quarterly_report',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -799,10 +811,16 @@ Return null for values you cannot find confidently. DO NOT guess or extract wron
                 print(f"      ℹ️  {result['notes']}")
 
             # Return only the data fields
-            return {
+            data = {
                 k: v for k, v in result.items()
                 if k in ['trust_cash', 'shares_outstanding', 'nav_per_share']
             }
+            try:
+                if result.get('balance_sheet_date'):
+                    data['period_end'] = datetime.strptime(result['balance_sheet_date'], '%Y-%m-%d').date()
+            except (TypeError, ValueError):
+                pass
+            return data
 
         except Exception as e:
             print(f"      ⚠️  AI extraction error: {e}")
@@ -872,7 +890,8 @@ Return null for values you cannot find confidently. DO NOT guess or extract wron
 If no deal activity found, return status null."""
 
         try:
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'quarterly_report',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -984,7 +1003,8 @@ Return JSON:
 If no extension info found, return {{}}.
 """
 
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'quarterly_report',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -1089,7 +1109,7 @@ If no extension info found, return {{}}.
                 time.sleep(2)  # Rate limiting
 
                 # Extract document URL
-                doc_url = self.sec_fetcher.extract_document_url(filing['url'])
+                doc_url = filing.get('document_url') or self.sec_fetcher.extract_document_url(filing['url'])
                 if not doc_url:
                     continue
 
@@ -1184,7 +1204,8 @@ Return null for fields you cannot find. If no redemptions found, return {{}}.
 """
 
         try:
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'quarterly_report',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
@@ -1256,6 +1277,8 @@ Return null for fields you cannot find. If no redemptions found, return {{}}.
                 # Use tracker to ensure trust_value and premium are recalculated
                 filing_type = '10-Q' if '10-Q' in str(data.get('filing_type', '')) else '10-K'
                 filing_date = data.get('filing_date', datetime.now().date())
+                # Balance sheet date (XBRL context / AI), else last quarter end before filing
+                period_end = data.get('period_end') or latest_period_end(filing_date)
 
                 update_trust_cash(
                     db_session=db,
@@ -1263,7 +1286,8 @@ Return null for fields you cannot find. If no redemptions found, return {{}}.
                     new_value=data['trust_cash'],
                     source=filing_type,
                     filing_date=filing_date,
-                    quarter=f"Q{((filing_date.month-1)//3)+1} {filing_date.year}" if filing_type == '10-Q' else f"FY {filing_date.year}"
+                    quarter=quarter_for_period(period_end, filing_type),
+                    period_end=period_end
                 )
                 updated_fields.append(f"trust_cash=${data['trust_cash']:,.0f}")
 
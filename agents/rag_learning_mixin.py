@@ -3,14 +3,16 @@ RAG Learning Mixin for Agents
 
 Uses vector database (ChromaDB) for semantic similarity search over past corrections.
 Better than Few-Shot SQL matching - finds semantically similar corrections, not just exact matches.
+
+Retrieval goes through the process-wide index in utils/correction_index.py: the
+embedding model and correction vectors are loaded once per process, not per agent.
 """
 
 from typing import List, Dict, Optional
-import chromadb
-from chromadb.utils import embedding_functions
-import json
 import logging
 
+from utils.correction_index import EMBEDDING_DIMENSION, EMBEDDING_MODEL, get_correction_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,9 +43,7 @@ class RAGLearningMixin:
     """
 
     def __init__(self):
-        self.rag_client = None
-        self.rag_collection = None
-        self.embedding_function = None
+        self.rag_index = None
 
     def init_rag(self, db_path: str = "./correction_vector_db"):
         """
@@ -52,35 +52,22 @@ class RAGLearningMixin:
         Args:
             db_path: Path to ChromaDB database (default: ./correction_vector_db)
 
-        Call this once in your agent's __init__ or execute method.
+        Call this once in your agent's __init__ or execute method. Cheap after
+        the first agent in the process: the index is shared, and the embedding
+        model is only loaded when a query is not already cached.
         """
-        if self.rag_client is not None:
+        if getattr(self, 'rag_index', None) is not None:
             return  # Already initialized
 
         try:
-            logger.info(f"[RAG] Initializing ChromaDB from {db_path}")
-
-            # Connect to persistent database
-            self.rag_client = chromadb.PersistentClient(path=db_path)
-
-            # Use same embedding model as indexing
-            self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="all-MiniLM-L6-v2"
-            )
-
-            # Get collection
-            self.rag_collection = self.rag_client.get_collection(
-                name="spac_corrections",
-                embedding_function=self.embedding_function
-            )
-
-            logger.info(f"[RAG] Connected to vector DB ({self.rag_collection.count()} corrections)")
+            index = get_correction_index(db_path)
+            logger.info(f"[RAG] Connected to vector DB ({index.count()} corrections)")
+            self.rag_index = index
 
         except Exception as e:
             logger.error(f"[RAG] Failed to initialize: {e}")
             logger.warning(f"[RAG] Falling back to no learning (database not indexed?)")
-            self.rag_client = None
-            self.rag_collection = None
+            self.rag_index = None
 
     def get_similar_corrections_rag(
         self,
@@ -101,48 +88,21 @@ class RAGLearningMixin:
         Returns:
             List of similar corrections with metadata
         """
-        if not self.rag_collection:
+        if not getattr(self, 'rag_index', None):
             logger.warning("[RAG] Vector DB not initialized, returning empty list")
             return []
 
         try:
-            # Build metadata filter
-            where_filter = None
-            if filter_ticker or filter_issue_type:
-                where_filter = {}
-                if filter_ticker:
-                    where_filter['ticker'] = filter_ticker
-                if filter_issue_type:
-                    where_filter['issue_type'] = filter_issue_type
-
-            # Semantic search
-            results = self.rag_collection.query(
-                query_texts=[query],
+            # Semantic search (in-memory matrix, cached query embedding)
+            corrections = self.rag_index.query(
+                query,
                 n_results=n_results,
-                where=where_filter if where_filter else None
+                filter_ticker=filter_ticker,
+                filter_issue_type=filter_issue_type
             )
 
-            # Format results
-            corrections = []
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
-            )):
-                # Parse fields_corrected back to list
-                fields = json.loads(metadata.get('fields_corrected', '[]'))
-
-                corrections.append({
-                    'document': doc,
-                    'ticker': metadata.get('ticker', ''),
-                    'issue_type': metadata.get('issue_type', ''),
-                    'fields_corrected': fields,
-                    'created_at': metadata.get('created_at', ''),
-                    'similarity': 1 - distance,  # Convert distance to similarity (0-1)
-                    'distance': distance
-                })
-
-            logger.info(f"[RAG] Found {len(corrections)} similar corrections (avg similarity: {sum(c['similarity'] for c in corrections) / len(corrections):.2%})")
+            if corrections:
+                logger.info(f"[RAG] Found {len(corrections)} similar corrections (avg similarity: {sum(c['similarity'] for c in corrections) / len(corrections):.2%})")
 
             return corrections
 
@@ -206,7 +166,7 @@ Correction details:
             Complete prompt with RAG examples
         """
         # Initialize RAG if not already
-        if not self.rag_collection:
+        if not getattr(self, 'rag_index', None):
             self.init_rag()
 
         # Build semantic search query
@@ -256,21 +216,18 @@ Output ONLY the value (no explanations).
         Returns:
             Dict with stats (total corrections, average similarity, etc.)
         """
-        if not self.rag_collection:
+        if not getattr(self, 'rag_index', None):
             return {'initialized': False, 'error': 'RAG not initialized'}
 
         try:
-            total = self.rag_collection.count()
-
-            # Get sample to check quality
-            sample = self.rag_collection.peek(limit=5)
+            total = self.rag_index.count()
 
             return {
                 'initialized': True,
                 'total_corrections': total,
-                'embedding_model': 'all-MiniLM-L6-v2',
-                'embedding_dimension': 384,
-                'sample_tickers': [m.get('ticker', '') for m in sample.get('metadatas', [])][:5]
+                'embedding_model': EMBEDDING_MODEL,
+                'embedding_dimension': EMBEDDING_DIMENSION,
+                'sample_tickers': [m.get('ticker', '') for m in self.rag_index.metadatas[:5]]
             }
 
         except Exception as e:
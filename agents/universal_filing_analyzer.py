@@ -10,6 +10,7 @@ Replaces narrow rule-based routing with intelligent content analysis.
 """
 
 import os
+import re
 import sys
 import json
 from typing import Dict, List, Optional
@@ -19,6 +20,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents.base_agent import BaseAgent
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
+from utils.keyword_matcher import KeywordMatcher
 
 # AI for intelligent analysis
 try:
@@ -32,6 +35,46 @@ except:
     AI_AVAILABLE = False
 
 
+# Filing agents registered by the orchestrator (relevance is judged per agent)
+FILING_AGENT_DESCRIPTIONS = {
+    'DealDetector': 'Detects deal announcements - looks for business combination agreements, merger terms, target companies, deal values',
+    'PipeExtractor': 'Extracts PIPE financing data from deal announcements - institutional investment amounts, prices, lock-up terms',
+    'TrustAccountProcessor': 'Extracts trust account financial data - balance sheets, trust cash, shares outstanding from 10-Q/10-K',
+    'ExtensionMonitor': 'Detects deadline extensions - charter amendments, new termination dates, sponsor deposits',
+    'RedemptionExtractor': 'Extracts redemption data from all filings - 8-K votes, DEFM14A proxies, 10-Q notes, extensions',
+    'S4Processor': 'Analyzes S-4 merger registrations - detailed deal structure, pro forma financials',
+    'ProxyProcessor': 'Processes proxy materials - shareholder vote dates, deal terms, management recommendations',
+    'DelistingDetector': 'Detects delisting events - Form 25 filings indicating liquidation or completion',
+    'CompletionMonitor': 'Detects deal closings - completion of acquisition, final share counts',
+    'FilingProcessor': 'Processes proxy statements and tender offers - vote details, deal terms',
+    'IPODetector': 'Detects IPO closings (424B4) for pre-IPO SPACs - graduates SPACs to main pipeline when IPO completes',
+    'EffectivenessMonitor': 'Tracks S-4 effectiveness - when merger registration becomes effective',
+    'ComplianceMonitor': 'Monitors compliance issues - late filing notices, accounting changes'
+}
+
+# "Item 5.03" / "ITEM 5.07." headings in 8-K text
+ITEM_HEADING_PATTERN = re.compile(r'\bItem\s+(\d\.\d{2})\b', re.IGNORECASE)
+
+EXHIBIT_DELIMITER = '=' * 80
+
+# Keyword fallback: data type -> phrases that suggest it (any one is enough)
+FILING_KEYWORDS = {
+    'deal_announcement': ['business combination agreement', 'merger agreement',
+                          'definitive agreement', 'target company'],
+    'vote_date': ['shareholder meeting', 'special meeting', 'record date'],
+    'redemption_data': ['shares redeemed', 'redemption', 'shares tendered'],
+    'trust_account_data': ['trust account', 'trust balance', 'shares outstanding'],
+    'extension': ['extension', 'charter amendment', 'termination date'],
+    'pipe_data': ['pipe', 'private investment', 'concurrent financing'],
+    'earnout_terms': ['earnout'],
+    'warrant_terms': ['warrant'],
+    'sponsor_terms': ['founder shares', 'sponsor'],
+    'completion_terms': ['closing', 'consummation', 'business combination completed'],
+    'liquidation': ['liquidation', 'dissolution', 'wind down'],
+}
+FILING_KEYWORD_MATCHER = KeywordMatcher(FILING_KEYWORDS)
+
+
 class UniversalFilingAnalyzer(BaseAgent):
     """
     Intelligent filing analyzer that detects ALL relevant data types
@@ -383,6 +426,22 @@ CONTAINS:
 
         return exhibits
 
+    def _sample_content(self, content: str, max_chars: int = 20000) -> str:
+        """
+        Excerpt for analysis: beginning of the main document plus the start of
+        each exhibit appended by the orchestrator (press releases often carry
+        the key details), capped at max_chars
+        """
+        if EXHIBIT_DELIMITER not in content:
+            return content[:max_chars]
+
+        parts = content.split(EXHIBIT_DELIMITER)
+        sample = parts[0][:12000]
+        for part in parts[1:]:
+            if "EXHIBIT " in part[:200]:
+                sample += f"\n{EXHIBIT_DELIMITER}\n" + part[:3000]
+        return sample[:max_chars]
+
     def analyze_filing_content(self, filing: Dict, content: str) -> Dict:
         """
         Analyze filing content and determine what data types are present
@@ -404,7 +463,11 @@ CONTAINS:
                 },
                 'relevance_score': int (0-100),
                 'summary': str,
-                'recommended_agents': List[str]
+                'items': List[str] (8-K items, e.g. ['1.01', '9.01']),
+                'agent_relevance': {agent_name: bool},
+                'relevance_reasoning': {agent_name: str} (agents marked false),
+                'recommended_agents': List[str],
+                'source': 'ai' or 'keywords'
             }
         """
 
@@ -413,8 +476,10 @@ CONTAINS:
             return self._keyword_based_analysis(filing, content)
 
         try:
-            # Limit to first 20k chars for analysis (full content used by extractors)
-            excerpt = content[:20000]
+            # Limit to 20k chars for analysis (full content used by extractors)
+            excerpt = self._sample_content(content)
+            agents_list = '\n'.join(f"- {agent}: {description}"
+                                     for agent, description in FILING_AGENT_DESCRIPTIONS.items())
 
             # Get filing-type-specific guidance from our domain knowledge
             filing_guidance = self._get_filing_type_guidance(filing.get('type'))
@@ -447,6 +512,13 @@ SCAN FOR THESE DATA TYPES (return true/false for each):
 Also provide:
 - **relevance_score** (0-100): How important is this filing for database updates?
 - **summary** (1-2 sentences): What are the key updates in this filing?
+- **items**: 8-K Item numbers reported in this filing (e.g. ["1.01", "9.01"]), empty list for other forms
+- **agent_relevance**: For EACH agent below, does this filing (including exhibits) contain
+  pertinent information it should process? Be conservative - if unsure, mark true.
+- **relevance_reasoning**: One short reason for each agent marked false
+
+Agents:
+{agents_list}
 
 Return JSON:
 {{
@@ -465,14 +537,18 @@ Return JSON:
         "material_updates": true/false
     }},
     "relevance_score": 85,
-    "summary": "Announces merger with XYZ Corp for $500M, shareholder vote on Jan 15, includes $100M PIPE"
+    "summary": "Announces merger with XYZ Corp for $500M, shareholder vote on Jan 15, includes $100M PIPE",
+    "items": ["1.01", "9.01"],
+    "agent_relevance": {{"DealDetector": true, "TrustAccountProcessor": false, ...}},
+    "relevance_reasoning": {{"TrustAccountProcessor": "No balance sheet or trust figures"}}
 }}
 
 Filing Text:
 {excerpt}
 """
 
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'universal_filing_analyzer',
                 model="deepseek-chat",
                 messages=[
                     {"role": "system", "content": "You are an SEC filing analysis expert. Identify all data types present in filings."},
@@ -483,6 +559,10 @@ Filing Text:
             )
 
             analysis = json.loads(response.choices[0].message.content)
+            analysis['source'] = 'ai'
+            analysis['items'] = [str(item).replace('Item ', '').strip() for item in analysis.get('items') or []]
+            analysis.setdefault('agent_relevance', {})
+            analysis.setdefault('relevance_reasoning', {})
 
             # Map data types to recommended agents
             analysis['recommended_agents'] = self._map_data_types_to_agents(
@@ -548,65 +628,27 @@ Filing Text:
         Fallback: keyword-based detection if AI unavailable
         Less accurate but better than nothing
         """
-        content_lower = content.lower()
-
-        data_types = {
-            'deal_announcement': any(k in content_lower for k in [
-                'business combination agreement',
-                'merger agreement',
-                'definitive agreement',
-                'target company'
-            ]),
-            'vote_date': any(k in content_lower for k in [
-                'shareholder meeting',
-                'special meeting',
-                'record date'
-            ]),
-            'redemption_data': any(k in content_lower for k in [
-                'shares redeemed',
-                'redemption',
-                'shares tendered'
-            ]),
-            'trust_account_data': any(k in content_lower for k in [
-                'trust account',
-                'trust balance',
-                'shares outstanding'
-            ]),
-            'extension': any(k in content_lower for k in [
-                'extension',
-                'charter amendment',
-                'termination date'
-            ]),
-            'pipe_data': any(k in content_lower for k in [
-                'pipe',
-                'private investment',
-                'concurrent financing'
-            ]),
-            'earnout_terms': 'earnout' in content_lower,
-            'warrant_terms': 'warrant' in content_lower,
-            'sponsor_terms': any(k in content_lower for k in [
-                'founder shares',
-                'sponsor'
-            ]),
-            'completion_terms': any(k in content_lower for k in [
-                'closing',
-                'consummation',
-                'business combination completed'
-            ]),
-            'liquidation': any(k in content_lower for k in [
-                'liquidation',
-                'dissolution',
-                'wind down'
-            ])
-        }
+        # One pass over the filing for every data type's keywords
+        found = FILING_KEYWORD_MATCHER.labels(content)
+        data_types = {data_type: data_type in found for data_type in FILING_KEYWORDS}
 
         relevance_score = sum(data_types.values()) * 10  # Rough estimate
 
+        items = []
+        if filing.get('type', '').startswith('8-K'):
+            for item in ITEM_HEADING_PATTERN.findall(content[:50000]):
+                if item not in items:
+                    items.append(item)
+
         return {
             'data_types': data_types,
             'relevance_score': min(relevance_score, 100),
             'summary': 'Keyword-based analysis (AI unavailable)',
-            'recommended_agents': self._map_data_types_to_agents(data_types)
+            'items': items,
+            'agent_relevance': {},  # Unknown - every agent stays relevant
+            'relevance_reasoning': {},
+            'recommended_agents': self._map_data_types_to_agents(data_types),
+            'source': 'keywords'
         }
 
 
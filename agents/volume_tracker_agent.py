@@ -19,10 +19,11 @@ Usage:
 import sys
 sys.path.append('/home/ubuntu/spac-research')
 
-import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from database import SessionLocal, SPAC
+from utils.price_bars import PriceBarStore, VOLUME_AVG_SESSIONS
+from utils.volume_spikes import VolumeSpikeDetector, detect_volume_spikes, spike_metrics, MIN_SESSIONS
 from agents.orchestrator_agent_base import OrchestratorAgentBase
 import logging
 
@@ -47,6 +48,15 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
         self.spike_threshold_high = 5.0      # 5x average
         self.spike_threshold_extreme = 10.0  # 10x average
 
+    @property
+    def spike_tiers(self):
+        """(level, minimum ratio) pairs for utils.volume_spikes, highest first"""
+        return (
+            ('EXTREME', self.spike_threshold_extreme),
+            ('HIGH', self.spike_threshold_high),
+            ('MODERATE', self.spike_threshold_moderate),
+        )
+
     def execute(self, task: Dict) -> Dict:
         """
         Execute volume tracking task
@@ -96,15 +106,20 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
 
             logger.info(f"📊 Updating volume tracking for {len(spacs)} SPACs...")
 
+            # One batch download for the whole universe, then one vectorized pass
+            detector = VolumeSpikeDetector(db=db, tiers=self.spike_tiers)
+            detector.store.sync([spac.ticker for spac in spacs])
+            spikes = detector.detect(deal_statuses=['SEARCHING', 'ANNOUNCED'])
+            spikes = spikes[spikes['sessions'] >= MIN_SESSIONS]
+
             updated = 0
             spikes_detected = 0
             spike_details = []
 
             for spac in spacs:
-                metrics = self._calculate_volume_metrics(spac.ticker)
-
-                if not metrics:
+                if spac.ticker not in spikes.index:
                     continue
+                metrics = spike_metrics(spikes.loc[spac.ticker])
 
                 # Update database
                 old_avg = spac.volume_avg_30d
@@ -134,10 +149,6 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
 
                 updated += 1
 
-                if updated % 20 == 0:
-                    db.commit()
-                    logger.info(f"   Processed {updated}/{len(spacs)}...")
-
             db.commit()
             logger.info(f"✅ Volume tracking updated: {updated} SPACs, {spikes_detected} spikes detected")
 
@@ -162,7 +173,7 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
             if not spac:
                 return {'success': False, 'error': f'SPAC {ticker} not found'}
 
-            metrics = self._calculate_volume_metrics(ticker)
+            metrics = self._calculate_volume_metrics(ticker, store=PriceBarStore(db=db))
             if not metrics:
                 return {'success': False, 'error': f'Could not fetch volume data for {ticker}'}
 
@@ -178,64 +189,48 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
         finally:
             db.close()
 
-    def _calculate_volume_metrics(self, ticker: str, period: str = "30d") -> Optional[Dict]:
+    def _calculate_volume_metrics(self, ticker: str, store: Optional[PriceBarStore] = None,
+                                  refresh: bool = True) -> Optional[Dict]:
         """
-        Calculate volume metrics for a ticker
+        Calculate volume metrics for a ticker from the local bar store
+
+        Args:
+            ticker: SPAC ticker
+            store: Bar store to read from (default: a temporary one)
+            refresh: Sync the ticker's bars first (False after a universe-wide sync)
 
         Returns:
             {
                 'avg_volume_30d': float,
                 'current_volume': int,
                 'volume_spike_ratio': float,
+                'volume_zscore': float,
+                'turnover_pct': None,  # needs shares_outstanding (see VolumeSpikeDetector)
                 'is_volume_spike': bool,
                 'spike_level': str  # 'EXTREME' (10x), 'HIGH' (5x), 'MODERATE' (3x), 'NORMAL'
             }
         """
+        owns_store = store is None
+        store = store or PriceBarStore()
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period, auto_adjust=True)
-
-            if hist.empty or len(hist) < 5:
-                logger.warning(f"{ticker}: Insufficient data ({len(hist)} days)")
+            if refresh:
+                store.sync([ticker])
+            volume = store.load_matrix('volume', [ticker], sessions=VOLUME_AVG_SESSIONS + 1)
+            spikes = detect_volume_spikes(volume, tiers=self.spike_tiers)
+
+            if ticker not in spikes.index or spikes.at[ticker, 'sessions'] < MIN_SESSIONS:
+                sessions = int(spikes.at[ticker, 'sessions']) if ticker in spikes.index else 0
+                logger.warning(f"{ticker}: Insufficient data ({sessions} days)")
                 return None
 
-            # Get current volume (most recent day)
-            current_volume = int(hist['Volume'].iloc[-1])
-
-            # Calculate 30-day average (excluding today for comparison)
-            if len(hist) > 1:
-                avg_volume_30d = hist['Volume'].iloc[:-1].mean()
-            else:
-                avg_volume_30d = current_volume
-
-            # Calculate spike ratio
-            spike_ratio = current_volume / avg_volume_30d if avg_volume_30d > 0 else 1.0
-
-            # Classify spike level
-            if spike_ratio >= self.spike_threshold_extreme:
-                spike_level = 'EXTREME'
-                is_spike = True
-            elif spike_ratio >= self.spike_threshold_high:
-                spike_level = 'HIGH'
-                is_spike = True
-            elif spike_ratio >= self.spike_threshold_moderate:
-                spike_level = 'MODERATE'
-                is_spike = True
-            else:
-                spike_level = 'NORMAL'
-                is_spike = False
-
-            return {
-                'avg_volume_30d': round(avg_volume_30d, 2),
-                'current_volume': current_volume,
-                'volume_spike_ratio': round(spike_ratio, 2),
-                'is_volume_spike': is_spike,
-                'spike_level': spike_level
-            }
+            return spike_metrics(spikes.loc[ticker])
 
         except Exception as e:
             logger.error(f"{ticker}: Error calculating volume metrics - {e}")
             return None
+        finally:
+            if owns_store:
+                store.close()
 
     def _trigger_volume_investigation(self, ticker: str, metrics: Dict):
         """
@@ -282,41 +277,13 @@ class VolumeTrackerAgent(OrchestratorAgentBase):
         Returns:
             List of dicts with SPAC info and volume metrics
         """
-        db = SessionLocal()
+        detector = VolumeSpikeDetector(tiers=self.spike_tiers)
 
         try:
-            spacs = db.query(SPAC).filter(
-                SPAC.deal_status == 'SEARCHING',
-                SPAC.volume.isnot(None),
-                SPAC.volume_avg_30d.isnot(None)
-            ).all()
-
-            candidates = []
-
-            for spac in spacs:
-                if spac.volume_avg_30d > 0:
-                    spike_ratio = spac.volume / spac.volume_avg_30d
-
-                    if spike_ratio >= min_spike_ratio:
-                        candidates.append({
-                            'ticker': spac.ticker,
-                            'company': spac.company,
-                            'volume': spac.volume,
-                            'avg_volume_30d': spac.volume_avg_30d,
-                            'spike_ratio': round(spike_ratio, 2),
-                            'premium': spac.premium,
-                            'ipo_proceeds': spac.ipo_proceeds,
-                            'banker': spac.banker,
-                            'sector': spac.sector
-                        })
-
-            # Sort by spike ratio descending
-            candidates.sort(key=lambda x: x['spike_ratio'], reverse=True)
-
-            return candidates
+            return detector.candidates(min_spike_ratio=min_spike_ratio)
 
         finally:
-            db.close()
+            detector.close()
 
 
 if __name__ == "__main__":
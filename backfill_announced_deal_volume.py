@@ -73,6 +73,9 @@ def backfill_announced_deal_volume(days_back=90, commit=True):
             days_collected = 0
             days_failed = 0
 
+            # One download for the whole period into the local bar store
+            tracker.bar_store.ensure_range(spac.ticker, start_date, end_date)
+
             current_date = start_date
             while current_date <= end_date:
                 # Check if we already have this data
@@ -90,7 +93,7 @@ def backfill_announced_deal_volume(days_back=90, commit=True):
                     continue
 
                 # Get volume data
-                volume_data = tracker.get_volume_data(spac.ticker, current_date)
+                volume_data = tracker.get_volume_data(spac.ticker, current_date, download=False)
 
                 if volume_data and volume_data.get('volume'):
                     # Record to database
@@ -16,6 +16,7 @@ import json
 sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
 from utils.expected_close_normalizer import normalize_expected_close
 
 # AI for extraction
@@ -98,7 +99,8 @@ Press release text:
 """
 
     try:
-        response = AI_CLIENT.chat.completions.create(
+        response = cached_completion(
+            AI_CLIENT, 'backfill_expected_close_8k',
             model="deepseek-chat",
             messages=[
                 {"role": "system", "content": "You are an SEC filing analyst. Extract expected closing dates precisely. Return valid JSON."},
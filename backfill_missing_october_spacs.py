@@ -10,6 +10,7 @@ import sys
 sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
 import requests
 from bs4 import BeautifulSoup
 import re
@@ -145,7 +146,8 @@ Text excerpt:
 
 Return ONLY the JSON object, no explanation."""
 
-        response = AI_CLIENT.chat.completions.create(
+        response = cached_completion(
+            AI_CLIENT, 'backfill_missing_spacs',
             model="deepseek-chat",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.0
@@ -16,6 +16,7 @@ import json
 sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -150,7 +151,8 @@ Proxy text:
 """
 
     try:
-        response = AI_CLIENT.chat.completions.create(
+        response = cached_completion(
+            AI_CLIENT, 'backfill_vote_dates',
             model="deepseek-chat",
             messages=[
                 {"role": "system", "content": "You are an SEC filing analyst. Extract dates precisely. Return valid JSON."},
@@ -4,13 +4,12 @@ CIK Resolver - Finds and populates missing CIK numbers
 Ensures all SPACs in database have valid SEC CIK numbers
 """
 
-import requests
-import time
 from bs4 import BeautifulSoup
 import re
 from typing import Optional, Dict
 
 from database import SessionLocal, SPAC
+from utils.sec_http import sec_get
 
 
 class CIKResolver:
@@ -33,7 +32,7 @@ class CIKResolver:
                 'owner': 'exclude'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
 
             # Look for CIK in response
             match = re.search(r'CIK.*?(\d{10})', response.text)
@@ -78,7 +77,6 @@ class CIKResolver:
             if cik and self.verify_cik(cik):
                 print(f"   ✓ Found with variation: '{variation}' -> CIK: {cik}")
                 return cik
-            time.sleep(0.2)  # Rate limiting
 
         return None
 
@@ -86,7 +84,7 @@ class CIKResolver:
         """Search using SEC's company_tickers.json API (most reliable)"""
         try:
             url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
@@ -117,7 +115,7 @@ class CIKResolver:
                 'owner': 'exclude'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
 
             # Look for CIK in response
             match = re.search(r'CIK.*?(\d{10})', response.text)
@@ -140,7 +138,7 @@ class CIKResolver:
                 'owner': 'exclude'
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
 
             # Check if we get a valid company page
             return 'companyName' in response.text and 'No matching' not in response.text
@@ -239,8 +237,6 @@ class CIKResolver:
             else:
                 not_found.append((spac.ticker, spac.company))
 
-            time.sleep(0.5)  # Rate limiting
-
         # Summary
         print("\n" + "=" * 60)
         print("RESOLUTION COMPLETE")
@@ -4,12 +4,14 @@ Daily Volume Tracker
 Collects and stores daily trading volume and turnover rate for all SPACs
 """
 
-import yfinance as yf
 from datetime import datetime, date, timedelta
 from database import SessionLocal, SPAC
 from sqlalchemy import text
 from typing import Optional, List, Dict
-import time
+from utils.price_bars import PriceBarStore
+from utils.volume_spikes import VolumeSpikeDetector, HIGH_TURNOVER_PCT
+
+TRACKED_DEAL_STATUSES = ['SEARCHING', 'ANNOUNCED', 'RUMORED_DEAL']
 
 
 class DailyVolumeTracker:
@@ -17,19 +19,22 @@ class DailyVolumeTracker:
 
     def __init__(self):
         self.db = SessionLocal()
+        self.bar_store = PriceBarStore(db=self.db)
 
     def __del__(self):
         """Cleanup database connection"""
         if hasattr(self, 'db'):
             self.db.close()
 
-    def get_volume_data(self, ticker: str, trade_date: Optional[date] = None) -> Optional[Dict]:
+    def get_volume_data(self, ticker: str, trade_date: Optional[date] = None,
+                        download: bool = True) -> Optional[Dict]:
         """
-        Fetch volume and price data for a ticker
+        Fetch volume and price data for a ticker from the local bar store
 
         Args:
             ticker: SPAC ticker
             trade_date: Date to fetch (default: yesterday for completed trading day)
+            download: Download the surrounding days if the bar is not stored yet
 
         Returns:
             Dict with volume, price data, or None if no data
@@ -39,34 +44,34 @@ class DailyVolumeTracker:
             trade_date = date.today() - timedelta(days=1)
 
         try:
-            # Fetch data for the specific date
-            stock = yf.Ticker(ticker)
-
-            # Get 2 days of data to ensure we have the target date
-            start_date = trade_date - timedelta(days=1)
-            end_date = trade_date + timedelta(days=1)
-
-            hist = stock.history(start=start_date.strftime('%Y-%m-%d'),
-                                end=end_date.strftime('%Y-%m-%d'))
-
-            if hist.empty or trade_date.strftime('%Y-%m-%d') not in hist.index.strftime('%Y-%m-%d').tolist():
+            bars = self.bar_store.bars_on(trade_date, [ticker])
+            if bars.empty and download:
+                # Get 2 days of data to ensure we have the target date
+                self.bar_store.ensure_range(ticker, trade_date - timedelta(days=1),
+                                            trade_date + timedelta(days=1), slack_days=0)
+                bars = self.bar_store.bars_on(trade_date, [ticker])
+
+            if bars.empty:
                 return None
 
-            # Get the specific date's data
-            day_data = hist[hist.index.strftime('%Y-%m-%d') == trade_date.strftime('%Y-%m-%d')].iloc[0]
-
-            return {
-                'volume': int(day_data['Volume']) if day_data['Volume'] > 0 else None,
-                'price_close': float(day_data['Close']),
-                'price_open': float(day_data['Open']),
-                'price_high': float(day_data['High']),
-                'price_low': float(day_data['Low'])
-            }
+            return self._volume_data_from_bar(bars.iloc[0])
 
         except Exception as e:
             print(f"⚠️  {ticker}: Failed to fetch volume data: {e}")
             return None
 
+    @staticmethod
+    def _volume_data_from_bar(bar) -> Dict:
+        """get_volume_data dict from a price_bars row"""
+        volume = bar['volume']
+        return {
+            'volume': int(volume) if volume == volume and volume > 0 else None,
+            'price_close': float(bar['close']),
+            'price_open': float(bar['open']),
+            'price_high': float(bar['high']),
+            'price_low': float(bar['low'])
+        }
+
     def calculate_turnover_rate(self, volume: int, shares_outstanding: int) -> Optional[float]:
         """
         Calculate turnover rate as percentage
@@ -155,7 +160,7 @@ class DailyVolumeTracker:
 
         # Get all active SPACs
         query = self.db.query(SPAC).filter(
-            SPAC.deal_status.in_(['SEARCHING', 'ANNOUNCED', 'RUMORED_DEAL'])
+            SPAC.deal_status.in_(TRACKED_DEAL_STATUSES)
         ).order_by(SPAC.ticker)
 
         if limit:
@@ -165,6 +170,11 @@ class DailyVolumeTracker:
 
         print(f"Found {len(spacs)} active SPACs")
 
+        # One batch download for every SPAC, then one read for the session
+        tickers = [spac.ticker for spac in spacs]
+        self.bar_store.sync(tickers)
+        day_bars = self.bar_store.bars_on(trade_date, tickers)
+
         success_count = 0
         failed_count = 0
         no_data_count = 0
@@ -172,8 +182,11 @@ class DailyVolumeTracker:
         for i, spac in enumerate(spacs, 1):
             print(f"[{i}/{len(spacs)}] {spac.ticker}...", end=" ", flush=True)
 
-            # Get volume data from yfinance
-            volume_data = self.get_volume_data(spac.ticker, trade_date)
+            # Get volume data from the local bar store
+            volume_data = (
+                self._volume_data_from_bar(day_bars.loc[spac.ticker])
+                if spac.ticker in day_bars.index else None
+            )
 
             if volume_data is None or volume_data['volume'] is None:
                 print("No data")
@@ -211,14 +224,11 @@ class DailyVolumeTracker:
                 print("❌ Failed")
                 failed_count += 1
 
-            # Rate limiting
-            time.sleep(0.1)
-
         print(f"\n✅ Complete: {success_count} recorded, {no_data_count} no data, {failed_count} failed")
 
-    def get_high_turnover_spacs(self, days: int = 1, min_turnover: float = 5.0) -> List[Dict]:
+    def get_high_turnover_spacs(self, days: int = 1, min_turnover: float = HIGH_TURNOVER_PCT) -> List[Dict]:
         """
-        Find SPACs with unusually high turnover
+        Find SPACs with unusually high turnover (vectorized over the bar store)
 
         Args:
             days: Number of recent days to check
@@ -227,30 +237,13 @@ class DailyVolumeTracker:
         Returns:
             List of high-turnover SPACs
         """
-        cutoff_date = date.today() - timedelta(days=days)
-
-        result = self.db.execute(text("""
-            SELECT ticker, trade_date, volume, turnover_rate, price_close
-            FROM daily_volume
-            WHERE trade_date >= :cutoff_date
-              AND turnover_rate >= :min_turnover
-            ORDER BY turnover_rate DESC
-            LIMIT 20
-        """), {
-            'cutoff_date': cutoff_date,
-            'min_turnover': min_turnover
-        })
-
-        return [
-            {
-                'ticker': row.ticker,
-                'date': row.trade_date,
-                'volume': row.volume,
-                'turnover_rate': float(row.turnover_rate),
-                'price': float(row.price_close)
-            }
-            for row in result
-        ]
+        detector = VolumeSpikeDetector(db=self.db, store=self.bar_store)
+        return detector.high_turnover(
+            days=days,
+            min_turnover=min_turnover,
+            deal_statuses=TRACKED_DEAL_STATUSES,
+            limit=20
+        )
 
     def get_turnover_history(self, ticker: str, days: int = 30) -> List[Dict]:
         """
@@ -30,6 +30,7 @@ from data_validation_rules import (
 from data_validation_log import DataValidationLogger
 from utils.telegram_notifier import send_telegram_alert
 from utils.sec_filing_fetcher import SECFilingFetcher
+from validation_rule_engine import SetBasedValidationEngine
 
 # AI Setup
 try:
@@ -61,9 +62,79 @@ class LogicalConsistencyValidator:
         self.issues = []
         self.db = SessionLocal()  # For historical price queries
 
+        # Bulk run context (loaded once by preload_bulk_context, None = query per SPAC)
+        self.suppressions = None    # {(ticker, rule_name)}
+        self.prev_prices = None     # {ticker: latest historical price since yesterday}
+        self.market_active = None   # SPACs with price_change_24h updated in last day
+
     def close(self):
         self.db.close()
 
+    def preload_bulk_context(self, spacs: Optional[List] = None) -> None:
+        """
+        Load per-run context once instead of querying per SPAC per rule
+
+        Args:
+            spacs: All SPAC rows (ORM objects or row namespaces) - None when
+                validating a subset, market activity is then counted in SQL
+        """
+        from sqlalchemy import text
+        from utils.validation_suppression import load_active_suppressions
+
+        self.suppressions = load_active_suppressions()
+
+        yesterday = datetime.now() - timedelta(days=1)
+        try:
+            result = self.db.execute(text("""
+                SELECT DISTINCT ON (ticker) ticker, price
+                FROM historical_prices
+                WHERE date >= :yesterday
+                ORDER BY ticker, date DESC
+            """), {'yesterday': yesterday.date()})
+            self.prev_prices = {row[0]: row[1] for row in result}
+        except Exception as e:
+            print(f"  ⚠️  Could not preload historical prices: {e}")
+            self.db.rollback()
+            self.prev_prices = None
+
+        if spacs is None:
+            self.market_active = self.db.query(SPAC).filter(
+                SPAC.price_change_24h.isnot(None),
+                SPAC.last_price_update >= yesterday
+            ).count()
+        else:
+            self.market_active = sum(
+                1 for spac in spacs
+                if spac.price_change_24h is not None
+                and spac.last_price_update is not None
+                and spac.last_price_update >= yesterday
+            )
+
+    def _is_suppressed(self, ticker: str, rule_name: str) -> bool:
+        """Check if validation rule is suppressed for this ticker (preloaded set if available)"""
+        if self.suppressions is not None:
+            suppressed = (ticker, rule_name) in self.suppressions
+        else:
+            try:
+                from sqlalchemy import text
+                result = self.db.execute(
+                    text("""
+                        SELECT COUNT(*) FROM validation_suppressions
+                        WHERE ticker = :ticker
+                          AND rule_name = :rule_name
+                          AND (expires_at IS NULL OR expires_at > NOW())
+                    """),
+                    {'ticker': ticker, 'rule_name': rule_name}
+                )
+                suppressed = result.scalar() > 0
+            except Exception as e:
+                print(f"  ⚠️  Error checking suppression for {ticker}: {e}")
+                return False
+
+        if suppressed:
+            print(f"  ⏭️  Skipping suppressed rule: {rule_name} for {ticker}")
+        return suppressed
+
     def validate_data_types_and_formats(self, spac: SPAC) -> List[Dict]:
         """Rule 1-4, 7: Data type and format validation"""
         issues = []
@@ -560,17 +631,21 @@ class LogicalConsistencyValidator:
 
         # Rule 20: price_change_24h > 20% for pre-deal SPACs (using historical_prices)
         if spac.deal_status == 'SEARCHING':
-            from sqlalchemy import text
-            yesterday = datetime.now() - timedelta(days=1)
-            query = text("""
-                SELECT price
-                FROM historical_prices
-                WHERE ticker = :ticker
-                AND date >= :yesterday
-                ORDER BY date DESC
-                LIMIT 1
-            """)
-            result = self.db.execute(query, {'ticker': spac.ticker, 'yesterday': yesterday.date()}).fetchone()
+            if self.prev_prices is not None:
+                prev = self.prev_prices.get(spac.ticker)
+                result = (prev,) if prev is not None else None
+            else:
+                from sqlalchemy import text
+                yesterday = datetime.now() - timedelta(days=1)
+                query = text("""
+                    SELECT price
+                    FROM historical_prices
+                    WHERE ticker = :ticker
+                    AND date >= :yesterday
+                    ORDER BY date DESC
+                    LIMIT 1
+                """)
+                result = self.db.execute(query, {'ticker': spac.ticker, 'yesterday': yesterday.date()}).fetchone()
 
             if result and result[0]:
                 prev_price = float(result[0])
@@ -932,10 +1007,13 @@ class LogicalConsistencyValidator:
             # If price was updated recently but price_change_24h is null, investigate
             if spac.price and spac.price_change_24h is None:
                 # Count how many other SPACs have valid price_change_24h (market is open)
-                market_active = self.db.query(SPAC).filter(
-                    SPAC.price_change_24h.isnot(None),
-                    SPAC.last_price_update >= datetime.now() - timedelta(days=1)
-                ).count()
+                if self.market_active is not None:
+                    market_active = self.market_active
+                else:
+                    market_active = self.db.query(SPAC).filter(
+                        SPAC.price_change_24h.isnot(None),
+                        SPAC.last_price_update >= datetime.now() - timedelta(days=1)
+                    ).count()
 
                 # For ANNOUNCED deals, always flag NULL price_change (may indicate completion)
                 # For other deals, only flag if market is active
@@ -1165,25 +1243,7 @@ class LogicalConsistencyValidator:
 
         # Check if this issue is suppressed (user confirmed data is correct)
         def is_suppressed(rule_name: str) -> bool:
-            """Check if validation rule is suppressed for this ticker"""
-            try:
-                from sqlalchemy import text
-                result = self.db.execute(
-                    text("""
-                        SELECT COUNT(*) FROM validation_suppressions
-                        WHERE ticker = :ticker
-                          AND rule_name = :rule_name
-                          AND (expires_at IS NULL OR expires_at > NOW())
-                    """),
-                    {'ticker': spac.ticker, 'rule_name': rule_name}
-                )
-                count = result.scalar()
-                if count > 0:
-                    print(f"  ⏭️  Skipping suppressed rule: {rule_name} for {spac.ticker}")
-                return count > 0
-            except Exception as e:
-                print(f"  ⚠️  Error checking suppression for {spac.ticker}: {e}")
-                return False
+            return self._is_suppressed(spac.ticker, rule_name)
 
         # Rule 1: Very old announcements (>18 months = 540 days)
         if days_since_announced > 540 and not is_suppressed('Stale Announced Deal (18+ months)'):
@@ -1738,6 +1798,23 @@ class LogicalConsistencyValidator:
         return issues
 
 
+def business_rule_issue(rule, spac) -> Optional[Dict]:
+    """Run one ValidationRulesEngine rule and convert its result to the validator issue format"""
+    issue = rule.validate(spac)
+    if not issue:
+        return None
+    return {
+        'type': 'business_rule',
+        'severity': issue['severity'].upper(),
+        'ticker': spac.ticker,
+        'field': issue.get('rule'),
+        'rule': issue['rule'],
+        'message': issue['issue'],
+        'auto_fix': None,
+        'current_values': issue.get('current_values', {})
+    }
+
+
 class DataValidatorAgent:
     """
     Main Data Validator Agent
@@ -1791,23 +1868,19 @@ class DataValidatorAgent:
         all_issues.extend(self.consistency_validator.validate_all(spac))
 
         # Business logic rules
-        for rule in self.rules_engine.rules:
-            issue = rule.validate(spac)
-            if issue:
-                # Convert to consistent format
-                all_issues.append({
-                    'type': 'business_rule',
-                    'severity': issue['severity'].upper(),
-                    'ticker': spac.ticker,
-                    'field': issue.get('rule'),
-                    'rule': issue['rule'],
-                    'message': issue['issue'],
-                    'auto_fix': None,
-                    'current_values': issue.get('current_values', {})
-                })
+        all_issues.extend(self._business_rule_issues(spac))
 
         return all_issues
 
+    def _business_rule_issues(self, spac) -> List[Dict]:
+        """Run ValidationRulesEngine rules on one SPAC (ORM object or row namespace)"""
+        issues = []
+        for rule in self.rules_engine.rules:
+            issue = business_rule_issue(rule, spac)
+            if issue:
+                issues.append(issue)
+        return issues
+
     def _assess_fix_confidence(self, spac: SPAC, fix_type: str) -> Tuple[str, str]:
         """
         Assess confidence level for a proposed fix
@@ -2179,22 +2252,34 @@ class DataValidatorAgent:
             print(f"  ❌ Error applying researched fix for {spac.ticker}: {e}")
             return False
 
-    def validate_all_spacs(self):
-        """Validate entire database"""
+    def validate_all_spacs(self, report: bool = True):
+        """
+        Validate entire database
+
+        Uses the set-based rule engine (validation_rule_engine.py): one query
+        loads all SPACs and evaluates SQL rules, pandas predicates select
+        candidate rows, and validate_* methods only run on candidates.
+        ORM objects are only loaded for issues being auto-fixed.
+
+        Args:
+            report: Print the full validation report (False = one-line summary)
+        """
         print(f"\n{'='*80}")
         print(f"DATA VALIDATOR AGENT - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*80}\n")
 
-        spacs = self.db.query(SPAC).all()
+        engine = SetBasedValidationEngine(self.consistency_validator, self.db)
+        results = engine.run()
 
-        print(f"Validating {len(spacs)} SPACs...")
+        print(f"Validated {len(results)} SPACs in {engine.timings['total']:.2f}s")
         print(f"Auto-fix: {'ENABLED' if self.auto_fix else 'DISABLED'}\n")
 
         # Track seen issues to avoid duplicates
         seen_issues = set()
 
-        for spac in spacs:
-            issues = self.validate_spac(spac)
+        for row, consistency_issues in results:
+            issues = consistency_issues + self._business_rule_issues(row)
+            spac = None  # ORM object, loaded only if an auto-fix is attempted
 
             for issue in issues:
                 # Deduplicate: same ticker + field + auto_fix = duplicate
@@ -2211,7 +2296,9 @@ class DataValidatorAgent:
 
                 # Attempt auto-fix if enabled
                 if self.auto_fix and issue.get('auto_fix'):
-                    if self.auto_fix_issue(spac, issue):
+                    if spac is None:
+                        spac = self.db.query(SPAC).filter(SPAC.id == row.id).first()
+                    if spac and self.auto_fix_issue(spac, issue):
                         self.fixes_applied.append({
                             'ticker': spac.ticker,
                             'issue': issue['message'],
@@ -2222,7 +2309,11 @@ class DataValidatorAgent:
         if self.auto_fix and self.fixes_applied:
             self.db.commit()
 
-        self.print_report()
+        if report:
+            self.print_report()
+        else:
+            counts = ', '.join(f"{k}: {len(v)}" for k, v in self.issues_found.items() if v)
+            print(f"Validation: {counts or 'no issues'}")
 
         # Return all issues as a flat list
         all_issues = []
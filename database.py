@@ -94,6 +94,7 @@ class SPAC(Base):
     market_cap = Column(Float)
     yahoo_market_cap = Column(Float)  # Yahoo Finance market cap for validation
     market_cap_variance = Column(Float)  # Variance % between our calc and Yahoo's
+    yahoo_market_cap_checked_at = Column(DateTime)  # When yahoo_market_cap was last fetched
     volume = Column(Integer)  # Daily trading volume
     dollar_volume_24h = Column(Integer)  # Dollar volume traded (price * volume)
     volume_24h = Column(Float)
@@ -30,8 +30,7 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database import SessionLocal, SPAC, MarketSnapshot
-from pre_ipo_database import SessionLocal as PreIPOSessionLocal, PreIPOSPAC
+from utils.dashboard_snapshot import load_snapshot
 
 # Initialize Dash app with Bootstrap theme
 app = dash.Dash(
@@ -48,74 +47,15 @@ server = app.server  # For gunicorn deployment
 # ============================================================================
 
 def load_spac_data():
-    """Load all SPAC data from database"""
-    db = SessionLocal()
-    try:
-        spacs = db.query(SPAC).all()
-        data = []
-        today = datetime.now().date()
-
-        for s in spacs:
-            # Calculate days_to_deadline
-            days_left = None
-            if s.deadline_date:
-                deadline = s.deadline_date.date() if isinstance(s.deadline_date, datetime) else s.deadline_date
-                days_left = (deadline - today).days
-
-            data.append({
-                'ticker': s.ticker,
-                'company': s.company,
-                'price': s.price,
-                'price_change_24h': s.price_change_24h,
-                'premium': s.premium,
-                'trust_value': s.trust_value,
-                'trust_cash': s.trust_cash,
-                'deal_status': s.deal_status,
-                'target': s.target,
-                'expected_close': s.expected_close,
-                'announced_date': s.announced_date,
-                'ipo_date': s.ipo_date,
-                'deadline_date': s.deadline_date,
-                'days_to_deadline': days_left,
-                'banker': s.banker,
-                'sector': s.sector,
-                'deal_value': s.deal_value,
-                'shares_outstanding': s.shares_outstanding,
-                'market_cap': s.market_cap,
-                'warrant_ticker': s.warrant_ticker,
-                'unit_ticker': s.unit_ticker
-            })
-
-        return pd.DataFrame(data)
-    finally:
-        db.close()
+    """Load all SPAC data from the shared dashboard snapshot (no database query)"""
+    return load_snapshot('spacs')
 
 
 def load_premium_history(days=90):
-    """Load historical premium data"""
-    db = SessionLocal()
-    try:
-        cutoff_date = datetime.now().date() - timedelta(days=days)
-
-        snapshots = db.query(MarketSnapshot).filter(
-            MarketSnapshot.snapshot_date >= cutoff_date
-        ).order_by(MarketSnapshot.snapshot_date).all()
-
-        data = []
-        for s in snapshots:
-            data.append({
-                'date': s.snapshot_date,
-                'avg_premium_predeal': s.avg_premium_predeal,
-                'median_premium_predeal': s.median_premium_predeal,
-                'avg_premium_announced': s.avg_premium_announced,
-                'median_premium_announced': s.median_premium_announced,
-                'count_predeal': s.count_predeal,
-                'count_announced': s.count_announced
-            })
-
-        return pd.DataFrame(data)
-    finally:
-        db.close()
+    """Load historical premium data from the shared dashboard snapshot"""
+    cutoff_date = datetime.now().date() - timedelta(days=days)
+    history = load_snapshot('premium_history')
+    return history[history['date'] >= cutoff_date]
 
 
 # ============================================================================
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Filing Processing Service - Long-lived worker pool for SEC filing processing
+
+The SEC monitor used to build a new Orchestrator (agent registry, state store,
+DB sessions, AI clients) for every filing and run filings one at a time. This
+service keeps one Orchestrator for the life of the process and feeds it from a
+priority queue:
+
+- Filing workers (FILING_WORKERS threads) take the most urgent filing first
+  (TaskPriority: CRITICAL → LOW, FIFO within a priority) and run
+  Orchestrator.process_filing
+- Filings for one company (CIK, else ticker) run one at a time in submission
+  order: only the oldest is queued, the rest wait in a per-company chain and
+  are queued when it finishes (an 8-K/A never races its 8-K on the SPAC row)
+- Independent agents of one filing run concurrently on the orchestrator's
+  agent pool (FILING_AGENT_WORKERS threads, see filing_agent_waves)
+- Async agents run on their worker thread's persistent event loop (run_async)
+
+A burst of filings on a busy morning is processed in parallel while deal
+announcements (CRITICAL / HIGH) still go first.
+
+Usage:
+    service = get_filing_service()
+    future = service.submit(filing, classification)    # → concurrent.futures.Future
+    logged = service.process_batch([(filing, classification), ...])
+"""
+
+import itertools
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, List, Optional, Tuple
+
+from agent_orchestrator import Orchestrator, TaskPriority
+
+# Filings processed in parallel
+FILING_WORKERS = int(os.getenv('FILING_WORKERS', '4'))
+
+# Queue rank for shutdown sentinels (after every real priority)
+_SHUTDOWN_RANK = max(priority.value for priority in TaskPriority) + 1
+
+
+def _company_key(filing: Dict) -> Optional[str]:
+    """Key that serializes filings of one company (CIK, else ticker)"""
+    cik = filing.get('cik')
+    if cik:
+        return f"cik:{str(cik).lstrip('0')}"
+    ticker = filing.get('ticker')
+    return f"ticker:{ticker.upper()}" if ticker else None
+
+
+class FilingProcessingService:
+    """Persistent Orchestrator + priority queue + bounded filing worker pool"""
+
+    def __init__(self, orchestrator: Optional[Orchestrator] = None, workers: int = FILING_WORKERS):
+        """
+        Args:
+            orchestrator: Orchestrator to process filings with (default: new one, built once)
+            workers: Number of filings processed concurrently
+        """
+        self.orchestrator = orchestrator or Orchestrator()
+        self._queue: "queue.PriorityQueue[Tuple]" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        # company key -> filings waiting behind the one queued / in flight
+        self._chains: Dict[str, Deque[Tuple]] = {}
+        self._chains_lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"filing-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, filing: Dict, classification: Dict) -> Future:
+        """
+        Queue a filing for processing
+
+        Args:
+            filing: Filing dict from SECFilingMonitor
+            classification: classify_filing() result (priority, agents_needed, ...)
+
+        Returns:
+            Future resolving to process_filing's result (True if logged to news feed)
+        """
+        future = Future()
+        rank = TaskPriority[classification.get('priority', 'MEDIUM')].value
+        item = (rank, next(self._sequence), filing, classification, future)
+
+        key = _company_key(filing)
+        if key is not None:
+            with self._chains_lock:
+                if key in self._chains:
+                    # An earlier filing of this company is pending - run after it
+                    self._chains[key].append(item)
+                    return future
+                self._chains[key] = deque()
+
+        self._queue.put(item)
+        return future
+
+    def _release(self, filing: Dict):
+        """Queue the next filing of this company (if any) once one finishes"""
+        key = _company_key(filing)
+        if key is None:
+            return
+        with self._chains_lock:
+            chain = self._chains.get(key)
+            if chain:
+                next_item = chain.popleft()
+            else:
+                self._chains.pop(key, None)
+                return
+        self._queue.put(next_item)
+
+    def process_batch(self, items: List[Tuple[Dict, Dict]]) -> List[bool]:
+        """
+        Process (filing, classification) pairs in parallel and wait for all
+
+        Returns:
+            process_filing result per item (False if processing raised)
+        """
+        futures = [self.submit(filing, classification) for filing, classification in items]
+        results = []
+        for (filing, _), future in zip(items, futures):
+            try:
+                results.append(bool(future.result()))
+            except Exception as e:
+                print(f"   ❌ Filing processing failed for {filing.get('type')} {filing.get('ticker', filing.get('cik'))}: {e}")
+                results.append(False)
+        return results
+
+    def _worker(self):
+        while True:
+            _, _, filing, classification, future = self._queue.get()
+            try:
+                if future is None:
+                    return
+                try:
+                    if future.set_running_or_notify_cancel():
+                        try:
+                            future.set_result(self.orchestrator.process_filing(filing, classification))
+                        except Exception as e:
+                            future.set_exception(e)
+                finally:
+                    self._release(filing)
+            finally:
+                self._queue.task_done()
+
+    def pending(self) -> int:
+        """Filings waiting in the queue or behind another filing of the same company"""
+        with self._chains_lock:
+            chained = sum(len(chain) for chain in self._chains.values())
+        return self._queue.qsize() + chained
+
+    def shutdown(self, wait: bool = True):
+        """Stop workers after the queued filings are processed"""
+        for _ in self._workers:
+            self._queue.put((_SHUTDOWN_RANK, next(self._sequence), None, None, None))
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+
+_service: Optional[FilingProcessingService] = None
+_service_lock = threading.Lock()
+
+
+def get_filing_service(orchestrator: Optional[Orchestrator] = None) -> FilingProcessingService:
+    """Get the process-wide filing processing service (created on first use)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = FilingProcessingService(orchestrator)
+        return _service
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Incremental Validator - Re-validates only what changed since the last run
+
+Running every validation rule over every SPAC after each price cycle repeats
+work whose inputs did not change. This validator combines:
+
+1. Change feed: SPACs with last_updated / last_price_update newer than the
+   last run, plus tickers with new trust_account_history rows. Run times are
+   naive US/Eastern, the clock write_price_updates stamps prices with (other
+   writers stamp host-local / UTC times, which are not earlier on US or UTC
+   hosts, so their rows are picked up as well)
+2. Rule → field map: SetRule.fields (validation_rule_engine.py) and
+   BUSINESS_RULE_FIELDS below list the spacs columns each rule reads
+3. Input hash per (spac_id, rule) stored in validation_rule_state - a rule is
+   re-run for a SPAC only when the hash of its input columns changed
+
+Time-dependent rules ("days since announcement", deadline passed, ...) can
+change with the clock alone. Their hash includes a time bucket, and the first
+run in each new bucket is a full sweep over all SPACs, so they are re-evaluated
+once per bucket (default hourly). Context shared across SPACs (suppressions,
+previous prices, market activity) is part of the hash and is also picked up
+by the sweep.
+
+Issues per (spac_id, rule) are stored with the state, so the complete issue
+list (same order and deduplication as DataValidatorAgent.validate_all_spacs)
+is available at any time via current_issues(), and each run returns the diff:
+added, resolved and updated issues.
+
+Usage:
+    python3 incremental_validator.py           # Incremental run (sweep when bucket changes)
+    python3 incremental_validator.py --full    # Force full sweep
+    python3 incremental_validator.py --reset   # Drop stored state (next run rebuilds it)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal
+from utils.timezone_helper import now_eastern
+from data_validation_rules import ValidationRulesEngine
+from data_validator_core import LogicalConsistencyValidator, business_rule_issue
+from validation_rule_engine import SET_RULES, SetBasedValidationEngine, SetRule
+
+# Time-dependent rules are re-evaluated once per bucket (full sweep)
+TIME_BUCKET_MINUTES = int(os.getenv('VALIDATION_TIME_BUCKET_MINUTES', '60'))
+
+# spacs columns read by each ValidationRulesEngine rule (data_validation_rules.py)
+BUSINESS_RULE_FIELDS = {
+    'MarketCapVsIPOProceedsRule': ['market_cap', 'ipo_proceeds'],
+    'IPOToDeadlineTimeframeRule': ['ipo_date', 'deadline_date'],
+    'TickerRelationshipRule': ['ticker', 'unit_ticker', 'warrant_ticker', 'right_ticker'],
+    'TrustValueRule': ['trust_value'],
+    'DealStatusConsistencyRule': ['target', 'deal_status', 'announced_date'],
+}
+
+# SPACs changed since :since (row edits, price updates, trust account changes)
+CHANGE_FEED_WHERE = """
+    last_updated > :since
+    OR last_price_update > :since
+    OR ticker IN (SELECT ticker FROM trust_account_history WHERE changed_at > :since)
+"""
+
+SEVERITY_ORDER = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
+
+
+def run_clock() -> datetime:
+    """Current naive US/Eastern time (same clock as last_price_update / last_updated price stamps)"""
+    return now_eastern().replace(tzinfo=None)
+
+
+def time_bucket(now: Optional[datetime] = None) -> str:
+    """Label of the time bucket containing `now` (changes every TIME_BUCKET_MINUTES)"""
+    now = now or run_clock()
+    minutes = (now.hour * 60 + now.minute) // TIME_BUCKET_MINUTES * TIME_BUCKET_MINUTES
+    return f"{now:%Y-%m-%d} {minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _issue_key(ticker: str, rule: str, issue: Dict, occurrence: int) -> Tuple:
+    """Identity of an issue across runs (same rule may report several issues per field)"""
+    return (ticker, rule, issue.get('field'), occurrence)
+
+
+class IncrementalValidator:
+    """
+    Incremental LogicalConsistencyValidator + ValidationRulesEngine runner
+
+    State lives in validation_rule_state (one row per SPAC and rule, including
+    the issues the rule produced) and validation_run_log (one row per run).
+    """
+
+    def __init__(self, db=None):
+        """
+        Args:
+            db: Optional SQLAlchemy session to share (default: own SessionLocal)
+        """
+        self._owns_session = db is None
+        self.db = db or SessionLocal()
+        self.validator = LogicalConsistencyValidator()
+        self.rules_engine = ValidationRulesEngine()
+        self.engine = SetBasedValidationEngine(self.validator, self.db)
+        self._ensure_tables_exist()
+
+        # (name, spacs columns, time dependent, runner) in validate_all_spacs order
+        self.rules = [(rule.method, rule.fields, rule.time_dependent, rule) for rule in SET_RULES]
+        for business_rule in self.rules_engine.rules:
+            name = type(business_rule).__name__
+            self.rules.append((name, BUSINESS_RULE_FIELDS.get(name, []), False, business_rule))
+
+    def _ensure_tables_exist(self):
+        """Create validation_rule_state / validation_run_log tables if they don't exist"""
+        create_tables_sql = """
+        CREATE TABLE IF NOT EXISTS validation_rule_state (
+            spac_id INTEGER NOT NULL,
+            rule VARCHAR(100) NOT NULL,          -- validate_* method or business rule class
+            rule_order INTEGER NOT NULL,         -- position in validate_all_spacs order
+            ticker VARCHAR(10),
+            input_hash VARCHAR(64) NOT NULL,     -- hash of the rule's input columns (+ time bucket)
+            issues JSONB NOT NULL DEFAULT '[]',  -- issues produced by the rule for this SPAC
+            validated_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (spac_id, rule)
+        );
+
+        CREATE TABLE IF NOT EXISTS validation_run_log (
+            id SERIAL PRIMARY KEY,
+            started_at TIMESTAMP NOT NULL,
+            time_bucket VARCHAR(20) NOT NULL,
+            full_sweep BOOLEAN NOT NULL,
+            rows_checked INTEGER,
+            rules_rerun INTEGER,
+            issues_added INTEGER,
+            issues_resolved INTEGER,
+            issues_updated INTEGER,
+            duration_seconds FLOAT
+        );
+        """
+
+        try:
+            self.db.execute(text(create_tables_sql))
+            self.db.commit()
+        except Exception as e:
+            print(f"⚠️  Could not create incremental validation tables: {e}")
+            self.db.rollback()
+
+    def _last_run(self) -> Optional[Dict]:
+        """Most recent run (started_at, time_bucket) or None"""
+        row = self.db.execute(text("""
+            SELECT started_at, time_bucket FROM validation_run_log
+            ORDER BY started_at DESC LIMIT 1
+        """)).mappings().first()
+        return dict(row) if row else None
+
+    def _load_state(self, spac_ids: Optional[List[int]] = None) -> Dict[Tuple[int, str], Dict]:
+        """Stored state for the given SPACs (None = all)"""
+        if spac_ids is None:
+            result = self.db.execute(text("SELECT * FROM validation_rule_state"))
+        elif not spac_ids:
+            return {}
+        else:
+            result = self.db.execute(
+                text("SELECT * FROM validation_rule_state WHERE spac_id = ANY(:ids)"),
+                {'ids': list(spac_ids)}
+            )
+        return {(row['spac_id'], row['rule']): dict(row) for row in result.mappings()}
+
+    def _rule_context(self, name: str, spac) -> object:
+        """Shared (non-row) inputs a rule reads from the bulk context"""
+        if name == 'validate_stale_announced_deals':
+            suppressions = self.validator.suppressions or set()
+            return sorted(rule for ticker, rule in suppressions if ticker == spac.ticker)
+        if name == 'validate_price_vs_nav':
+            prev_prices = self.validator.prev_prices or {}
+            return prev_prices.get(spac.ticker)
+        if name == 'validate_price_trading_status':
+            return (self.validator.market_active or 0) > 10
+        return None
+
+    def _input_hash(self, spac, name: str, fields: List[str], time_dependent: bool, bucket: str) -> str:
+        """Hash of everything a rule reads for one SPAC"""
+        payload = {
+            'ticker': spac.ticker,
+            'fields': {field: getattr(spac, field, None) for field in fields},
+            'context': self._rule_context(name, spac),
+            'bucket': bucket if time_dependent else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def run(self, full: bool = False) -> Dict:
+        """
+        Re-validate changed SPACs and rules
+
+        Args:
+            full: Force a full sweep (otherwise only when the time bucket changed
+                or no previous run exists)
+
+        Returns:
+            Dict with run stats and the issue diff:
+            - added / resolved: lists of issues
+            - updated: list of (old issue, new issue) with changed message/severity
+        """
+        started = time.time()
+        started_at = run_clock()
+        bucket = time_bucket(started_at)
+        last_run = self._last_run()
+        sweep = full or last_run is None or last_run['time_bucket'] != bucket
+
+        if sweep:
+            rows, frame, candidates = self.engine.load()
+        else:
+            rows, frame, candidates = self.engine.load(CHANGE_FEED_WHERE, {'since': last_run['started_at']})
+
+        self.validator.preload_bulk_context(rows if sweep else None)
+        candidates = self.engine.select_candidates(frame, candidates)
+        state = self._load_state(None if sweep else [spac.id for spac in rows])
+
+        added, resolved, updated = [], [], []
+        writes = []
+        rules_rerun = 0
+
+        for spac in rows:
+            for order, (name, fields, time_dependent, runner) in enumerate(self.rules):
+                input_hash = self._input_hash(spac, name, fields, time_dependent, bucket)
+                previous = state.get((spac.id, name))
+                if previous and previous['input_hash'] == input_hash and previous['rule_order'] == order:
+                    continue
+
+                rules_rerun += 1
+                if isinstance(runner, SetRule):
+                    issues = []
+                    if spac.id in candidates[runner.method]:
+                        issues = getattr(self.validator, runner.method)(spac)
+                else:
+                    issue = business_rule_issue(runner, spac)
+                    issues = [issue] if issue else []
+                issues = json.loads(json.dumps(issues, default=str))
+
+                self._diff(spac.ticker, name, previous['issues'] if previous else [], issues,
+                           added, resolved, updated)
+                writes.append({
+                    'spac_id': spac.id,
+                    'rule': name,
+                    'rule_order': order,
+                    'ticker': spac.ticker,
+                    'input_hash': input_hash,
+                    'issues': json.dumps(issues),
+                    'validated_at': started_at,
+                })
+
+        try:
+            if sweep:
+                # SPACs deleted from the table: their issues are resolved
+                live_ids = [spac.id for spac in rows]
+                removed = self.db.execute(text("""
+                    DELETE FROM validation_rule_state
+                    WHERE NOT (spac_id = ANY(:ids))
+                    RETURNING ticker, rule, issues
+                """), {'ids': live_ids}).mappings().all()
+                for row in removed:
+                    self._diff(row['ticker'], row['rule'], row['issues'], [], added, resolved, updated)
+
+            if writes:
+                self.db.execute(text("""
+                    INSERT INTO validation_rule_state (
+                        spac_id, rule, rule_order, ticker, input_hash, issues, validated_at
+                    ) VALUES (
+                        :spac_id, :rule, :rule_order, :ticker, :input_hash, CAST(:issues AS JSONB), :validated_at
+                    )
+                    ON CONFLICT (spac_id, rule) DO UPDATE SET
+                        rule_order = EXCLUDED.rule_order,
+                        ticker = EXCLUDED.ticker,
+                        input_hash = EXCLUDED.input_hash,
+                        issues = EXCLUDED.issues,
+                        validated_at = EXCLUDED.validated_at
+                """), writes)
+
+            stats = {
+                'started_at': started_at,
+                'time_bucket': bucket,
+                'full_sweep': sweep,
+                'rows_checked': len(rows),
+                'rules_rerun': rules_rerun,
+                'issues_added': len(added),
+                'issues_resolved': len(resolved),
+                'issues_updated': len(updated),
+                'duration_seconds': time.time() - started,
+            }
+            self.db.execute(text("""
+                INSERT INTO validation_run_log (
+                    started_at, time_bucket, full_sweep, rows_checked, rules_rerun,
+                    issues_added, issues_resolved, issues_updated, duration_seconds
+                ) VALUES (
+                    :started_at, :time_bucket, :full_sweep, :rows_checked, :rules_rerun,
+                    :issues_added, :issues_resolved, :issues_updated, :duration_seconds
+                )
+            """), stats)
+            self.db.commit()
+        except Exception as e:
+            print(f"⚠️  Could not save incremental validation state: {e}")
+            self.db.rollback()
+            raise
+
+        print(f"🔍 Validation ({'full sweep' if sweep else 'incremental'}): "
+              f"{len(rows)} SPACs, {rules_rerun} rule checks re-run, "
+              f"+{len(added)} / -{len(resolved)} / ~{len(updated)} issues "
+              f"in {stats['duration_seconds']:.2f}s")
+
+        return {**stats, 'added': added, 'resolved': resolved, 'updated': updated}
+
+    @staticmethod
+    def _diff(ticker: str, rule: str, old_issues: List[Dict], new_issues: List[Dict],
+              added: List, resolved: List, updated: List):
+        """Append the differences between a rule's old and new issues for one SPAC"""
+        def keyed(issues):
+            counts, result = {}, {}
+            for issue in issues:
+                field = issue.get('field')
+                counts[field] = counts.get(field, 0) + 1
+                result[_issue_key(ticker, rule, issue, counts[field])] = issue
+            return result
+
+        old, new = keyed(old_issues), keyed(new_issues)
+        for key, issue in new.items():
+            if key not in old:
+                added.append(issue)
+            elif (old[key].get('message'), old[key].get('severity')) != (issue.get('message'), issue.get('severity')):
+                updated.append((old[key], issue))
+        for key, issue in old.items():
+            if key not in new:
+                resolved.append(issue)
+
+    def current_issues(self) -> List[Dict]:
+        """
+        Full current issue list from stored state
+
+        Returns:
+            Issues in the same order and with the same deduplication as
+            DataValidatorAgent.validate_all_spacs (grouped by severity)
+        """
+        result = self.db.execute(text("""
+            SELECT issues FROM validation_rule_state
+            WHERE jsonb_array_length(issues) > 0
+            ORDER BY spac_id, rule_order
+        """))
+
+        by_severity = {severity: [] for severity in SEVERITY_ORDER}
+        seen_issues = set()
+        for (issues,) in result:
+            for issue in issues:
+                issue_key = (issue['ticker'], issue.get('field'), issue.get('auto_fix'))
+                if issue_key in seen_issues:
+                    continue
+                seen_issues.add(issue_key)
+                if issue['severity'] in by_severity:
+                    by_severity[issue['severity']].append(issue)
+
+        return [issue for severity in SEVERITY_ORDER for issue in by_severity[severity]]
+
+    def reset(self):
+        """Drop stored state (next run is a full rebuild)"""
+        self.db.execute(text("DELETE FROM validation_rule_state"))
+        self.db.execute(text("DELETE FROM validation_run_log"))
+        self.db.commit()
+        print("🗑️  Incremental validation state cleared")
+
+    def close(self):
+        self.validator.close()
+        self.rules_engine.close()
+        if self._owns_session:
+            self.db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental SPAC data validation')
+    parser.add_argument('--full', action='store_true', help='Force full sweep')
+    parser.add_argument('--reset', action='store_true', help='Clear stored state before running')
+    parser.add_argument('--list', action='store_true', help='Print current issue list after the run')
+    args = parser.parse_args()
+
+    validator = IncrementalValidator()
+    try:
+        if args.reset:
+            validator.reset()
+        result = validator.run(full=args.full)
+
+        for issue in result['added']:
+            print(f"   ➕ [{issue['severity']}] {issue['ticker']}: {issue['message']}")
+        for issue in result['resolved']:
+            print(f"   ✅ [{issue['severity']}] {issue['ticker']}: {issue['message']}")
+        for old, new in result['updated']:
+            print(f"   🔄 [{new['severity']}] {new['ticker']}: {new['message']}")
+
+        if args.list:
+            issues = validator.current_issues()
+            print(f"\n📋 {len(issues)} current issues")
+            for issue in issues:
+                print(f"   [{issue['severity']}] {issue['ticker']}: {issue['message']}")
+    finally:
+        validator.close()
+
+
+if __name__ == '__main__':
+    main()
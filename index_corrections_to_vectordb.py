@@ -2,8 +2,10 @@
 """
 Index Corrections to Vector Database
 
-One-time script to index your 369 corrections into ChromaDB for RAG retrieval.
-Creates semantic search over all past corrections.
+Indexes corrections into ChromaDB for RAG retrieval. Runs incrementally: only
+corrections not yet in the collection are embedded and added (--rebuild starts
+over). Agents pick up the new rows through utils/correction_index.py without
+restarting.
 """
 
 import os
@@ -16,12 +18,14 @@ sys.path.append('/home/ubuntu/spac-research')
 from database import SessionLocal
 from sqlalchemy import text
 import chromadb
-from chromadb.utils import embedding_functions
 import json
 
-# Use sentence-transformers for embeddings (free, local)
-# Alternative: OpenAI embeddings (costs ~$0.04 for 369 corrections)
-EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # Fast, good quality, free
+# Embeddings come from the shared sentence-transformers service (all-MiniLM-L6-v2,
+# free, local) so indexing and retrieval always use the same model
+from utils.correction_index import (
+    COLLECTION_NAME, EMBEDDING_DIMENSION, EMBEDDING_MODEL,
+    get_correction_index, get_embedding_service
+)
 
 
 class CorrectionIndexer:
@@ -36,18 +40,17 @@ class CorrectionIndexer:
         """
         print(f"🔧 Initializing ChromaDB at {db_path}...")
 
+        self.db_path = db_path
+
         # Create persistent client
         self.client = chromadb.PersistentClient(path=db_path)
 
-        # Use sentence-transformers for embeddings (free, local)
-        self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=EMBEDDING_MODEL
-        )
+        # Embeddings are computed by the shared service and passed explicitly
+        self.embedder = get_embedding_service()
 
         # Create or get collection
         self.collection = self.client.get_or_create_collection(
-            name="spac_corrections",
-            embedding_function=self.embedding_function,
+            name=COLLECTION_NAME,
             metadata={"description": "SPAC data quality corrections for self-learning"}
         )
 
@@ -126,29 +129,36 @@ class CorrectionIndexer:
 
         return "\n".join(text_parts)
 
-    def index_corrections(self, corrections: List[Dict], batch_size: int = 100):
+    def index_corrections(self, corrections: List[Dict], batch_size: int = 100, rebuild: bool = False):
         """
         Index corrections into vector database.
 
         Args:
             corrections: List of correction dicts
             batch_size: Number of corrections to index per batch
+            rebuild: Drop the collection and re-embed everything
         """
-        print(f"\n🔍 Indexing {len(corrections)} corrections...")
-        print(f"   Using embedding model: {EMBEDDING_MODEL}")
-        print(f"   This may take 1-2 minutes...")
-
-        # Clear existing collection (fresh start)
         current_count = self.collection.count()
-        if current_count > 0:
+        if rebuild and current_count > 0:
             print(f"   ⚠️  Clearing {current_count} existing documents")
             # Delete collection and recreate
-            self.client.delete_collection(name="spac_corrections")
+            self.client.delete_collection(name=COLLECTION_NAME)
             self.collection = self.client.create_collection(
-                name="spac_corrections",
-                embedding_function=self.embedding_function,
+                name=COLLECTION_NAME,
                 metadata={"description": "SPAC data quality corrections for self-learning"}
             )
+        elif current_count > 0:
+            # Incremental: skip corrections already indexed
+            existing_ids = set(self.collection.get(include=[])['ids'])
+            corrections = [c for c in corrections if f"correction_{c['id']}" not in existing_ids]
+            print(f"\n   {current_count} corrections already indexed")
+
+        if not corrections:
+            print("✅ No new corrections to index")
+            return
+
+        print(f"\n🔍 Indexing {len(corrections)} corrections...")
+        print(f"   Using embedding model: {EMBEDDING_MODEL}")
 
         # Prepare batches
         for i in range(0, len(corrections), batch_size):
@@ -175,9 +185,10 @@ class CorrectionIndexer:
                 # Unique ID
                 ids.append(f"correction_{correction['id']}")
 
-            # Add to ChromaDB (automatically generates embeddings)
+            # Add to ChromaDB (one embedding batch per chunk)
             self.collection.add(
                 documents=documents,
+                embeddings=self.embedder.embed(documents).tolist(),
                 metadatas=metadatas,
                 ids=ids
             )
@@ -197,21 +208,16 @@ class CorrectionIndexer:
         """
         print(f"\n🔍 Testing search: '{query}'")
 
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results
-        )
+        index = get_correction_index(self.db_path)
+        index.refresh(force=True)
+        results = index.query(query, n_results=n_results)
 
         print(f"\n📋 Top {n_results} similar corrections:")
-        for i, (doc, metadata, distance) in enumerate(zip(
-            results['documents'][0],
-            results['metadatas'][0],
-            results['distances'][0]
-        ), 1):
-            print(f"\n   {i}. Similarity: {1 - distance:.2%}")
-            print(f"      Ticker: {metadata['ticker']}")
-            print(f"      Issue: {metadata['issue_type']}")
-            print(f"      Preview: {doc[:150]}...")
+        for i, correction in enumerate(results, 1):
+            print(f"\n   {i}. Similarity: {correction['similarity']:.2%}")
+            print(f"      Ticker: {correction['ticker']}")
+            print(f"      Issue: {correction['issue_type']}")
+            print(f"      Preview: {correction['document'][:150]}...")
 
     def get_stats(self):
         """Print statistics about indexed corrections"""
@@ -220,7 +226,7 @@ class CorrectionIndexer:
         print(f"\n📊 Vector Database Stats:")
         print(f"   Total corrections indexed: {total}")
         print(f"   Embedding model: {EMBEDDING_MODEL}")
-        print(f"   Embedding dimension: 384")  # all-MiniLM-L6-v2
+        print(f"   Embedding dimension: {EMBEDDING_DIMENSION}")
         print(f"   Storage: ./correction_vector_db/")
 
 
@@ -233,6 +239,8 @@ def main():
                         help='Test search with query after indexing')
     parser.add_argument('--stats-only', action='store_true',
                         help='Just show stats, don\'t re-index')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Drop the collection and re-embed every correction')
 
     args = parser.parse_args()
 
@@ -251,7 +259,7 @@ def main():
         return
 
     # Index
-    indexer.index_corrections(corrections)
+    indexer.index_corrections(corrections, rebuild=args.rebuild)
 
     # Stats
     indexer.get_stats()
@@ -0,0 +1,22 @@
+-- Persistent resolution index for SPAC unit / warrant / rights symbols
+-- Used by price_updater.py (see utils/component_ticker_index.py)
+--
+-- VERIFIED:  verified_symbol returned a quote → only that symbol is requested
+-- CANDIDATE: symbol from 424B4 / press release / SPAC field, not yet quoted
+-- NOT_FOUND: no suffix format quoted → skipped until next_probe_at (1h doubling, max 7d)
+
+CREATE TABLE IF NOT EXISTS component_ticker_index (
+    base_ticker VARCHAR(10) NOT NULL,
+    component VARCHAR(10) NOT NULL,      -- unit / warrant / rights
+    verified_symbol VARCHAR(20),         -- last symbol that quoted (or filing candidate)
+    status VARCHAR(20) NOT NULL,         -- VERIFIED / CANDIDATE / NOT_FOUND
+    failed_attempts INTEGER DEFAULT 0,
+    next_probe_at TIMESTAMP,             -- NOT_FOUND: skip until this time
+    last_verified_at TIMESTAMP,
+    last_probed_at TIMESTAMP,
+    source VARCHAR(50),                  -- price_updater / 424B4 / press_release / spac_field
+    PRIMARY KEY (base_ticker, component)
+);
+
+CREATE INDEX IF NOT EXISTS idx_component_ticker_index_status
+ON component_ticker_index(status);
@@ -0,0 +1,20 @@
+-- Single-pass filing analysis shared by classification, agent routing and news feed
+-- Used by sec_filing_monitor.py / agent_orchestrator.py / utils/filing_logger.py
+-- (see utils/filing_analysis.py)
+--
+-- One row per accession number; analysis holds FilingAnalysis.to_dict():
+-- data_types, relevance_score, priority, summary, items_8k, recommended_agents,
+-- agent_relevance, relevance_reasoning
+
+CREATE TABLE IF NOT EXISTS filing_analysis (
+    accession_number VARCHAR(25) PRIMARY KEY,
+    ticker VARCHAR(10),
+    filing_type VARCHAR(20),
+    priority VARCHAR(10),
+    relevance_score INTEGER,
+    analysis JSONB NOT NULL,             -- FilingAnalysis.to_dict()
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_filing_analysis_ticker
+ON filing_analysis(ticker, created_at);
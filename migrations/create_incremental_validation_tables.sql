@@ -0,0 +1,37 @@
+-- State for incremental validation (see incremental_validator.py)
+--
+-- validation_rule_state: one row per (SPAC, rule) with the hash of the rule's
+-- input columns and the issues it produced. A rule is re-run for a SPAC only
+-- when the hash changes (time-dependent rules include an hourly time bucket).
+-- validation_run_log: one row per run, holds the change feed watermark.
+
+CREATE TABLE IF NOT EXISTS validation_rule_state (
+    spac_id INTEGER NOT NULL,
+    rule VARCHAR(100) NOT NULL,          -- validate_* method or business rule class
+    rule_order INTEGER NOT NULL,         -- position in validate_all_spacs order
+    ticker VARCHAR(10),
+    input_hash VARCHAR(64) NOT NULL,     -- hash of the rule's input columns (+ time bucket)
+    issues JSONB NOT NULL DEFAULT '[]',  -- issues produced by the rule for this SPAC
+    validated_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (spac_id, rule)
+);
+
+CREATE TABLE IF NOT EXISTS validation_run_log (
+    id SERIAL PRIMARY KEY,
+    started_at TIMESTAMP NOT NULL,
+    time_bucket VARCHAR(20) NOT NULL,
+    full_sweep BOOLEAN NOT NULL,
+    rows_checked INTEGER,
+    rules_rerun INTEGER,
+    issues_added INTEGER,
+    issues_resolved INTEGER,
+    issues_updated INTEGER,
+    duration_seconds FLOAT
+);
+
+CREATE INDEX IF NOT EXISTS idx_validation_run_log_started_at
+ON validation_run_log(started_at DESC);
+
+-- Change feed lookup
+CREATE INDEX IF NOT EXISTS idx_trust_account_history_changed_at
+ON trust_account_history(changed_at);
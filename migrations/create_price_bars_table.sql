@@ -0,0 +1,22 @@
+-- Local daily OHLCV store shared by price and volume consumers
+-- Used by price_updater.py, volume_tracker.py, daily_volume_tracker.py,
+-- agents/volume_tracker_agent.py and the sponsor performance scripts
+-- (see utils/price_bars.py)
+--
+-- Backfilled once per ticker (PRICE_BARS_BACKFILL_PERIOD, default 1y), then
+-- appended from the last stored session in one batch download per cycle
+
+CREATE TABLE IF NOT EXISTS price_bars (
+    ticker VARCHAR(20) NOT NULL,
+    trade_date DATE NOT NULL,
+    open DOUBLE PRECISION,
+    high DOUBLE PRECISION,
+    low DOUBLE PRECISION,
+    close DOUBLE PRECISION,
+    volume BIGINT,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (ticker, trade_date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_price_bars_trade_date
+ON price_bars(trade_date);
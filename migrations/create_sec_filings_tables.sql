@@ -0,0 +1,29 @@
+-- Local mirror of EDGAR submissions JSON (data.sec.gov/submissions) per tracked CIK
+-- Used by utils/sec_filing_fetcher.py / sec_data_scraper.py for filing discovery
+-- (see utils/edgar_submissions.py)
+--
+-- sec_filings: one row per (cik, accession number)
+-- sec_submissions_sync: per-CIK sync state for conditional (If-Modified-Since) refresh
+
+CREATE TABLE IF NOT EXISTS sec_filings (
+    cik VARCHAR(10) NOT NULL,            -- no leading zeros
+    accession_number VARCHAR(25) NOT NULL,
+    form VARCHAR(20) NOT NULL,
+    filing_date DATE NOT NULL,
+    report_date DATE,
+    acceptance_datetime TIMESTAMP,
+    primary_document VARCHAR(255),
+    primary_doc_description VARCHAR(255),
+    items VARCHAR(255),                  -- 8-K items, comma separated ('5.03,9.01')
+    PRIMARY KEY (cik, accession_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sec_filings_cik_form_date
+ON sec_filings(cik, form, filing_date DESC);
+
+CREATE TABLE IF NOT EXISTS sec_submissions_sync (
+    cik VARCHAR(10) PRIMARY KEY,
+    last_modified VARCHAR(64),           -- Last-Modified header of the submissions JSON
+    synced_at TIMESTAMP,                 -- NULL = invalidated, re-sync on next lookup
+    filing_count INTEGER
+);
@@ -18,7 +18,7 @@ Usage:
 import os
 import sys
 from datetime import datetime, timedelta, date
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import logging
 
 sys.path.append('/home/ubuntu/spac-research')
@@ -370,88 +370,128 @@ def trigger_volume_spike(
         spike_ratio: Current volume / 30-day average (e.g., 5.2 = 5.2x)
         deal_status: Current deal status ('SEARCHING', 'ANNOUNCED', etc.)
     """
-    db = SessionLocal()
-    try:
-        spac = db.query(SPAC).filter(SPAC.ticker == ticker).first()
+    return trigger_volume_spikes([{
+        'ticker': ticker,
+        'current_volume': current_volume,
+        'avg_volume_30d': avg_volume_30d,
+        'spike_ratio': spike_ratio,
+        'deal_status': deal_status,
+    }]) == 1
 
-        if not spac:
-            logger.warning(f"SPAC {ticker} not found in database")
-            return False
 
-        # Only alert on pre-deal SPACs (volume spikes on announced deals are normal)
-        if deal_status != 'SEARCHING':
-            logger.info(f"⏭️  Skipping volume alert for {ticker} - not searching (status: {deal_status})")
-            return False
+def trigger_volume_spikes(spikes: List[Dict]) -> int:
+    """
+    Batch version of trigger_volume_spike (used after each price/volume cycle).
 
-        # Check if alert already sent for this ticker today
-        alert_key = f"volume_spike_{ticker}"
-        if not should_send_alert('volume_spike', ticker=ticker, dedup_hours=24):
-            logger.info(f"⏭️  Skipping volume spike alert for {ticker} - already sent today")
-            return False
+    All SPACs are loaded in one query and accelerated polling for HIGH and
+    EXTREME spikes is committed once; severity tiers come from
+    utils.volume_spikes.spike_tier so every tracker alerts on the same levels.
 
-        # Determine spike severity
-        if spike_ratio >= 10:
-            severity = "EXTREME"
-            emoji = "🔥"
-        elif spike_ratio >= 5:
-            severity = "HIGH"
-            emoji = "📊"
-            # Enable accelerated SEC polling for 24 hours (might be deal leak)
-            spac.accelerated_polling_until = datetime.now() + timedelta(hours=24)
-            logger.info(f"✅ Enabled 24-hour accelerated polling for {ticker} due to {spike_ratio:.1f}x volume spike")
-        elif spike_ratio >= 3:
-            severity = "MODERATE"
-            emoji = "📈"
-        else:
-            # Don't alert on <3x spikes
-            return False
+    Args:
+        spikes: Dicts with ticker, current_volume, avg_volume_30d, spike_ratio, deal_status
 
-        db.commit()  # last_updated auto-updates via SQLAlchemy
+    Returns:
+        Number of alerts sent
+    """
+    from utils.volume_spikes import spike_tier
 
-        # Build alert message
-        message = f"""{emoji} <b>VOLUME SPIKE - {severity}</b> {emoji}
+    if not spikes:
+        return 0
 
-<b>{ticker}</b> - {spac.company}
-<b>Volume Today:</b> {current_volume:,} ({spike_ratio:.1f}x average)
-<b>30-Day Avg:</b> {avg_volume_30d:,.0f}
-<b>Deal Status:</b> {deal_status or 'SEARCHING'}
-"""
+    db = SessionLocal()
+    try:
+        tickers = [spike['ticker'] for spike in spikes]
+        spacs = {spac.ticker: spac for spac in db.query(SPAC).filter(SPAC.ticker.in_(tickers)).all()}
 
-        # Add context
-        if spac.ipo_proceeds:
-            message += f"<b>IPO Size:</b> {spac.ipo_proceeds}\n"
-        if spac.banker:
-            message += f"<b>Banker:</b> {spac.banker}\n"
-        if spac.sector:
-            message += f"<b>Target Sector:</b> {spac.sector}\n"
+        pending = []
+        for spike in spikes:
+            ticker = spike['ticker']
+            deal_status = spike.get('deal_status')
+            spike_ratio = spike['spike_ratio']
+            spac = spacs.get(ticker)
 
-        # Add investigation recommendations
-        message += f"\n🔍 <b>Possible Causes:</b>\n"
-        message += f"• Deal rumor or leak\n"
-        message += f"• Upcoming announcement\n"
-        message += f"• Sector rotation or market movement\n"
-        message += f"• Social media speculation\n"
+            if not spac:
+                logger.warning(f"SPAC {ticker} not found in database")
+                continue
 
-        if spike_ratio >= 5:
-            message += f"\n⚡ Accelerated SEC polling enabled for 24 hours\n"
+            # Only alert on pre-deal SPACs (volume spikes on announced deals are normal)
+            if deal_status != 'SEARCHING':
+                logger.info(f"⏭️  Skipping volume alert for {ticker} - not searching (status: {deal_status})")
+                continue
 
-        message += f"\n⏰ <b>Detected:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            # Don't alert on <3x spikes
+            severity = spike_tier(spike_ratio)
+            if severity == 'NORMAL':
+                continue
 
-        # Send Telegram alert
-        send_telegram_alert(message)
-        mark_alert_sent('volume_spike', ticker=ticker, message_preview=message)
-        logger.info(f"📱 Telegram alert sent for {ticker} volume spike ({spike_ratio:.1f}x)")
+            # Check if alert already sent for this ticker today
+            if not should_send_alert('volume_spike', ticker=ticker, dedup_hours=24):
+                logger.info(f"⏭️  Skipping volume spike alert for {ticker} - already sent today")
+                continue
 
-        return True
+            if severity in ('EXTREME', 'HIGH'):
+                # Enable accelerated SEC polling for 24 hours (might be deal leak)
+                spac.accelerated_polling_until = datetime.now() + timedelta(hours=24)
+                logger.info(f"✅ Enabled 24-hour accelerated polling for {ticker} due to {spike_ratio:.1f}x volume spike")
+
+            pending.append((spac, spike, severity))
+
+        db.commit()  # last_updated auto-updates via SQLAlchemy
+
+        sent = 0
+        for spac, spike, severity in pending:
+            message = _volume_spike_message(spac, spike, severity)
+            send_telegram_alert(message)
+            mark_alert_sent('volume_spike', ticker=spac.ticker, message_preview=message)
+            logger.info(f"📱 Telegram alert sent for {spac.ticker} volume spike ({spike['spike_ratio']:.1f}x)")
+            sent += 1
+
+        return sent
 
     except Exception as e:
         logger.error(f"Error triggering volume spike alert: {e}")
         db.rollback()
-        return False
+        return 0
     finally:
         db.close()
 
 
+def _volume_spike_message(spac: SPAC, spike: Dict, severity: str) -> str:
+    """Telegram message for one volume spike"""
+    emoji = {'EXTREME': "🔥", 'HIGH': "📊", 'MODERATE': "📈"}[severity]
+    spike_ratio = spike['spike_ratio']
+
+    # Build alert message
+    message = f"""{emoji} <b>VOLUME SPIKE - {severity}</b> {emoji}
+
+<b>{spac.ticker}</b> - {spac.company}
+<b>Volume Today:</b> {spike['current_volume']:,} ({spike_ratio:.1f}x average)
+<b>30-Day Avg:</b> {spike['avg_volume_30d']:,.0f}
+<b>Deal Status:</b> {spike.get('deal_status') or 'SEARCHING'}
+"""
+
+    # Add context
+    if spac.ipo_proceeds:
+        message += f"<b>IPO Size:</b> {spac.ipo_proceeds}\n"
+    if spac.banker:
+        message += f"<b>Banker:</b> {spac.banker}\n"
+    if spac.sector:
+        message += f"<b>Target Sector:</b> {spac.sector}\n"
+
+    # Add investigation recommendations
+    message += f"\n🔍 <b>Possible Causes:</b>\n"
+    message += f"• Deal rumor or leak\n"
+    message += f"• Upcoming announcement\n"
+    message += f"• Sector rotation or market movement\n"
+    message += f"• Social media speculation\n"
+
+    if severity in ('EXTREME', 'HIGH'):
+        message += f"\n⚡ Accelerated SEC polling enabled for 24 hours\n"
+
+    message += f"\n⏰ <b>Detected:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    return message
+
+
 def get_accelerated_polling_tickers() -> list:
     """
     Get list of tickers that need accelerated SEC polling.
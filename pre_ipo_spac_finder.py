@@ -7,7 +7,6 @@ Searches SEC EDGAR for new S-1 filings with SIC code 6770 (Blank Checks/SPACs)
 import os
 import re
 import time
-import requests
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
@@ -17,6 +16,7 @@ load_dotenv()
 
 from pre_ipo_database import SessionLocal, PreIPOSPAC
 from database import SessionLocal as MainSessionLocal, SPAC
+from utils.sec_http import sec_get
 
 # Import AI for S-1 parsing
 try:
@@ -78,7 +78,7 @@ class PreIPOSPACFinder:
             index_url = f"{self.base_url}/Archives/edgar/daily-index/{year}/{quarter}/master.{date_str}.idx"
 
             try:
-                response = requests.get(index_url, headers=self.headers, timeout=10)
+                response = sec_get(index_url, headers=self.headers, timeout=10)
 
                 if response.status_code != 200:
                     if days_ago % 5 == 0:  # Debug: show some failures
@@ -174,8 +174,6 @@ class PreIPOSPACFinder:
                 if days_ago % 5 == 0 and s1_count > 0:  # Debug output every 5 days
                     print(f"   [{date_str}: {s1_count} S-1s, {matched_count} matched]")
 
-                time.sleep(0.15)  # Rate limiting
-
             except Exception as e:
                 # Daily index may not exist for today/weekends
                 if days_ago < 3:  # Only show error for very recent dates
@@ -193,7 +191,7 @@ class PreIPOSPACFinder:
         Checks both main documents and exhibits (S-1s often in exhibits for amendments)
         """
         try:
-            response = requests.get(filing_url, headers=self.headers, timeout=30)
+            response = sec_get(filing_url, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # Check if this is a directory listing (archive path) or document page
@@ -298,7 +296,7 @@ class PreIPOSPACFinder:
 
         try:
             # Fetch S-1 document
-            response = requests.get(s1_url, headers=self.headers, timeout=60)
+            response = sec_get(s1_url, headers=self.headers, timeout=60)
             soup = BeautifulSoup(response.text, 'html.parser')
             text = soup.get_text()
 
@@ -580,6 +578,9 @@ Return JSON only (use null for missing fields, ~60% accuracy acceptable for Prio
         print(f"\n📊 Pre-IPO SPACs in pipeline: {recent}")
         print(f"📊 Total tracked (all time): {total}")
 
+        from utils.dashboard_snapshot import invalidate_dashboard_snapshot
+        invalidate_dashboard_snapshot(['pre_ipo'])
+
     def close(self):
         """Close database connections"""
         self.db.close()
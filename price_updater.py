@@ -16,15 +16,20 @@ Use the orchestrator instead (systemctl status orchestrator)
 """
 
 import os
+import json
 import time
-from datetime import datetime
-from typing import Dict, Optional, List
+from datetime import date, datetime
+from typing import Dict, Optional, List, Sequence
 import logging
+import numpy as np
+import pandas as pd
 import pytz
 
 # Database
 from database import SessionLocal, SPAC
-from sqlalchemy import update
+from sqlalchemy import update, text
+from utils.component_ticker_index import ComponentTickerIndex, COMPONENT_FIELDS
+from utils.price_bars import PriceBarStore, VOLUME_AVG_SESSIONS, quote_cutoff
 
 # Install with: pip install yfinance requests
 try:
@@ -43,6 +48,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Yahoo market cap (one .info request per ticker) is re-checked this often per
+# SPAC, at most MARKET_CAP_CHECKS_PER_RUN tickers per batch update
+MARKET_CAP_CHECK_HOURS = float(os.getenv('PRICE_MARKET_CAP_CHECK_HOURS', '24'))
+MARKET_CAP_CHECKS_PER_RUN = int(os.getenv('PRICE_MARKET_CAP_CHECKS_PER_RUN', '50'))
+
 
 class PriceUpdater:
     """Handles price updates from multiple data sources"""
@@ -60,9 +70,27 @@ class PriceUpdater:
         # API keys from environment
         self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_KEY')
         self.polygon_key = os.getenv('POLYGON_API_KEY')
+
+        self._ticker_index = None
+        self._bar_store = None
+        self._columns_checked = False
         
         logger.info(f"Initialized PriceUpdater with source: {source}")
 
+    @property
+    def ticker_index(self) -> ComponentTickerIndex:
+        """Component ticker resolution index (shares this updater's session)"""
+        if self._ticker_index is None:
+            self._ticker_index = ComponentTickerIndex(db=self.db)
+        return self._ticker_index
+
+    @property
+    def bar_store(self) -> PriceBarStore:
+        """Local daily bar store (shares this updater's session)"""
+        if self._bar_store is None:
+            self._bar_store = PriceBarStore(db=self.db)
+        return self._bar_store
+
     def validate_yahoo_shares(self, ticker: str, yahoo_shares: Optional[int],
                               trust_cash: Optional[float], ipo_proceeds: Optional[str]) -> Optional[int]:
         """
@@ -221,6 +249,17 @@ class PriceUpdater:
         logger.error(f"{spac.ticker}: Cannot determine shares_outstanding")
         return {}
 
+    @staticmethod
+    def get_yahoo_market_cap(ticker: str) -> Optional[float]:
+        """Yahoo's market cap in millions (None if unavailable)"""
+        if not YFINANCE_AVAILABLE:
+            return None
+        try:
+            market_cap = yf.Ticker(ticker).info.get('marketCap')
+        except Exception:
+            return None  # Market cap not available, continue without it
+        return round(market_cap / 1_000_000, 2) if market_cap else None
+
     def get_price_yfinance(self, ticker: str) -> Optional[Dict]:
         """Get price from Yahoo Finance"""
         if not YFINANCE_AVAILABLE:
@@ -228,38 +267,37 @@ class PriceUpdater:
             return None
 
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="2d")  # Get last 2 days for change calculation
+            # Refresh the local bar store (incremental after the first backfill)
+            # and read the latest session plus the 30 before it
+            self.bar_store.sync([ticker])
+            hist = self.bar_store.history(ticker, sessions=VOLUME_AVG_SESSIONS + 1)
 
             if hist.empty:
                 logger.warning(f"No data for {ticker}")
                 return None
+            if hist.index[-1] < quote_cutoff():
+                logger.warning(f"No recent data for {ticker} (last session {hist.index[-1]})")
+                return None
 
-            current_price = float(hist['Close'].iloc[-1])
-            current_volume = int(hist['Volume'].iloc[-1]) if 'Volume' in hist.columns else 0
+            current_price = float(hist['close'].iloc[-1])
+            current_volume = int(hist['volume'].iloc[-1]) if pd.notna(hist['volume'].iloc[-1]) else 0
 
             # Calculate 24h change if we have 2 days of data
             price_change_24h = None
             if len(hist) >= 2:
-                prev_price = float(hist['Close'].iloc[-2])
+                prev_price = float(hist['close'].iloc[-2])
                 price_change_24h = ((current_price - prev_price) / prev_price) * 100
 
             # Calculate 30-day average volume (excluding today for comparison)
             volume_avg_30d = None
-            if 'Volume' in hist.columns and len(hist) > 1:
-                volume_avg_30d = float(hist['Volume'].iloc[:-1].mean())
+            if len(hist) > 1:
+                volume_avg_30d = float(hist['volume'].iloc[:-1].mean())
 
             # Calculate dollar volume (value traded)
             dollar_volume = int(current_price * current_volume) if current_volume else None
 
             # Get Yahoo's market cap for validation (in millions)
-            yahoo_market_cap = None
-            try:
-                info = stock.info
-                if 'marketCap' in info and info['marketCap']:
-                    yahoo_market_cap = round(info['marketCap'] / 1_000_000, 2)  # Convert to millions
-            except:
-                pass  # Market cap not available, continue without it
+            yahoo_market_cap = self.get_yahoo_market_cap(ticker)
 
             # Get current time in EST (without timezone info for database storage)
             est = pytz.timezone('US/Eastern')
@@ -379,6 +417,10 @@ class PriceUpdater:
         """
         Fetch prices for all components: common, unit, warrant, rights
         Returns dict with price data for each available component
+
+        Component symbols come from the component ticker index: a verified
+        symbol costs one request, a component in NOT_FOUND backoff costs none,
+        and suffix formats are only probed for unresolved components.
         """
         components = {}
 
@@ -387,78 +429,27 @@ class PriceUpdater:
         if common_data:
             components['common'] = common_data
 
-        # 2. Units (try multiple formats if primary fails)
-        unit_tickers = []
-        if spac.unit_ticker:
-            # Try stored ticker first
-            unit_tickers.append(spac.unit_ticker)
-
-        # Also try common unit ticker formats (in case stored ticker is wrong)
-        # Most common patterns: TICKERU, TICKER.U, TICKER-UN, TICKER U
-        unit_suffixes = ['U', '.U', '-UN', ' U', '/U', '-U']
-        for suffix in unit_suffixes:
-            potential_ticker = f"{spac.ticker}{suffix}"
-            if potential_ticker not in unit_tickers:
-                unit_tickers.append(potential_ticker)
-
-        for u_ticker in unit_tickers:
-            unit_data = self.get_price(u_ticker)
-            if unit_data:
-                components['unit'] = unit_data
-                # Update unit_ticker in database if we found a different working format
-                if spac.unit_ticker != u_ticker:
-                    logger.info(f"   ✓ Found working unit ticker: {u_ticker} (was: {spac.unit_ticker})")
-                    spac.unit_ticker = u_ticker
-                break
-
-        # 3. Warrants (try multiple formats)
-        warrant_tickers = []
-        if spac.warrant_ticker:
-            # Try stored ticker first
-            warrant_tickers.append(spac.warrant_ticker)
-
-        # Also try common warrant ticker formats
-        # Most common patterns: TICKERW, TICKER.W, TICKER.WS, TICKER WS, TICKER-WT
-        warrant_suffixes = ['W', 'WS', '.W', '.WS', '-WT', '/WS', ' W', ' WS', '-W', '+']
-        for suffix in warrant_suffixes:
-            potential_ticker = f"{spac.ticker}{suffix}"
-            if potential_ticker not in warrant_tickers:
-                warrant_tickers.append(potential_ticker)
-
-        for w_ticker in warrant_tickers:
-            warrant_data = self.get_price(w_ticker)
-            if warrant_data:
-                components['warrant'] = warrant_data
-                # Update warrant_ticker in database if we found a different working format
-                if spac.warrant_ticker != w_ticker:
-                    logger.info(f"   ✓ Found working warrant ticker: {w_ticker} (was: {spac.warrant_ticker or 'NOT SET'})")
-                    spac.warrant_ticker = w_ticker
-                break
-
-        # 4. Rights (try multiple formats)
-        right_tickers = []
-        if spac.right_ticker:
-            # Try stored ticker first
-            right_tickers.append(spac.right_ticker)
-
-        # Also try common rights ticker formats
-        # Most common patterns: TICKERR, TICKER.R, TICKER R
-        right_suffixes = ['R', '.R', ' R', '-R', '/R']
-        for suffix in right_suffixes:
-            potential_ticker = f"{spac.ticker}{suffix}"
-            if potential_ticker not in right_tickers:
-                right_tickers.append(potential_ticker)
-
-        for r_ticker in right_tickers:
-            right_data = self.get_price(r_ticker)
-            if right_data:
-                components['rights'] = right_data
-                # Update right_ticker in database if we found a different working format
-                if spac.right_ticker != r_ticker:
-                    logger.info(f"   ✓ Found working rights ticker: {r_ticker} (was: {spac.right_ticker or 'NOT SET'})")
-                    spac.right_ticker = r_ticker
-                break
+        # 2-4. Units, warrants, rights
+        for component, field in COMPONENT_FIELDS.items():
+            stored_ticker = getattr(spac, field)
+            probed = self.ticker_index.candidates(spac.ticker, component, stored_ticker)
+
+            found = None
+            for candidate in probed:
+                data = self.get_price(candidate)
+                if data:
+                    components[component] = data
+                    found = candidate
+                    break
 
+            self.ticker_index.resolve(spac.ticker, component, probed, {found} if found else set())
+
+            # Update SPAC field if we found a different working format
+            if found and stored_ticker != found:
+                logger.info(f"   ✓ Found working {component} ticker: {found} (was: {stored_ticker or 'NOT SET'})")
+                setattr(spac, field, found)
+
+        self.ticker_index.flush()
         return components
 
     def update_single_spac(self, ticker: str) -> bool:
@@ -619,39 +610,406 @@ class PriceUpdater:
             self.db.rollback()
             return False
     
-    def update_all_spacs(self, delay: float = 0.2) -> Dict[str, int]:
+    # ========================================================================
+    # Batch Engine - whole universe from one bar store sync
+    # ========================================================================
+
+    def load_price_universe(self, deal_statuses: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Load the columns needed for pricing into a DataFrame (one row per SPAC)
+
+        Args:
+            deal_statuses: Only load SPACs with these deal statuses (None = all)
+        """
+        if not self._columns_checked:
+            # Added for check_market_caps - existing tables don't have it yet
+            self.db.execute(text(
+                "ALTER TABLE spacs ADD COLUMN IF NOT EXISTS yahoo_market_cap_checked_at TIMESTAMP"
+            ))
+            self.db.commit()
+            self._columns_checked = True
+
+        query = """
+            SELECT id, ticker, unit_ticker, warrant_ticker, right_ticker,
+                   trust_value, shares_outstanding, founder_shares,
+                   warrant_ratio, warrant_exercise_price, yahoo_market_cap_checked_at
+            FROM spacs
+        """
+        params = {}
+        if deal_statuses:
+            query += " WHERE deal_status = ANY(:statuses)"
+            params['statuses'] = list(deal_statuses)
+
+        return pd.read_sql(text(query), self.db.bind, params=params)
+
+    def download_quotes(self, tickers: Sequence[str], batch_size: int = 200,
+                        delay_seconds: float = 1.0) -> pd.DataFrame:
+        """
+        Sync daily bars for many tickers into the local bar store and compute quote metrics
+
+        Only sessions since each ticker's last stored bar are downloaded (new
+        tickers are backfilled once), then the last 31 sessions are read back
+        from the store. Tickers whose last bar is older than QUOTE_MAX_AGE
+        (delisted, or every download failed) are left out.
+
+        Args:
+            tickers: Tickers to download
+            batch_size: Tickers per yf.download call
+            delay_seconds: Pause between download calls (Yahoo rate limits)
+
+        Returns:
+            DataFrame indexed by ticker (see compute_quote_metrics)
         """
-        Update all SPACs in database
+        tickers = sorted(set(t for t in tickers if t))
+        self.bar_store.sync(tickers, batch_size=batch_size, delay_seconds=delay_seconds)
+
+        sessions = VOLUME_AVG_SESSIONS + 1
+        close = self.bar_store.load_matrix('close', tickers, sessions=sessions)
+        volume = self.bar_store.load_matrix('volume', tickers, sessions=sessions)
+        return self.compute_quote_metrics(close, volume, fresh_since=quote_cutoff())
+
+    @staticmethod
+    def compute_quote_metrics(close: pd.DataFrame, volume: pd.DataFrame,
+                              fresh_since: Optional[date] = None) -> pd.DataFrame:
+        """
+        Compute quote metrics for every ticker at once from (date x ticker) frames
+
+        Each ticker's "latest" row is its last non-null close, so tickers that
+        didn't trade today still get their most recent price. With fresh_since,
+        tickers whose latest close is before that date are dropped.
+
+        Returns:
+            DataFrame indexed by ticker with columns: price, prev_close, volume,
+            price_change_24h, volume_avg_30d (30 sessions before latest), dollar_volume
+        """
+        columns = ['price', 'prev_close', 'volume', 'price_change_24h', 'volume_avg_30d', 'dollar_volume']
+        if close.empty:
+            return pd.DataFrame(columns=columns, dtype=float)
+
+        close = close.loc[:, ~close.columns.duplicated()]
+        volume = volume.loc[:, ~volume.columns.duplicated()].reindex_like(close)
+
+        valid = close.notna()
+        # Number of valid sessions at or after each row: 1 = latest, 2 = previous, ...
+        sessions_from_end = valid.iloc[::-1].cumsum().iloc[::-1].where(valid)
+
+        price = close.where(sessions_from_end == 1).max()
+        prev_close = close.where(sessions_from_end == 2).max()
+        latest_volume = volume.where(sessions_from_end == 1).max().fillna(0)
+        volume_avg_30d = volume.where((sessions_from_end >= 2) & (sessions_from_end <= 31)).mean()
+
+        metrics = pd.DataFrame({
+            'price': price,
+            'prev_close': prev_close,
+            'volume': latest_volume,
+            'price_change_24h': (price - prev_close) / prev_close * 100,
+            'volume_avg_30d': volume_avg_30d,
+            'dollar_volume': price * latest_volume,
+        })
+        metrics = metrics[metrics['price'].notna()]
+        if fresh_since is not None:
+            last_session = valid.iloc[::-1].idxmax().reindex(metrics.index)
+            metrics = metrics[last_session >= pd.Timestamp(fresh_since)]
+        return metrics.replace([np.inf, -np.inf], np.nan)
+
+    @staticmethod
+    def _parse_warrant_ratio(value) -> float:
+        """Parse warrant_ratio ("1/3", "0.333", ...) - 1/3 if unparseable"""
+        try:
+            if '/' in str(value):
+                numerator, denominator = str(value).split('/', 1)
+                return float(numerator) / float(denominator)
+            return float(value)
+        except (TypeError, ValueError, ZeroDivisionError):
+            return 0.333
+
+    @classmethod
+    def _warrant_dilution(cls, universe: pd.DataFrame, common_price: pd.Series) -> pd.Series:
+        """Shares added by in-the-money warrants (treasury method), 0 when out of the money"""
+        shares = pd.to_numeric(universe['shares_outstanding'], errors='coerce')
+        strike = pd.to_numeric(universe['warrant_exercise_price'], errors='coerce')
+        ratio = universe['warrant_ratio'].map(cls._parse_warrant_ratio)
+        return (shares * ratio * (common_price - strike) / common_price).where(
+            universe['warrant_ratio'].notna() & (common_price > strike), 0.0
+        )
+
+    def compute_price_updates(self, universe: pd.DataFrame, quotes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute database updates for every SPAC with column operations
+
+        Unit split detection (from the original batch updater):
+        - Both unit and common trading: split once common volume >= unit volume
+        - Only unit trading: not split; only common trading: split
+        Common-share fields (price, premium, volume, market cap) are only written
+        once units have split; unit/warrant/rights prices are written whenever quoted.
+
+        Returns:
+            DataFrame with one row per SPAC to update (NaN = leave column unchanged)
+        """
+        def component(column: str, field: str) -> pd.Series:
+            return quotes[field].reindex(universe[column].values).set_axis(universe.index)
+
+        common_price = component('ticker', 'price')
+        common_volume = component('ticker', 'volume')
+        unit_price = component('unit_ticker', 'price')
+        unit_volume = component('unit_ticker', 'volume')
+
+        common_has = common_price.notna()
+        unit_has = unit_price.notna()
+        units_split = common_has & (~unit_has | (unit_volume.fillna(0) <= common_volume.fillna(0)))
+
+        # Premium vs NAV (default $10.00)
+        nav = pd.to_numeric(universe['trust_value'], errors='coerce').fillna(10.0)
+        premium = (common_price - nav) / nav * 100
+
+        # Fully diluted market cap: (public + founder + ITM warrant dilution) x price
+        shares = pd.to_numeric(universe['shares_outstanding'], errors='coerce')
+        founder = pd.to_numeric(universe['founder_shares'], errors='coerce')
+        base_shares = (shares + founder).where(founder > 1_000_000)
+        dilution = self._warrant_dilution(universe, common_price)
+        market_cap = (common_price * (base_shares + dilution) / 1_000_000).round(2)
+
+        updates = pd.DataFrame({
+            'id': universe['id'],
+            'price': common_price.round(2).where(units_split),
+            'common_price': common_price.round(2),
+            'premium': premium.round(2).where(units_split),
+            'price_change_24h': component('ticker', 'price_change_24h').round(2).where(units_split),
+            'volume': common_volume.where(units_split),
+            'volume_avg_30d': component('ticker', 'volume_avg_30d').round(2).where(units_split),
+            'dollar_volume_24h': component('ticker', 'dollar_volume').where(units_split),
+            'market_cap': market_cap.where(units_split),
+            'unit_price': unit_price.round(2),
+            'warrant_price': component('warrant_ticker', 'price').round(2),
+            'rights_price': component('right_ticker', 'price').round(2),
+        })
+
+        price_columns = ['price', 'common_price', 'unit_price', 'warrant_price', 'rights_price']
+        return updates[updates[price_columns].notna().any(axis=1)]
+
+    def write_price_updates(self, updates: pd.DataFrame, updated_at: datetime) -> int:
+        """
+        Write all price updates with a single UPDATE ... FROM json_to_recordset statement
+
+        NULL values keep the existing column value (COALESCE).
+
+        Returns:
+            Number of rows updated
+        """
+        if updates.empty:
+            return 0
+
+        sql_types = {'id': 'integer', 'volume': 'bigint', 'dollar_volume_24h': 'bigint'}
+        records = []
+        for row in updates.itertuples(index=False):
+            record = {}
+            for column, value in zip(updates.columns, row):
+                if pd.isna(value):
+                    record[column] = None
+                elif column in sql_types:
+                    record[column] = int(round(float(value)))
+                else:
+                    record[column] = float(value)
+            records.append(record)
+
+        value_columns = [c for c in updates.columns if c != 'id']
+        set_clause = ',\n                '.join(f"{c} = COALESCE(v.{c}, s.{c})" for c in value_columns)
+        column_types = ', '.join(f"{c} {sql_types.get(c, 'double precision')}" for c in updates.columns)
+
+        result = self.db.execute(text(f"""
+            UPDATE spacs AS s SET
+                {set_clause},
+                last_price_update = :updated_at,
+                last_updated = :updated_at
+            FROM json_to_recordset(CAST(:rows AS json)) AS v({column_types})
+            WHERE s.id = v.id
+        """), {'rows': json.dumps(records), 'updated_at': updated_at})
+        self.db.commit()
+
+        return result.rowcount
+
+    def check_market_caps(self, universe: pd.DataFrame, updates: pd.DataFrame, checked_at: datetime,
+                          limit: int = MARKET_CAP_CHECKS_PER_RUN) -> int:
+        """
+        Compare computed market caps with Yahoo's for SPACs not checked in MARKET_CAP_CHECK_HOURS
+
+        Sets yahoo_market_cap / market_cap_variance and logs the share-count
+        warning of update_single_spac. Yahoo counts public + sponsor shares
+        (from the last SEC filing) but no warrants, so the expected variance
+        is the in-the-money warrant dilution; anything >10% beyond that points
+        at redemptions or stale Yahoo data. At most `limit` tickers (oldest
+        check first) are fetched per call.
+
+        Returns:
+            Number of SPACs checked
+        """
+        if updates.empty or not YFINANCE_AVAILABLE:
+            return 0
+
+        rows = universe.loc[updates.index].assign(
+            market_cap=updates['market_cap'], common_price=updates['common_price']
+        )
+        last_checked = pd.to_datetime(rows['yahoo_market_cap_checked_at'])
+        due = rows[
+            rows['market_cap'].notna() & pd.to_numeric(rows['shares_outstanding'], errors='coerce').gt(0) &
+            (last_checked.isna() | (last_checked < checked_at - pd.Timedelta(hours=MARKET_CAP_CHECK_HOURS)))
+        ]
+        due = due.loc[last_checked[due.index].sort_values(na_position='first').index[:limit]]
+        if due.empty:
+            return 0
+
+        shares = pd.to_numeric(due['shares_outstanding'], errors='coerce')
+        founder = pd.to_numeric(due['founder_shares'], errors='coerce')
+        base_shares = shares + founder.fillna(shares * 0.25)  # 25% fallback
+        expected = self._warrant_dilution(due, due['common_price']) / base_shares * 100
+
+        records = []
+        for row in due.itertuples():
+            yahoo_market_cap = self.get_yahoo_market_cap(row.ticker)
+            variance = None
+            if yahoo_market_cap:
+                variance = round((row.market_cap - yahoo_market_cap) / yahoo_market_cap * 100, 1)
+                expected_variance = expected[row.Index]
+                if abs(variance - expected_variance) > 10:  # >10% difference is suspicious
+                    logger.warning(
+                        f"{row.ticker} market cap variance: {variance:.1f}% (expected ~{expected_variance:.1f}% "
+                        f"from warrant dilution). Our: ${row.market_cap}M, Yahoo: ${yahoo_market_cap}M. "
+                        f"May indicate redemptions or stale Yahoo data."
+                    )
+            records.append({'id': int(row.id), 'yahoo_market_cap': yahoo_market_cap, 'variance': variance})
+
+        self.db.execute(text("""
+            UPDATE spacs SET
+                yahoo_market_cap = COALESCE(:yahoo_market_cap, yahoo_market_cap),
+                market_cap_variance = COALESCE(:variance, market_cap_variance),
+                yahoo_market_cap_checked_at = :checked_at
+            WHERE id = :id
+        """), [dict(record, checked_at=checked_at) for record in records])
+        self.db.commit()
+        return len(records)
+
+    def plan_component_probes(self, universe: pd.DataFrame) -> Dict:
+        """
+        Get symbols to download for every SPAC component this cycle
+
+        Returns:
+            Dict (row index, component) -> candidate symbols (see ComponentTickerIndex.candidates)
+        """
+        now = datetime.now()
+        probes = {}
+        for row in universe.itertuples():
+            for component, field in COMPONENT_FIELDS.items():
+                stored = getattr(row, field)
+                probes[(row.Index, component)] = self.ticker_index.candidates(
+                    row.ticker, component, stored if isinstance(stored, str) else None, now=now
+                )
+        return probes
+
+    def resolve_component_tickers(self, universe: pd.DataFrame, probes: Dict, quoted: set) -> pd.DataFrame:
+        """
+        Record probe outcomes in the index and point universe columns at the working symbols
+
+        SPAC records whose stored symbol differs from the working one are corrected.
+
+        Returns:
+            Copy of universe with unit/warrant/right ticker columns resolved (None = no quote)
+        """
+        now = datetime.now()
+        resolved = universe.copy()
+        corrections = {field: [] for field in COMPONENT_FIELDS.values()}
+
+        for (row_index, component), probed in probes.items():
+            field = COMPONENT_FIELDS[component]
+            base_ticker = universe.at[row_index, 'ticker']
+            symbol = self.ticker_index.resolve(base_ticker, component, probed, quoted, now=now)
+            stored = universe.at[row_index, field]
+            resolved.at[row_index, field] = symbol
+
+            if symbol and symbol != stored:
+                logger.info(f"   ✓ {base_ticker}: found working {component} ticker {symbol} (was: {stored or 'NOT SET'})")
+                corrections[field].append({'id': int(universe.at[row_index, 'id']), 'symbol': symbol})
+
+        self.ticker_index.flush()
+
+        for field, rows in corrections.items():
+            if rows:
+                self.db.execute(text(f"UPDATE spacs SET {field} = :symbol WHERE id = :id"), rows)
+        self.db.commit()
+
+        return resolved
+
+    def batch_update_prices(self, deal_statuses: Optional[Sequence[str]] = ('SEARCHING', 'ANNOUNCED'),
+                            batch_size: int = 200, delay_seconds: float = 1.0) -> Dict[str, int]:
+        """
+        Update prices for the whole universe: load → batch download → vectorized metrics → one UPDATE
+
+        Unit/warrant/rights symbols come from the component ticker index:
+        verified symbols are downloaded alone, unresolved components add their
+        suffix variants to the same batch download, NOT_FOUND components in
+        backoff are skipped. Yahoo market caps are re-checked for a few SPACs
+        per run (see check_market_caps).
+
+        Args:
+            deal_statuses: Only update SPACs with these deal statuses (None = all)
+            batch_size: Tickers per yf.download call
+            delay_seconds: Pause between download calls
+
+        Returns:
+            Dict with counts of total/successful/failed updates
+        """
+        start = time.time()
+        universe = self.load_price_universe(deal_statuses)
+
+        probes = self.plan_component_probes(universe)
+        probe_tickers = [symbol for probed in probes.values() for symbol in probed]
+        tickers = pd.concat([universe['ticker'], pd.Series(probe_tickers, dtype=object)]).dropna().unique().tolist()
+
+        logger.info(f"📊 Batch updating prices for {len(universe)} SPACs ({len(tickers)} component tickers)...")
+
+        quotes = self.download_quotes(tickers, batch_size=batch_size, delay_seconds=delay_seconds)
+        universe = self.resolve_component_tickers(universe, probes, set(quotes.index))
+        updates = self.compute_price_updates(universe, quotes)
+
+        est = pytz.timezone('US/Eastern')
+        now_est = datetime.now(est).replace(tzinfo=None)
+        updated = self.write_price_updates(updates, now_est)
+
+        try:
+            checked = self.check_market_caps(universe, updates, now_est)
+            if checked:
+                logger.info(f"   Checked Yahoo market cap for {checked} SPACs")
+        except Exception as e:
+            logger.warning(f"Market cap check failed: {e}")
+            self.db.rollback()
+
+        stats = {
+            'total': len(universe),
+            'successful': updated,
+            'failed': len(universe) - updated
+        }
+        logger.info(f"   ✅ Updated {updated}/{len(universe)} SPACs in {time.time() - start:.1f}s "
+                    f"({len(quotes)}/{len(tickers)} tickers quoted)")
+
+        # Republish dashboard snapshot so viewers see the committed prices
+        if updated:
+            from utils.dashboard_snapshot import invalidate_dashboard_snapshot
+            invalidate_dashboard_snapshot(['spacs', 'premium_history'])
+
+        return stats
+
+    def update_all_spacs(self, delay: float = 1.0) -> Dict[str, int]:
+        """
+        Update all SPACs in database (batch engine)
         
         Args:
-            delay: Delay between requests in seconds (to respect rate limits)
+            delay: Delay between batch downloads in seconds (to respect rate limits)
         
         Returns:
             Dict with counts of successful/failed updates
         """
         logger.info("Starting update of all SPACs...")
-        
-        # Get all tickers
-        spacs = self.db.query(SPAC).all()
-        tickers = [s.ticker for s in spacs]
-        
-        stats = {
-            'total': len(tickers),
-            'successful': 0,
-            'failed': 0
-        }
-        
-        for i, ticker in enumerate(tickers, 1):
-            logger.info(f"Updating {i}/{stats['total']}: {ticker}")
-            
-            if self.update_single_spac(ticker):
-                stats['successful'] += 1
-            else:
-                stats['failed'] += 1
-            
-            # Delay to respect rate limits
-            if i < len(tickers):
-                time.sleep(delay)
+
+        stats = self.batch_update_prices(deal_statuses=None, delay_seconds=delay)
         
         logger.info(f"""
         ✅ Update Complete!
@@ -673,35 +1031,14 @@ class PriceUpdater:
             logger.warning(f"Price spike monitoring failed: {e}")
             stats['price_alerts'] = 0
 
-        # Check for volume spikes on pre-deal SPACs
+        # Check for volume spikes on pre-deal SPACs (bars were just synced)
         try:
-            from orchestrator_trigger import trigger_volume_spike
+            from utils.volume_spikes import VolumeSpikeDetector
             logger.info("\n📊 Checking for volume spikes on pre-deal SPACs...")
 
-            # Get pre-deal SPACs with volume data
-            spacs = self.db.query(SPAC).filter(
-                SPAC.deal_status == 'SEARCHING',
-                SPAC.volume.isnot(None),
-                SPAC.volume_avg_30d.isnot(None),
-                SPAC.volume_avg_30d > 0
-            ).all()
-
-            volume_alerts = 0
-            for spac in spacs:
-                # Calculate spike ratio
-                spike_ratio = spac.volume / spac.volume_avg_30d
-
-                # Alert on 3x+ spikes
-                if spike_ratio >= 3.0:
-                    success = trigger_volume_spike(
-                        ticker=spac.ticker,
-                        current_volume=spac.volume,
-                        avg_volume_30d=spac.volume_avg_30d,
-                        spike_ratio=spike_ratio,
-                        deal_status=spac.deal_status
-                    )
-                    if success:
-                        volume_alerts += 1
+            detector = VolumeSpikeDetector(db=self.db, store=self.bar_store)
+            spikes = detector.detect(deal_statuses=['SEARCHING'])
+            volume_alerts = detector.trigger_alerts(spikes)
 
             if volume_alerts > 0:
                 logger.info(f"✅ Sent {volume_alerts} volume spike alert(s)")
@@ -711,6 +1048,32 @@ class PriceUpdater:
             logger.warning(f"Volume spike monitoring failed: {e}")
             stats['volume_alerts'] = 0
 
+        # Re-validate the database against fresh prices (set-based rule engine)
+        if os.getenv('VALIDATE_AFTER_PRICE_UPDATE', 'true').lower() == 'true':
+            try:
+                from incremental_validator import IncrementalValidator
+                logger.info("\n🔎 Validating changed SPACs after price update...")
+                validator = IncrementalValidator()
+                try:
+                    result = validator.run()
+                    stats['validation_issues_added'] = result['issues_added']
+                    stats['validation_issues_resolved'] = result['issues_resolved']
+                finally:
+                    validator.close()
+            except Exception as e:
+                logger.warning(f"Post-update validation failed: {e}")
+
+        # Rescore the universe against fresh prices and volumes (batch scorer)
+        if os.getenv('RESCORE_AFTER_PRICE_UPDATE', 'true').lower() == 'true':
+            try:
+                from agents.batch_scorer import BatchScorer
+                logger.info("\n🎯 Rescoring opportunities after price update...")
+                scores = BatchScorer(db=self.db).run()
+                stats['rescored'] = len(scores)
+            except Exception as e:
+                self.db.rollback()
+                logger.warning(f"Post-update rescoring failed: {e}")
+
         return stats
     
     def update_specific_tickers(self, tickers: List[str], delay: float = 0.2) -> Dict[str, int]:
@@ -732,6 +1095,8 @@ class PriceUpdater:
     
     def close(self):
         """Close database connection"""
+        if self._ticker_index:
+            self._ticker_index.flush()
         self.db.close()
 
 
@@ -758,8 +1123,8 @@ def main():
     parser.add_argument(
         '--delay',
         type=float,
-        default=0.2,
-        help='Delay between requests in seconds (default: 0.2)'
+        default=1.0,
+        help='Delay between batch downloads in seconds (default: 1.0)'
     )
     
     args = parser.parse_args()
@@ -10,6 +10,7 @@ import sys
 sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
+from utils.sponsor_resolver import get_sponsor_families
 import json
 from typing import Dict, List, Optional
 
@@ -26,36 +27,11 @@ class SponsorFamilyMapper:
 
     def _load_seed_file(self) -> List[Dict]:
         """Load sponsor families seed file"""
-        with open('data/sponsor_families_seed.json', 'r') as f:
-            return json.load(f)
+        return get_sponsor_families().families
 
     def find_family(self, sponsor_name: str) -> Optional[Dict]:
-        """Find which family a sponsor belongs to"""
-        if not sponsor_name:
-            return None
-
-        sponsor_lower = sponsor_name.lower()
-
-        # Check each family
-        for family in self.families:
-            # Check sponsor_variations
-            for variation in family['sponsor_variations']:
-                if variation.lower() in sponsor_lower:
-                    return family
-
-            # Check principals (for cases like "Michael Klein" in sponsor name)
-            for principal in family['principals']:
-                if principal.lower() in sponsor_lower:
-                    return family
-
-            # Check family name itself
-            family_name_lower = family['family_name'].lower()
-            # Remove common words for matching
-            family_core = family_name_lower.replace('the ', '').replace(' group', '').replace(' capital', '')
-            if family_core in sponsor_lower:
-                return family
-
-        return None
+        """Find which family a sponsor belongs to (variations, principals, family name)"""
+        return get_sponsor_families().find(sponsor_name)
 
     def apply_to_database(self, commit: bool = False) -> Dict:
         """Apply family mapping to all SPACs in database"""
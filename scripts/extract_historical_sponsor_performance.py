@@ -13,9 +13,9 @@ import sys
 sys.path.append('/home/ubuntu/spac-research')
 
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from utils.price_bars import PriceBarStore
 import json
 import time
 
@@ -25,8 +25,12 @@ class HistoricalPerformanceExtractor:
 
     def __init__(self, csv_path: str = "sponsor_family_tree_historical.csv"):
         self.csv_path = csv_path
+        self.bar_store = PriceBarStore()
         self.results = []
 
+    def close(self):
+        self.bar_store.close()
+
     def load_completed_deals(self) -> pd.DataFrame:
         """Load completed deals from CSV"""
 
@@ -51,35 +55,9 @@ class HistoricalPerformanceExtractor:
     def fetch_price_on_date(self, ticker: str, target_date: datetime) -> Optional[float]:
         """Fetch closing price for a ticker on a specific date"""
         try:
-            # Convert to date if datetime
-            if isinstance(target_date, datetime):
-                target_date = target_date.date()
-
-            # Fetch a week of data around target date to handle weekends/holidays
-            start_date = target_date - timedelta(days=5)
-            end_date = target_date + timedelta(days=5)
-
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date)
-
-            if hist.empty:
-                return None
-
-            # Try to get exact date first
-            if target_date in hist.index.date:
-                return float(hist.loc[hist.index.date == target_date, 'Close'].iloc[0])
-
-            # If exact date not found, get closest date after target
-            future_dates = hist[hist.index.date >= target_date]
-            if not future_dates.empty:
-                return float(future_dates['Close'].iloc[0])
-
-            # Fall back to closest date before target
-            past_dates = hist[hist.index.date < target_date]
-            if not past_dates.empty:
-                return float(past_dates['Close'].iloc[-1])
-
-            return None
+            # Session on the date, else first after, else last before (within 5 days);
+            # only downloads when the local bar store has no bar in that window
+            return self.bar_store.close_on(ticker, target_date, window_days=5)
 
         except Exception as e:
             print(f"   ⚠️  Error fetching {ticker} on {target_date}: {e}")
@@ -120,6 +98,10 @@ class HistoricalPerformanceExtractor:
         print(f"      Sponsor: {sponsor}")
         print(f"      Announced: {announced_date.date()}")
 
+        # One download covering the announcement date through +1 month
+        self.bar_store.ensure_range(ticker, announced_date - timedelta(days=7),
+                                    announced_date + timedelta(days=40))
+
         # Fetch prices
         price_0d = self.fetch_price_on_date(ticker, announced_date)
         if not price_0d:
@@ -326,6 +308,9 @@ def main():
         print("\n\n⚠️  Interrupted by user")
         print(f"Extracted {len(extractor.results)} deals before interruption")
 
+    finally:
+        extractor.close()
+
 
 if __name__ == '__main__':
     main()
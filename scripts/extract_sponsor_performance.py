@@ -15,7 +15,7 @@ sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
 from sqlalchemy import text
-import yfinance as yf
+from utils.price_bars import PriceBarStore
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import json
@@ -28,6 +28,7 @@ class SponsorPerformanceExtractor:
 
     def __init__(self):
         self.db = SessionLocal()
+        self.bar_store = PriceBarStore(db=self.db)
         self.results = {}
 
     def close(self):
@@ -58,35 +59,9 @@ class SponsorPerformanceExtractor:
         Returns None if data not available.
         """
         try:
-            # Convert to date if datetime
-            if isinstance(target_date, datetime):
-                target_date = target_date.date()
-
-            # Fetch a week of data around target date to handle weekends/holidays
-            start_date = target_date - timedelta(days=5)
-            end_date = target_date + timedelta(days=5)
-
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date)
-
-            if hist.empty:
-                return None
-
-            # Try to get exact date first
-            if target_date in hist.index.date:
-                return float(hist.loc[hist.index.date == target_date, 'Close'].iloc[0])
-
-            # If exact date not found, get closest date after target
-            future_dates = hist[hist.index.date >= target_date]
-            if not future_dates.empty:
-                return float(future_dates['Close'].iloc[0])
-
-            # Fall back to closest date before target
-            past_dates = hist[hist.index.date < target_date]
-            if not past_dates.empty:
-                return float(past_dates['Close'].iloc[-1])
-
-            return None
+            # Session on the date, else first after, else last before (within 5 days);
+            # only downloads when the local bar store has no bar in that window
+            return self.bar_store.close_on(ticker, target_date, window_days=5)
 
         except Exception as e:
             print(f"   ⚠️  Error fetching {ticker} on {target_date}: {e}")
@@ -120,6 +95,10 @@ class SponsorPerformanceExtractor:
         print(f"\n   📊 {spac.ticker} → {spac.target}")
         print(f"      Announced: {announced_date}")
 
+        # One download covering the announcement date through +1 month
+        self.bar_store.ensure_range(spac.ticker, announced_date - timedelta(days=7),
+                                    announced_date + timedelta(days=40))
+
         # Fetch prices
         price_0d = self.fetch_price_on_date(spac.ticker, announced_date)
         if not price_0d:
@@ -21,7 +21,7 @@ sys.path.append('/home/ubuntu/spac-research')
 
 from database import SessionLocal, SPAC
 from sqlalchemy import text
-import re
+from utils.sponsor_resolver import normalize_sponsor_name
 from datetime import datetime
 
 
@@ -126,31 +126,8 @@ class OpportunityDataPopulator:
             })
 
     def _normalize_sponsor_name(self, sponsor_name: str) -> str:
-        """Normalize a sponsor name"""
-        if not sponsor_name:
-            return None
-
-        normalized = sponsor_name
-
-        # Remove Roman numerals ANYWHERE in the name (not just at end)
-        # Examples: "Churchill Sponsor IX LLC" → "Churchill Sponsor"
-        #           "Gores Sponsor X LLC" → "Gores Sponsor"
-        #           "Live Oak Sponsor V, LLC" → "Live Oak Sponsor"
-        patterns = [
-            r'\s+(II|III|IV|V|VI|VII|VIII|IX|X|XI|XII)\s*',  # Roman numerals anywhere
-            r'\s+(\d+)\s*',  # Arabic numerals (2, 3, 4, etc.)
-        ]
-
-        for pattern in patterns:
-            normalized = re.sub(pattern, ' ', normalized, flags=re.IGNORECASE)
-
-        # Standardize entity types at end
-        normalized = re.sub(r',?\s+(LLC|Corp\.?|Inc\.?|Ltd\.?|Limited|L\.P\.|LP)$', '', normalized, flags=re.IGNORECASE)
-
-        # Clean up extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-
-        return normalized
+        """Normalize a sponsor name (shared with utils.sponsor_resolver)"""
+        return normalize_sponsor_name(sponsor_name)
 
     # ========================================================================
     # STEP 2: CALCULATE PUBLIC FLOAT
@@ -7,22 +7,31 @@ Extracts: IPO Date, Proceeds, Tickers, Structure, Deadline, Trust Cash
 import os
 import re
 import json
-import time
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta, date
 from bs4 import BeautifulSoup
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
 load_dotenv()
 
 from database import SessionLocal, SPAC
+from utils.llm_cache import cached_completion
 from auto_log_data_changes import init_logger, log_data_change
 from enhance_extraction_logger import get_enhanced_logger
 from utils.deal_value_tracker import update_deal_value
-from utils.trust_account_tracker import update_trust_cash, update_trust_value, update_shares_outstanding
+from utils.trust_account_tracker import (
+    update_trust_cash, update_trust_value, update_shares_outstanding, quarter_for_period, latest_period_end
+)
+from utils.xbrl_facts import extract_trust_facts
+from utils.edgar_submissions import get_local_filings
 from utils.redemption_tracker import add_redemption_event
 from sec_text_extractor import extract_filing_text
+from utils.sec_http import sec_get
+from utils.component_ticker_index import ComponentTickerIndex, COMPONENT_FIELDS
+from utils.section_index import SectionIndex, get_section_index
 from prompt_manager import get_prompt, log_prompt_result
 
 # Import dateutil for date calculations
@@ -53,6 +62,59 @@ except Exception as e:
     print(f"⚠️  AI unavailable: {e}")
 
 
+# enrich_all parallelism - workers share the process-wide SEC rate limiter (utils/sec_http.py)
+ENRICH_WORKERS = int(os.getenv('ENRICH_WORKERS', '6'))
+ENRICH_CHECKPOINT_PATH = os.getenv('ENRICH_CHECKPOINT_PATH', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.enrich_checkpoint', 'enrich_all.jsonl'
+))
+
+
+class EnrichmentCheckpoint:
+    """
+    Append-only record of tickers enriched by the current enrich_all run
+
+    A rerun after a crash skips tickers already enriched successfully (failed
+    ones are retried). Cleared when a run completes.
+    """
+
+    def __init__(self, path: str = ENRICH_CHECKPOINT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def completed(self) -> set:
+        """Tickers enriched successfully by the interrupted run"""
+        if not os.path.exists(self.path):
+            return set()
+        done = set()
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from a crash mid-write
+                if entry.get('success'):
+                    done.add(entry['ticker'])
+        return done
+
+    def mark(self, ticker: str, success: bool):
+        entry = json.dumps({'ticker': ticker, 'success': success, 'at': datetime.now().isoformat()})
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(entry + '\n')
+
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+@lru_cache(maxsize=4)
+def _s1_section_index(html: str) -> SectionIndex:
+    """Parse S-1 HTML to text once and index it (shared by all section lookups)"""
+    return get_section_index(BeautifulSoup(html, 'html.parser').get_text())
+
+
 class SPACDataEnricher:
 
     def __init__(self):
@@ -63,6 +125,14 @@ class SPACDataEnricher:
         self.db = SessionLocal()
         self.logger = get_enhanced_logger()
         init_logger()  # Initialize data quality logging
+        self._ticker_index = None
+
+    @property
+    def ticker_index(self) -> ComponentTickerIndex:
+        """Component ticker resolution index (own session - commits independently)"""
+        if self._ticker_index is None:
+            self._ticker_index = ComponentTickerIndex()
+        return self._ticker_index
 
     def get_cik(self, company_name: str) -> Optional[str]:
         """Get CIK number for a company (tries variations if needed)"""
@@ -96,7 +166,7 @@ class SPACDataEnricher:
                     'count': 1
                 }
 
-                response = requests.get(url, params=params, headers=self.headers, timeout=30)
+                response = sec_get(url, params=params, headers=self.headers, timeout=30)
                 soup = BeautifulSoup(response.text, 'html.parser')
 
                 cik_elem = soup.find('span', {'class': 'companyName'})
@@ -109,7 +179,6 @@ class SPACDataEnricher:
                             print(f"   ℹ️  Found with variation: '{variation}'")
                         return cik
 
-                time.sleep(0.15)  # Rate limiting between attempts
 
             return None
         except Exception as e:
@@ -119,7 +188,7 @@ class SPACDataEnricher:
     def _validate_ipo_press_release(self, url: str, debug=False) -> bool:
         """Check if document is IPO CLOSING press release (not pricing announcement)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = sec_get(url, headers=self.headers, timeout=15)
             text = response.text[:12000].lower()
 
             # Check for closing indicators (more permissive)
@@ -242,7 +311,7 @@ class SPACDataEnricher:
                 'count': 40
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -273,7 +342,7 @@ class SPACDataEnricher:
                 print(f"   [{i+1}] {filing['date']}", end='')
 
                 try:
-                    filing_page = requests.get(filing['url'], headers=self.headers, timeout=30)
+                    filing_page = sec_get(filing['url'], headers=self.headers, timeout=30)
                     filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                     # Store the first (earliest) 8-K main document URL as fallback
@@ -343,7 +412,7 @@ class SPACDataEnricher:
                 'count': 5
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -356,7 +425,7 @@ class SPACDataEnricher:
                     doc_link = cols[1].find('a', {'id': 'documentsbutton'})
                     if doc_link:
                         filing_url = self.base_url + doc_link['href']
-                        filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                        filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                         filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                         # Look for the primary document table
@@ -397,7 +466,7 @@ class SPACDataEnricher:
                 'count': 5
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -410,7 +479,7 @@ class SPACDataEnricher:
                     doc_link = cols[1].find('a', {'id': 'documentsbutton'})
                     if doc_link:
                         filing_url = self.base_url + doc_link['href']
-                        filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                        filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                         filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                         # Look for main S-1 document (not amendments)
@@ -449,7 +518,7 @@ class SPACDataEnricher:
                 'count': 5
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -464,7 +533,7 @@ class SPACDataEnricher:
                     doc_link = cols[1].find('a', {'id': 'documentsbutton'})
                     if doc_link:
                         filing_url = self.base_url + doc_link['href']
-                        filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                        filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                         filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                         # Look for main S-4 document (not amendments or exhibits)
@@ -556,7 +625,7 @@ class SPACDataEnricher:
                 'count': count
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -598,7 +667,7 @@ class SPACDataEnricher:
 
                         try:
                             # Get the filing page
-                            filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                            filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                             filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                             # Look for press release (Exhibit 99.1) first, then other exhibits
@@ -618,7 +687,7 @@ class SPACDataEnricher:
                             for doc_url in exhibits_to_check:
                                 try:
                                     # Fetch the document
-                                    doc_response = requests.get(doc_url, headers=self.headers, timeout=15)
+                                    doc_response = sec_get(doc_url, headers=self.headers, timeout=15)
                                     doc_text = doc_response.text.lower()
 
                                     # Check for deal announcement keywords
@@ -798,6 +867,16 @@ class SPACDataEnricher:
         Returns:
             Tuple of (filing_url, filing_date, filing_type) or None if not found
         """
+        # Local submissions store first (primary document known, no browse-edgar scraping)
+        local = get_local_filings(cik, ['10-Q', '10-K'], limit=10)
+        if local is not None:
+            for filing in local:
+                if filing['document_url']:
+                    filing_type = '10-Q' if filing['type'].startswith('10-Q') else '10-K'
+                    print(f"   ✓ Latest {filing['type']}: {filing['date'].strftime('%Y-%m-%d')} (local index)")
+                    return filing['document_url'], filing['date'].strftime('%Y-%m-%d'), filing_type
+            return None
+
         try:
             cik_padded = cik.zfill(10)
 
@@ -816,7 +895,7 @@ class SPACDataEnricher:
                     'count': 3
                 }
 
-                response = requests.get(url, params=params, headers=self.headers, timeout=30)
+                response = sec_get(url, params=params, headers=self.headers, timeout=30)
                 soup = BeautifulSoup(response.text, 'html.parser')
 
                 table = soup.find('table', {'class': 'tableFile2'})
@@ -839,7 +918,7 @@ class SPACDataEnricher:
                             filing_url = self.base_url + doc_link['href']
 
                             # Get the filing page
-                            filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                            filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                             filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                             # Get the document table
@@ -900,7 +979,7 @@ class SPACDataEnricher:
     def extract_trust_cash(self, url: str) -> Optional[Dict]:
         """Extract trust account value from 10-Q/10-K balance sheet (most recent period only)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             text = response.text
 
             # Remove HTML tags for cleaner parsing
@@ -910,6 +989,29 @@ class SPACDataEnricher:
             # Lightweight check for business combination mention (for deal confirmation)
             self._check_deal_mention_in_10q(clean_text)
 
+            # Method 0: Inline XBRL facts (exact values + balance sheet date, no AI)
+            xbrl = extract_trust_facts(text)
+            if xbrl and xbrl.get('trust_cash') and xbrl.get('shares_outstanding'):
+                trust_per_share = xbrl['trust_cash'] / xbrl['shares_outstanding']
+                if 8 <= trust_per_share <= 15:
+                    print(f"   ✓ XBRL trust NAV: ${trust_per_share:.2f} (as of {xbrl['period_end']})")
+                    result = {
+                        'trust_cash': xbrl['trust_cash'],
+                        'shares_outstanding': xbrl['shares_outstanding'],
+                        'trust_value': round(trust_per_share, 2),
+                        'period_end': xbrl['period_end'],
+                    }
+
+                    founder_shares = self._extract_founder_shares(clean_text)
+                    if founder_shares:
+                        result['founder_shares'] = founder_shares
+                        total_shares = xbrl['shares_outstanding'] + founder_shares
+                        result['founder_ownership'] = round((founder_shares / total_shares) * 100, 2)
+
+                    return result
+                else:
+                    print(f"   ⚠️  XBRL result outside valid range: ${trust_per_share:.2f}")
+
             # Method 1: Extract per-share redemption value directly from balance sheet
             # Pattern: "subject to possible redemption at $10.07 per share" or "at redemption value of $10.52"
             redemption_patterns = [
@@ -1024,7 +1126,7 @@ class SPACDataEnricher:
         data = {}
         try:
             # Get the main 8-K document
-            response = requests.get(filing_url, headers=self.headers, timeout=30)
+            response = sec_get(filing_url, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # Find the main 8-K document link
@@ -1041,8 +1143,7 @@ class SPACDataEnricher:
                 return data
 
             # Fetch the main document
-            time.sleep(0.15)
-            doc_response = requests.get(main_doc_link, headers=self.headers, timeout=30)
+            doc_response = sec_get(main_doc_link, headers=self.headers, timeout=30)
             doc_soup = BeautifulSoup(doc_response.text, 'html.parser')
             text = doc_soup.get_text()
 
@@ -1153,7 +1254,7 @@ IMPORTANT: Return the ACTUAL numbers from the filing text, not calculated values
         """Extract IPO data from 10-Q Note 1 (Organization and Business Description)"""
         data = {}
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
             text = soup.get_text()
 
@@ -1430,7 +1531,7 @@ JSON only:"""
                 'count': 10  # Check last 10 8-Ks
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -1467,7 +1568,7 @@ JSON only:"""
                         print(f"      Found 8-K filed {filing_date} - checking if it's IPO closing...")
 
                         # Get the filing page to find the main 8-K document
-                        filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                        filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                         filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                         # Get the document table
@@ -1504,7 +1605,7 @@ JSON only:"""
                                             doc_url = self.base_url + doc_url.split('/ix?doc=')[1]
 
                                         # Fetch the 8-K document
-                                        doc_response = requests.get(doc_url, headers=self.headers, timeout=30)
+                                        doc_response = sec_get(doc_url, headers=self.headers, timeout=30)
                                         doc_html = doc_response.text
 
                                         # Extract text from HTML
@@ -1594,17 +1695,17 @@ JSON only:"""
             str: Extracted section text (~20,000 chars / 5-10 pages)
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            full_text = soup.get_text()
+            # Parsed text and its section index are cached per document, so the
+            # founder share and warrant passes over the same S-1 parse it once
+            index = _s1_section_index(html)
+            full_text = index.text
 
             # Try to find section by name
             for section_name in section_names:
-                # Case-insensitive search for section heading
-                pattern = re.compile(rf'(?:^|\n)\s*{re.escape(section_name)}\s*(?:\n|$)', re.IGNORECASE | re.MULTILINE)
-                match = pattern.search(full_text)
+                # Case-insensitive search for section heading on its own line
+                start_idx = index.find_heading(section_name)
 
-                if match:
-                    start_idx = match.start()
+                if start_idx != -1:
                     # Extract 20,000 characters from this point (about 5-10 pages)
                     section_text = full_text[start_idx:start_idx + 20000]
                     print(f"   ℹ️  Extracted {len(section_text):,} chars from '{section_name}' section")
@@ -2028,7 +2129,8 @@ JSON only:"""
             # Store for enhanced logging
             self.last_prompt = prompt
 
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'sec_scraper_extract',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
@@ -2068,7 +2170,8 @@ Text excerpt:
 Return ONLY the number of months as an integer (e.g., "24").
 If not found, return "NOT_FOUND"."""
 
-            response = AI_CLIENT.chat.completions.create(
+            response = cached_completion(
+                AI_CLIENT, 'sec_scraper_extract',
                 model="deepseek-chat",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
@@ -2105,7 +2208,7 @@ If not found, return "NOT_FOUND"."""
         ai_data = None  # Track AI result for logging
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             text = response.text
 
             # Try AI first
@@ -2265,7 +2368,7 @@ If not found, return "NOT_FOUND"."""
         }
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             text = response.text
 
             # Extract deadline months - try multiple patterns
@@ -2395,7 +2498,7 @@ If not found, return "NOT_FOUND"."""
 
         try:
             print(f"   📄 Fetching S-4 from: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             html_content = response.text
             soup = BeautifulSoup(html_content, 'html.parser')
             full_text = soup.get_text()
@@ -2572,6 +2675,16 @@ If not found, return null.
 
         Returns list of {date, url} for each extension filing
         """
+        # Local submissions store first (EDGAR item metadata - no index/document fetches)
+        local = get_local_filings(cik, ['8-K'], after=after_date, items=['5.03'])
+        if local is not None:
+            extension_filings = []
+            for filing in local:
+                if filing['document_url']:
+                    extension_filings.append({'date': filing['date'].date(), 'url': filing['document_url']})
+                    print(f"   ✓ Found Item 5.03 filing on {filing['date'].date()}")
+            return extension_filings
+
         try:
             cik_padded = cik.zfill(10)
             url = f"{self.base_url}/cgi-bin/browse-edgar"
@@ -2584,7 +2697,7 @@ If not found, return null.
                 'count': 100  # Check up to 100 8-Ks
             }
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            response = sec_get(url, params=params, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             table = soup.find('table', {'class': 'tableFile2'})
@@ -2610,8 +2723,7 @@ If not found, return null.
                         filing_url = self.base_url + doc_link['href']
 
                         # Fetch the filing index page
-                        time.sleep(0.15)  # Rate limiting
-                        filing_page = requests.get(filing_url, headers=self.headers, timeout=30)
+                        filing_page = sec_get(filing_url, headers=self.headers, timeout=30)
                         filing_soup = BeautifulSoup(filing_page.text, 'html.parser')
 
                         # Look for the main 8-K document (not exhibits)
@@ -2621,8 +2733,7 @@ If not found, return null.
                                 doc_url = self.base_url + href
 
                                 # Fetch the document and check for Item 5.03
-                                time.sleep(0.15)
-                                doc_response = requests.get(doc_url, headers=self.headers, timeout=30)
+                                doc_response = sec_get(doc_url, headers=self.headers, timeout=30)
                                 doc_text = doc_response.text.lower()
 
                                 # Check if this is an Item 5.03 filing
@@ -2667,7 +2778,7 @@ If not found, return null.
 
         try:
             print(f"   📄 Extracting extension from: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             html_content = response.text
             soup = BeautifulSoup(html_content, 'html.parser')
             full_text = soup.get_text()
@@ -2791,7 +2902,6 @@ If any field is not found, return null for that field.
 
             # Extract details from each extension
             for filing in extension_filings:
-                time.sleep(0.15)  # Rate limiting
                 extension_data = self.extract_extension_from_8k(filing['url'])
 
                 if extension_data.get('new_deadline'):
@@ -2883,7 +2993,7 @@ If any field is not found, return null for that field.
 
         try:
             print(f"   📄 Fetching 424B4 from: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = sec_get(url, headers=self.headers, timeout=30)
             html_content = response.text
 
             # Use Filing424B4Extractor for targeted extraction
@@ -3400,20 +3510,16 @@ Return JSON format with all fields. Calculate sponsor_total_at_risk = founder_sh
                 except:
                     pass
 
-            unit_ticker = pr_data.get('unit_ticker') or prosp_data.get('unit_ticker')
-            if unit_ticker:
-                spac.unit_ticker = unit_ticker
-                print(f"      ✓ unit_ticker: {unit_ticker}")
-
-            warrant_ticker = pr_data.get('warrant_ticker') or prosp_data.get('warrant_ticker')
-            if warrant_ticker:
-                spac.warrant_ticker = warrant_ticker
-                print(f"      ✓ warrant_ticker: {warrant_ticker}")
-
-            right_ticker = pr_data.get('right_ticker') or prosp_data.get('right_ticker')
-            if right_ticker:
-                spac.right_ticker = right_ticker
-                print(f"      ✓ right_ticker: {right_ticker}")
+            # Component tickers: also seed the component ticker index so the
+            # price updaters try the filing's symbol before probing suffix formats
+            for component, field in COMPONENT_FIELDS.items():
+                component_ticker = pr_data.get(field) or prosp_data.get(field)
+                if component_ticker:
+                    setattr(spac, field, component_ticker)
+                    print(f"      ✓ {field}: {component_ticker}")
+                    source = 'press_release' if pr_data.get(field) else '424B4'
+                    self.ticker_index.record_candidate(ticker, component, component_ticker, source)
+            self.ticker_index.flush()
 
             unit_structure = pr_data.get('unit_structure') or prosp_data.get('unit_structure')
             if unit_structure:
@@ -3471,19 +3577,9 @@ Return JSON format with all fields. Calculate sponsor_total_at_risk = founder_sh
                 except:
                     filing_date_obj = date.today()
 
-                # Extract quarter from filing type and date
-                quarter = None
-                if tenq_filing_type == '10-Q' and tenq_filing_date:
-                    month = int(tenq_filing_date.split('-')[1])
-                    year = tenq_filing_date.split('-')[0]
-                    if month <= 3:
-                        quarter = f"Q1 {year}"
-                    elif month <= 6:
-                        quarter = f"Q2 {year}"
-                    elif month <= 9:
-                        quarter = f"Q3 {year}"
-                    else:
-                        quarter = f"Q4 {year}"
+                # Reporting period: XBRL balance sheet date, else last quarter end before filing
+                period_end = trust_data.get('period_end') or latest_period_end(filing_date_obj)
+                quarter = quarter_for_period(period_end, tenq_filing_type or '10-Q')
 
                 # Update trust_cash with tracker
                 if trust_data.get('trust_cash'):
@@ -3493,7 +3589,8 @@ Return JSON format with all fields. Calculate sponsor_total_at_risk = founder_sh
                         new_value=trust_data['trust_cash'],
                         source=tenq_filing_type,
                         filing_date=filing_date_obj,
-                        quarter=quarter
+                        quarter=quarter,
+                        period_end=period_end
                     )
 
                 # Update shares_outstanding with tracker
@@ -3812,7 +3909,7 @@ Default $10.00 was NOT applied - field left blank for accuracy"""
                 'count': 1
             }
 
-            response = requests.get(search_url, params=params, headers=self.headers, timeout=10)
+            response = sec_get(search_url, params=params, headers=self.headers, timeout=10)
 
             if response.status_code == 200:
                 from bs4 import BeautifulSoup
@@ -4052,7 +4149,6 @@ Default $10.00 was NOT applied - field left blank for accuracy"""
             if s4_result:
                 s4_url, s4_filing_date = s4_result
                 print(f"   ✓ Found S-4 filing (filed: {s4_filing_date})")
-                time.sleep(0.15)  # Rate limiting
                 s4_data = self.extract_from_s4(s4_url)
                 if s4_data:
                     extracted_fields = [k for k, v in s4_data.items() if v is not None and k != 's4_filing_url']
@@ -4075,10 +4171,9 @@ Default $10.00 was NOT applied - field left blank for accuracy"""
 
             if s1_url:
                 print(f"   ✓ Found S-1 filing")
-                time.sleep(0.15)  # Rate limiting
 
                 try:
-                    response = requests.get(s1_url, headers=self.headers, timeout=30)
+                    response = sec_get(s1_url, headers=self.headers, timeout=30)
                     s1_html = response.text
 
                     # Extract founder shares
@@ -4151,31 +4246,102 @@ Default $10.00 was NOT applied - field left blank for accuracy"""
 
         return True
 
-    def enrich_all(self, limit=None):
-        """Enrich all SPACs"""
-        spacs = self.db.query(SPAC).all()
+    def _tickers_to_enrich(self, limit=None, stale_hours: Optional[float] = None) -> List[str]:
+        """Tickers to enrich, least recently scraped first (optionally only stale ones)"""
+        query = self.db.query(SPAC.ticker)
+        if stale_hours is not None:
+            cutoff = datetime.now() - timedelta(hours=stale_hours)
+            query = query.filter((SPAC.last_scraped_at.is_(None)) | (SPAC.last_scraped_at < cutoff))
+        query = query.order_by(SPAC.last_scraped_at.asc().nullsfirst(), SPAC.ticker)
         if limit:
-            spacs = spacs[:limit]
+            query = query.limit(limit)
+        return [row[0] for row in query.all()]
+
+    def enrich_all(self, limit=None, workers: int = ENRICH_WORKERS, stale_hours: Optional[float] = None,
+                   resume: bool = True):
+        """
+        Enrich all SPACs in parallel
+
+        Tickers are sharded across a thread pool; each worker has its own
+        SPACDataEnricher (own DB session) and all share the SEC rate limiter,
+        so throughput is bounded by SEC's 10 req/s and AI latency overlaps.
+        Completed tickers are checkpointed - an interrupted run resumes where
+        it stopped.
+
+        Args:
+            limit: Max number of SPACs
+            workers: Parallel workers (1 = serial, in this enricher)
+            stale_hours: Only SPACs not scraped within this many hours
+            resume: Skip tickers completed by an interrupted previous run
+        """
+        checkpoint = EnrichmentCheckpoint()
+        if not resume:
+            checkpoint.clear()
+
+        tickers = self._tickers_to_enrich(limit, stale_hours)
+        done = checkpoint.completed()
+        if done:
+            remaining = [ticker for ticker in tickers if ticker not in done]
+            print(f"⏩ Resuming: {len(tickers) - len(remaining)} SPACs already enriched by interrupted run")
+            tickers = remaining
 
         print(f"\n{'='*60}")
-        print(f"Enriching {len(spacs)} SPACs...")
+        print(f"Enriching {len(tickers)} SPACs ({workers} workers)...")
         print(f"{'='*60}")
 
         success_count = 0
-        for i, spac in enumerate(spacs, 1):
-            print(f"\n[{i}/{len(spacs)}]")
-            if self.enrich_spac(spac.ticker):
-                success_count += 1
-            time.sleep(0.3)
+        if workers <= 1:
+            for i, ticker in enumerate(tickers, 1):
+                print(f"\n[{i}/{len(tickers)}]")
+                success = self._enrich_checkpointed(self, ticker, checkpoint)
+                success_count += success
+        else:
+            local = threading.local()
+            enrichers = []
+            enrichers_lock = threading.Lock()
+
+            def enrich(ticker: str) -> bool:
+                if not hasattr(local, 'enricher'):
+                    local.enricher = SPACDataEnricher()
+                    with enrichers_lock:
+                        enrichers.append(local.enricher)
+                return self._enrich_checkpointed(local.enricher, ticker, checkpoint)
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enrich') as pool:
+                    futures = {pool.submit(enrich, ticker): ticker for ticker in tickers}
+                    for i, future in enumerate(as_completed(futures), 1):
+                        success_count += future.result()
+                        if i % 10 == 0:
+                            print(f"\n📊 Progress: {i}/{len(tickers)} SPACs ({success_count} enriched)")
+            finally:
+                for enricher in enrichers:
+                    enricher.close()
+
+        checkpoint.clear()
 
         print(f"\n{'='*60}")
-        print(f"✅ Complete: {success_count}/{len(spacs)} enriched")
+        print(f"✅ Complete: {success_count}/{len(tickers)} enriched")
         print(f"{'='*60}")
 
         # Print extraction quality summary
         self.logger.print_session_summary()
 
+    @staticmethod
+    def _enrich_checkpointed(enricher: 'SPACDataEnricher', ticker: str, checkpoint: EnrichmentCheckpoint) -> bool:
+        """Enrich one ticker, record it in the checkpoint (errors count as failures)"""
+        try:
+            success = bool(enricher.enrich_spac(ticker))
+        except Exception as e:
+            print(f"❌ {ticker}: enrichment failed: {e}")
+            enricher.db.rollback()
+            success = False
+        checkpoint.mark(ticker, success)
+        return success
+
     def close(self):
+        if self._ticker_index:
+            self._ticker_index.close()
         self.db.close()
 
 
@@ -4195,6 +4361,16 @@ class Filing424B4Extractor:
         self.html = html_content
         self.soup = BeautifulSoup(html_content, 'html.parser')
         self.text = self.soup.get_text()
+        # Marker offsets shared by every extract_* call on this prospectus
+        self.index = get_section_index(self.text)
+
+    def _find_first_heading(self, headings: List[str]) -> Optional[int]:
+        """Offset of the first heading (in list order) found on its own line, exact case"""
+        for heading in headings:
+            pos = self.index.find_heading(heading, match_case=True)
+            if pos != -1:
+                return pos
+        return None
 
     def extract_cover_page(self) -> str:
         """
@@ -4215,49 +4391,30 @@ class Filing424B4Extractor:
         We extract the SUMMARY section if it exists, otherwise THE OFFERING
         """
         # First try to find SUMMARY section (CCCX and similar)
-        summary_patterns = [
-            r"\n\s*SUMMARY\s*\n",
-            r"\n\s*Summary\s*\n",
-            r"\n\s*PROSPECTUS SUMMARY\s*\n",
-        ]
+        summary_headings = ["SUMMARY", "Summary", "PROSPECTUS SUMMARY"]
 
-        start_idx = None
-        for pattern in summary_patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                start_idx = match.start()
-                print(f"   ✓ Found SUMMARY section at {start_idx:,}")
-                break
+        start_idx = self._find_first_heading(summary_headings)
+        if start_idx:
+            print(f"   ✓ Found SUMMARY section at {start_idx:,}")
 
         # Fallback to THE OFFERING if no SUMMARY found
         if not start_idx:
-            offering_patterns = [
-                r"\n\s*THE OFFERING\s*\n",
-                r"\n\s*The Offering\s*\n",
-            ]
-            for pattern in offering_patterns:
-                match = re.search(pattern, self.text)
-                if match:
-                    start_idx = match.start()
-                    print(f"   ✓ Found THE OFFERING section at {start_idx:,}")
-                    break
+            start_idx = self._find_first_heading(["THE OFFERING", "The Offering"])
+            if start_idx:
+                print(f"   ✓ Found THE OFFERING section at {start_idx:,}")
 
         if not start_idx:
             print("   ⚠️  Could not find 'The Offering' or 'Summary' section in 424B4")
             return ""
 
         # Find the end of this section (look for next major section)
-        end_patterns = [
-            r"\n\s*RISK FACTORS\s*\n",
-            r"\n\s*Risk Factors\s*\n",
-            r"\n\s*USE OF PROCEEDS\s*\n",
-        ]
+        end_headings = ["RISK FACTORS", "Risk Factors", "USE OF PROCEEDS"]
 
         end_idx = start_idx + 150000  # Take up to 150K chars to ensure we get all warrant details
-        for pattern in end_patterns:
-            match = re.search(pattern, self.text[start_idx + 1000:start_idx + 150000])
-            if match:
-                end_idx = start_idx + 1000 + match.start()
+        for heading in end_headings:
+            pos = self.index.find_heading(heading, start_idx + 1000, start_idx + 150000, match_case=True)
+            if pos != -1:
+                end_idx = pos
                 break
 
         # Extract the full section
@@ -4272,17 +4429,13 @@ class Filing424B4Extractor:
 
         Typical location: 174,000 - 255,000 chars in document
         """
-        patterns = [
-            r"PROSPECTUS SUMMARY",
-            r"Prospectus Summary",
-            r"SUMMARY",
-        ]
+        markers = ["PROSPECTUS SUMMARY", "Prospectus Summary", "SUMMARY"]
 
         start_idx = None
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                start_idx = match.start()
+        for marker in markers:
+            pos = self.index.find(marker, match_case=True)
+            if pos != -1:
+                start_idx = pos
                 break
 
         if not start_idx:
@@ -4302,24 +4455,25 @@ class Filing424B4Extractor:
         # Look for "MANAGEMENT" followed by "Officers" and actual bios (has names/ages)
         # This is more reliable than looking for "DIRECTORS AND EXECUTIVE OFFICERS" which appears in many contexts
         start_idx = None
-        for match in re.finditer(r"\bMANAGEMENT\b", self.text):
+        management_positions = list(self.index.occurrences("MANAGEMENT", match_case=True, whole_word=True))
+        for pos in management_positions:
             # Check if followed by Officers AND has actual executive info (Name/Age table or specific patterns)
-            following_text = self.text[match.start():match.start()+2000]
+            following_text = self.text[pos:pos+2000]
             if "Officers" in following_text and "DISCUSSION" not in following_text and "Discussion" not in following_text:
                 # Check for signs of actual bios: Name/Age table or biographical content
                 if any(marker in following_text for marker in ["Name\n", "Age\n", "\nTitle\n", "served as our Chief", "has served as"]):
-                    start_idx = match.start()
+                    start_idx = pos
                     break
 
         # Fallback: Look for "MANAGEMENT" followed by bios (has "Officers" and actual names like "Name", "Age", or specific names)
         if not start_idx:
-            for match in re.finditer(r"\bMANAGEMENT\b", self.text):
+            for pos in management_positions:
                 # Check if followed by Officers AND has actual executive info (Name/Age table or specific names)
-                following_text = self.text[match.start():match.start()+2000]
+                following_text = self.text[pos:pos+2000]
                 if "Officers" in following_text and "DISCUSSION" not in following_text:
                     # Check for signs of actual bios: Name/Age table or common executive names
                     if any(marker in following_text for marker in ["Name", "Age", "Title", "Michael", "John", "David", "James"]):
-                        start_idx = match.start()
+                        start_idx = pos
                         break
 
         if not start_idx:
@@ -4337,38 +4491,35 @@ class Filing424B4Extractor:
         This section contains the definitive warrant terms that may not be in "The Offering"
         Usually appears after Management section in the 424B4
         """
-        patterns = [
-            r"\n\s*DESCRIPTION OF SECURITIES\s*\n",
-            r"\n\s*Description of Securities\s*\n",
-            r"\n\s*DESCRIPTION OF CAPITAL STOCK\s*\n",
-            r"\n\s*Description of Capital Stock\s*\n",
+        headings = [
+            "DESCRIPTION OF SECURITIES",
+            "Description of Securities",
+            "DESCRIPTION OF CAPITAL STOCK",
+            "Description of Capital Stock",
         ]
 
-        start_idx = None
-        for pattern in patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                start_idx = match.start()
-                print(f"   ✓ Found Description of Securities at position {start_idx:,}")
-                break
+        start_idx = self._find_first_heading(headings)
+        if start_idx:
+            print(f"   ✓ Found Description of Securities at position {start_idx:,}")
 
         if not start_idx:
             print("   ⚠️  Could not find 'Description of Securities' section in 424B4")
             return ""
 
         # Find the end of this section (look for next major section)
-        end_patterns = [
-            r"\n\s*CERTAIN RELATIONSHIPS",
-            r"\n\s*SECURITIES ACT RESTRICTIONS",
-            r"\n\s*MATERIAL U\.S\. FEDERAL INCOME TAX",
-            r"\n\s*PLAN OF DISTRIBUTION",
+        end_headings = [
+            "CERTAIN RELATIONSHIPS",
+            "SECURITIES ACT RESTRICTIONS",
+            "MATERIAL U.S. FEDERAL INCOME TAX",
+            "PLAN OF DISTRIBUTION",
         ]
 
         end_idx = start_idx + 100000  # Default: take 100K chars
-        for pattern in end_patterns:
-            match = re.search(pattern, self.text[start_idx + 1000:start_idx + 100000])
-            if match:
-                end_idx = start_idx + 1000 + match.start()
+        for heading in end_headings:
+            pos = self.index.find_heading(heading, start_idx + 1000, start_idx + 100000,
+                                          match_case=True, whole_line=False)
+            if pos != -1:
+                end_idx = pos
                 break
 
         # Extract the full section
@@ -4410,12 +4561,21 @@ if __name__ == "__main__":
     enricher = SPACDataEnricher()
 
     try:
-        if len(sys.argv) > 1:
-            ticker = sys.argv[1].upper()
+        args = [arg for arg in sys.argv[1:] if not arg.startswith('--') or arg.upper() == '--ALL']
+        options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+        flags = {arg[2:] for arg in sys.argv[1:] if arg.startswith('--') and '=' not in arg}
+
+        if args:
+            ticker = args[0].upper()
 
             if ticker == '--ALL':
-                limit = int(sys.argv[2]) if len(sys.argv) > 2 else None
-                enricher.enrich_all(limit=limit)
+                limit = int(args[1]) if len(args) > 1 else None
+                enricher.enrich_all(
+                    limit=limit,
+                    workers=int(options.get('workers', ENRICH_WORKERS)),
+                    stale_hours=float(options['stale-hours']) if 'stale-hours' in options else None,
+                    resume='restart' not in flags
+                )
             else:
                 enricher.enrich_spac(ticker)
         else:
@@ -4423,5 +4583,7 @@ if __name__ == "__main__":
             print("  python sec_data_scraper.py TICKER")
             print("  python sec_data_scraper.py --ALL")
             print("  python sec_data_scraper.py --ALL 10")
+            print("  python sec_data_scraper.py --ALL --workers=8 --stale-hours=24")
+            print("  python sec_data_scraper.py --ALL --restart      # Ignore interrupted run checkpoint")
     finally:
         enricher.close()
@@ -10,11 +10,11 @@ Architecture:
 """
 
 import os
+import re
 import time
 import json
-import requests
 import feedparser
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
@@ -22,12 +22,27 @@ from dateutil import parser as date_parser
 from database import SessionLocal, SPAC
 from pre_ipo_database import SessionLocal as PreIPOSessionLocal, PreIPOSPAC
 from dotenv import load_dotenv
-from sec_text_extractor import extract_filing_text
+from sec_text_extractor import extract_filing_text, html_to_text
 from orchestrator_trigger import get_accelerated_polling_tickers
 from utils.sec_filing_fetcher import SECFilingFetcher
+from utils.sec_http import sec_get
+from utils.edgar_submissions import invalidate_ciks
+from utils.sec_async_fetcher import fetch_filing_bundles
 
 load_dotenv()
 
+# EDGAR bulk feeds (bulk mode): one "latest filings" feed + daily master index per cycle
+EDGAR_LATEST_FILINGS_URL = (
+    "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=&company=&dateb="
+    "&owner=include&start={start}&count={count}&output=atom"
+)
+EDGAR_DAILY_INDEX_URL = "https://www.sec.gov/Archives/edgar/daily-index/{year}/QTR{quarter}/master.{date}.idx"
+# Latest filings feed is read back to the previous check minus this overlap
+# (entries can show up in the feed a little after their acceptance time)
+LATEST_FEED_OVERLAP = timedelta(minutes=10)
+# Daily indexes are scanned for this far back (past days are cached for good)
+DAILY_INDEX_LOOKBACK = timedelta(hours=48)
+
 # DeepSeek AI for classification
 try:
     from openai import OpenAI
@@ -48,9 +63,15 @@ class SECFilingMonitor:
     Polls SEC EDGAR every 15 minutes for new filings from tracked SPACs
     """
 
-    def __init__(self, poll_interval_seconds: int = 900):  # 15 minutes
+    def __init__(self, poll_interval_seconds: int = 900, bulk_mode: Optional[bool] = None):  # 15 minutes
         self.poll_interval = poll_interval_seconds
         self.tracked_ciks = self._load_tracked_ciks()
+
+        # Bulk mode: join EDGAR-wide feeds against tracked CIKs, then only poll matched CIKs
+        if bulk_mode is None:
+            bulk_mode = os.getenv('SEC_MONITOR_BULK_MODE', 'false').lower() in ('1', 'true', 'yes')
+        self.bulk_mode = bulk_mode
+        self.tracked_cik_set = {self._normalize_cik(cik) for cik in self.tracked_ciks}
         self.state_file = '.sec_filing_monitor_state.json'
 
         # Initialize SEC filing fetcher (centralized utility)
@@ -60,10 +81,16 @@ class SECFilingMonitor:
         state = self._load_state()
         self.last_check = state.get('last_check', datetime.now() - timedelta(hours=24))  # Start 24 hours back if new
         self.seen_filings = set(state.get('seen_filings', []))
+        # Daily index dates already joined against tracked CIKs (files never change once published)
+        self.scanned_daily_indexes = set()
+        # Filings returned by poll_all_spacs but not yet marked processed (id → CIK);
+        # bulk mode re-polls their CIKs even after the feed cutoff moved past them
+        self.unprocessed_filings: Dict[str, str] = {}
 
         print(f"✅ SEC Filing Monitor initialized")
         print(f"   Tracking {len(self.tracked_ciks)} SPACs")
         print(f"   Poll interval: {poll_interval_seconds}s ({poll_interval_seconds/60:.0f} min)")
+        print(f"   Poll mode: {'bulk EDGAR feed' if self.bulk_mode else 'per-CIK'}")
         print(f"   Last check: {self.last_check.strftime('%Y-%m-%d %H:%M:%S')} ({(datetime.now() - self.last_check).total_seconds() / 3600:.1f}h ago)")
 
     def _load_state(self) -> Dict:
@@ -100,6 +127,7 @@ class SECFilingMonitor:
         This prevents marking filings as "seen" if logging fails
         """
         self.seen_filings.add(filing_id)
+        self.unprocessed_filings.pop(filing_id, None)
 
     def mark_filings_processed(self, filing_ids: List[str]):
         """
@@ -113,6 +141,7 @@ class SECFilingMonitor:
         """
         for filing_id in filing_ids:
             self.seen_filings.add(filing_id)
+            self.unprocessed_filings.pop(filing_id, None)
 
         # Now save state (includes updated last_check and seen_filings)
         self._save_state()
@@ -160,21 +189,25 @@ class SECFilingMonitor:
         return ciks
 
 
-    def poll_sec_for_filing(self, cik: str) -> List[Dict]:
+    def poll_sec_for_filing(self, cik: str, resolve_urls: bool = True) -> List[Dict]:
         """
         Poll SEC RSS feed for recent filings from a specific CIK
 
         SEC RSS URL format:
         https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=XXXXX&type=&dateb=&owner=exclude&count=40&output=atom
+
+        Args:
+            cik: Company CIK
+            resolve_urls: Resolve index page → primary document URL inline.
+                          poll_all_spacs passes False and resolves all filings
+                          concurrently via the async fetch engine instead.
         """
         try:
             cik_padded = cik.zfill(10)
             rss_url = f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik_padded}&type=&dateb=&owner=exclude&count=40&output=atom"
 
-            # Fetch RSS feed
-            response = requests.get(rss_url, headers={
-                'User-Agent': 'SPAC Research Platform admin@spacresearch.com'
-            }, timeout=30)
+            # Fetch RSS feed (shared SEC rate limiter + keep-alive session)
+            response = sec_get(rss_url, timeout=30)
 
             if response.status_code != 200:
                 return []
@@ -229,7 +262,10 @@ class SECFilingMonitor:
 
                 # Resolve index page URL to primary document URL using centralized fetcher
                 # This ensures we fetch the actual filing (e.g., 10-Q report) not just the index page
-                primary_url = self.sec_fetcher.extract_document_url(entry.link, filing_type) or entry.link
+                if resolve_urls:
+                    primary_url = self.sec_fetcher.extract_document_url(entry.link, filing_type) or entry.link
+                else:
+                    primary_url = entry.link
 
                 filing = {
                     'id': filing_id,
@@ -238,6 +274,7 @@ class SECFilingMonitor:
                     'date': filing_date,
                     'title': entry.title,
                     'url': primary_url,  # Use resolved URL instead of entry.link
+                    'index_url': entry.link,
                     'summary': entry.summary if hasattr(entry, 'summary') else ''
                 }
 
@@ -251,36 +288,184 @@ class SECFilingMonitor:
             print(f"   ⚠️  Error polling CIK {cik}: {e}")
             return []
 
+    @staticmethod
+    def _normalize_cik(cik) -> str:
+        """Normalize CIK for set membership ('0001234567', '1234567', 1234567 → '1234567')"""
+        return str(cik).strip().lstrip('0') or '0'
+
+    def _poll_latest_filings_feed(self, cutoff: datetime, page_size: int = 100, max_pages: int = 40) -> set:
+        """
+        Scan EDGAR's "latest filings" Atom feed (all filers) for tracked CIKs
+
+        Feed is ordered newest first, so paging stops once entries fall behind cutoff.
+
+        Args:
+            cutoff: Naive local time (entry timestamps are UTC and compared in UTC)
+
+        Returns:
+            Set of normalized tracked CIKs with a filing since cutoff
+        """
+        matched = set()
+        cutoff_utc = cutoff.astimezone(timezone.utc)
+
+        for page in range(max_pages):
+            url = EDGAR_LATEST_FILINGS_URL.format(start=page * page_size, count=page_size)
+            content = self.sec_fetcher.fetch_document(url)
+            if not content:
+                break
+
+            feed = feedparser.parse(content)
+            if not feed.entries:
+                break
+
+            reached_cutoff = False
+            for entry in feed.entries:
+                # Title format: "8-K - ACME ACQUISITION CORP (0001234567) (Filer)"
+                cik_match = re.search(r'\((\d{10})\)', entry.get('title', ''))
+                if not cik_match:
+                    cik_match = re.search(r'/edgar/data/(\d+)/', entry.get('link', ''))
+                if cik_match:
+                    cik = self._normalize_cik(cik_match.group(1))
+                    if cik in self.tracked_cik_set:
+                        matched.add(cik)
+
+                updated = entry.get('updated_parsed')
+                if updated and datetime(*updated[:6], tzinfo=timezone.utc) < cutoff_utc:
+                    reached_cutoff = True
+
+            if reached_cutoff or len(feed.entries) < page_size:
+                break
+
+        return matched
+
+    def _poll_daily_indexes(self, cutoff: datetime) -> set:
+        """
+        Scan EDGAR daily master indexes (master.YYYYMMDD.idx) since cutoff for tracked CIKs
+
+        Covers filings that already rolled off the latest filings feed. Index for the
+        current day is only published after close, so missing indexes are skipped.
+        A published index is joined once: later cycles skip it, so CIKs that
+        filed days ago are not re-polled every cycle.
+
+        Returns:
+            Set of normalized tracked CIKs with a filing in the newly scanned indexes
+        """
+        matched = set()
+        day = cutoff.date()
+        today = datetime.now().date()
+
+        while day <= today:
+            if day.weekday() < 5 and day not in self.scanned_daily_indexes:  # No indexes on weekends
+                url = EDGAR_DAILY_INDEX_URL.format(
+                    year=day.year,
+                    quarter=(day.month - 1) // 3 + 1,
+                    date=day.strftime('%Y%m%d')
+                )
+                content = self.sec_fetcher.fetch_document(url, max_retries=1)
+                if content:
+                    self.scanned_daily_indexes.add(day)
+                    # Data rows: CIK|Company Name|Form Type|Date Filed|Filename
+                    for line in content.splitlines():
+                        cik, sep, _ = line.partition('|')
+                        if sep and cik.isdigit():
+                            cik = self._normalize_cik(cik)
+                            if cik in self.tracked_cik_set:
+                                matched.add(cik)
+            day += timedelta(days=1)
+
+        return matched
+
+    def _find_ciks_with_new_filings(self) -> List[str]:
+        """
+        Bulk mode: join EDGAR-wide feeds against tracked CIK set
+
+        The latest filings feed is read back to the previous check (minus
+        LATEST_FEED_OVERLAP), so a cycle pages through new filings only. Daily
+        indexes cover DAILY_INDEX_LOOKBACK (same window as poll_sec_for_filing)
+        for filings that rolled off the feed, each index joined once.
+
+        Returns:
+            Tracked CIKs (original format) that have filings since cutoff
+        """
+        matched = self._poll_latest_filings_feed(self.last_check - LATEST_FEED_OVERLAP)
+        matched |= self._poll_daily_indexes(datetime.now() - DAILY_INDEX_LOOKBACK)
+        matched |= {self._normalize_cik(cik) for cik in self.unprocessed_filings.values()}
+
+        return [cik for cik in self.tracked_ciks if self._normalize_cik(cik) in matched]
+
     def poll_all_spacs(self) -> List[Dict]:
         """Poll SEC for filings from all tracked SPACs"""
         print(f"\n🔍 Polling SEC for new filings...")
         print(f"   Last check: {self.last_check.strftime('%Y-%m-%d %H:%M:%S')}")
 
+        # Next cycle reads the feeds back to when this one started
+        poll_started = datetime.now()
         all_filings = []
 
-        for i, cik in enumerate(self.tracked_ciks):
+        if self.bulk_mode:
+            ciks_to_poll = self._find_ciks_with_new_filings()
+            print(f"   ✓ Bulk feeds matched {len(ciks_to_poll)}/{len(self.tracked_ciks)} tracked CIKs")
+        else:
+            ciks_to_poll = self.tracked_ciks
+
+        for i, cik in enumerate(ciks_to_poll):
             if i > 0 and i % 10 == 0:
-                print(f"   Progress: {i}/{len(self.tracked_ciks)} CIKs checked")
-                time.sleep(1)  # Rate limiting
+                print(f"   Progress: {i}/{len(ciks_to_poll)} CIKs checked")
 
-            filings = self.poll_sec_for_filing(cik)
+            # SEC rate limit (10 req/s) enforced by shared limiter in utils.sec_http
+            filings = self.poll_sec_for_filing(cik, resolve_urls=False)
             all_filings.extend(filings)
 
-            time.sleep(0.15)  # SEC rate limit: 10 requests/second
-
         print(f"   ✓ Found {len(all_filings)} new filings")
+        self.unprocessed_filings.update((filing['id'], filing['cik']) for filing in all_filings)
 
-        # Fetch filing text content for each filing
-        for filing in all_filings:
-            filing['content'] = self.fetch_filing_content(filing)
+        # Local submissions copies of these CIKs are now stale - agents must see the new filings
+        invalidate_ciks({filing['cik'] for filing in all_filings if filing.get('cik')})
+
+        # Resolve primary documents and fetch filing text for all filings concurrently
+        self.fetch_filing_contents(all_filings)
 
         # Update last check time (but DON'T save state yet - wait for orchestrator confirmation)
-        self.last_check = datetime.now()
+        self.last_check = poll_started
         # DON'T save state here - orchestrator will call mark_filings_processed() after DB insertion
         # self._save_state()  # MOVED to mark_filings_processed()
 
         return all_filings
 
+    def fetch_filing_contents(self, filings: List[Dict]):
+        """
+        Resolve primary document URL and fetch text for many filings concurrently
+
+        Index pages and primary documents are pipelined through the async fetch
+        engine (shared SEC rate limit + document cache). Sets filing['url'] to the
+        resolved primary document and filing['content'] to its text (50k chars).
+        """
+        if not filings:
+            return
+
+        try:
+            bundles = fetch_filing_bundles(
+                [(f.get('index_url') or f['url'], f['type']) for f in filings],
+                exhibit_numbers=None
+            )
+        except Exception as e:
+            print(f"   ⚠️  Concurrent fetch failed ({e}) - fetching sequentially")
+            for filing in filings:
+                filing['url'] = self.sec_fetcher.extract_document_url(filing['url'], filing['type']) or filing['url']
+                filing['content'] = self.fetch_filing_content(filing)
+            return
+
+        for filing, bundle in zip(filings, bundles):
+            if bundle['document_url']:
+                filing['url'] = bundle['document_url']
+
+            if bundle['document']:
+                filing['content'] = html_to_text(bundle['document'], max_chars=50000)
+                print(f"      ✓ Fetched {len(filing['content']):,} chars of filing text")
+            else:
+                filing['content'] = None
+                print(f"      ⚠️  Could not fetch filing text")
+
     def fetch_filing_content(self, filing: Dict) -> Optional[str]:
         """
         Fetch the actual filing text content
@@ -311,42 +496,32 @@ class SECFilingMonitor:
             print(f"      ⚠️  Error fetching filing content: {e}")
             return None
 
-    def _determine_priority(self, relevance_score: int) -> str:
-        """Convert AI relevance score (0-100) to priority level"""
-        if relevance_score >= 80:
-            return 'CRITICAL'
-        elif relevance_score >= 60:
-            return 'HIGH'
-        elif relevance_score >= 40:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
-
     def classify_filing(self, filing: Dict) -> Dict:
         """
         Classify filing priority and determine which agents to route to
 
-        NEW: Uses Universal Filing Analyzer for comprehensive AI-powered analysis
-        Falls back to rule-based classification if AI unavailable
+        Uses the single-pass FilingAnalysis (utils/filing_analysis.py): one
+        Universal Filing Analyzer call, persisted by accession number, whose
+        agent relevance and summary are reused by the orchestrator and the
+        news feed. Falls back to rule-based classification if no content.
+
+        8-Ks are routed by the items EDGAR lists for them (utils/eight_k_items.py)
+        without any AI call; only filings with missing or ambiguous items
+        (7.01 / 8.01 only) are analyzed.
         """
-        # Try Universal Analyzer first (comprehensive AI analysis)
+        if filing['type'] in ['8-K', '8-K/A']:
+            classification = self._classify_8k_by_items(filing)
+            if classification:
+                return classification
+
         try:
-            from agents.universal_filing_analyzer import UniversalFilingAnalyzer
+            from utils.filing_analysis import get_filing_analysis
 
-            # Ensure we have filing content
-            content = filing.get('content')
-            if content:
-                analyzer = UniversalFilingAnalyzer()
-                analysis = analyzer.analyze_filing_content(filing, content)
-
-                # Convert AI analysis to classification format
-                return {
-                    'priority': self._determine_priority(analysis['relevance_score']),
-                    'agents_needed': analysis['recommended_agents'],
-                    'reason': analysis['summary'],
-                    'data_types': analysis.get('data_types', {}),
-                    'relevance_score': analysis['relevance_score']
-                }
+            analysis = get_filing_analysis(filing)
+            if analysis:
+                if analysis.primary_item and not filing.get('item_number'):
+                    filing['item_number'] = analysis.primary_item
+                return analysis.to_classification()
         except Exception as e:
             print(f"   ⚠️  Universal Analyzer failed: {e}")
             print(f"   ⏭️  Falling back to rule-based classification")
@@ -473,6 +648,28 @@ class SECFilingMonitor:
                 'reason': f'Standard filing type: {filing_type}'
             }
 
+    def _classify_8k_by_items(self, filing: Dict) -> Optional[Dict]:
+        """
+        Route 8-K by the items listed in EDGAR metadata (rule table, no AI)
+
+        Returns:
+            Classification, or None if items are missing or ambiguous
+        """
+        from utils.eight_k_items import get_8k_items, route_8k_items
+
+        try:
+            items = get_8k_items(filing, self.sec_fetcher)
+        except Exception as e:
+            print(f"   ⚠️  Could not read 8-K items: {e}")
+            return None
+
+        if items:
+            filing['items'] = items
+        classification = route_8k_items(items)
+        if classification:
+            filing['item_number'] = classification['item_number']
+        return classification
+
     def _classify_8k_with_ai(self, filing: Dict) -> Dict:
         """
         Use AI to classify 8-K filing by determining Item number
@@ -637,7 +834,8 @@ NOTE: If Item 5.07 (shareholder vote results), include RedemptionExtractor to ex
                 if not filings:
                     print(f"   No new filings - sleeping for {self.poll_interval}s")
                 else:
-                    # Classify and route each filing
+                    # Classify each filing, then route all of them through the shared worker pool
+                    to_process = []
                     for filing in filings:
                         classification = self.classify_filing(filing)
 
@@ -656,13 +854,20 @@ NOTE: If Item 5.07 (shareholder vote results), include RedemptionExtractor to ex
                         # Route to agent orchestrator
                         if classification['agents_needed']:
                             print(f"      → Routing to agent orchestrator...")
-                            # Import orchestrator (lazy load to avoid circular imports)
-                            from agent_orchestrator import Orchestrator
-                            orchestrator = Orchestrator()
-                            orchestrator.process_filing(filing, classification)
+                            to_process.append((filing, classification))
+
+                    if to_process:
+                        # Long-lived orchestrator + worker pool (lazy import avoids circular imports)
+                        from filing_processing_service import get_filing_service
+                        get_filing_service().process_batch(to_process)
+
+                    # Republish dashboard snapshot with data committed by the agents
+                    from utils.dashboard_snapshot import invalidate_dashboard_snapshot
+                    invalidate_dashboard_snapshot(['spacs'])
 
                 # Adaptive sleep: shorter intervals if we have accelerated tickers
-                if accelerated_tickers:
+                # (bulk mode polls are cheap enough to run accelerated for everyone)
+                if accelerated_tickers or self.bulk_mode:
                     sleep_interval = min(300, self.poll_interval)  # 5 minutes for accelerated
                     print(f"\n   ⚡ Accelerated mode: sleeping for {sleep_interval}s ({sleep_interval/60:.0f} min)...")
                 else:
@@ -688,10 +893,12 @@ def main():
                        help='Run in continuous monitoring mode')
     parser.add_argument('--interval', type=int, default=900,
                        help='Poll interval in seconds (default: 900 = 15 min)')
+    parser.add_argument('--bulk', action='store_true',
+                       help='Use EDGAR latest-filings feed + daily index instead of one request per CIK')
     args = parser.parse_args()
 
     # Initialize monitor
-    monitor = SECFilingMonitor(poll_interval_seconds=args.interval)
+    monitor = SECFilingMonitor(poll_interval_seconds=args.interval, bulk_mode=args.bulk or None)
 
     if args.continuous:
         # Run continuous monitoring
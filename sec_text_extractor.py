@@ -10,11 +10,12 @@ Usage:
     text = extract_filing_text(filing_url)
 """
 
-import requests
-from bs4 import BeautifulSoup
 import re
 from typing import Optional
 
+from utils.sec_http import sec_get
+from utils.html_text import html_to_text as fast_html_to_text
+
 def extract_filing_text(filing_url: str, max_chars: int = 100000) -> Optional[str]:
     """
     Extract clean text from an SEC filing
@@ -27,38 +28,37 @@ def extract_filing_text(filing_url: str, max_chars: int = 100000) -> Optional[st
         Clean text string or None if extraction fails
     """
     try:
-        response = requests.get(
-            filing_url,
-            headers={'User-Agent': 'LEVP SPAC Platform fenil@legacyevp.com'},
-            timeout=30
-        )
+        response = sec_get(filing_url, timeout=30)
         
         if response.status_code != 200:
             return None
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "meta", "link"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        # Return truncated text
-        return text[:max_chars] if max_chars else text
+        return html_to_text(response.content, max_chars)
         
     except Exception as e:
         print(f"⚠️  Error extracting text from {filing_url}: {e}")
         return None
 
 
+def html_to_text(html, max_chars: int = 100000) -> str:
+    """
+    Convert already-fetched filing HTML to clean text
+    
+    Used by extract_filing_text and by callers that download documents
+    themselves (e.g., the async fetch engine in utils/sec_async_fetcher.py).
+    
+    Args:
+        html: Raw HTML (str or bytes)
+        max_chars: Maximum characters to return (default 100k, None/0 = no limit)
+    
+    Returns:
+        Clean text string
+    """
+    # Streaming parse: hidden iXBRL / script content is skipped and parsing
+    # stops once max_chars of visible text is collected
+    return fast_html_to_text(html, max_chars=max_chars or None)
+
+
 def extract_txt_file(accession_number: str, cik: str) -> Optional[str]:
     """
     Extract from .txt version of filing (plain text format)
@@ -80,11 +80,7 @@ def extract_txt_file(accession_number: str, cik: str) -> Optional[str]:
     txt_url = f"https://www.sec.gov/Archives/edgar/data/{cik_clean}/{accession_clean}/{txt_filename}"
     
     try:
-        response = requests.get(
-            txt_url,
-            headers={'User-Agent': 'LEVP SPAC Platform fenil@legacyevp.com'},
-            timeout=30
-        )
+        response = sec_get(txt_url, timeout=30)
         
         if response.status_code == 200:
             return response.text
@@ -95,6 +91,49 @@ def extract_txt_file(accession_number: str, cik: str) -> Optional[str]:
         return None
 
 
+def extract_txt_header(accession_number: str, cik: str, max_bytes: int = 256 * 1024) -> Optional[str]:
+    """
+    Read only the SEC-HEADER block of the .txt version of a filing
+
+    The .txt submission carries every document of the filing (often several
+    MB); the header (filer, items, dates) comes first, so the download is
+    streamed and stopped right after </SEC-HEADER>.
+
+    Args:
+        accession_number: SEC accession number (e.g., 0001193125-25-223444)
+        cik: Company CIK number
+        max_bytes: Give up after this many bytes without a closing tag
+
+    Returns:
+        Header text (up to and including </SEC-HEADER>), or None
+    """
+    accession_clean = accession_number.replace('-', '')
+    txt_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession_clean}/{accession_clean}.txt"
+
+    try:
+        response = sec_get(txt_url, timeout=30, stream=True)
+        try:
+            if response.status_code != 200:
+                return None
+
+            content = b''
+            for chunk in response.iter_content(chunk_size=8192):
+                content += chunk
+                end = content.find(b'</SEC-HEADER>')
+                if end >= 0:
+                    content = content[:end + len(b'</SEC-HEADER>')]
+                    break
+                if len(content) >= max_bytes:
+                    break
+            return content.decode(response.encoding or 'latin-1', errors='replace')
+        finally:
+            response.close()
+
+    except Exception as e:
+        print(f"⚠️  Error fetching .txt header: {e}")
+        return None
+
+
 def search_filing_for_patterns(filing_text: str, patterns: dict) -> dict:
     """
     Search filing text for specific patterns
@@ -9,6 +9,9 @@ echo "Setting up AI Agent Orchestrator cron jobs..."
 # Run every 2 hours
 (crontab -l 2>/dev/null; echo "0 */2 * * * /home/ubuntu/spac-research/venv/bin/python3 /home/ubuntu/spac-research/agent_orchestrator.py >> /home/ubuntu/spac-research/logs/orchestrator.log 2>&1") | crontab -
 
+# Sync EDGAR submissions (local filing index) every 4 hours
+(crontab -l 2>/dev/null; echo "30 */4 * * * /home/ubuntu/spac-research/venv/bin/python3 /home/ubuntu/spac-research/utils/edgar_submissions.py >> /home/ubuntu/spac-research/logs/edgar_submissions.log 2>&1") | crontab -
+
 # Show installed cron jobs
 echo ""
 echo "Installed cron jobs:"
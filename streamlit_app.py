@@ -7,7 +7,7 @@ import os
 # Import timezone helpers
 from utils.timezone_helper import (
     format_datetime, format_short_date, format_long_date,
-    format_news_timestamp, now_eastern, to_eastern
+    format_news_timestamp, now_eastern
 )
 
 # Import number formatting
@@ -21,8 +21,10 @@ except:
     AGENT_AVAILABLE = False
 
 # Import database
-from database import SessionLocal, SPAC, MarketSnapshot, UserIssue
-from pre_ipo_database import SessionLocal as PreIPOSessionLocal, PreIPOSPAC
+from database import SessionLocal, UserIssue
+
+# Dashboard data comes from the shared columnar snapshot (published by the pipelines)
+from utils.dashboard_snapshot import load_snapshot, snapshot_version, invalidate_dashboard_snapshot
 
 st.set_page_config(
     page_title="LEVP SPAC Platform",
@@ -47,219 +49,50 @@ if 'agent' not in st.session_state:
         st.session_state.agent = None
 
 # Load premium history data
-@st.cache_data(ttl=300)
 def load_premium_history(days=90):
     """Load historical premium snapshots"""
-    db = SessionLocal()
-    try:
-        from datetime import timedelta
-        cutoff_date = datetime.now().date() - timedelta(days=days)
-
-        snapshots = db.query(MarketSnapshot).filter(
-            MarketSnapshot.snapshot_date >= cutoff_date
-        ).order_by(MarketSnapshot.snapshot_date).all()
-
-        data = []
-        for s in snapshots:
-            data.append({
-                'date': s.snapshot_date,
-                'avg_premium_predeal': s.avg_premium_predeal,
-                'median_premium_predeal': s.median_premium_predeal,
-                'weighted_avg_premium_predeal': s.weighted_avg_premium_predeal,
-                'count_predeal': s.count_predeal,
-                'avg_premium_announced': s.avg_premium_announced,
-                'median_premium_announced': s.median_premium_announced,
-                'weighted_avg_premium_announced': s.weighted_avg_premium_announced,
-                'count_announced': s.count_announced
-            })
-
-        return pd.DataFrame(data)
-    finally:
-        db.close()
+    from datetime import timedelta
+    cutoff_date = datetime.now().date() - timedelta(days=days)
+
+    history = load_snapshot('premium_history')
+    return history[history['date'] >= cutoff_date]
+
+def to_eastern_series(values: pd.Series) -> pd.Series:
+    """Vectorized to_eastern: naive timestamps are UTC, converted to US/Eastern"""
+    timestamps = pd.to_datetime(values, errors='coerce')
+    if timestamps.dt.tz is None:
+        timestamps = timestamps.dt.tz_localize('UTC')
+    return timestamps.dt.tz_convert('US/Eastern')
+
+# Columns displayed in Eastern time
+SPAC_EASTERN_COLUMNS = [
+    'announced_date', 'shareholder_vote_date', 'ipo_date', 'deadline_date', 'latest_s4_date',
+    'proxy_filed_date', 'last_scraped_at', 'last_price_update'
+]
+
+# Load data from snapshot - one frame per server process shared by all sessions,
+# rebuilt only when a pipeline publishes a new snapshot (version changes)
+@st.cache_resource(max_entries=1)
+def _load_spac_view(version):
+    df = load_snapshot('spacs')
+    return df.assign(**{column: to_eastern_series(df[column]) for column in SPAC_EASTERN_COLUMNS})
 
-# Load data from database
-@st.cache_data(ttl=300)
 def load_spac_data():
-    db = SessionLocal()
-    try:
-        spacs = db.query(SPAC).all()
-        data = []
-        today = datetime.now().date()
-
-        for s in spacs:
-            # Calculate days_to_deadline dynamically
-            days_left = None
-            if s.deadline_date:
-                deadline = s.deadline_date.date() if isinstance(s.deadline_date, datetime) else s.deadline_date
-                days_left = (deadline - today).days
-
-            data.append({
-                'ticker': s.ticker,
-                'company': s.company,
-                'price': s.price,
-                'price_change_24h': s.price_change_24h,
-                'volume': s.volume,
-                'premium': s.premium,
-                'trust_value': s.trust_value,
-                'trust_cash': s.trust_cash,
-                'shares_outstanding': s.shares_outstanding,
-                'founder_shares': s.founder_shares,
-                'founder_ownership': s.founder_ownership,
-                'deal_status': s.deal_status,
-                'target': s.target,
-                'expected_close': s.expected_close,
-                'announced_date': to_eastern(s.announced_date),
-                'completion_date': s.completion_date,
-                'new_ticker': s.new_ticker,
-                'shareholder_vote_date': to_eastern(s.shareholder_vote_date),
-                'price_at_announcement': s.price_at_announcement,
-                'return_since_announcement': s.return_since_announcement,
-                'days_to_deadline': days_left,  # Calculated dynamically
-                'market_cap': s.market_cap,
-                'yahoo_market_cap': s.yahoo_market_cap,
-                'market_cap_variance': s.market_cap_variance,
-                'risk_level': s.risk_level,
-                'sector': s.sector,
-                'banker': s.banker,
-                'co_bankers': s.co_bankers,
-                'sponsor': s.sponsor,
-                'deal_value': s.deal_value,
-                'pipe_size': s.pipe_size,
-                'pipe_price': s.pipe_price,
-                'min_cash': s.min_cash,
-                'ipo_date': to_eastern(s.ipo_date),
-                'ipo_proceeds': s.ipo_proceeds,
-                'unit_ticker': s.unit_ticker,
-                'warrant_ticker': s.warrant_ticker,
-                'right_ticker': s.right_ticker,
-                'unit_price': s.unit_price,
-                'warrant_price': s.warrant_price,
-                'rights_price': s.rights_price,
-                'unit_structure': s.unit_structure,
-                'deadline_date': to_eastern(s.deadline_date),
-                'deadline_months': s.deadline_months,
-                'redemptions_occurred': s.redemptions_occurred,
-                'shares_redeemed': s.shares_redeemed,
-                'redemption_percentage': s.redemption_percentage,
-                'redemption_amount': s.redemption_amount,
-                'last_redemption_date': s.last_redemption_date,
-                'latest_s4_date': to_eastern(s.latest_s4_date),
-                'proxy_filed_date': to_eastern(s.proxy_filed_date),
-                'last_scraped_at': to_eastern(s.last_scraped_at),
-                'last_price_update': to_eastern(s.last_price_update),
-                'notes': s.notes,
-                # Sponsor economics
-                'sponsor_total_at_risk': s.sponsor_total_at_risk,
-                'sponsor_at_risk_percentage': s.sponsor_at_risk_percentage,
-                # Source document URLs
-                'prospectus_424b4_url': s.prospectus_424b4_url,
-                'deal_filing_url': s.deal_filing_url,
-                'press_release_url': s.press_release_url,
-                's1_filing_url': s.s1_filing_url,
-                's4_filing_url': s.s4_filing_url,
-                'proxy_filing_url': s.proxy_filing_url,
-                'sec_company_url': s.sec_company_url
-            })
-        return pd.DataFrame(data)
-    finally:
-        db.close()
+    return _load_spac_view(snapshot_version())
 
 df = load_spac_data()
 
-# Calculate tradeable float and volume as % of float
-def calculate_float_metrics(row):
-    """
-    Calculate public float and volume % of float
-
-    KEY INSIGHT (Oct 20, 2025):
-    For pre-deal SPACs, ALL Class A shares are freely tradeable.
-    Float = shares_outstanding (no need to subtract founder/redeemed)
-
-    Why? Class A shares are:
-    - All public (sold in IPO)
-    - All redeemable (can be redeemed for trust value)
-    - All liquid (trade on exchange)
-
-    Founder shares are Class B (separate, not counted in shares_outstanding)
-    """
-    shares_out = row.get('shares_outstanding')
-    deal_status = row.get('deal_status')
-    volume = row.get('volume')
-
-    if not shares_out:
-        return None, None
-
-    # For pre-deal SPACs (SEARCHING, ANNOUNCED):
-    # Float = shares_outstanding (all Class A shares are tradeable)
-    if deal_status in ['SEARCHING', 'ANNOUNCED']:
-        public_float = shares_out
-    else:
-        # For completed deals, we'd ideally use Yahoo's floatShares
-        # but for now, use shares_outstanding as approximation
-        public_float = shares_out
-
-    # Volume as % of float
-    volume_pct_float = (volume / public_float * 100) if volume else None
+# public_float / volume_pct_float / ipo_proceeds_numeric are precomputed in the snapshot
+# (see add_float_metrics / parse_ipo_proceeds_series in utils/dashboard_snapshot.py)
 
-    return public_float, volume_pct_float
+# Load pre-IPO SPAC data (shared snapshot, see load_spac_data)
+@st.cache_resource(max_entries=1)
+def _load_pre_ipo_view(version):
+    df = load_snapshot('pre_ipo')
+    return df.assign(last_checked=to_eastern_series(df['last_checked']))
 
-df['public_float'] = df.apply(lambda row: calculate_float_metrics(row)[0], axis=1)
-df['volume_pct_float'] = df.apply(lambda row: calculate_float_metrics(row)[1], axis=1)
-
-# Helper function to convert IPO proceeds string to numeric for sorting
-def parse_ipo_proceeds(value):
-    """Convert '$100M' or '$150,650,000' to millions (100.0, 150.65)"""
-    if pd.isna(value) or not value:
-        return None
-    try:
-        # Remove $ and commas
-        cleaned = value.replace('$', '').replace(',', '')
-
-        # If it ends with M, just remove M and convert
-        if cleaned.endswith('M'):
-            return float(cleaned.replace('M', ''))
-        else:
-            # Otherwise it's in dollars, convert to millions
-            return float(cleaned) / 1_000_000
-    except:
-        return None
-
-# Load pre-IPO SPAC data
-# IMPORTANT: Cache disabled for debugging - re-enable with @st.cache_data(ttl=60) after confirming it works
 def load_pre_ipo_data():
-    db = PreIPOSessionLocal()
-    try:
-        spacs = db.query(PreIPOSPAC).filter(
-            PreIPOSPAC.moved_to_main_pipeline == False
-        ).all()
-        data = []
-        for s in spacs:
-            data.append({
-                'company': s.company,
-                'expected_ticker': s.expected_ticker,
-                'cik': s.cik,
-                's1_filing_date': s.s1_filing_date,
-                'filing_status': s.filing_status,
-                'effectiveness_date': s.effectiveness_date,
-                'pricing_date': s.pricing_date,
-                'target_proceeds': s.target_proceeds,
-                'ipo_price_range': s.ipo_price_range,
-                'trust_per_unit': s.trust_per_unit,
-                'unit_structure': s.unit_structure,
-                'charter_deadline_months': s.charter_deadline_months,
-                'target_sector': s.target_sector,
-                'target_geography': s.target_geography,
-                'target_description': s.target_description,
-                'sponsor': s.sponsor,
-                'lead_banker': s.lead_banker,
-                'co_bankers': s.co_bankers,
-                'amendment_count': s.amendment_count,
-                's1_url': s.s1_url,
-                'last_checked': to_eastern(s.last_checked)
-            })
-        return pd.DataFrame(data)
-    finally:
-        db.close()
+    return _load_pre_ipo_view(snapshot_version())
 
 pre_ipo_df = load_pre_ipo_data()
 
@@ -1158,9 +991,6 @@ elif page == "🔍 Pre-Deal SPACs":
     else:
         display_df = df_predeal.copy()
 
-        # Convert IPO proceeds to numeric for sorting
-        display_df['ipo_proceeds_numeric'] = display_df['ipo_proceeds'].apply(parse_ipo_proceeds)
-
         # Convert sponsor at-risk to millions for display
         display_df['sponsor_at_risk_millions'] = display_df['sponsor_total_at_risk'].apply(
             lambda x: round(x / 1_000_000, 2) if pd.notna(x) else None
@@ -1275,6 +1105,7 @@ elif page == "🚀 Pre-IPO Pipeline":
     with col_refresh:
         if st.button("🔄 Refresh"):
             st.cache_data.clear()
+            invalidate_dashboard_snapshot(['pre_ipo'])
             st.rerun()
 
     if len(pre_ipo_df) == 0:
@@ -2098,9 +1929,6 @@ elif page == "⭐ Watchlist":
     else:
         display_df = df_predeal_watchlist.copy()
 
-        # Convert IPO proceeds to numeric for sorting
-        display_df['ipo_proceeds_numeric'] = display_df['ipo_proceeds'].apply(parse_ipo_proceeds)
-
         # Convert sponsor at-risk to millions for display
         display_df['sponsor_at_risk_millions'] = display_df['sponsor_total_at_risk'].apply(
             lambda x: round(x / 1_000_000, 2) if pd.notna(x) else None
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Agent State Store - Append-only, bounded SQLite backend for the orchestrator StateManager
+
+The orchestrator used to keep task history and decisions in ever-growing lists
+and rewrite one JSON file (indent=2) on every call - slower and larger the
+longer it ran, and a crash mid-write could corrupt the file. This store keeps:
+
+- task_history / decisions: append-only tables (one INSERT per event), pruned
+  to a retention window
+- agent_stats: per-agent aggregates (runs, successes, failures, avg and p95
+  duration) updated incrementally on every task
+- kv: small key/value state (last_run timestamps, counters), upserted per key
+
+SQLite runs in WAL mode: appends are O(1), readers never block the writer, and
+a crash can only lose the last uncommitted event, never corrupt existing state.
+
+Usage:
+    store = AgentStateStore('/path/to/agent_state.db')
+    store.append_task(task.to_dict())
+    store.set_values({'sec_monitor_error_count': 0})
+    stats = store.agent_stats()
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Retention windows for append-only tables
+TASK_HISTORY_RETENTION_DAYS = int(os.getenv('AGENT_TASK_HISTORY_RETENTION_DAYS', '30'))
+DECISION_RETENTION_DAYS = int(os.getenv('AGENT_DECISION_RETENTION_DAYS', '30'))
+
+# Prune expired rows every N appends (plus once at startup)
+PRUNE_EVERY = 500
+
+# Durations kept per agent for the rolling p95
+DURATION_WINDOW = 200
+
+
+def _percentile(values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of a small collection"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class AgentStateStore:
+    """SQLite (WAL) store for orchestrator state, history and per-agent aggregates"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_tables_exist()
+
+        self._appends = 0
+        self._stats: Dict[str, Dict] = {}
+        self._durations: Dict[str, deque] = {}
+        self._load_stats()
+        self.prune()
+
+    def _ensure_tables_exist(self):
+        """Create tables if they don't exist"""
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS kv (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL              -- JSON
+            );
+
+            CREATE TABLE IF NOT EXISTS task_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recorded_at TEXT NOT NULL,
+                agent_name TEXT,
+                task_type TEXT,
+                status TEXT,
+                duration_seconds REAL,
+                data TEXT NOT NULL               -- AgentTask.to_dict() as JSON
+            );
+            CREATE INDEX IF NOT EXISTS idx_task_history_recorded_at ON task_history(recorded_at);
+            CREATE INDEX IF NOT EXISTS idx_task_history_agent ON task_history(agent_name, recorded_at);
+
+            CREATE TABLE IF NOT EXISTS decisions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recorded_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_decisions_recorded_at ON decisions(recorded_at);
+
+            CREATE TABLE IF NOT EXISTS agent_stats (
+                agent_name TEXT PRIMARY KEY,
+                total_runs INTEGER NOT NULL DEFAULT 0,
+                successes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                timed_runs INTEGER NOT NULL DEFAULT 0,   -- runs with a known duration
+                avg_duration REAL NOT NULL DEFAULT 0,
+                p95_duration REAL,
+                recent_durations TEXT NOT NULL DEFAULT '[]'  -- last DURATION_WINDOW durations
+            );
+        """)
+
+    def _load_stats(self):
+        for row in self._conn.execute("""
+            SELECT agent_name, total_runs, successes, failures, timed_runs, avg_duration,
+                   p95_duration, recent_durations
+            FROM agent_stats
+        """):
+            name = row[0]
+            self._stats[name] = {
+                'total_runs': row[1],
+                'successes': row[2],
+                'failures': row[3],
+                'timed_runs': row[4],
+                'avg_duration': row[5],
+                'p95_duration': row[6],
+            }
+            self._durations[name] = deque(json.loads(row[7]), maxlen=DURATION_WINDOW)
+
+    # ------------------------------------------------------------------
+    # Key/value state
+    # ------------------------------------------------------------------
+
+    def get_values(self) -> Dict:
+        """All key/value state (small - loaded once by StateManager)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM kv").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def set_values(self, values: Dict):
+        """Upsert the given keys in one transaction"""
+        if not values:
+            return
+        rows = [(key, json.dumps(value, default=str)) for key, value in values.items()]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO kv (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows
+            )
+            self._conn.execute("COMMIT")
+
+    def delete_values(self, keys):
+        with self._lock:
+            self._conn.executemany("DELETE FROM kv WHERE key = ?", [(key,) for key in keys])
+
+    # ------------------------------------------------------------------
+    # Append-only history
+    # ------------------------------------------------------------------
+
+    def append_task(self, task: Dict, recorded_at: Optional[datetime] = None):
+        """
+        Append a task record and update its agent's aggregates
+
+        Args:
+            task: AgentTask.to_dict() (status as string value, ISO timestamps)
+            recorded_at: Event time (default: now)
+        """
+        recorded_at = recorded_at or datetime.now()
+        agent_name = task.get('agent_name')
+        status = task.get('status')
+        duration = None
+        if task.get('started_at') and task.get('completed_at'):
+            try:
+                duration = (datetime.fromisoformat(str(task['completed_at'])) -
+                            datetime.fromisoformat(str(task['started_at']))).total_seconds()
+            except ValueError:
+                duration = None
+
+        # Aggregates are shared with other worker threads - update them under the lock
+        with self._lock:
+            stats = self._stats.setdefault(agent_name, {
+                'total_runs': 0, 'successes': 0, 'failures': 0,
+                'timed_runs': 0, 'avg_duration': 0, 'p95_duration': None,
+            })
+            durations = self._durations.setdefault(agent_name, deque(maxlen=DURATION_WINDOW))
+
+            stats['total_runs'] += 1
+            if status == 'completed':
+                stats['successes'] += 1
+            elif status == 'failed':
+                stats['failures'] += 1
+            if duration is not None:
+                stats['timed_runs'] += 1
+                stats['avg_duration'] += (duration - stats['avg_duration']) / stats['timed_runs']
+                durations.append(duration)
+                stats['p95_duration'] = _percentile(durations, 95)
+
+            self._conn.execute("BEGIN")
+            self._conn.execute("""
+                INSERT INTO task_history (recorded_at, agent_name, task_type, status, duration_seconds, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (recorded_at.isoformat(), agent_name, task.get('task_type'), status, duration,
+                  json.dumps(task, default=str)))
+            self._conn.execute("""
+                INSERT INTO agent_stats (agent_name, total_runs, successes, failures, timed_runs,
+                                         avg_duration, p95_duration, recent_durations)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(agent_name) DO UPDATE SET
+                    total_runs = excluded.total_runs,
+                    successes = excluded.successes,
+                    failures = excluded.failures,
+                    timed_runs = excluded.timed_runs,
+                    avg_duration = excluded.avg_duration,
+                    p95_duration = excluded.p95_duration,
+                    recent_durations = excluded.recent_durations
+            """, (agent_name, stats['total_runs'], stats['successes'], stats['failures'], stats['timed_runs'],
+                  stats['avg_duration'], stats['p95_duration'], json.dumps(list(durations))))
+            self._conn.execute("COMMIT")
+
+        self._after_append()
+
+    def append_decision(self, decision: Dict, recorded_at: Optional[datetime] = None):
+        """Append an orchestrator decision"""
+        recorded_at = recorded_at or datetime.now()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO decisions (recorded_at, data) VALUES (?, ?)",
+                (recorded_at.isoformat(), json.dumps(decision, default=str))
+            )
+        self._after_append()
+
+    def _after_append(self):
+        self._appends += 1
+        if self._appends % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete history and decisions older than their retention windows
+
+        Returns:
+            Number of rows deleted
+        """
+        now = now or datetime.now()
+        task_cutoff = (now - timedelta(days=TASK_HISTORY_RETENTION_DAYS)).isoformat()
+        decision_cutoff = (now - timedelta(days=DECISION_RETENTION_DAYS)).isoformat()
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM task_history WHERE recorded_at < ?", (task_cutoff,)
+            ).rowcount
+            deleted += self._conn.execute(
+                "DELETE FROM decisions WHERE recorded_at < ?", (decision_cutoff,)
+            ).rowcount
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def agent_stats(self) -> Dict[str, Dict]:
+        """Per-agent aggregates (copy of in-memory values)"""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def recent_tasks(self, limit: int = 100, agent_name: Optional[str] = None) -> List[Dict]:
+        """Most recent task records (newest first)"""
+        with self._lock:
+            if agent_name:
+                rows = self._conn.execute(
+                    "SELECT data FROM task_history WHERE agent_name = ? ORDER BY id DESC LIMIT ?",
+                    (agent_name, limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT data FROM task_history ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def recent_decisions(self, limit: int = 100) -> List[Dict]:
+        """Most recent decisions (newest first)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM decisions ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return (self._conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 0 and
+                    self._conn.execute("SELECT COUNT(*) FROM agent_stats").fetchone()[0] == 0)
+
+    def import_legacy_json(self, state: Dict) -> Dict[str, int]:
+        """
+        Import history and aggregates from a legacy agent_state.json
+
+        Only history inside the retention windows is imported; key/value state
+        is written by the caller (StateManager decides the key layout).
+
+        Returns:
+            Counts of imported items
+        """
+        task_cutoff = (datetime.now() - timedelta(days=TASK_HISTORY_RETENTION_DAYS)).isoformat()
+        tasks = [task for task in state.get('task_history', [])
+                 if str(task.get('completed_at') or task.get('created_at') or '') >= task_cutoff]
+        for task in tasks:
+            recorded = task.get('completed_at') or task.get('created_at')
+            self.append_task(task, datetime.fromisoformat(str(recorded)) if recorded else None)
+
+        decision_cutoff = (datetime.now() - timedelta(days=DECISION_RETENTION_DAYS)).isoformat()
+        decisions = [decision for decision in state.get('decisions', [])
+                     if str(decision.get('timestamp', '')) >= decision_cutoff]
+        for decision in decisions:
+            recorded = decision.get('timestamp')
+            self.append_decision(decision, datetime.fromisoformat(recorded) if recorded else None)
+
+        # Lifetime counters from the legacy aggregates (history before the window is gone)
+        for name, legacy in state.get('agent_stats', {}).items():
+            stats = self._stats.setdefault(name, {
+                'total_runs': 0, 'successes': 0, 'failures': 0,
+                'timed_runs': 0, 'avg_duration': 0, 'p95_duration': None,
+            })
+            stats['total_runs'] = max(stats['total_runs'], legacy.get('total_runs', 0))
+            stats['successes'] = max(stats['successes'], legacy.get('successes', 0))
+            stats['failures'] = max(stats['failures'], legacy.get('failures', 0))
+            durations = self._durations.setdefault(name, deque(maxlen=DURATION_WINDOW))
+            with self._lock:
+                self._conn.execute("""
+                    INSERT INTO agent_stats (agent_name, total_runs, successes, failures, timed_runs,
+                                             avg_duration, p95_duration, recent_durations)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(agent_name) DO UPDATE SET
+                        total_runs = excluded.total_runs,
+                        successes = excluded.successes,
+                        failures = excluded.failures
+                """, (name, stats['total_runs'], stats['successes'], stats['failures'], stats['timed_runs'],
+                      stats['avg_duration'], stats['p95_duration'], json.dumps(list(durations))))
+
+        return {'tasks': len(tasks), 'decisions': len(decisions)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Component Ticker Index - Persistent resolution of unit/warrant/rights symbols
+
+Data providers list SPAC components under inconsistent suffixes (ABCDU,
+ABCD.U, ABCD-UN, ABCDWS, ABCD.WS, ABCD+, ABCDR, ...). Instead of probing every
+format on every price cycle, the index remembers per (base_ticker, component):
+
+- VERIFIED:  symbol that returned a quote → only that symbol is requested
+- CANDIDATE: symbol from a filing / SPAC field, not yet confirmed by a quote
+- NOT_FOUND: no format quoted → skipped until next_probe_at (exponential backoff)
+
+Fed by:
+- PriceUpdater (single + batch engines) with probe results
+- sec_data_scraper (424B4 / IPO press release tickers) via record_candidate
+- SPAC.unit_ticker / warrant_ticker / right_ticker (always probed first)
+
+Usage:
+    index = ComponentTickerIndex()
+    for symbol in index.candidates('ABCD', 'warrant', spac.warrant_ticker):
+        ...quote symbol...
+    index.record_success('ABCD', 'warrant', 'ABCD.WS')   # or record_failure(...)
+    index.flush()
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from database import SessionLocal
+
+# Components and the SPAC column holding their symbol
+COMPONENT_FIELDS = {
+    'unit': 'unit_ticker',
+    'warrant': 'warrant_ticker',
+    'rights': 'right_ticker',
+}
+
+# Suffix formats probed when no verified symbol is known (most common first)
+COMPONENT_SUFFIXES = {
+    'unit': ['U', '.U', '-UN', ' U', '/U', '-U'],
+    'warrant': ['W', 'WS', '.W', '.WS', '-WT', '/WS', ' W', ' WS', '-W', '+'],
+    'rights': ['R', '.R', ' R', '-R', '/R'],
+}
+
+# Re-probe backoff for NOT_FOUND entries: 1h, 2h, 4h, ... capped at 7 days
+BACKOFF_BASE = timedelta(hours=1)
+BACKOFF_MAX = timedelta(days=7)
+
+# Consecutive misses before a VERIFIED symbol is demoted (tolerates provider glitches)
+VERIFIED_MAX_MISSES = 3
+
+STATUS_VERIFIED = 'VERIFIED'
+STATUS_CANDIDATE = 'CANDIDATE'
+STATUS_NOT_FOUND = 'NOT_FOUND'
+
+
+def backoff_for(failed_attempts: int) -> timedelta:
+    """Re-probe delay after `failed_attempts` consecutive failed probes"""
+    return min(BACKOFF_BASE * (2 ** max(0, failed_attempts - 1)), BACKOFF_MAX)
+
+
+class ComponentTickerIndex:
+    """
+    In-memory view of the component_ticker_index table with batched write-back
+
+    All rows are loaded once (a few thousand at most); record_* calls update
+    memory and queue an upsert, flush() writes the queue in one statement.
+    """
+
+    def __init__(self, db=None):
+        """
+        Args:
+            db: Optional SQLAlchemy session to share (default: own SessionLocal)
+        """
+        self._owns_session = db is None
+        self.db = db or SessionLocal()
+        self._ensure_table_exists()
+
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+        self._dirty: Dict[Tuple[str, str], Dict] = {}
+        self.load()
+
+    def _ensure_table_exists(self):
+        """Create component_ticker_index table if it doesn't exist"""
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS component_ticker_index (
+            base_ticker VARCHAR(10) NOT NULL,
+            component VARCHAR(10) NOT NULL,      -- unit / warrant / rights
+            verified_symbol VARCHAR(20),         -- last symbol that quoted (or filing candidate)
+            status VARCHAR(20) NOT NULL,         -- VERIFIED / CANDIDATE / NOT_FOUND
+            failed_attempts INTEGER DEFAULT 0,
+            next_probe_at TIMESTAMP,             -- NOT_FOUND: skip until this time
+            last_verified_at TIMESTAMP,
+            last_probed_at TIMESTAMP,
+            source VARCHAR(50),                  -- price_updater / 424B4 / press_release / spac_field
+            PRIMARY KEY (base_ticker, component)
+        );
+        """
+
+        try:
+            self.db.execute(text(create_table_sql))
+            self.db.commit()
+        except Exception as e:
+            print(f"⚠️  Could not create component_ticker_index table: {e}")
+            self.db.rollback()
+
+    def load(self):
+        """(Re)load all index rows into memory"""
+        try:
+            rows = self.db.execute(text("""
+                SELECT base_ticker, component, verified_symbol, status, failed_attempts,
+                       next_probe_at, last_verified_at, last_probed_at, source
+                FROM component_ticker_index
+            """)).mappings().all()
+        except Exception as e:
+            print(f"⚠️  Could not load component_ticker_index: {e}")
+            self.db.rollback()
+            rows = []
+
+        self.entries = {(row['base_ticker'], row['component']): dict(row) for row in rows}
+
+    def _entry(self, base_ticker: str, component: str) -> Dict:
+        key = (base_ticker, component)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {
+                'base_ticker': base_ticker,
+                'component': component,
+                'verified_symbol': None,
+                'status': STATUS_CANDIDATE,
+                'failed_attempts': 0,
+                'next_probe_at': None,
+                'last_verified_at': None,
+                'last_probed_at': None,
+                'source': None,
+            }
+            self.entries[key] = entry
+        return entry
+
+    def _mark_dirty(self, entry: Dict):
+        self._dirty[(entry['base_ticker'], entry['component'])] = entry
+
+    def get_verified_symbol(self, base_ticker: str, component: str) -> Optional[str]:
+        """Get verified symbol for a component (None if not verified)"""
+        entry = self.entries.get((base_ticker, component))
+        if entry and entry['status'] == STATUS_VERIFIED:
+            return entry['verified_symbol']
+        return None
+
+    def candidates(self, base_ticker: str, component: str, known_symbol: Optional[str] = None,
+                   now: Optional[datetime] = None) -> List[str]:
+        """
+        Get symbols to request for a component this cycle
+
+        Args:
+            base_ticker: Common share ticker (e.g. 'ABCD')
+            component: 'unit', 'warrant' or 'rights'
+            known_symbol: Symbol stored on the SPAC record (probed first)
+            now: Current time (default: datetime.now())
+
+        Returns:
+            [verified_symbol] if verified, [] if in NOT_FOUND backoff,
+            otherwise known/candidate symbols followed by suffix variants
+        """
+        now = now or datetime.now()
+        entry = self.entries.get((base_ticker, component))
+
+        if entry:
+            if entry['status'] == STATUS_VERIFIED and entry['verified_symbol']:
+                return [entry['verified_symbol']]
+            if entry['status'] == STATUS_NOT_FOUND and entry['next_probe_at'] and entry['next_probe_at'] > now:
+                return []
+
+        symbols = []
+        for symbol in [known_symbol, entry['verified_symbol'] if entry else None]:
+            if symbol and symbol not in symbols:
+                symbols.append(symbol)
+        for suffix in COMPONENT_SUFFIXES[component]:
+            symbol = f"{base_ticker}{suffix}"
+            if symbol not in symbols:
+                symbols.append(symbol)
+        return symbols
+
+    def record_success(self, base_ticker: str, component: str, symbol: str,
+                       source: str = 'price_updater', now: Optional[datetime] = None):
+        """Record that `symbol` returned a quote for this component"""
+        now = now or datetime.now()
+        entry = self._entry(base_ticker, component)
+        if entry['verified_symbol'] != symbol or entry['status'] != STATUS_VERIFIED:
+            entry['source'] = source
+        entry.update({
+            'verified_symbol': symbol,
+            'status': STATUS_VERIFIED,
+            'failed_attempts': 0,
+            'next_probe_at': None,
+            'last_verified_at': now,
+            'last_probed_at': now,
+        })
+        self._mark_dirty(entry)
+
+    def record_failure(self, base_ticker: str, component: str, now: Optional[datetime] = None):
+        """
+        Record that no requested symbol quoted for this component
+
+        VERIFIED symbols are demoted after VERIFIED_MAX_MISSES consecutive
+        misses; otherwise the entry moves to NOT_FOUND with exponential backoff.
+        """
+        now = now or datetime.now()
+        entry = self._entry(base_ticker, component)
+        entry['failed_attempts'] = (entry['failed_attempts'] or 0) + 1
+        entry['last_probed_at'] = now
+
+        if entry['status'] == STATUS_VERIFIED and entry['failed_attempts'] < VERIFIED_MAX_MISSES:
+            self._mark_dirty(entry)
+            return
+
+        entry['status'] = STATUS_NOT_FOUND
+        entry['next_probe_at'] = now + backoff_for(entry['failed_attempts'])
+        self._mark_dirty(entry)
+
+    def record_candidate(self, base_ticker: str, component: str, symbol: str, source: str):
+        """
+        Record a symbol reported by a filing or SPAC field (not yet quoted)
+
+        A new candidate clears any NOT_FOUND backoff so it is probed next cycle.
+        A different candidate never overrides a VERIFIED symbol.
+        """
+        if not base_ticker or not symbol:
+            return
+        entry = self._entry(base_ticker, component)
+        if entry['status'] == STATUS_VERIFIED or entry['verified_symbol'] == symbol:
+            return
+        entry.update({
+            'verified_symbol': symbol,
+            'status': STATUS_CANDIDATE,
+            'failed_attempts': 0,
+            'next_probe_at': None,
+            'source': source,
+        })
+        self._mark_dirty(entry)
+
+    def resolve(self, base_ticker: str, component: str, probed: List[str], quoted,
+                now: Optional[datetime] = None) -> Optional[str]:
+        """
+        Record the outcome of a probe and return the working symbol
+
+        Args:
+            probed: Symbols requested (in preference order, from candidates())
+            quoted: Container of symbols that returned a quote
+
+        Returns:
+            First probed symbol that quoted, or None
+        """
+        if not probed:
+            return None
+        for symbol in probed:
+            if symbol in quoted:
+                self.record_success(base_ticker, component, symbol, now=now)
+                return symbol
+        self.record_failure(base_ticker, component, now=now)
+        return None
+
+    def flush(self) -> int:
+        """
+        Write queued changes in one upsert
+
+        Returns:
+            Number of rows written
+        """
+        if not self._dirty:
+            return 0
+
+        rows = list(self._dirty.values())
+        try:
+            self.db.execute(text("""
+                INSERT INTO component_ticker_index (
+                    base_ticker, component, verified_symbol, status, failed_attempts,
+                    next_probe_at, last_verified_at, last_probed_at, source
+                ) VALUES (
+                    :base_ticker, :component, :verified_symbol, :status, :failed_attempts,
+                    :next_probe_at, :last_verified_at, :last_probed_at, :source
+                )
+                ON CONFLICT (base_ticker, component) DO UPDATE SET
+                    verified_symbol = EXCLUDED.verified_symbol,
+                    status = EXCLUDED.status,
+                    failed_attempts = EXCLUDED.failed_attempts,
+                    next_probe_at = EXCLUDED.next_probe_at,
+                    last_verified_at = EXCLUDED.last_verified_at,
+                    last_probed_at = EXCLUDED.last_probed_at,
+                    source = EXCLUDED.source
+            """), rows)
+            self.db.commit()
+        except Exception as e:
+            print(f"⚠️  Could not write component_ticker_index: {e}")
+            self.db.rollback()
+            return 0
+
+        self._dirty.clear()
+        return len(rows)
+
+    def close(self):
+        """Flush pending changes and close own session"""
+        self.flush()
+        if self._owns_session:
+            self.db.close()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Correction Index - In-memory vector index over correction_vector_db
+
+RAGLearningMixin used to open a chromadb.PersistentClient and load the
+all-MiniLM-L6-v2 SentenceTransformer per agent instance, then embed and
+search one query at a time through Chroma. Model load alone cost seconds on
+every agent start.
+
+Instead, one index per process:
+
+- Embedding model: loaded lazily on the first query that is not already
+  cached, shared by every agent and by index_corrections_to_vectordb.py
+- Query embeddings: memoised per query string (prompts reuse a handful of
+  "Extracting {field} field ..." queries); embed_queries() batches misses
+- Correction vectors: read once from the Chroma collection into a NumPy
+  matrix; a search is one matrix-vector product plus metadata masks
+- Incremental refresh: at most every REFRESH_SECONDS the collection id list
+  is compared with the loaded ids and only new rows are fetched (a rebuilt
+  collection reloads in full)
+- Refreshes build a new _CorrectionSnapshot and swap it in with one
+  assignment; a query reads the snapshot once, so it never sees ids, vectors
+  and metadata masks from two different loads
+
+Distances follow the collection's hnsw:space (l2 by default), so results and
+'similarity' = 1 - distance match what Chroma returned.
+
+Usage:
+    from utils.correction_index import get_correction_index
+
+    index = get_correction_index()
+    corrections = index.query("Extracting trust_value field from SPAC SEC filing", n_results=3)
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv('CORRECTION_VECTOR_DB', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'correction_vector_db'
+))
+COLLECTION_NAME = 'spac_corrections'
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBEDDING_DIMENSION = 384
+
+# How often query() checks the collection for rows added by the indexer
+REFRESH_SECONDS = float(os.getenv('CORRECTION_INDEX_REFRESH_SECONDS', '60'))
+# Query embeddings kept in memory (each is 384 floats)
+QUERY_CACHE_SIZE = 1024
+
+
+class EmbeddingService:
+    """Process-wide sentence embedding model, loaded on first use"""
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL):
+        self.model_name = model_name
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._cache: Dict[str, np.ndarray] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    started = time.time()
+                    self._model = SentenceTransformer(self.model_name)
+                    logger.info(f"[RAG] Loaded {self.model_name} in {time.time() - started:.1f}s")
+        return self._model
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed documents in one batch (not cached) → float32 matrix"""
+        if not texts:
+            return np.zeros((0, EMBEDDING_DIMENSION), dtype=np.float32)
+        return np.asarray(self.model.encode(list(texts), batch_size=64), dtype=np.float32)
+
+    def embed_queries(self, queries: Sequence[str]) -> np.ndarray:
+        """Embed queries, reusing cached vectors and batching the misses"""
+        with self._cache_lock:
+            missing = list(dict.fromkeys(q for q in queries if q not in self._cache))
+
+        if missing:
+            vectors = self.embed(missing)
+            with self._cache_lock:
+                if len(self._cache) + len(missing) > QUERY_CACHE_SIZE:
+                    self._cache.clear()
+                self._cache.update(zip(missing, vectors))
+
+        with self._cache_lock:
+            return np.stack([self._cache[q] for q in queries]) if queries else self.embed([])
+
+
+class _CorrectionSnapshot:
+    """Loaded rows, vectors and filter arrays - never modified after construction"""
+
+    def __init__(self, ids: Sequence[str] = (), embeddings=None, documents: Sequence[str] = (),
+                 metadatas: Sequence[Optional[Dict]] = (), space: str = 'l2'):
+        self.space = space
+        self.ids = tuple(ids)
+        self.documents = tuple(documents)
+        self.metadatas = tuple(m or {} for m in metadatas)
+        if embeddings is None or not len(self.ids):
+            self.vectors = np.zeros((0, EMBEDDING_DIMENSION), dtype=np.float32)
+        else:
+            self.vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(self.ids), -1)
+        self.norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+        self.tickers = np.array([m.get('ticker', '') for m in self.metadatas], dtype=object)
+        self.issue_types = np.array([m.get('issue_type', '') for m in self.metadatas], dtype=object)
+
+    def extended(self, ids, embeddings, documents, metadatas, space: str) -> '_CorrectionSnapshot':
+        """New snapshot with rows appended (self is left untouched)"""
+        if not self.ids:
+            return _CorrectionSnapshot(ids, embeddings, documents, metadatas, space)
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        return _CorrectionSnapshot(
+            self.ids + tuple(ids), np.vstack([self.vectors, vectors]),
+            self.documents + tuple(documents), self.metadatas + tuple(metadatas), space
+        )
+
+
+class CorrectionIndex:
+    """NumPy copy of the spac_corrections collection with metadata filters"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, embedder: Optional[EmbeddingService] = None):
+        self.db_path = db_path
+        self.embedder = embedder or get_embedding_service()
+        self.space = 'l2'
+        self._collection = None
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._snapshot = _CorrectionSnapshot()
+
+    @property
+    def ids(self) -> Sequence[str]:
+        return self._snapshot.ids
+
+    @property
+    def documents(self) -> Sequence[str]:
+        return self._snapshot.documents
+
+    @property
+    def metadatas(self) -> Sequence[Dict]:
+        return self._snapshot.metadatas
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._snapshot.vectors
+
+    @property
+    def collection(self):
+        """Chroma collection (opened on first use, no embedding function attached)"""
+        if self._collection is None:
+            import chromadb
+
+            client = chromadb.PersistentClient(path=self.db_path)
+            self._collection = client.get_collection(name=COLLECTION_NAME)
+            self.space = (self._collection.metadata or {}).get('hnsw:space', 'l2')
+        return self._collection
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Load rows added to the collection since the last refresh
+
+        Returns:
+            Number of rows loaded
+        """
+        now = time.time()
+        if not force and now - self._checked_at < REFRESH_SECONDS:
+            return 0
+
+        with self._lock:
+            self._checked_at = now
+            current_ids = self.collection.get(include=[])['ids']
+            snapshot = self._snapshot
+            loaded = set(snapshot.ids)
+
+            if len(current_ids) < len(loaded) or not loaded.issubset(current_ids):
+                # Collection was rebuilt - start over
+                snapshot = _CorrectionSnapshot(space=self.space)
+                loaded = set()
+
+            new_ids = [i for i in current_ids if i not in loaded]
+            if not new_ids:
+                self._snapshot = snapshot
+                return 0
+
+            rows = self.collection.get(ids=new_ids, include=['embeddings', 'documents', 'metadatas'])
+            snapshot = snapshot.extended(rows['ids'], rows['embeddings'], rows['documents'],
+                                         rows['metadatas'], self.space)
+            self._snapshot = snapshot
+            logger.info(f"[RAG] Loaded {len(new_ids)} corrections ({len(snapshot.ids)} in memory)")
+            return len(new_ids)
+
+    def count(self) -> int:
+        self.refresh()
+        return len(self.ids)
+
+    @staticmethod
+    def _distances(snapshot: _CorrectionSnapshot, query_vectors: np.ndarray) -> np.ndarray:
+        """(queries × corrections) distances in the collection's space"""
+        dots = query_vectors @ snapshot.vectors.T
+        if snapshot.space == 'ip':
+            return 1.0 - dots
+        query_norms = np.einsum('ij,ij->i', query_vectors, query_vectors)
+        if snapshot.space == 'cosine':
+            denom = np.sqrt(np.outer(query_norms, snapshot.norms))
+            return 1.0 - dots / np.maximum(denom, 1e-12)
+        # Squared L2, as Chroma reports it
+        return np.maximum(query_norms[:, None] + snapshot.norms[None, :] - 2.0 * dots, 0.0)
+
+    def query_many(
+        self,
+        queries: Sequence[str],
+        n_results: int = 3,
+        filter_ticker: Optional[str] = None,
+        filter_issue_type: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Nearest corrections for several queries (one embedding batch, one matrix product)
+
+        Returns:
+            One list of correction dicts per query (same shape as
+            RAGLearningMixin.get_similar_corrections_rag)
+        """
+        self.refresh()
+        snapshot = self._snapshot
+        if not queries:
+            return []
+        if not snapshot.ids:
+            return [[] for _ in queries]
+
+        mask = np.ones(len(snapshot.ids), dtype=bool)
+        if filter_ticker:
+            mask &= snapshot.tickers == filter_ticker
+        if filter_issue_type:
+            mask &= snapshot.issue_types == filter_issue_type
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return [[] for _ in queries]
+
+        distances = self._distances(snapshot, self.embedder.embed_queries(queries))[:, candidates]
+        k = min(n_results, len(candidates))
+
+        results = []
+        for row in distances:
+            top = np.argpartition(row, k - 1)[:k] if k < len(row) else np.arange(len(row))
+            top = top[np.argsort(row[top])]
+            results.append([self._format(snapshot, candidates[i], float(row[i])) for i in top])
+        return results
+
+    def query(self, query: str, n_results: int = 3, filter_ticker: Optional[str] = None,
+              filter_issue_type: Optional[str] = None) -> List[Dict]:
+        """Nearest corrections for one query"""
+        return self.query_many([query], n_results, filter_ticker, filter_issue_type)[0]
+
+    @staticmethod
+    def _format(snapshot: _CorrectionSnapshot, i: int, distance: float) -> Dict:
+        metadata = snapshot.metadatas[i]
+        return {
+            'document': snapshot.documents[i],
+            'ticker': metadata.get('ticker', ''),
+            'issue_type': metadata.get('issue_type', ''),
+            'fields_corrected': json.loads(metadata.get('fields_corrected', '[]')),
+            'created_at': metadata.get('created_at', ''),
+            'similarity': 1 - distance,  # Convert distance to similarity (0-1)
+            'distance': distance
+        }
+
+
+_embedder: Optional[EmbeddingService] = None
+_indexes: Dict[str, CorrectionIndex] = {}
+_singleton_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service (model loads on first embed)"""
+    global _embedder
+    with _singleton_lock:
+        if _embedder is None:
+            _embedder = EmbeddingService()
+        return _embedder
+
+
+def get_correction_index(db_path: str = DEFAULT_DB_PATH) -> CorrectionIndex:
+    """Get the process-wide correction index for a vector DB path"""
+    embedder = get_embedding_service()
+    path = os.path.abspath(db_path)
+    with _singleton_lock:
+        if path not in _indexes:
+            _indexes[path] = CorrectionIndex(path, embedder)
+        return _indexes[path]
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Dashboard Snapshot - Columnar snapshot of dashboard data shared by all viewers
+
+The Streamlit dashboard (and dev/dash_app.py) used to hydrate every SPAC as a
+~100-column ORM object per process on each cache expiry, then derive columns
+row by row. Instead, the pipelines publish one snapshot after they commit:
+
+- spacs:           dashboard columns + derived metrics (public float, volume %
+                   float, parsed IPO proceeds), selected with pd.read_sql
+- pre_ipo:         pre-IPO pipeline (not yet moved to main pipeline)
+- premium_history: market_snapshots premium series
+
+Each frame is written as an uncompressed Arrow IPC (Feather v2) file, replaced
+atomically. Readers memory-map the file and keep one DataFrame per process,
+reloaded only when the file changes - page loads never touch Postgres, and
+memory does not grow with the number of viewers.
+
+Date-dependent columns (days_to_deadline) are computed at read time so an old
+snapshot never shows stale countdowns.
+
+Usage (pipelines, after commit):
+    from utils.dashboard_snapshot import invalidate_dashboard_snapshot
+    invalidate_dashboard_snapshot()
+
+Usage (dashboards):
+    from utils.dashboard_snapshot import load_snapshot
+    df = load_snapshot('spacs')
+
+CLI:
+    python3 utils/dashboard_snapshot.py    # Rebuild all snapshots
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_SNAPSHOT_DIR = os.getenv('DASHBOARD_SNAPSHOT_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.dashboard_snapshot'
+))
+
+# Columns shown by streamlit_app.py and dev/dash_app.py
+SPAC_COLUMNS = [
+    'ticker', 'company', 'price', 'price_change_24h', 'volume', 'premium', 'trust_value',
+    'trust_cash', 'shares_outstanding', 'founder_shares', 'founder_ownership', 'deal_status',
+    'target', 'expected_close', 'announced_date', 'completion_date', 'new_ticker',
+    'shareholder_vote_date', 'price_at_announcement', 'return_since_announcement', 'market_cap',
+    'yahoo_market_cap', 'market_cap_variance', 'risk_level', 'sector', 'banker', 'co_bankers',
+    'sponsor', 'deal_value', 'pipe_size', 'pipe_price', 'min_cash', 'ipo_date', 'ipo_proceeds',
+    'unit_ticker', 'warrant_ticker', 'right_ticker', 'unit_price', 'warrant_price', 'rights_price',
+    'unit_structure', 'deadline_date', 'deadline_months', 'redemptions_occurred', 'shares_redeemed',
+    'redemption_percentage', 'redemption_amount', 'last_redemption_date', 'latest_s4_date',
+    'proxy_filed_date', 'last_scraped_at', 'last_price_update', 'notes', 'sponsor_total_at_risk',
+    'sponsor_at_risk_percentage', 'prospectus_424b4_url', 'deal_filing_url', 'press_release_url',
+    's1_filing_url', 's4_filing_url', 'proxy_filing_url', 'sec_company_url',
+]
+
+PRE_IPO_COLUMNS = [
+    'company', 'expected_ticker', 'cik', 's1_filing_date', 'filing_status', 'effectiveness_date',
+    'pricing_date', 'target_proceeds', 'ipo_price_range', 'trust_per_unit', 'unit_structure',
+    'charter_deadline_months', 'target_sector', 'target_geography', 'target_description', 'sponsor',
+    'lead_banker', 'co_bankers', 'amendment_count', 's1_url', 'last_checked',
+]
+
+PREMIUM_HISTORY_COLUMNS = [
+    'snapshot_date', 'avg_premium_predeal', 'median_premium_predeal', 'weighted_avg_premium_predeal',
+    'count_predeal', 'avg_premium_announced', 'median_premium_announced',
+    'weighted_avg_premium_announced', 'count_announced',
+]
+
+SNAPSHOT_NAMES = ['spacs', 'pre_ipo', 'premium_history']
+
+_publish_lock = threading.Lock()
+_loaded: Dict[str, Tuple[float, str, pd.DataFrame]] = {}  # name -> (mtime, date, frame)
+_loaded_lock = threading.Lock()
+
+
+def parse_ipo_proceeds_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized IPO proceeds parser: '$100M' / '$150,650,000' → millions (100.0, 150.65)
+    """
+    cleaned = values.astype('string').str.replace(r'[$,]', '', regex=True).str.strip()
+    in_millions = cleaned.str.endswith('M').fillna(False).astype(bool)
+    numbers = pd.to_numeric(cleaned.str.replace('M', '', regex=False), errors='coerce')
+    return pd.Series(np.where(in_millions, numbers, numbers / 1_000_000), index=values.index, dtype='float64')
+
+
+def add_float_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add public_float and volume_pct_float (vectorized calculate_float_metrics)
+
+    For pre-deal SPACs all Class A shares are freely tradeable, so the float is
+    shares_outstanding; completed deals use shares_outstanding as approximation.
+    """
+    shares_out = pd.to_numeric(df['shares_outstanding'], errors='coerce')
+    volume = pd.to_numeric(df['volume'], errors='coerce')
+    public_float = shares_out.where(shares_out != 0)
+
+    df['public_float'] = public_float
+    df['volume_pct_float'] = (volume / public_float * 100).where(volume != 0)
+    return df
+
+
+def add_days_to_deadline(df: pd.DataFrame, today: Optional[datetime] = None) -> pd.DataFrame:
+    """Add days_to_deadline relative to today (computed at read time)"""
+    today = pd.Timestamp((today or datetime.now()).date())
+    deadline = pd.to_datetime(df['deadline_date'], errors='coerce')
+    if getattr(deadline.dt, 'tz', None) is not None:
+        deadline = deadline.dt.tz_localize(None)
+    df['days_to_deadline'] = (deadline.dt.normalize() - today).dt.days
+    return df
+
+
+def build_spac_frame(engine=None) -> pd.DataFrame:
+    """Select dashboard columns from spacs and add derived metrics"""
+    if engine is None:
+        from database import engine
+    df = pd.read_sql(f"SELECT {', '.join(SPAC_COLUMNS)} FROM spacs", engine)
+    df = add_float_metrics(df)
+    df['ipo_proceeds_numeric'] = parse_ipo_proceeds_series(df['ipo_proceeds'])
+    return df
+
+
+def build_pre_ipo_frame(engine=None) -> pd.DataFrame:
+    """Select pre-IPO SPACs still in the pre-IPO pipeline"""
+    if engine is None:
+        from pre_ipo_database import engine
+    return pd.read_sql(
+        f"SELECT {', '.join(PRE_IPO_COLUMNS)} FROM pre_ipo_spacs "
+        f"WHERE moved_to_main_pipeline = FALSE OR moved_to_main_pipeline IS NULL",
+        engine
+    )
+
+
+def build_premium_history_frame(engine=None) -> pd.DataFrame:
+    """Select full premium history (readers filter by date)"""
+    if engine is None:
+        from database import engine
+    df = pd.read_sql(
+        f"SELECT {', '.join(PREMIUM_HISTORY_COLUMNS)} FROM market_snapshots ORDER BY snapshot_date",
+        engine
+    )
+    return df.rename(columns={'snapshot_date': 'date'})
+
+
+BUILDERS = {
+    'spacs': build_spac_frame,
+    'pre_ipo': build_pre_ipo_frame,
+    'premium_history': build_premium_history_frame,
+}
+
+
+def snapshot_path(name: str, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> str:
+    return os.path.join(snapshot_dir, f"{name}.arrow")
+
+
+def _write_frame(df: pd.DataFrame, path: str):
+    """Write frame as uncompressed Arrow IPC (memory-mappable), replacing atomically"""
+    # Object columns mixing types (e.g. dates + strings) are stored as strings
+    table = None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy()
+        for column in df.columns[df.dtypes == object]:
+            try:
+                pa.array(df[column], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[column] = df[column].map(lambda v: None if v is None or v is pd.NA else str(v))
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def publish_snapshot(names=SNAPSHOT_NAMES, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Dict[str, int]:
+    """
+    Rebuild snapshots from Postgres and publish them
+
+    Args:
+        names: Snapshots to rebuild (default: all)
+        snapshot_dir: Output directory
+
+    Returns:
+        {name: row count} for each published snapshot
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    counts = {}
+    with _publish_lock:
+        for name in names:
+            df = BUILDERS[name]()
+            _write_frame(df, snapshot_path(name, snapshot_dir))
+            counts[name] = len(df)
+    return counts
+
+
+def invalidate_dashboard_snapshot(names=SNAPSHOT_NAMES) -> bool:
+    """
+    Republish snapshots after a pipeline commit (never raises)
+
+    Returns:
+        True if published
+    """
+    try:
+        counts = publish_snapshot(names)
+        print(f"📸 Dashboard snapshot published ({', '.join(f'{k}: {v}' for k, v in counts.items())})")
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not publish dashboard snapshot: {e}")
+        return False
+
+
+def load_snapshot(name: str, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> pd.DataFrame:
+    """
+    Get snapshot frame (memory-mapped, one copy per process)
+
+    The file is only re-read when a pipeline republished it. Callers share the
+    returned DataFrame - copy before modifying it.
+
+    Args:
+        name: 'spacs', 'pre_ipo' or 'premium_history'
+        snapshot_dir: Snapshot directory
+
+    Returns:
+        DataFrame (built from Postgres once if no snapshot exists yet)
+    """
+    path = snapshot_path(name, snapshot_dir)
+    if not os.path.exists(path):
+        publish_snapshot([name], snapshot_dir)
+
+    mtime = os.stat(path).st_mtime
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    with _loaded_lock:
+        cached = _loaded.get(name)
+        if cached and cached[0] == mtime and cached[1] == today:
+            return cached[2]
+
+        table = feather.read_table(path, memory_map=True)
+        df = table.to_pandas()
+        if name == 'spacs':
+            df = add_days_to_deadline(df)
+        _loaded[name] = (mtime, today, df)
+        return df
+
+
+def snapshot_version(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Tuple:
+    """Modification times of all snapshots (cache key for derived per-process views)"""
+    return tuple(
+        os.stat(snapshot_path(name, snapshot_dir)).st_mtime if os.path.exists(snapshot_path(name, snapshot_dir)) else None
+        for name in SNAPSHOT_NAMES
+    ) + (datetime.now().strftime('%Y-%m-%d'),)
+
+
+if __name__ == '__main__':
+    counts = publish_snapshot()
+    for name, count in counts.items():
+        print(f"✅ {name}: {count} rows → {snapshot_path(name)}")
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+EDGAR Submissions Store - Local index of filings per CIK from data.sec.gov
+
+Filing discovery (latest 10-Q/10-K, 8-Ks after a date, Item 5.03 extensions)
+used to scrape browse-edgar HTML per CIK on demand - and for 8-Ks also every
+index page and document - so enriching one SPAC cost 10+ SEC round trips
+before any extraction started.
+
+This module mirrors the EDGAR submissions JSON of every tracked CIK into a
+local table (sec_filings: form, filing date, report date, accession, primary
+document, 8-K items) and answers those lookups with indexed queries:
+
+- sync_tracked_ciks(): periodic job (cron / monitor) - conditional GET per CIK
+  (If-Modified-Since), so unchanged companies cost a 304 and no writes
+- get_local_filings(): lookup used by SECFilingFetcher.search_filings and
+  SPACDataEnricher - re-syncs a CIK on demand only when its copy is older
+  than EDGAR_SUBMISSIONS_MAX_AGE_HOURS or was invalidated by the monitor
+- invalidate_ciks(): SECFilingMonitor marks CIKs with new filings stale so
+  agents processing those filings see them
+
+Lookups return None when the store can't answer (no DB, SEC unreachable on
+first sync); callers then fall back to browse-edgar.
+
+Usage:
+    from utils.edgar_submissions import get_local_filings
+
+    filings = get_local_filings(cik, ['10-Q', '10-K'], limit=1)
+    extensions = get_local_filings(cik, ['8-K'], items=['5.03'])
+
+CLI:
+    python3 utils/edgar_submissions.py                 # Sync all tracked CIKs
+    python3 utils/edgar_submissions.py --force         # Ignore Last-Modified
+    python3 utils/edgar_submissions.py --cik 1234567   # Sync one CIK
+"""
+
+import os
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SUBMISSIONS_URL = 'https://data.sec.gov/submissions/CIK{cik}.json'
+SUBMISSIONS_PAGE_URL = 'https://data.sec.gov/submissions/{name}'
+ARCHIVES_URL = 'https://www.sec.gov/Archives/edgar/data'
+
+# Local copy older than this is re-synced on lookup (conditional GET)
+MAX_AGE_HOURS = float(os.getenv('EDGAR_SUBMISSIONS_MAX_AGE_HOURS', '6'))
+
+_table_checked = False
+_table_lock = threading.Lock()
+
+
+def local_filings_enabled() -> bool:
+    return os.getenv('EDGAR_LOCAL_FILINGS', 'true').lower() == 'true'
+
+
+def normalize_cik(cik) -> str:
+    """'0001234567', '1234567', 1234567 → '1234567'"""
+    return str(cik).strip().lstrip('0') or '0'
+
+
+def _ensure_table_exists(db):
+    """Create sec_filings / sec_submissions_sync tables if they don't exist (once per process)"""
+    global _table_checked
+    if _table_checked:
+        return
+
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS sec_filings (
+        cik VARCHAR(10) NOT NULL,            -- no leading zeros
+        accession_number VARCHAR(25) NOT NULL,
+        form VARCHAR(20) NOT NULL,
+        filing_date DATE NOT NULL,
+        report_date DATE,
+        acceptance_datetime TIMESTAMP,
+        primary_document VARCHAR(255),
+        primary_doc_description VARCHAR(255),
+        items VARCHAR(255),                  -- 8-K items, comma separated ('5.03,9.01')
+        PRIMARY KEY (cik, accession_number)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_sec_filings_cik_form_date
+    ON sec_filings(cik, form, filing_date DESC);
+
+    CREATE TABLE IF NOT EXISTS sec_submissions_sync (
+        cik VARCHAR(10) PRIMARY KEY,
+        last_modified VARCHAR(64),           -- Last-Modified header of the submissions JSON
+        synced_at TIMESTAMP,                 -- NULL = invalidated, re-sync on next lookup
+        filing_count INTEGER
+    );
+    """
+
+    with _table_lock:
+        if _table_checked:
+            return
+        try:
+            db.execute(text(create_table_sql))
+            db.commit()
+            _table_checked = True
+        except Exception as e:
+            print(f"⚠️  Could not create sec_filings tables: {e}")
+            db.rollback()
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S')
+    except ValueError:
+        return None
+
+
+def parse_submissions(columns: Dict, cik: str) -> List[Dict]:
+    """
+    Rows from a submissions 'recent' block (or an older-filings page)
+
+    Args:
+        columns: Column-oriented dict (accessionNumber, form, filingDate, ...)
+        cik: Company CIK
+
+    Returns:
+        sec_filings rows
+    """
+    cik = normalize_cik(cik)
+    accessions = columns.get('accessionNumber', [])
+
+    def column(name):
+        values = columns.get(name) or []
+        return values + [None] * (len(accessions) - len(values))
+
+    rows = []
+    for accession, form, filed, report, accepted, document, description, items in zip(
+        accessions, column('form'), column('filingDate'), column('reportDate'),
+        column('acceptanceDateTime'), column('primaryDocument'), column('primaryDocDescription'),
+        column('items')
+    ):
+        filing_date = _parse_date(filed)
+        if not accession or not form or not filing_date:
+            continue
+        rows.append({
+            'cik': cik,
+            'accession_number': accession,
+            'form': form,
+            'filing_date': filing_date,
+            'report_date': _parse_date(report),
+            'acceptance_datetime': _parse_timestamp(accepted),
+            'primary_document': document or None,
+            'primary_doc_description': (description or '')[:255] or None,
+            'items': (items or '').replace(' ', '')[:255] or None,
+        })
+    return rows
+
+
+def _save_rows(db, rows: List[Dict]):
+    if not rows:
+        return
+    db.execute(text("""
+        INSERT INTO sec_filings (
+            cik, accession_number, form, filing_date, report_date, acceptance_datetime,
+            primary_document, primary_doc_description, items
+        ) VALUES (
+            :cik, :accession_number, :form, :filing_date, :report_date, :acceptance_datetime,
+            :primary_document, :primary_doc_description, :items
+        )
+        ON CONFLICT (cik, accession_number) DO UPDATE SET
+            form = EXCLUDED.form,
+            report_date = EXCLUDED.report_date,
+            primary_document = EXCLUDED.primary_document,
+            primary_doc_description = EXCLUDED.primary_doc_description,
+            items = EXCLUDED.items
+    """), rows)
+
+
+def sync_cik(cik, db=None, force: bool = False) -> Optional[int]:
+    """
+    Sync one CIK's submissions into sec_filings
+
+    Args:
+        cik: Company CIK (any format)
+        db: Optional SQLAlchemy session (default: new one)
+        force: Ignore Last-Modified (full re-download)
+
+    Returns:
+        Number of filings in the submissions document (0 if unchanged since
+        last sync), or None if the sync failed
+    """
+    from utils.sec_http import sec_get
+
+    cik = normalize_cik(cik)
+    own_session = db is None
+    if own_session:
+        from database import SessionLocal
+        db = SessionLocal()
+
+    try:
+        _ensure_table_exists(db)
+        state = db.execute(
+            text("SELECT last_modified FROM sec_submissions_sync WHERE cik = :cik"), {'cik': cik}
+        ).first()
+
+        headers = {}
+        if state and state[0] and not force:
+            headers['If-Modified-Since'] = state[0]
+
+        response = sec_get(SUBMISSIONS_URL.format(cik=cik.zfill(10)), headers=headers)
+        if response.status_code == 304:
+            db.execute(text("UPDATE sec_submissions_sync SET synced_at = :now WHERE cik = :cik"),
+                       {'now': datetime.now(), 'cik': cik})
+            db.commit()
+            return 0
+        if response.status_code != 200:
+            print(f"   ⚠️  Submissions fetch failed for CIK {cik}: HTTP {response.status_code}")
+            return None
+
+        data = response.json()
+        filings = data.get('filings', {})
+        rows = parse_submissions(filings.get('recent', {}), cik)
+
+        # Older filings are paged out of 'recent' - only needed on the first sync
+        if not state or force:
+            for page in filings.get('files', []):
+                page_response = sec_get(SUBMISSIONS_PAGE_URL.format(name=page['name']))
+                if page_response.status_code == 200:
+                    rows.extend(parse_submissions(page_response.json(), cik))
+
+        _save_rows(db, rows)
+        db.execute(text("""
+            INSERT INTO sec_submissions_sync (cik, last_modified, synced_at, filing_count)
+            VALUES (:cik, :last_modified, :now, :filing_count)
+            ON CONFLICT (cik) DO UPDATE SET
+                last_modified = EXCLUDED.last_modified,
+                synced_at = EXCLUDED.synced_at,
+                filing_count = EXCLUDED.filing_count
+        """), {
+            'cik': cik,
+            'last_modified': response.headers.get('Last-Modified'),
+            'now': datetime.now(),
+            'filing_count': len(rows),
+        })
+        db.commit()
+        return len(rows)
+
+    except Exception as e:
+        print(f"   ⚠️  Submissions sync failed for CIK {cik}: {e}")
+        db.rollback()
+        return None
+    finally:
+        if own_session:
+            db.close()
+
+
+def _tracked_ciks() -> List[str]:
+    from database import SessionLocal, SPAC
+
+    db = SessionLocal()
+    try:
+        ciks = {normalize_cik(row[0]) for row in db.query(SPAC.cik).filter(SPAC.cik.isnot(None)).all() if row[0]}
+    finally:
+        db.close()
+    return sorted(ciks)
+
+
+def sync_tracked_ciks(ciks: Optional[Iterable] = None, force: bool = False) -> Dict[str, int]:
+    """
+    Sync submissions for all tracked SPAC CIKs (or the given ones)
+
+    Returns:
+        Counts: synced (changed), unchanged (304), failed
+    """
+    from database import SessionLocal
+
+    ciks = [normalize_cik(cik) for cik in ciks] if ciks else _tracked_ciks()
+    print(f"🔄 Syncing EDGAR submissions for {len(ciks)} CIKs...")
+
+    counts = {'synced': 0, 'unchanged': 0, 'failed': 0}
+    db = SessionLocal()
+    try:
+        for i, cik in enumerate(ciks):
+            if i > 0 and i % 50 == 0:
+                print(f"   Progress: {i}/{len(ciks)} CIKs")
+            result = sync_cik(cik, db=db, force=force)
+            if result is None:
+                counts['failed'] += 1
+            elif result == 0:
+                counts['unchanged'] += 1
+            else:
+                counts['synced'] += 1
+    finally:
+        db.close()
+
+    print(f"   ✓ {counts['synced']} synced, {counts['unchanged']} unchanged, {counts['failed']} failed")
+    return counts
+
+
+def invalidate_ciks(ciks: Iterable):
+    """Mark CIKs stale (new filings seen) - next lookup re-syncs them"""
+    ciks = sorted({normalize_cik(cik) for cik in ciks})
+    if not ciks:
+        return
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        _ensure_table_exists(db)
+        db.execute(text("UPDATE sec_submissions_sync SET synced_at = NULL WHERE cik = ANY(:ciks)"),
+                   {'ciks': ciks})
+        db.commit()
+    except Exception as e:
+        print(f"⚠️  Could not invalidate submissions for {len(ciks)} CIKs: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _filing_dict(row) -> Dict:
+    cik, accession, form, filing_date, report_date, document, items = row
+    folder = f"{ARCHIVES_URL}/{cik}/{accession.replace('-', '')}"
+    return {
+        'type': form,
+        'date': datetime.combine(filing_date, datetime.min.time()),
+        'url': f"{folder}/{accession}-index.htm",
+        'document_url': f"{folder}/{document}" if document else None,
+        'summary': '',
+        'accession': accession,
+        'report_date': report_date,
+        'items': items.split(',') if items else [],
+    }
+
+
+def get_local_filings(
+    cik,
+    forms: List[str],
+    after: Optional[date] = None,
+    before: Optional[date] = None,
+    items: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    max_age_hours: float = MAX_AGE_HOURS
+) -> Optional[List[Dict]]:
+    """
+    Filings of a CIK from the local submissions store (newest first)
+
+    Args:
+        cik: Company CIK (any format)
+        forms: Form type prefixes, matched like browse-edgar's type= ('10-Q' also matches '10-Q/A')
+        after: Only filings filed on or after this date
+        before: Only filings filed on or before this date
+        items: Only 8-Ks reporting any of these items (e.g. ['5.03'])
+        limit: Max filings returned
+        max_age_hours: Re-sync the CIK first if its copy is older than this
+
+    Returns:
+        Filing dicts (type, date, url, document_url, accession, report_date,
+        items), or None if the store can't answer (caller falls back to browse-edgar)
+    """
+    if not local_filings_enabled():
+        return None
+
+    from database import SessionLocal
+
+    cik = normalize_cik(cik)
+    db = SessionLocal()
+    try:
+        _ensure_table_exists(db)
+        state = db.execute(
+            text("SELECT synced_at FROM sec_submissions_sync WHERE cik = :cik"), {'cik': cik}
+        ).first()
+        fresh = state and state[0] and datetime.now() - state[0] < timedelta(hours=max_age_hours)
+        if not fresh and sync_cik(cik, db=db) is None and not state:
+            return None
+
+        conditions = ["cik = :cik", "(" + " OR ".join(f"form LIKE :form{i}" for i in range(len(forms))) + ")"]
+        params = {'cik': cik}
+        params.update({f"form{i}": f"{form}%" for i, form in enumerate(forms)})
+        if after:
+            conditions.append("filing_date >= :after")
+            params['after'] = after.date() if isinstance(after, datetime) else after
+        if before:
+            conditions.append("filing_date <= :before")
+            params['before'] = before.date() if isinstance(before, datetime) else before
+        if items:
+            conditions.append("(" + " OR ".join(f"items LIKE :item{i}" for i in range(len(items))) + ")")
+            params.update({f"item{i}": f"%{item}%" for i, item in enumerate(items)})
+
+        query = f"""
+            SELECT cik, accession_number, form, filing_date, report_date, primary_document, items
+            FROM sec_filings
+            WHERE {' AND '.join(conditions)}
+            ORDER BY filing_date DESC, acceptance_datetime DESC NULLS LAST
+        """
+        if limit:
+            query += " LIMIT :limit"
+            params['limit'] = limit
+
+        return [_filing_dict(row) for row in db.execute(text(query), params).fetchall()]
+
+    except Exception as e:
+        print(f"   ⚠️  Local filings lookup failed for CIK {cik}: {e}")
+        db.rollback()
+        return None
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Sync EDGAR submissions into the local filings store')
+    parser.add_argument('--cik', action='append', help='CIK to sync (repeatable, default: all tracked SPACs)')
+    parser.add_argument('--force', action='store_true', help='Ignore Last-Modified and re-download')
+    args = parser.parse_args()
+
+    sync_tracked_ciks(args.cik, force=args.force)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+8-K Items - Deterministic 8-K item extraction and rule-table routing
+
+EDGAR already states which items an 8-K reports, so there is no need to ask
+an LLM. Items are read from (cheapest first):
+
+1. filing['items'] (set by callers that already know them)
+2. Company Atom feed summary ("Item 1.01: Entry into a Material ...")
+3. Filing index page "Items" block (already in the SEC document cache -
+   fetched by SECFilingMonitor.fetch_filing_contents)
+4. Submissions JSON (data.sec.gov/submissions, 'items' column)
+5. .txt submission header ("ITEM INFORMATION:" lines, via extract_txt_header -
+   streamed, stops at </SEC-HEADER> instead of downloading every document)
+
+route_8k_items() then maps items to priority and agents with EIGHT_K_ROUTES.
+Filings whose only substantive items are 7.01 / 8.01 (Reg FD, Other Events)
+are ambiguous - press releases about deals, extensions and redemptions all
+use them - so they still go to the LLM analysis.
+
+Usage:
+    from utils.eight_k_items import get_8k_items, route_8k_items
+
+    items = get_8k_items(filing)             # ['5.07', '9.01']
+    classification = route_8k_items(items)   # None → ask the LLM
+"""
+
+import json
+import re
+from typing import Dict, List, Optional
+
+ITEM_NUMBER_PATTERN = re.compile(r'\bItem\s+(\d\.\d{2})\b', re.IGNORECASE)
+INDEX_ITEMS_PATTERN = re.compile(
+    r'<div class="infoHead">\s*Items\s*</div>\s*<div class="info">(.*?)</div>',
+    re.IGNORECASE | re.DOTALL
+)
+HEADER_ITEM_PATTERN = re.compile(r'^\s*ITEM INFORMATION:\s*(.+?)\s*$', re.MULTILINE)
+
+# EDGAR item descriptions (as written in ITEM INFORMATION header lines) → item number
+ITEM_DESCRIPTIONS = {
+    'entry into a material definitive agreement': '1.01',
+    'termination of a material definitive agreement': '1.02',
+    'bankruptcy or receivership': '1.03',
+    'mine safety': '1.04',
+    'material cybersecurity incidents': '1.05',
+    'completion of acquisition or disposition of assets': '2.01',
+    'results of operations and financial condition': '2.02',
+    'creation of a direct financial obligation': '2.03',
+    'triggering events that accelerate or increase': '2.04',
+    'costs associated with exit or disposal activities': '2.05',
+    'material impairments': '2.06',
+    'notice of delisting or failure to satisfy': '3.01',
+    'unregistered sales of equity securities': '3.02',
+    'material modification to rights of security holders': '3.03',
+    "changes in registrant's certifying accountant": '4.01',
+    'non-reliance on previously issued financial statements': '4.02',
+    'changes in control of registrant': '5.01',
+    'departure of directors or certain officers': '5.02',
+    'amendments to articles of incorporation or bylaws': '5.03',
+    "temporary suspension of trading under registrant's employee benefit plans": '5.04',
+    "amendments to the registrant's code of ethics": '5.05',
+    'change in shell company status': '5.06',
+    'submission of matters to a vote of security holders': '5.07',
+    'shareholder director nominations': '5.08',
+    'regulation fd disclosure': '7.01',
+    'other events': '8.01',
+    'financial statements and exhibits': '9.01',
+}
+
+# Item → routing (priority, agents). Items not listed route nowhere on their own.
+EIGHT_K_ROUTES = {
+    '1.01': ('HIGH', ['DealDetector', 'PipeExtractor'], 'material definitive agreement (deal announcement)'),
+    '1.02': ('HIGH', ['DealDetector'], 'termination of material agreement (deal termination)'),
+    '2.01': ('CRITICAL', ['CompletionMonitor'], 'completion of acquisition (deal closed)'),
+    '2.03': ('MEDIUM', ['ExtensionMonitor'], 'direct financial obligation (sponsor extension loan)'),
+    '3.01': ('HIGH', ['ComplianceMonitor'], 'delisting notice'),
+    '3.03': ('MEDIUM', ['ExtensionMonitor'], 'material modification to security holder rights'),
+    '4.01': ('LOW', ['ComplianceMonitor'], 'change in certifying accountant'),
+    '4.02': ('MEDIUM', ['ComplianceMonitor'], 'financial statement non-reliance'),
+    '5.01': ('HIGH', ['CompletionMonitor'], 'change in control'),
+    '5.03': ('HIGH', ['ExtensionMonitor', 'RedemptionExtractor'], 'charter amendment (deadline extension)'),
+    '5.06': ('CRITICAL', ['CompletionMonitor'], 'change in shell company status (deal closed)'),
+    '5.07': ('HIGH', ['RedemptionExtractor', 'ExtensionMonitor'], 'shareholder vote results (redemptions)'),
+}
+
+# Items whose content varies too much to route by number (LLM decides)
+AMBIGUOUS_ITEMS = {'7.01', '8.01'}
+
+# Items that never carry information on their own
+NEUTRAL_ITEMS = {'9.01'}
+
+PRIORITY_ORDER = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+
+
+def _unique(items) -> List[str]:
+    result = []
+    for item in items:
+        if item and item not in result:
+            result.append(item)
+    return result
+
+
+def item_for_description(description: str) -> Optional[str]:
+    """Item number for an EDGAR item description (None if unknown)"""
+    description = description.lower().strip()
+    for prefix, item in ITEM_DESCRIPTIONS.items():
+        if description.startswith(prefix):
+            return item
+    return None
+
+
+def parse_summary_items(summary: str) -> List[str]:
+    """Items listed in a company Atom feed entry summary"""
+    return _unique(ITEM_NUMBER_PATTERN.findall(summary or ''))
+
+
+def parse_index_items(index_html: str) -> List[str]:
+    """Items from the "Items" block of a filing index page"""
+    match = INDEX_ITEMS_PATTERN.search(index_html or '')
+    if not match:
+        return []
+    return _unique(ITEM_NUMBER_PATTERN.findall(match.group(1)))
+
+
+def parse_header_items(txt_content: str) -> List[str]:
+    """Items from the ITEM INFORMATION lines of a .txt submission header"""
+    if not txt_content:
+        return []
+    header = txt_content.split('</SEC-HEADER>', 1)[0]
+    return _unique(item_for_description(line) for line in HEADER_ITEM_PATTERN.findall(header))
+
+
+def parse_submissions_items(submissions: Dict, accession: str) -> List[str]:
+    """Items for one accession number from a data.sec.gov submissions document"""
+    recent = submissions.get('filings', {}).get('recent', {})
+    accessions = recent.get('accessionNumber', [])
+    if accession not in accessions:
+        return []
+    items = recent.get('items', [])
+    position = accessions.index(accession)
+    if position >= len(items):
+        return []
+    return _unique(item.strip() for item in items[position].split(','))
+
+
+def get_8k_items(filing: Dict, fetcher=None) -> List[str]:
+    """
+    8-K items reported by a filing, read from EDGAR metadata (no AI)
+
+    Args:
+        filing: Filing dict (summary, index_url / url, cik)
+        fetcher: Optional SECFilingFetcher (default: new one - shares cache and rate limit)
+
+    Returns:
+        Item numbers in filing order (empty if EDGAR metadata has none)
+    """
+    if filing.get('items'):
+        return list(filing['items'])
+
+    items = parse_summary_items(filing.get('summary'))
+    if items:
+        return items
+
+    from utils.filing_analysis import accession_number
+
+    if fetcher is None:
+        from utils.sec_filing_fetcher import SECFilingFetcher
+        fetcher = SECFilingFetcher()
+
+    index_url = filing.get('index_url') or filing.get('url')
+    if index_url and 'index' in index_url:
+        items = parse_index_items(fetcher.fetch_document(index_url, max_retries=1))
+        if items:
+            return items
+
+    accession = accession_number(filing)
+    cik = filing.get('cik')
+    if not accession or not cik:
+        return []
+
+    submissions = fetcher.fetch_document(
+        f"https://data.sec.gov/submissions/CIK{str(cik).zfill(10)}.json", max_retries=1
+    )
+    if submissions:
+        try:
+            items = parse_submissions_items(json.loads(submissions), accession)
+        except ValueError:
+            items = []
+        if items:
+            return items
+
+    from sec_text_extractor import extract_txt_header
+
+    return parse_header_items(extract_txt_header(accession, str(cik)))
+
+
+def route_8k_items(items: List[str]) -> Optional[Dict]:
+    """
+    Classification for an 8-K from its items (rule table, no AI)
+
+    Returns:
+        Classification dict (priority, agents_needed, reason, item_number, items),
+        or None when items are missing or ambiguous (only 7.01 / 8.01 / unknown)
+    """
+    substantive = [item for item in items if item not in NEUTRAL_ITEMS]
+    routed = [item for item in substantive if item in EIGHT_K_ROUTES]
+
+    if not substantive:
+        return None
+    if not routed and any(item in AMBIGUOUS_ITEMS for item in substantive):
+        return None
+
+    priority = 'LOW'
+    agents = []
+    reasons = []
+    for item in routed:
+        item_priority, item_agents, reason = EIGHT_K_ROUTES[item]
+        if PRIORITY_ORDER.index(item_priority) > PRIORITY_ORDER.index(priority):
+            priority = item_priority
+        agents.extend(agent for agent in item_agents if agent not in agents)
+        reasons.append(f"Item {item} - {reason}")
+
+    if not reasons:
+        label = 'Items' if len(substantive) > 1 else 'Item'
+        reasons.append(f"{label} {', '.join(substantive)} - no SPAC data routing")
+
+    return {
+        'priority': priority,
+        'agents_needed': agents,
+        'reason': f"8-K {'; '.join(reasons)}",
+        'item_number': routed[0] if routed else substantive[0],
+        'items': items,
+        'source': 'edgar_items',
+    }
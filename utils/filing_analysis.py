@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Filing Analysis - One structured analysis per filing, shared by every consumer
+
+A new 8-K used to reach the LLM up to three times: SECFilingMonitor.classify_filing
+(UniversalFilingAnalyzer), Orchestrator._analyze_filing_relevance (which agents
+to run) and filing_logger._generate_summary (news feed). Now a single
+UniversalFilingAnalyzer call produces a FilingAnalysis with everything the
+downstream stages need:
+
+- data_types / relevance_score / priority → classification
+- agent_relevance (+ reasoning)            → orchestrator agent filtering
+- summary / items_8k                       → news feed summary and tag
+
+Analyses are persisted in filing_analysis keyed by accession number, so a
+filing re-seen by another process (monitor restart, orchestrator retry,
+backfill) is never analyzed twice.
+
+Usage:
+    from utils.filing_analysis import get_filing_analysis
+
+    analysis = get_filing_analysis(filing)          # filing['content'] required on first sight
+    classification = analysis.to_classification()
+    agents = analysis.relevant_agents(classification['agents_needed'])
+"""
+
+import json
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+# 0000950170-24-123456 (index URLs, .txt names) or the 18-digit folder in Archives paths
+ACCESSION_PATTERN = re.compile(r'(\d{10}-\d{2}-\d{6})')
+ACCESSION_FOLDER_PATTERN = re.compile(r'/Archives/edgar/data/\d+/(\d{18})(?:/|$)')
+
+# 8-K items that never drive routing on their own (exhibits / signatures)
+NON_ROUTING_ITEMS = {'9.01'}
+
+_memory: Dict[str, 'FilingAnalysis'] = {}
+_memory_lock = threading.Lock()
+_table_checked = False
+
+
+def priority_for_score(relevance_score: int) -> str:
+    """Convert AI relevance score (0-100) to priority level"""
+    if relevance_score >= 80:
+        return 'CRITICAL'
+    elif relevance_score >= 60:
+        return 'HIGH'
+    elif relevance_score >= 40:
+        return 'MEDIUM'
+    else:
+        return 'LOW'
+
+
+def accession_number(filing: Dict) -> Optional[str]:
+    """
+    Accession number of a filing (0000950170-24-123456 format)
+
+    Taken from filing['accession_number'] if present, otherwise parsed from
+    the index / document URL.
+    """
+    if filing.get('accession_number'):
+        return filing['accession_number']
+
+    for url in (filing.get('index_url'), filing.get('url'), filing.get('id')):
+        if not url:
+            continue
+        match = ACCESSION_PATTERN.search(url)
+        if match:
+            return match.group(1)
+        match = ACCESSION_FOLDER_PATTERN.search(url)
+        if match:
+            digits = match.group(1)
+            return f"{digits[:10]}-{digits[10:12]}-{digits[12:]}"
+    return None
+
+
+@dataclass
+class FilingAnalysis:
+    """Structured result of the single analysis pass over a filing"""
+    accession_number: Optional[str]
+    filing_type: str
+    ticker: Optional[str] = None
+    data_types: Dict[str, bool] = field(default_factory=dict)
+    relevance_score: int = 0
+    priority: str = 'LOW'
+    summary: str = ''
+    items_8k: List[str] = field(default_factory=list)
+    recommended_agents: List[str] = field(default_factory=list)
+    agent_relevance: Dict[str, bool] = field(default_factory=dict)
+    relevance_reasoning: Dict[str, str] = field(default_factory=dict)
+    source: str = 'ai'  # ai / keywords
+    analyzed_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @classmethod
+    def from_analyzer_result(cls, filing: Dict, result: Dict) -> 'FilingAnalysis':
+        """Build from UniversalFilingAnalyzer.analyze_filing_content output"""
+        relevance_score = int(result.get('relevance_score') or 0)
+        return cls(
+            accession_number=accession_number(filing),
+            filing_type=filing.get('type'),
+            ticker=filing.get('ticker'),
+            data_types=result.get('data_types', {}),
+            relevance_score=relevance_score,
+            priority=priority_for_score(relevance_score),
+            summary=result.get('summary') or '',
+            items_8k=filing.get('items') or result.get('items', []),  # EDGAR metadata wins
+            recommended_agents=result.get('recommended_agents', []),
+            agent_relevance=result.get('agent_relevance', {}),
+            relevance_reasoning=result.get('relevance_reasoning', {}),
+            source=result.get('source', 'ai'),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FilingAnalysis':
+        known = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        return cls(**known)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @property
+    def primary_item(self) -> Optional[str]:
+        """Most significant 8-K item (first one that isn't 9.01 exhibits)"""
+        for item in self.items_8k:
+            if item not in NON_ROUTING_ITEMS:
+                return item
+        return self.items_8k[0] if self.items_8k else None
+
+    def relevant_agents(self, agents: List[str]) -> List[str]:
+        """Agents the analysis did not rule out (unknown agents stay relevant)"""
+        return [agent for agent in agents if self.agent_relevance.get(agent, True)]
+
+    def to_classification(self) -> Dict:
+        """Classification dict consumed by the orchestrator and filing logger"""
+        return {
+            'priority': self.priority,
+            'agents_needed': list(self.recommended_agents),
+            'reason': self.summary,
+            'data_types': self.data_types,
+            'relevance_score': self.relevance_score,
+            'item_number': self.primary_item,
+            'analysis': self.to_dict(),
+        }
+
+
+def _ensure_table_exists(db):
+    """Create filing_analysis table if it doesn't exist (once per process)"""
+    global _table_checked
+    if _table_checked:
+        return
+
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS filing_analysis (
+        accession_number VARCHAR(25) PRIMARY KEY,
+        ticker VARCHAR(10),
+        filing_type VARCHAR(20),
+        priority VARCHAR(10),
+        relevance_score INTEGER,
+        analysis JSONB NOT NULL,             -- FilingAnalysis.to_dict()
+        created_at TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_filing_analysis_ticker
+    ON filing_analysis(ticker, created_at);
+    """
+
+    try:
+        db.execute(text(create_table_sql))
+        db.commit()
+        _table_checked = True
+    except Exception as e:
+        print(f"⚠️  Could not create filing_analysis table: {e}")
+        db.rollback()
+
+
+def load_filing_analysis(accession: str) -> Optional[FilingAnalysis]:
+    """Persisted analysis for an accession number (None if never analyzed)"""
+    with _memory_lock:
+        if accession in _memory:
+            return _memory[accession]
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        _ensure_table_exists(db)
+        row = db.execute(
+            text("SELECT analysis FROM filing_analysis WHERE accession_number = :accession"),
+            {'accession': accession}
+        ).first()
+    except Exception as e:
+        print(f"⚠️  Could not load filing analysis {accession}: {e}")
+        db.rollback()
+        row = None
+    finally:
+        db.close()
+
+    if not row:
+        return None
+
+    data = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+    analysis = FilingAnalysis.from_dict(data)
+    with _memory_lock:
+        _memory[accession] = analysis
+    return analysis
+
+
+def save_filing_analysis(analysis: FilingAnalysis):
+    """Persist an analysis (upsert by accession number)"""
+    if not analysis.accession_number:
+        return
+
+    with _memory_lock:
+        _memory[analysis.accession_number] = analysis
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        _ensure_table_exists(db)
+        db.execute(text("""
+            INSERT INTO filing_analysis (
+                accession_number, ticker, filing_type, priority, relevance_score, analysis
+            ) VALUES (
+                :accession_number, :ticker, :filing_type, :priority, :relevance_score, CAST(:analysis AS JSONB)
+            )
+            ON CONFLICT (accession_number) DO UPDATE SET
+                ticker = COALESCE(EXCLUDED.ticker, filing_analysis.ticker),
+                priority = EXCLUDED.priority,
+                relevance_score = EXCLUDED.relevance_score,
+                analysis = EXCLUDED.analysis
+        """), {
+            'accession_number': analysis.accession_number,
+            'ticker': analysis.ticker,
+            'filing_type': analysis.filing_type,
+            'priority': analysis.priority,
+            'relevance_score': analysis.relevance_score,
+            'analysis': json.dumps(analysis.to_dict(), default=str),
+        })
+        db.commit()
+    except Exception as e:
+        print(f"⚠️  Could not save filing analysis {analysis.accession_number}: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def get_filing_analysis(filing: Dict, content: Optional[str] = None) -> Optional[FilingAnalysis]:
+    """
+    Get the analysis for a filing, running the LLM only on first sight
+
+    Lookup order: analysis already attached to the filing → in-process cache →
+    filing_analysis table → UniversalFilingAnalyzer (result persisted and
+    attached as filing['analysis']).
+
+    Args:
+        filing: Filing dict (type, url / index_url, ticker, content)
+        content: Filing text (default: filing['content'])
+
+    Returns:
+        FilingAnalysis, or None if it was never analyzed and there is no content
+    """
+    attached = filing.get('analysis')
+    if isinstance(attached, FilingAnalysis):
+        return attached
+    if isinstance(attached, dict):
+        filing['analysis'] = FilingAnalysis.from_dict(attached)
+        return filing['analysis']
+
+    accession = accession_number(filing)
+    if accession:
+        analysis = load_filing_analysis(accession)
+        if analysis:
+            if not analysis.ticker and filing.get('ticker'):
+                analysis.ticker = filing['ticker']
+            filing['analysis'] = analysis
+            return analysis
+
+    content = content or filing.get('content')
+    if not content:
+        return None
+
+    from agents.universal_filing_analyzer import UniversalFilingAnalyzer
+
+    result = UniversalFilingAnalyzer().analyze_filing_content(filing, content)
+    analysis = FilingAnalysis.from_analyzer_result(filing, result)
+    if analysis.source == 'ai':
+        # Keyword fallbacks are not persisted - retried once the AI is back
+        save_filing_analysis(analysis)
+    filing['analysis'] = analysis
+    return analysis
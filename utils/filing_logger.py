@@ -14,6 +14,7 @@ from typing import Dict, Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import SessionLocal, FilingEvent
+from utils.llm_cache import cached_completion
 from sqlalchemy.exc import IntegrityError
 
 # AI for summary generation
@@ -126,6 +127,11 @@ def log_filing(filing: Dict) -> bool:
         True if successfully logged, False otherwise
     """
 
+    # 8-K item from the shared FilingAnalysis (no separate item classification)
+    if not filing.get('item_number'):
+        classification = filing.get('classification', {})
+        filing['item_number'] = classification.get('item_number')
+
     db = SessionLocal()
     try:
         # Determine tag
@@ -134,15 +140,15 @@ def log_filing(filing: Dict) -> bool:
         # Determine priority
         priority = filing.get('classification', {}).get('priority', 'MEDIUM')
 
-        # Get summary - prefer orchestrator's AI analysis over re-generation
+        # Get summary - prefer the shared FilingAnalysis summary over re-generation
         classification = filing.get('classification', {})
-        orchestrator_summary = classification.get('reason', '')
+        orchestrator_summary = classification.get('analysis', {}).get('summary') or classification.get('reason', '')
 
         # Use orchestrator summary if it's detailed (not just the filing type)
         if orchestrator_summary and len(orchestrator_summary) > 20 and orchestrator_summary != filing['type']:
             summary = orchestrator_summary
         else:
-            # Generate summary (AI-powered)
+            # Generate summary (AI-powered) - only when no analysis produced one
             summary = _generate_summary(filing)
 
         # Convert filing_date to date object if it's datetime
@@ -508,7 +514,8 @@ Filing excerpt:
 One sentence summary:"""
 
     try:
-        response = AI_CLIENT.chat.completions.create(
+        response = cached_completion(
+            AI_CLIENT, 'filing_summary',
             model="deepseek-chat",
             messages=[
                 {"role": "system", "content": "You are a financial filing analyzer. Provide concise, accurate summaries that identify the SPECIFIC event type (name change, redemption, extension, etc.)."},
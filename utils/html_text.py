@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+HTML Text - Streaming HTML/iXBRL to text for SEC filings
+
+sec_text_extractor.html_to_text and SECFilingFetcher.extract_text used to
+build a full BeautifulSoup tree with html.parser, call get_text() and then
+regex the whole result - only for extract_filing_text to keep the first
+100k characters. On large S-4s that took seconds per document.
+
+This backend never builds a tree. Tags and text are pushed through a
+callback target as they are tokenized:
+
+- lxml's HTMLParser(target=...) when lxml is installed (C tokenizer),
+  otherwise the stdlib html.parser tokenizer (same callbacks, no tree)
+- script / style / head metadata and iXBRL hidden sections (<ix:header>,
+  display:none blocks) are dropped as they are seen
+- the document is fed in chunks and parsing stops once max_chars of visible
+  text is collected, so a 100k-char extract of a 5 MB S-4 reads only the
+  start of the file
+
+Output matches the old pipelines: text nodes joined by `separator` ('' like
+get_text(), ' ' like get_text(separator=' ')) and all whitespace collapsed
+to single spaces (or, with keep_lines=True, stripped non-blank lines).
+
+Usage:
+    from utils.html_text import html_to_text
+
+    text = html_to_text(html, max_chars=100000)
+
+CLI (benchmark against the BeautifulSoup path):
+    python3 utils/html_text.py --benchmark saved_filings/      # *.htm, *.html, *.txt
+    python3 utils/html_text.py --benchmark .sec_cache/         # cached *.gz documents
+"""
+
+import os
+import re
+import gzip
+import time
+from html.parser import HTMLParser
+from typing import List, Optional, Union
+
+from bs4 import UnicodeDammit
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+CHUNK_SIZE = 64 * 1024
+
+# Elements whose content is never visible text
+SKIP_TAGS = {'script', 'style', 'meta', 'link', 'noscript', 'template', 'ix:header', 'ix:hidden'}
+# Elements without end tags (never pushed on the skip stack)
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+             'param', 'source', 'track', 'wbr'}
+HIDDEN_STYLE_PATTERN = re.compile(r'display\s*:\s*none', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+# Start tags that implicitly close an open element (html.parser does not apply
+# these; lxml emits the end events itself): tag -> (closed tags, scope boundaries)
+_P_CLOSERS = {'address', 'article', 'aside', 'blockquote', 'details', 'div', 'dl', 'fieldset',
+              'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+              'header', 'hr', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul'}
+_P_SCOPE = {'html', 'table', 'td', 'th', 'caption', 'button', 'object', 'applet', 'marquee'}
+IMPLIED_CLOSE = {tag: ({'p'}, _P_SCOPE) for tag in _P_CLOSERS}
+IMPLIED_CLOSE.update({
+    'li': ({'li', 'p'}, {'ul', 'ol', 'table'}),
+    'dt': ({'dt', 'dd', 'p'}, {'dl', 'table'}),
+    'dd': ({'dt', 'dd', 'p'}, {'dl', 'table'}),
+    'tr': ({'tr', 'td', 'th'}, {'table', 'tbody', 'thead', 'tfoot'}),
+    'td': ({'td', 'th'}, {'tr', 'table'}),
+    'th': ({'td', 'th'}, {'tr', 'table'}),
+    'tbody': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'thead': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'tfoot': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'option': ({'option'}, {'select'}),
+})
+
+
+class _TextCollector:
+    """
+    Parser target: keeps visible text, tracks the hidden element currently being skipped
+
+    Open elements are kept on a stack, so a hidden element also ends when an
+    ancestor's end tag arrives or a start tag implicitly closes it
+    (<p style="display:none"> followed by </div> or by the next <p>).
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+        self._stack: List[str] = []
+        # Stack depth of the hidden element being skipped (None = visible)
+        self._skip_at: Optional[int] = None
+
+    def _pop_to(self, depth: int):
+        """Close every open element from stack position depth upwards"""
+        del self._stack[depth:]
+        if self._skip_at is not None and self._skip_at >= depth:
+            self._skip_at = None
+
+    def start(self, tag, attrib):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        if tag in VOID_TAGS:
+            return
+
+        implied = IMPLIED_CLOSE.get(tag)
+        if implied:
+            closed, boundaries = implied
+            for depth in range(len(self._stack) - 1, -1, -1):
+                open_tag = self._stack[depth]
+                if open_tag in closed:
+                    self._pop_to(depth)
+                    break
+                if open_tag in boundaries:
+                    break
+
+        self._stack.append(tag)
+        if self._skip_at is not None:
+            return
+        style = attrib.get('style') if attrib else None
+        if tag in SKIP_TAGS or (style and HIDDEN_STYLE_PATTERN.search(style)):
+            self._skip_at = len(self._stack) - 1
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        # Unmatched end tags are ignored; a matched one closes everything above it
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth] == tag:
+                self._pop_to(depth)
+                return
+
+    def data(self, data):
+        if self._skip_at is None and data:
+            self.parts.append(data)
+            self.length += len(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return None
+
+
+class _StdlibTokenizer(HTMLParser):
+    """html.parser driver for _TextCollector (used when lxml is not installed)"""
+
+    def __init__(self, collector: _TextCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        # <div style="display:none"/> has no content to hide
+        pass
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+def _decode(html: Union[str, bytes]) -> str:
+    """Bytes → str using the document's declared / detected encoding"""
+    if isinstance(html, str):
+        return html
+    return UnicodeDammit(html, ['utf-8', 'windows-1252']).unicode_markup or ''
+
+
+def _make_parser(collector: _TextCollector):
+    if LXML_AVAILABLE:
+        return etree.HTMLParser(target=collector, recover=True, no_network=True,
+                                remove_comments=True, remove_pis=True)
+    return _StdlibTokenizer(collector)
+
+
+def _join(parts: List[str], separator: str, keep_lines: bool = False) -> str:
+    text = separator.join(parts)
+    if keep_lines:
+        lines = (line.strip() for line in text.splitlines())
+        return '\n'.join(line for line in lines if line)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def html_to_text(html: Union[str, bytes], max_chars: Optional[int] = None,
+                 separator: str = '', keep_lines: bool = False) -> str:
+    """
+    Visible text of an HTML / iXBRL document, whitespace collapsed
+
+    Args:
+        html: Raw HTML (str or bytes)
+        max_chars: Stop once this many characters are collected (None/0 = whole document)
+        separator: Inserted between text nodes ('' = get_text(), ' ' = get_text(separator=' '))
+        keep_lines: Keep source line breaks (stripped, blank lines dropped) instead of
+                    collapsing everything to single spaces
+
+    Returns:
+        Clean text string (at most max_chars characters)
+    """
+    html = _decode(html)
+    collector = _TextCollector()
+    parser = _make_parser(collector)
+
+    # Collected text shrinks when whitespace is collapsed, so only join when
+    # the raw length says we might have enough
+    threshold = max_chars
+    for offset in range(0, len(html), CHUNK_SIZE):
+        parser.feed(html[offset:offset + CHUNK_SIZE])
+        if max_chars and collector.length >= threshold:
+            text = _join(collector.parts, separator, keep_lines)
+            if len(text) >= max_chars:
+                return text[:max_chars]
+            threshold = collector.length + max(max_chars - len(text), CHUNK_SIZE)
+
+    try:
+        parser.close()
+    except Exception:
+        # lxml raises on documents with no elements at all
+        pass
+
+    text = _join(collector.parts, separator, keep_lines)
+    return text[:max_chars] if max_chars else text
+
+
+def _legacy_html_to_text(html: Union[str, bytes], max_chars: Optional[int] = None) -> str:
+    """Previous BeautifulSoup implementation (benchmark baseline)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(["script", "style", "meta", "link"]):
+        element.decompose()
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = ' '.join(chunk for chunk in chunks if chunk)
+    return text[:max_chars] if max_chars else text
+
+
+def _read_corpus_file(path: str) -> str:
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    with open(path, 'rb') as f:
+        return _decode(f.read())
+
+
+def benchmark(corpus_dir: str, max_chars: Optional[int] = 100000, limit: Optional[int] = None):
+    """
+    Time html_to_text against the BeautifulSoup baseline over saved filings
+
+    Args:
+        corpus_dir: Directory of saved 424B4 / S-4 / 10-Q documents (.htm, .html, .txt, .gz)
+        max_chars: Truncation passed to both implementations (0 = full documents)
+        limit: Only use the first N files (largest first)
+    """
+    paths = [
+        os.path.join(root, name)
+        for root, _, names in os.walk(corpus_dir)
+        for name in names
+        if name.lower().endswith(('.htm', '.html', '.txt', '.gz'))
+    ]
+    paths.sort(key=os.path.getsize, reverse=True)
+    if limit:
+        paths = paths[:limit]
+    if not paths:
+        print(f"⚠️  No .htm/.html/.txt/.gz documents under {corpus_dir}")
+        return
+
+    backend = 'lxml' if LXML_AVAILABLE else 'html.parser tokenizer'
+    print(f"📊 {len(paths)} documents, max_chars={max_chars or 'none'}, backend={backend}")
+
+    total_legacy = total_fast = 0.0
+    total_bytes = 0
+    for path in paths:
+        html = _read_corpus_file(path)
+        total_bytes += len(html)
+
+        started = time.perf_counter()
+        legacy = _legacy_html_to_text(html, max_chars)
+        legacy_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        fast = html_to_text(html, max_chars)
+        fast_time = time.perf_counter() - started
+
+        total_legacy += legacy_time
+        total_fast += fast_time
+        print(f"   {os.path.basename(path)[:40]:40s} {len(html) / 1024 / 1024:6.2f} MB  "
+              f"bs4 {legacy_time:6.2f}s  fast {fast_time:6.3f}s  "
+              f"chars {len(legacy):>8,} / {len(fast):>8,}")
+
+    speedup = total_legacy / total_fast if total_fast else float('inf')
+    print(f"\n✅ {total_bytes / 1024 / 1024:.1f} MB: bs4 {total_legacy:.2f}s, fast {total_fast:.2f}s "
+          f"({speedup:.1f}x)")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Streaming HTML to text for SEC filings')
+    parser.add_argument('--benchmark', metavar='DIR', required=True,
+                        help='Directory of saved filings (.htm/.html/.txt, or .sec_cache .gz entries)')
+    parser.add_argument('--max-chars', type=int, default=100000, help='Truncation (0 = full text)')
+    parser.add_argument('--limit', type=int, help='Only benchmark the N largest documents')
+    args = parser.parse_args()
+
+    benchmark(args.benchmark, args.max_chars or None, args.limit)
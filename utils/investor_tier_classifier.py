@@ -14,9 +14,15 @@ Why this matters:
 - Tier-3+ = 0 points (no institutional signal)
 """
 
+import os
+import sys
 from typing import Dict, List, Optional
 import re
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.keyword_matcher import KeywordMatcher
+
 
 # ============================================================================
 # TIER-1: Elite Institutional Investors
@@ -157,6 +163,16 @@ TIER3_CATEGORIES = {
 }
 
 
+# Corporate indicators for Tier-3
+CORPORATE_KEYWORDS = ['corporation', 'corp.', 'inc.', 'holdings', 'ventures']
+
+# Compiled once: one pass over an investor name per tier instead of a scan per variation
+TIER1_MATCHER = KeywordMatcher((name, data['variations']) for name, data in TIER1_INVESTORS.items())
+TIER1_RANK = {name: i for i, name in enumerate(TIER1_INVESTORS)}
+TIER2_MATCHER = KeywordMatcher((name, data['variations']) for name, data in TIER2_INVESTORS.items())
+CORPORATE_MATCHER = KeywordMatcher({'corporate': CORPORATE_KEYWORDS})
+
+
 class InvestorTierClassifier:
     """Classify PIPE investors into tiers"""
 
@@ -223,50 +239,44 @@ class InvestorTierClassifier:
         }
 
     def _check_tier1(self, investor_lower: str) -> Optional[Dict]:
-        """Check if investor matches Tier-1 list"""
-        for entity_name, entity_data in TIER1_INVESTORS.items():
-            variations = entity_data['variations']
-
-            # Exact match
-            if investor_lower == entity_name:
-                return {
-                    'name': entity_name.title(),
-                    'confidence': 100,
-                    **entity_data
-                }
-
-            # Check variations
-            for variation in variations:
-                if variation in investor_lower:
-                    # Fuzzy match confidence based on length
-                    confidence = 90 if len(variation) > 5 else 80
-                    return {
-                        'name': entity_name.title(),
-                        'confidence': confidence,
-                        **entity_data
-                    }
+        """Check if investor matches Tier-1 list (first entity in list order wins)"""
+        match = TIER1_MATCHER.first(investor_lower)
+        exact_rank = TIER1_RANK.get(investor_lower)
+
+        # Exact match on an entity name that comes before any variation match
+        if exact_rank is not None and (match is None or exact_rank <= match.group):
+            entity_name = TIER1_MATCHER.labels_order[exact_rank]
+            return {
+                'name': entity_name.title(),
+                'confidence': 100,
+                **TIER1_INVESTORS[entity_name]
+            }
+
+        if match:
+            # Fuzzy match confidence based on length
+            confidence = 90 if len(match.keyword) > 5 else 80
+            return {
+                'name': match.label.title(),
+                'confidence': confidence,
+                **TIER1_INVESTORS[match.label]
+            }
 
         return None
 
     def _check_tier2(self, investor_lower: str) -> Optional[Dict]:
         """Check if investor matches Tier-2 list"""
-        for entity_name, entity_data in TIER2_INVESTORS.items():
-            variations = entity_data['variations']
-
-            for variation in variations:
-                if variation in investor_lower:
-                    return {
-                        'name': entity_name.title(),
-                        'confidence': 85
-                    }
+        match = TIER2_MATCHER.first(investor_lower)
+        if match:
+            return {
+                'name': match.label.title(),
+                'confidence': 85
+            }
 
         return None
 
     def _is_corporate_investor(self, investor_lower: str) -> bool:
         """Check if investor looks like a corporate/strategic investor"""
-        # Corporate indicators
-        corporate_keywords = ['corporation', 'corp.', 'inc.', 'holdings', 'ventures']
-        return any(keyword in investor_lower for keyword in corporate_keywords)
+        return CORPORATE_MATCHER.contains_any(investor_lower)
 
     def classify_pipe_investors(self, investor_list: List[str]) -> Dict:
         """
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache - Prompt-hash keyed cache for chat completion responses
+
+Backfills and reprocessing runs send the same prompts for the same filings
+again and again, paying full LLM latency and cost each time. This cache stores
+responses locally (SQLite) keyed by a hash of everything that determines the
+output: model, temperature, max_tokens, response_format and the full message
+list (system + user prompts).
+
+- Opt-in per call site: replace AI_CLIENT.chat.completions.create(...) with
+  cached_completion(AI_CLIENT, 'namespace', ...) - the return value has the
+  same shape (response.choices[0].message.content)
+- TTL (LLM_CACHE_TTL_DAYS, default 30) and size cap (LLM_CACHE_MAX_MB, default
+  512, least recently used entries evicted first)
+- Hit / miss counters per namespace, persisted across runs
+- LLM_CACHE_ENABLED=false bypasses the cache everywhere
+
+Usage:
+    from utils.llm_cache import cached_completion
+
+    response = cached_completion(
+        AI_CLIENT, 'filing_processor',
+        model="deepseek-chat",
+        messages=[{"role": "user", "content": prompt}],
+        response_format={"type": "json_object"},
+        temperature=0.1
+    )
+    data = json.loads(response.choices[0].message.content)
+
+CLI:
+    python3 utils/llm_cache.py --stats    # Hit rates per namespace
+    python3 utils/llm_cache.py --clear    # Drop all cached responses
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+DEFAULT_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.llm_cache', 'responses.db'
+))
+DEFAULT_TTL_SECONDS = int(float(os.getenv('LLM_CACHE_TTL_DAYS', '30')) * 86400)
+DEFAULT_MAX_BYTES = int(float(os.getenv('LLM_CACHE_MAX_MB', '512')) * 1024 * 1024)
+
+# Request parameters that determine the response (others, e.g. timeout, don't)
+KEY_PARAMS = ['model', 'messages', 'temperature', 'max_tokens', 'response_format', 'top_p', 'stop']
+
+
+def cache_enabled() -> bool:
+    return os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+
+
+def request_key(params: Dict) -> str:
+    """Hash of the request parameters that determine the response"""
+    material = {name: params.get(name) for name in KEY_PARAMS}
+    encoded = json.dumps(material, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _as_response(content: str, model: Optional[str], finish_reason: Optional[str]) -> SimpleNamespace:
+    """Minimal ChatCompletion-shaped object for cached content"""
+    message = SimpleNamespace(role='assistant', content=content)
+    choice = SimpleNamespace(index=0, message=message, finish_reason=finish_reason)
+    return SimpleNamespace(choices=[choice], model=model, usage=None, cached=True)
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response cache with TTL, size cap and hit statistics
+
+    Thread-safe (one connection guarded by a lock); safe to share across
+    processes thanks to WAL mode.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._session_stats: Dict[str, Dict[str, int]] = {}
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                namespace TEXT,
+                model TEXT,
+                content TEXT NOT NULL,
+                finish_reason TEXT,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_hit_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_last_hit ON responses(last_hit_at);
+
+            CREATE TABLE IF NOT EXISTS stats (
+                namespace TEXT PRIMARY KEY,
+                hits INTEGER NOT NULL DEFAULT 0,
+                misses INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        self._writes_since_evict = 0
+
+    def _count(self, namespace: str, hit: bool):
+        counters = self._session_stats.setdefault(namespace, {'hits': 0, 'misses': 0})
+        counters['hits' if hit else 'misses'] += 1
+        column = 'hits' if hit else 'misses'
+        self._conn.execute(
+            f"INSERT INTO stats (namespace, {column}) VALUES (?, 1) "
+            f"ON CONFLICT(namespace) DO UPDATE SET {column} = {column} + 1",
+            (namespace,)
+        )
+
+    def get(self, key: str, namespace: str = 'default') -> Optional[SimpleNamespace]:
+        """Cached response for key (None on miss or expired)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, model, finish_reason, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[3] <= self.ttl_seconds:
+                self._conn.execute("UPDATE responses SET last_hit_at = ? WHERE key = ?", (now, key))
+                self._count(namespace, hit=True)
+                return _as_response(row[0], row[1], row[2])
+            if row:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._count(namespace, hit=False)
+            return None
+
+    def put(self, key: str, content: str, namespace: str = 'default', model: Optional[str] = None,
+            finish_reason: Optional[str] = None):
+        """Store a response"""
+        now = time.time()
+        size = len(content.encode('utf-8'))
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO responses
+                    (key, namespace, model, content, finish_reason, size_bytes, created_at, last_hit_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, namespace, model, content, finish_reason, size, now, now))
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= 100:
+                self._writes_since_evict = 0
+                self._evict(now)
+
+    def _evict(self, now: float):
+        """Drop expired entries, then least recently used until under max_bytes (lock held)"""
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * 0.9)  # Evict to 90% to avoid evicting on every write
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size_bytes FROM responses ORDER BY last_hit_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def stats(self, session_only: bool = False) -> Dict[str, Dict]:
+        """
+        Hit statistics per namespace
+
+        Args:
+            session_only: Only count lookups made by this process
+
+        Returns:
+            {namespace: {'hits', 'misses', 'hit_rate'}}
+        """
+        if session_only:
+            counters = {name: dict(values) for name, values in self._session_stats.items()}
+        else:
+            with self._lock:
+                rows = self._conn.execute("SELECT namespace, hits, misses FROM stats").fetchall()
+            counters = {name: {'hits': hits, 'misses': misses} for name, hits, misses in rows}
+
+        for values in counters.values():
+            lookups = values['hits'] + values['misses']
+            values['hit_rate'] = values['hits'] / lookups if lookups else 0.0
+        return counters
+
+    def size(self) -> Dict[str, int]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+            ).fetchone()
+        return {'entries': entries, 'bytes': total}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM stats")
+        self._session_stats.clear()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache (created on first use)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache()
+        return _cache
+
+
+def cached_completion(client, namespace: str, use_cache: bool = True, **params):
+    """
+    chat.completions.create with response caching
+
+    Args:
+        client: OpenAI-compatible client (e.g. AI_CLIENT)
+        namespace: Call site label for hit statistics (e.g. 'quarterly_report')
+        use_cache: False to bypass the cache for this call
+        **params: Arguments for client.chat.completions.create
+
+    Returns:
+        API response, or a cached response with the same shape
+        (response.choices[0].message.content) and response.cached = True
+    """
+    if not use_cache or not cache_enabled() or params.get('stream'):
+        return client.chat.completions.create(**params)
+
+    try:
+        cache = get_llm_cache()
+    except (sqlite3.Error, OSError) as e:
+        # Cache is optional - an unwritable .llm_cache/ or locked DB must not fail the call
+        print(f"⚠️  LLM cache unavailable: {e}")
+        return client.chat.completions.create(**params)
+
+    key = request_key(params)
+    try:
+        cached = cache.get(key, namespace)
+    except sqlite3.Error as e:
+        print(f"⚠️  LLM cache read failed: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    response = client.chat.completions.create(**params)
+
+    choice = response.choices[0] if response.choices else None
+    content = choice.message.content if choice else None
+    if content and (not choice.finish_reason or choice.finish_reason == 'stop'):
+        try:
+            cache.put(key, content, namespace, getattr(response, 'model', None), choice.finish_reason)
+        except sqlite3.Error as e:
+            print(f"⚠️  LLM cache write failed: {e}")
+    return response
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='LLM response cache')
+    parser.add_argument('--stats', action='store_true', help='Show hit rates per namespace')
+    parser.add_argument('--clear', action='store_true', help='Drop all cached responses')
+    args = parser.parse_args()
+
+    try:
+        cache = get_llm_cache()
+    except (sqlite3.Error, OSError) as e:
+        raise SystemExit(f"❌ LLM cache unavailable: {e}")
+
+    if args.clear:
+        cache.clear()
+        print("🗑️  LLM response cache cleared")
+
+    size = cache.size()
+    print(f"📦 {size['entries']} cached responses ({size['bytes'] / 1024 / 1024:.1f} MB) in {cache.path}")
+    for namespace, values in sorted(cache.stats().items()):
+        print(f"   {namespace:30s} hits {values['hits']:6d}  misses {values['misses']:6d}  "
+              f"hit rate {values['hit_rate']:.0%}")
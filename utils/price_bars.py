@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Price Bars - Local daily OHLCV store shared by all price and volume consumers
+
+PriceUpdater, volume_tracker, DailyVolumeTracker, VolumeTrackerAgent and the
+sponsor performance scripts each downloaded overlapping history per ticker
+from Yahoo (update_all_spacs even claimed a 30-day average from 2 days of
+data). Instead, daily bars live in one Postgres table keyed by (ticker,
+trade_date):
+
+- Backfill: tickers with no bars get BACKFILL_PERIOD of history once; a
+  backfill that returns no new bars (delisted symbol, failed download) is
+  recorded in price_bar_misses and retried with exponential backoff instead
+  of every sync
+- Incremental: tickers with recent bars are refreshed from their last stored
+  session in one batched yf.download per cycle (the last bar is re-fetched so
+  today's partial bar is kept current)
+- Reads are vectorized: load_matrix() returns a (date × ticker) frame for
+  rolling averages and spike ratios, closes_on() answers many on-date
+  lookups in one query
+- Quotes: consumers treat a ticker as quoted only if its last bar is within
+  QUOTE_MAX_AGE, so a dead symbol doesn't keep serving a weeks-old close
+
+Usage:
+    from utils.price_bars import PriceBarStore, volume_metrics
+
+    store = PriceBarStore()
+    store.sync(tickers)                              # one batch download
+    volume = store.load_matrix('volume', tickers, sessions=31)
+    metrics = volume_metrics(volume)                 # avg_volume_30d, spike ratio, ...
+    close = store.close_on('ABCD', date(2024, 3, 1))
+    store.close()
+
+CLI:
+    python3 utils/price_bars.py                # Sync all SPAC tickers
+    python3 utils/price_bars.py --ticker ABCD  # Sync one ticker
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import SessionLocal
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BAR_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+# History downloaded the first time a ticker is seen
+BACKFILL_PERIOD = os.getenv('PRICE_BARS_BACKFILL_PERIOD', '1y')
+# Tickers whose last bar is older than this are re-backfilled instead of
+# widening the shared incremental download window
+INCREMENTAL_MAX_GAP = timedelta(days=30)
+# Empty backfills are retried after BACKFILL_RETRY_BASE, doubling per miss up to BACKFILL_RETRY_MAX
+BACKFILL_RETRY_BASE = timedelta(hours=float(os.getenv('PRICE_BARS_BACKFILL_RETRY_HOURS', '24')))
+BACKFILL_RETRY_MAX = timedelta(days=30)
+# A ticker whose last bar is older than this has no current quote (covers
+# weekends and market holidays)
+QUOTE_MAX_AGE = timedelta(days=5)
+# Sessions averaged for volume_avg_30d (latest session excluded)
+VOLUME_AVG_SESSIONS = 30
+# Rows per INSERT statement
+SAVE_CHUNK_ROWS = 5000
+
+_table_checked = False
+_table_lock = threading.Lock()
+
+
+def _ensure_table_exists(db):
+    """Create price_bars table if it doesn't exist (once per process)"""
+    global _table_checked
+    if _table_checked:
+        return
+
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS price_bars (
+        ticker VARCHAR(20) NOT NULL,
+        trade_date DATE NOT NULL,
+        open DOUBLE PRECISION,
+        high DOUBLE PRECISION,
+        low DOUBLE PRECISION,
+        close DOUBLE PRECISION,
+        volume BIGINT,
+        updated_at TIMESTAMP DEFAULT NOW(),
+        PRIMARY KEY (ticker, trade_date)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_price_bars_trade_date
+    ON price_bars(trade_date);
+
+    CREATE TABLE IF NOT EXISTS price_bar_misses (
+        ticker VARCHAR(20) PRIMARY KEY,
+        misses INTEGER NOT NULL DEFAULT 1,
+        last_attempt TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+    """
+
+    with _table_lock:
+        if _table_checked:
+            return
+        try:
+            db.execute(text(create_table_sql))
+            db.commit()
+            _table_checked = True
+        except Exception as e:
+            print(f"⚠️  Could not create price_bars table: {e}")
+            db.rollback()
+
+
+def quote_cutoff(today: Optional[date] = None) -> date:
+    """Oldest last-bar date that still counts as a current quote"""
+    return (today or date.today()) - QUOTE_MAX_AGE
+
+
+def bars_from_download(data: pd.DataFrame, tickers: Sequence[str]) -> pd.DataFrame:
+    """
+    Long-format bars from a yf.download(group_by='column') result
+
+    Returns:
+        DataFrame with columns ticker, trade_date, open, high, low, close, volume
+        (rows without a close dropped)
+    """
+    columns = ['ticker', 'trade_date'] + BAR_FIELDS
+    if data is None or data.empty:
+        return pd.DataFrame(columns=columns)
+
+    frames = {}
+    for field in BAR_FIELDS:
+        frame = data[field.capitalize()]
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame(tickers[0])
+        frames[field] = frame
+
+    long = pd.concat({field: frame.stack(future_stack=True) for field, frame in frames.items()}, axis=1)
+    long.index = long.index.set_names(['trade_date', 'ticker'])
+    long = long.reset_index()
+    long = long[long['close'].notna()]
+    long['trade_date'] = pd.to_datetime(long['trade_date']).dt.date
+    return long[columns]
+
+
+def volume_metrics(volume: pd.DataFrame, window: int = VOLUME_AVG_SESSIONS) -> pd.DataFrame:
+    """
+    Latest volume vs the average of the `window` sessions before it, per ticker
+
+    Each ticker's latest session is its last non-null volume, so tickers that
+    didn't trade today still compare their most recent session.
+
+    Args:
+        volume: (date × ticker) volume frame (see PriceBarStore.load_matrix)
+
+    Returns:
+        DataFrame indexed by ticker: current_volume, avg_volume_30d, sessions,
+        volume_spike_ratio
+    """
+    columns = ['current_volume', 'avg_volume_30d', 'sessions', 'volume_spike_ratio']
+    if volume.empty:
+        return pd.DataFrame(columns=columns, dtype=float)
+
+    valid = volume.notna()
+    sessions_from_end = valid.iloc[::-1].cumsum().iloc[::-1].where(valid)
+
+    current = volume.where(sessions_from_end == 1).max()
+    prior = volume.where((sessions_from_end >= 2) & (sessions_from_end <= window + 1))
+    avg = prior.mean()
+
+    metrics = pd.DataFrame({
+        'current_volume': current,
+        'avg_volume_30d': avg,
+        'sessions': valid.sum(),
+        'volume_spike_ratio': (current / avg.where(avg > 0)).fillna(1.0),
+    })
+    return metrics[metrics['current_volume'].notna()].replace([np.inf, -np.inf], np.nan)
+
+
+class PriceBarStore:
+    """Daily OHLCV bars in Postgres with batched Yahoo sync and vectorized reads"""
+
+    def __init__(self, db=None):
+        """
+        Args:
+            db: Optional SQLAlchemy session to share (default: own SessionLocal)
+        """
+        self._owns_session = db is None
+        self.db = db or SessionLocal()
+        _ensure_table_exists(self.db)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def save_bars(self, bars: pd.DataFrame) -> int:
+        """Upsert long-format bars (see bars_from_download)"""
+        if bars.empty:
+            return 0
+
+        records = []
+        for row in bars.itertuples(index=False):
+            records.append({
+                'ticker': row.ticker,
+                'trade_date': row.trade_date.isoformat(),
+                'open': None if pd.isna(row.open) else float(row.open),
+                'high': None if pd.isna(row.high) else float(row.high),
+                'low': None if pd.isna(row.low) else float(row.low),
+                'close': float(row.close),
+                'volume': None if pd.isna(row.volume) else int(row.volume),
+            })
+
+        for i in range(0, len(records), SAVE_CHUNK_ROWS):
+            self.db.execute(text("""
+                INSERT INTO price_bars (ticker, trade_date, open, high, low, close, volume, updated_at)
+                SELECT ticker, trade_date, open, high, low, close, volume, NOW()
+                FROM json_to_recordset(CAST(:rows AS json)) AS v(
+                    ticker varchar, trade_date date, open double precision, high double precision,
+                    low double precision, close double precision, volume bigint
+                )
+                ON CONFLICT (ticker, trade_date) DO UPDATE SET
+                    open = EXCLUDED.open,
+                    high = EXCLUDED.high,
+                    low = EXCLUDED.low,
+                    close = EXCLUDED.close,
+                    volume = EXCLUDED.volume,
+                    updated_at = EXCLUDED.updated_at
+            """), {'rows': json.dumps(records[i:i + SAVE_CHUNK_ROWS])})
+        self.db.commit()
+        return len(records)
+
+    def download(self, tickers: Sequence[str], start: Optional[date] = None, end: Optional[date] = None,
+                 period: Optional[str] = None, batch_size: int = 200,
+                 delay_seconds: float = 1.0) -> pd.DataFrame:
+        """
+        Download daily bars with batched yf.download calls
+
+        Returns:
+            Long-format bars (see bars_from_download)
+        """
+        if not YFINANCE_AVAILABLE:
+            logger.error("yfinance not installed")
+            return bars_from_download(None, tickers)
+
+        tickers = sorted(set(t for t in tickers if t))
+        batches = [tickers[i:i + batch_size] for i in range(0, len(tickers), batch_size)]
+        kwargs = {'period': period} if period else {
+            'start': start.isoformat() if start else None,
+            'end': (end + timedelta(days=1)).isoformat() if end else None,
+        }
+
+        frames = []
+        for batch_num, batch in enumerate(batches, 1):
+            if batch_num > 1:
+                time.sleep(delay_seconds)
+
+            logger.info(f"   Downloading bars batch {batch_num}/{len(batches)} ({len(batch)} tickers)...")
+            try:
+                data = yf.download(
+                    batch,
+                    group_by='column',
+                    threads=True,
+                    progress=False,
+                    auto_adjust=True,
+                    **kwargs
+                )
+            except Exception as e:
+                logger.error(f"   Bars batch {batch_num} download failed: {e}")
+                continue
+            frames.append(bars_from_download(data, batch))
+
+        if not frames:
+            return bars_from_download(None, tickers)
+        return pd.concat(frames, ignore_index=True)
+
+    def last_bar_dates(self, tickers: Iterable[str]) -> Dict[str, date]:
+        """Most recent stored session per ticker (tickers without bars omitted)"""
+        rows = self.db.execute(text("""
+            SELECT ticker, MAX(trade_date) AS last_date
+            FROM price_bars
+            WHERE ticker = ANY(:tickers)
+            GROUP BY ticker
+        """), {'tickers': list(tickers)})
+        return {row.ticker: row.last_date for row in rows}
+
+    def backfill_backoff(self, tickers: Iterable[str]) -> set:
+        """
+        Tickers whose last backfill came back empty and are still in backoff
+
+        The wait is BACKFILL_RETRY_BASE doubled per miss (capped at
+        BACKFILL_RETRY_MAX), compared against the DB clock that stamped
+        last_attempt.
+        """
+        rows = self.db.execute(text("""
+            SELECT ticker
+            FROM price_bar_misses
+            WHERE ticker = ANY(:tickers)
+              AND last_attempt + LEAST(
+                      make_interval(secs => :base * POWER(2, GREATEST(misses - 1, 0))),
+                      make_interval(secs => :max)
+                  ) > NOW()
+        """), {
+            'tickers': list(tickers),
+            'base': BACKFILL_RETRY_BASE.total_seconds(),
+            'max': BACKFILL_RETRY_MAX.total_seconds(),
+        })
+        return {row.ticker for row in rows}
+
+    def record_backfill(self, tickers: Sequence[str], bars: pd.DataFrame, last_dates: Dict[str, date]):
+        """Count tickers that got no bars newer than their stored ones as misses, clear the rest"""
+        if bars.empty:
+            newest = {}
+        else:
+            newest = bars.groupby('ticker')['trade_date'].max().to_dict()
+        missed = [t for t in tickers if t not in newest or (t in last_dates and newest[t] <= last_dates[t])]
+        found = [t for t in tickers if t not in missed]
+
+        if missed:
+            self.db.execute(text("""
+                INSERT INTO price_bar_misses (ticker, misses, last_attempt)
+                SELECT ticker, 1, NOW() FROM unnest(CAST(:tickers AS varchar[])) AS ticker
+                ON CONFLICT (ticker) DO UPDATE SET
+                    misses = price_bar_misses.misses + 1,
+                    last_attempt = EXCLUDED.last_attempt
+            """), {'tickers': missed})
+        if found:
+            self.db.execute(text("DELETE FROM price_bar_misses WHERE ticker = ANY(:tickers)"),
+                            {'tickers': found})
+        self.db.commit()
+        if missed:
+            logger.info(f"   {len(missed)} tickers returned no new bars (backfill backed off)")
+
+    def sync(self, tickers: Sequence[str], batch_size: int = 200, delay_seconds: float = 1.0,
+             backfill_period: str = BACKFILL_PERIOD) -> int:
+        """
+        Bring bars for tickers up to date
+
+        Tickers with recent bars share one incremental download starting at the
+        oldest of their last sessions; new or long-stale tickers are backfilled,
+        except those whose previous backfill came back empty and are still in
+        backoff (see backfill_backoff).
+
+        Returns:
+            Number of bars written
+        """
+        tickers = sorted(set(t for t in tickers if t))
+        if not tickers:
+            return 0
+
+        last_dates = self.last_bar_dates(tickers)
+        cutoff = date.today() - INCREMENTAL_MAX_GAP
+        incremental = [t for t in tickers if t in last_dates and last_dates[t] >= cutoff]
+        backfill = [t for t in tickers if t not in incremental]
+        if backfill:
+            backing_off = self.backfill_backoff(backfill)
+            backfill = [t for t in backfill if t not in backing_off]
+
+        saved = 0
+        if incremental:
+            start = min(last_dates[t] for t in incremental)
+            saved += self.save_bars(self.download(incremental, start=start, batch_size=batch_size,
+                                                  delay_seconds=delay_seconds))
+        if backfill:
+            logger.info(f"   Backfilling {backfill_period} of bars for {len(backfill)} tickers...")
+            bars = self.download(backfill, period=backfill_period, batch_size=batch_size,
+                                 delay_seconds=delay_seconds)
+            saved += self.save_bars(bars)
+            self.record_backfill(backfill, bars, last_dates)
+        return saved
+
+    def ensure_range(self, ticker: str, start: date, end: date, slack_days: int = 5) -> bool:
+        """
+        Make sure bars covering [start, end] are stored (downloads the range once)
+
+        Returns:
+            True if the store has bars in the range afterwards
+        """
+        start, end = [d.date() if isinstance(d, datetime) else d for d in (start, end)]
+        row = self.db.execute(text("""
+            SELECT MIN(trade_date) AS first_date, MAX(trade_date) AS last_date
+            FROM price_bars
+            WHERE ticker = :ticker AND trade_date BETWEEN :start AND :end
+        """), {'ticker': ticker, 'start': start, 'end': end}).first()
+
+        covered = (
+            row and row.first_date and
+            row.first_date <= start + timedelta(days=slack_days) and
+            row.last_date >= min(end, date.today()) - timedelta(days=slack_days)
+        )
+        if covered:
+            return True
+
+        saved = self.save_bars(self.download([ticker], start=start, end=end))
+        return saved > 0 or bool(row and row.first_date)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def load_matrix(self, field: str, tickers: Optional[Sequence[str]] = None,
+                    sessions: Optional[int] = None, start: Optional[date] = None,
+                    end: Optional[date] = None) -> pd.DataFrame:
+        """
+        (date × ticker) frame of one bar field
+
+        Args:
+            field: open / high / low / close / volume
+            tickers: Tickers to load (None = all)
+            sessions: Only the last N sessions per ticker
+            start / end: Date bounds (inclusive)
+        """
+        if field not in BAR_FIELDS:
+            raise ValueError(f"Unknown bar field: {field}")
+
+        conditions, params = [], {}
+        if tickers is not None:
+            conditions.append("ticker = ANY(:tickers)")
+            params['tickers'] = list(tickers)
+        if start:
+            conditions.append("trade_date >= :start")
+            params['start'] = start
+        if end:
+            conditions.append("trade_date <= :end")
+            params['end'] = end
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        if sessions:
+            query = f"""
+                SELECT ticker, trade_date, {field} AS value FROM (
+                    SELECT ticker, trade_date, {field},
+                           ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY trade_date DESC) AS rn
+                    FROM price_bars {where}
+                ) ranked
+                WHERE rn <= :sessions
+            """
+            params['sessions'] = sessions
+        else:
+            query = f"SELECT ticker, trade_date, {field} AS value FROM price_bars {where}"
+
+        long = pd.read_sql(text(query), self.db.bind, params=params)
+        if long.empty:
+            return pd.DataFrame(columns=list(tickers or []), dtype=float)
+
+        matrix = long.pivot(index='trade_date', columns='ticker', values='value').sort_index()
+        matrix.index = pd.to_datetime(matrix.index)
+        return matrix.astype(float)
+
+    def history(self, ticker: str, sessions: int) -> pd.DataFrame:
+        """Last N bars for one ticker (index trade_date, columns open..volume)"""
+        frame = pd.read_sql(text("""
+            SELECT trade_date, open, high, low, close, volume
+            FROM price_bars
+            WHERE ticker = :ticker
+            ORDER BY trade_date DESC
+            LIMIT :sessions
+        """), self.db.bind, params={'ticker': ticker, 'sessions': sessions})
+        return frame.iloc[::-1].set_index('trade_date')
+
+    def bars_on(self, trade_date: date, tickers: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Bars for one session (index ticker, columns open..volume)"""
+        params = {'trade_date': trade_date}
+        query = "SELECT ticker, open, high, low, close, volume FROM price_bars WHERE trade_date = :trade_date"
+        if tickers is not None:
+            query += " AND ticker = ANY(:tickers)"
+            params['tickers'] = list(tickers)
+        return pd.read_sql(text(query), self.db.bind, params=params).set_index('ticker')
+
+    def closes_on(self, lookups: Sequence[tuple], window_days: int = 5) -> List[Optional[float]]:
+        """
+        Close for many (ticker, date) pairs in one query
+
+        Uses the session on the date, else the first session after it, else
+        the last session before it (within window_days).
+
+        Returns:
+            Closes in lookup order (None where no bar is stored)
+        """
+        if not lookups:
+            return []
+
+        rows = self.db.execute(text("""
+            SELECT q.n, b.close
+            FROM unnest(CAST(:tickers AS varchar[]), CAST(:dates AS date[]))
+                 WITH ORDINALITY AS q(ticker, on_date, n)
+            LEFT JOIN LATERAL (
+                SELECT close FROM price_bars p
+                WHERE p.ticker = q.ticker
+                  AND p.trade_date BETWEEN q.on_date - :window AND q.on_date + :window
+                ORDER BY (p.trade_date < q.on_date), ABS(p.trade_date - q.on_date)
+                LIMIT 1
+            ) b ON TRUE
+        """), {
+            'tickers': [ticker for ticker, _ in lookups],
+            'dates': [d.date() if isinstance(d, datetime) else d for _, d in lookups],
+            'window': window_days,
+        })
+
+        closes = {row.n: row.close for row in rows}
+        return [float(closes[i]) if closes.get(i) is not None else None for i in range(1, len(lookups) + 1)]
+
+    def close_on(self, ticker: str, on_date: date, window_days: int = 5, download: bool = True) -> Optional[float]:
+        """Close for one ticker on a date (downloads the surrounding window if not stored)"""
+        if isinstance(on_date, datetime):
+            on_date = on_date.date()
+
+        close = self.closes_on([(ticker, on_date)], window_days)[0]
+        if close is None and download:
+            self.ensure_range(ticker, on_date - timedelta(days=window_days), on_date + timedelta(days=window_days))
+            close = self.closes_on([(ticker, on_date)], window_days)[0]
+        return close
+
+    def close(self):
+        if self._owns_session:
+            self.db.close()
+
+
+if __name__ == '__main__':
+    import argparse
+    from database import SPAC
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Sync daily price bars into the local store')
+    parser.add_argument('--ticker', action='append', help='Ticker to sync (repeatable, default: all SPACs)')
+    args = parser.parse_args()
+
+    store = PriceBarStore()
+    try:
+        tickers = args.ticker or [row.ticker for row in store.db.query(SPAC.ticker).all()]
+        saved = store.sync(tickers)
+        print(f"✅ {saved} bars written for {len(tickers)} tickers")
+    finally:
+        store.close()
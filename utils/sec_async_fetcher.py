@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Async SEC Fetcher - Concurrent fetch engine for SEC documents
+
+Most of a poll cycle is spent waiting on network latency, not on the SEC
+rate limit. This engine keeps up to `max_concurrency` requests in flight
+while still drawing every request from the shared token bucket in
+utils/sec_http.py, and shares the on-disk document cache with SECFilingFetcher.
+
+Pipelining per filing:
+    index page ─┬─> primary document URL ──> primary document  ┐
+                └─> exhibit links ─────────> key exhibits      ┴─> bundle
+
+Index parsing is reused from SECFilingFetcher so sync and async paths
+resolve the same documents.
+
+Usage (async):
+    fetcher = get_async_fetcher()
+    bundle = await fetcher.fetch_filing_bundle(index_url, filing_type='8-K')
+
+Usage (sync facade - for existing blocking callers):
+    from utils.sec_async_fetcher import fetch_filing_bundles
+
+    bundles = fetch_filing_bundles([(url, '8-K'), (url2, '10-Q')])
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from utils.sec_document_cache import get_document_cache
+from utils.sec_filing_fetcher import SECFilingFetcher
+from utils.sec_http import SEC_USER_AGENT, get_sec_rate_limiter
+
+# Exhibits that typically carry the substance of an 8-K
+KEY_EXHIBIT_NUMBERS = ['99.1', '10.1', '2.1', '99.2', '10.2']
+
+
+class AsyncSECFetcher:
+    """
+    Async SEC document fetcher (httpx) bound to one event loop
+
+    Features:
+    - Shared SEC token bucket (same budget as sync callers)
+    - Bounded concurrency (max_concurrency requests in flight)
+    - Shared on-disk document cache
+    - Retries with backoff on 429 / timeouts
+    """
+
+    def __init__(self, max_concurrency: int = 10, use_cache: bool = True):
+        self.rate_limiter = get_sec_rate_limiter()
+        self.cache = get_document_cache() if use_cache else None
+        self.parser = SECFilingFetcher(use_cache=use_cache)  # Index parsing helpers
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            headers={'User-Agent': SEC_USER_AGENT, 'Accept-Encoding': 'gzip, deflate'},
+            timeout=30,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        )
+        self.request_count = 0
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def fetch_document(self, url: str, max_retries: int = 3) -> Optional[str]:
+        """
+        Fetch SEC document (async) with cache, rate limiting and retries
+
+        Returns:
+            Document text or None if fetch failed
+        """
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
+        for attempt in range(max_retries):
+            async with self._semaphore:
+                await self.rate_limiter.acquire_async()
+                self.request_count += 1
+                try:
+                    response = await self._client.get(url)
+                except (httpx.TimeoutException, httpx.TransportError) as e:
+                    print(f"   ⚠️  SEC async fetch error ({attempt + 1}/{max_retries}): {e}")
+                    response = None
+
+            if response is None:
+                await asyncio.sleep(2 * (attempt + 1))
+                continue
+
+            if response.status_code == 200:
+                text = response.text
+                if self.cache:
+                    self.cache.put(url, text)
+                return text
+
+            if response.status_code == 429:  # Too Many Requests
+                wait_time = 5 * (attempt + 1)
+                print(f"   ⚠️  Rate limited, waiting {wait_time}s...")
+                await asyncio.sleep(wait_time)
+                continue
+
+            print(f"   ⚠️  SEC fetch failed: HTTP {response.status_code}")
+            return None
+
+        return None
+
+    async def fetch_many(self, urls: Sequence[str]) -> List[Optional[str]]:
+        """Fetch several documents concurrently (results in input order)"""
+        return await asyncio.gather(*(self.fetch_document(url) for url in urls))
+
+    async def _validate_url(self, url: str) -> bool:
+        """Async equivalent of SECFilingFetcher._validate_url"""
+        if self.cache and self.cache.contains(url):
+            return True
+        try:
+            async with self._semaphore:
+                await self.rate_limiter.acquire_async()
+                response = await self._client.head(url, timeout=5)
+            return response.status_code == 200
+        except Exception:
+            # Some servers don't support HEAD - don't invalidate
+            return True
+
+    async def _resolve_primary(self, index_url: str, index_content: str, filing_type: Optional[str]) -> Optional[str]:
+        """Pick first valid primary document candidate from a fetched index page"""
+        for doc_url in self.parser.parse_primary_document_candidates(index_content, index_url, filing_type):
+            if await self._validate_url(doc_url):
+                return doc_url
+        return None
+
+    async def extract_document_url(self, filing_url: str, filing_type: Optional[str] = None) -> Optional[str]:
+        """
+        Async equivalent of SECFilingFetcher.extract_document_url
+
+        Direct document URLs (and inline XBRL viewer links) are delegated to the
+        sync resolver in a worker thread since they need no index download.
+        """
+        if '/Archives/edgar/data/' in filing_url and '.htm' in filing_url and 'index' not in filing_url:
+            return await asyncio.to_thread(self.parser.extract_document_url, filing_url, filing_type)
+
+        index_content = await self.fetch_document(filing_url)
+        if not index_content:
+            return None
+        return await self._resolve_primary(filing_url, index_content, filing_type)
+
+    async def extract_exhibits(self, filing_url: str) -> List[Dict]:
+        """Async equivalent of SECFilingFetcher.extract_exhibits"""
+        index_content = await self.fetch_document(filing_url)
+        if not index_content:
+            return []
+        return self.parser.parse_exhibits(index_content)
+
+    async def fetch_filing_bundle(
+        self,
+        filing_url: str,
+        filing_type: Optional[str] = None,
+        exhibit_numbers: Optional[Sequence[str]] = KEY_EXHIBIT_NUMBERS
+    ) -> Dict:
+        """
+        Fetch index page once, then primary document + key exhibits concurrently
+
+        Args:
+            filing_url: Filing index page URL (or direct document URL)
+            filing_type: Optional filing type to match primary document
+            exhibit_numbers: Exhibits to download (None = skip exhibits)
+
+        Returns:
+            Dict with keys:
+            - filing_url: Input URL
+            - document_url: Resolved primary document URL (or None)
+            - document: Primary document content (or None)
+            - exhibits: List of exhibit dicts with added 'content'
+        """
+        bundle = {'filing_url': filing_url, 'document_url': None, 'document': None, 'exhibits': []}
+
+        is_direct_document = (
+            '/Archives/edgar/data/' in filing_url and '.htm' in filing_url and 'index' not in filing_url
+        )
+
+        if is_direct_document:
+            bundle['document_url'] = await self.extract_document_url(filing_url, filing_type)
+            if bundle['document_url']:
+                bundle['document'] = await self.fetch_document(bundle['document_url'])
+            return bundle
+
+        index_content = await self.fetch_document(filing_url)
+        if not index_content:
+            return bundle
+
+        exhibits = []
+        if exhibit_numbers:
+            exhibits = [
+                ex for ex in self.parser.parse_exhibits(index_content)
+                if ex['exhibit_number'] in exhibit_numbers
+            ]
+
+        async def primary():
+            doc_url = await self._resolve_primary(filing_url, index_content, filing_type)
+            bundle['document_url'] = doc_url
+            return await self.fetch_document(doc_url) if doc_url else None
+
+        results = await asyncio.gather(primary(), *(self.fetch_document(ex['url']) for ex in exhibits))
+
+        bundle['document'] = results[0]
+        for exhibit, content in zip(exhibits, results[1:]):
+            if content:
+                bundle['exhibits'].append({**exhibit, 'content': content})
+
+        return bundle
+
+    async def fetch_filing_bundles(
+        self,
+        filings: Sequence[Tuple[str, Optional[str]]],
+        exhibit_numbers: Optional[Sequence[str]] = KEY_EXHIBIT_NUMBERS
+    ) -> List[Dict]:
+        """Fetch bundles for many (filing_url, filing_type) pairs concurrently"""
+        return await asyncio.gather(*(
+            self.fetch_filing_bundle(url, filing_type, exhibit_numbers) for url, filing_type in filings
+        ))
+
+
+# One fetcher per event loop (httpx clients and semaphores are loop-bound)
+_loop_fetchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSECFetcher]" = weakref.WeakKeyDictionary()
+
+
+def get_async_fetcher() -> AsyncSECFetcher:
+    """Get the AsyncSECFetcher for the running event loop (created on first use)"""
+    loop = asyncio.get_running_loop()
+    fetcher = _loop_fetchers.get(loop)
+    if fetcher is None:
+        fetcher = AsyncSECFetcher()
+        _loop_fetchers[loop] = fetcher
+    return fetcher
+
+
+def run_sync(coro_factory):
+    """
+    Run an async fetch from blocking code
+
+    Uses asyncio.run when no loop is running; if called from inside a running
+    loop (e.g. sync helper invoked by an async agent), runs in a helper thread.
+
+    Args:
+        coro_factory: Callable taking an AsyncSECFetcher and returning a coroutine
+    """
+    async def runner():
+        async with AsyncSECFetcher() as fetcher:
+            return await coro_factory(fetcher)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+
+    result = {}
+
+    def target():
+        result['value'] = asyncio.run(runner())
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return result.get('value')
+
+
+def fetch_documents(urls: Sequence[str]) -> List[Optional[str]]:
+    """Sync facade - fetch several SEC documents concurrently"""
+    return run_sync(lambda fetcher: fetcher.fetch_many(urls))
+
+
+def fetch_filing_bundle(
+    filing_url: str,
+    filing_type: Optional[str] = None,
+    exhibit_numbers: Optional[Sequence[str]] = KEY_EXHIBIT_NUMBERS
+) -> Dict:
+    """Sync facade - fetch primary document + key exhibits for one filing"""
+    return run_sync(lambda fetcher: fetcher.fetch_filing_bundle(filing_url, filing_type, exhibit_numbers))
+
+
+def fetch_filing_bundles(
+    filings: Sequence[Tuple[str, Optional[str]]],
+    exhibit_numbers: Optional[Sequence[str]] = KEY_EXHIBIT_NUMBERS
+) -> List[Dict]:
+    """Sync facade - fetch bundles for many (filing_url, filing_type) pairs concurrently"""
+    return run_sync(lambda fetcher: fetcher.fetch_filing_bundles(filings, exhibit_numbers))
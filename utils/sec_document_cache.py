@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SEC Document Cache - Persistent on-disk cache for SEC EDGAR responses
+
+EDGAR archive documents (/Archives/edgar/...) are immutable once filed, so the
+same 424B4 / S-4 / 10-Q fetched by the enricher, filing processor, quarterly
+extractor and backfill scripts only needs to be downloaded once.
+
+Cache policy:
+- /Archives/ URLs: cached forever (until evicted)
+- browse-edgar index/search pages: short TTL (they change as new filings arrive)
+- Everything else: default TTL
+
+Storage:
+- One gzip-compressed file per URL, keyed by SHA-256 of the URL
+- File mtime = fetch time (freshness), file atime = last access (LRU)
+- Size-bounded: least recently used entries evicted when over max_bytes
+
+Usage:
+    from utils.sec_document_cache import get_document_cache
+
+    cache = get_document_cache()
+    content = cache.get(url)
+    if content is None:
+        content = download(url)
+        cache.put(url, content)
+"""
+
+import os
+import gzip
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+
+
+DEFAULT_CACHE_DIR = os.getenv('SEC_CACHE_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.sec_cache'
+))
+DEFAULT_MAX_BYTES = int(float(os.getenv('SEC_CACHE_MAX_MB', '2048')) * 1024 * 1024)
+
+# TTLs in seconds (None = never expires)
+ARCHIVE_TTL = None
+BROWSE_EDGAR_TTL = 60
+DEFAULT_TTL = 3600
+
+
+def ttl_for_url(url: str) -> Optional[int]:
+    """
+    Get cache TTL for a SEC URL
+
+    Returns:
+        TTL in seconds, or None if the document never changes
+    """
+    if 'browse-edgar' in url:
+        return BROWSE_EDGAR_TTL
+    if '/Archives/' in url:
+        return ARCHIVE_TTL
+    return DEFAULT_TTL
+
+
+class SECDocumentCache:
+    """
+    Content-addressed, size-bounded LRU cache of SEC documents on disk
+
+    Safe to share between threads; safe between processes as far as writes
+    are atomic (os.replace) - size accounting is per-process and re-synced
+    from disk on startup.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total_bytes = self._scan_size()
+
+    def _scan_size(self) -> int:
+        """Sum size of all cached entries on disk"""
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith('.gz'):
+                total += entry.stat().st_size
+        return total
+
+    def _path_for(self, url: str) -> str:
+        """Content-addressed path for a URL"""
+        key = hashlib.sha256(url.strip().encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.gz")
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Get cached document text
+
+        Returns:
+            Document text, or None if not cached / expired
+        """
+        path = self._path_for(url)
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+
+        ttl = ttl_for_url(url)
+        now = time.time()
+        if ttl is not None and now - stat.st_mtime > ttl:
+            self._count(hit=False)
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, EOFError):
+            # Corrupt/partial entry - drop it
+            self._remove(path)
+            self._count(hit=False)
+            return None
+
+        # Touch atime for LRU (keep mtime = fetch time)
+        try:
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+
+        self._count(hit=True)
+        return content
+
+    def _count(self, hit: bool):
+        """Record a lookup (get runs on many fetch threads at once)"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def contains(self, url: str) -> bool:
+        """Check if a fresh entry exists for URL (does not count as hit/miss)"""
+        path = self._path_for(url)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        ttl = ttl_for_url(url)
+        return ttl is None or time.time() - stat.st_mtime <= ttl
+
+    def put(self, url: str, content: str):
+        """Store document text (atomic write, then evict if over size limit)"""
+        path = self._path_for(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                f.write(content)
+            new_size = os.path.getsize(tmp_path)
+
+            with self._lock:
+                try:
+                    old_size = os.path.getsize(path)
+                except FileNotFoundError:
+                    old_size = 0
+                os.replace(tmp_path, path)
+                self._total_bytes += new_size - old_size
+                self.stores += 1
+
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+
+        except OSError as e:
+            print(f"   ⚠️  SEC cache write failed: {e}")
+            self._remove(tmp_path)
+
+    def _evict(self):
+        """Evict least recently used entries down to 90% of max_bytes (caller holds lock)"""
+        target = int(self.max_bytes * 0.9)
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith('.gz'):
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+
+        self._total_bytes = sum(size for _, size, _ in entries)
+        entries.sort()
+
+        for _, size, path in entries:
+            if self._total_bytes <= target:
+                break
+            if self._remove(path):
+                self._total_bytes -= size
+                self.evictions += 1
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file():
+                    self._remove(entry.path)
+            self._total_bytes = 0
+
+    def get_statistics(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hits, misses, hit_rate, stores, evictions, size_bytes, max_bytes
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': (hits / lookups) if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'size_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+_document_cache: Optional[SECDocumentCache] = None
+_document_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> SECDocumentCache:
+    """Get process-wide SEC document cache (created on first use)"""
+    global _document_cache
+    if _document_cache is None:
+        with _document_cache_lock:
+            if _document_cache is None:
+                _document_cache = SECDocumentCache()
+    return _document_cache
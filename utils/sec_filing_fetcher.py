@@ -18,14 +18,19 @@ from functools import lru_cache
 from datetime import datetime
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 
+from utils.edgar_submissions import get_local_filings
+from utils.html_text import html_to_text
+from utils.sec_document_cache import get_document_cache
+from utils.sec_http import SEC_USER_AGENT, get_sec_rate_limiter, get_sec_session
+
 
 class SECFilingFetcher:
     """
     Shared utility for fetching SEC documents
 
     Features:
-    - Rate limiting (10 requests/second per SEC rules)
-    - Caching (avoid re-fetching same documents)
+    - Rate limiting (10 requests/second per SEC rules, shared process-wide - see utils/sec_http.py)
+    - Caching (persistent on-disk cache, see utils/sec_document_cache.py)
     - Retries (handle transient errors)
     - User-Agent compliance (required by SEC)
     - Search filings by CIK and type
@@ -41,13 +46,13 @@ class SECFilingFetcher:
         content = fetcher.fetch_document(filings[0]['url'])
     """
 
-    def __init__(self):
-        self.last_request_time = 0
-        self.rate_limit_seconds = 0.11  # 10 req/sec = 0.1s + buffer
+    def __init__(self, use_cache: bool = True):
+        self.cache = get_document_cache() if use_cache else None
+        self.rate_limiter = get_sec_rate_limiter()
+        self.session = get_sec_session()
         self.headers = {
-            'User-Agent': 'LEVP SPAC Platform fenil@legacyevp.com',
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov'
+            'User-Agent': SEC_USER_AGENT,
+            'Accept-Encoding': 'gzip, deflate'
         }
         self.request_count = 0
 
@@ -58,11 +63,11 @@ class SECFilingFetcher:
         SEC EDGAR enforces rate limits:
         - 10 requests per second per IP
         - Exceeding this gets you temporarily blocked
+
+        The token bucket is shared by every SEC caller in the process
+        (and optionally across processes via file lock / Redis).
         """
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_seconds:
-            time.sleep(self.rate_limit_seconds - elapsed)
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def fetch_document(self, url: str, max_retries: int = 3) -> Optional[str]:
         """
@@ -81,14 +86,21 @@ class SECFilingFetcher:
             >>> if doc:
             >>>     print(f"Fetched {len(doc)} characters")
         """
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
         self._rate_limit()
         self.request_count += 1
 
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, headers=self.headers, timeout=30)
+                response = self.session.get(url, headers=self.headers, timeout=30)
 
                 if response.status_code == 200:
+                    if self.cache:
+                        self.cache.put(url, response.text)
                     return response.text
 
                 elif response.status_code == 429:  # Too Many Requests
@@ -147,6 +159,14 @@ class SECFilingFetcher:
             >>> print(f"Found {len(filings)} 10-Q filings")
             >>> print(f"Latest: {filings[0]['date']}")
         """
+        # Local submissions store first (no SEC round trip when synced)
+        local = get_local_filings(
+            cik, [filing_type], before=datetime.strptime(date_before, '%Y-%m-%d') if date_before else None,
+            limit=count
+        )
+        if local is not None:
+            return local
+
         cik_padded = cik.zfill(10)
 
         # Build search URL
@@ -164,7 +184,7 @@ class SECFilingFetcher:
         self.request_count += 1
 
         try:
-            response = requests.get(search_url, headers=self.headers, timeout=30)
+            response = self.session.get(search_url, headers=self.headers, timeout=30)
 
             if response.status_code != 200:
                 print(f"   ⚠️  SEC search failed: HTTP {response.status_code}")
@@ -345,6 +365,36 @@ class SECFilingFetcher:
         if not content:
             return None
 
+        for doc_url in self.parse_primary_document_candidates(content, filing_url, filing_type):
+            # Validate URL before returning
+            if self._validate_url(doc_url):
+                return doc_url
+
+        return None
+
+    def parse_primary_document_candidates(
+        self,
+        content: str,
+        filing_url: str,
+        filing_type: Optional[str] = None
+    ) -> List[str]:
+        """
+        Parse candidate primary document URLs from an already-fetched index page
+
+        Candidates are returned in preference order (document table matches first,
+        then first-table fallback links). Callers validate and take the first good one.
+        Shared by extract_document_url and the async fetch engine.
+
+        Args:
+            content: Index page HTML
+            filing_url: URL of the index page (for resolving relative links)
+            filing_type: Optional filing type to match
+
+        Returns:
+            List of candidate document URLs (may be empty)
+        """
+        candidates = []
+
         try:
             soup = BeautifulSoup(content, 'html.parser')
 
@@ -407,9 +457,7 @@ class SECFilingFetcher:
                                 # Build direct document URL (bypass JavaScript viewer)
                                 doc_url = f"https://www.sec.gov{doc_path}"
 
-                        # Validate URL before returning
-                        if self._validate_url(doc_url):
-                            return doc_url
+                        candidates.append(doc_url)
 
             # Strategy 2: Fallback - Look for first .htm link (less reliable)
             tables = soup.find_all('table')
@@ -441,15 +489,12 @@ class SECFilingFetcher:
                         base_url = filing_url.rsplit('/', 1)[0]
                         doc_url = f"{base_url}/{href}"
 
-                    # Validate and return
-                    if self._validate_url(doc_url):
-                        return doc_url
-
-            return None
+                    candidates.append(doc_url)
 
         except Exception as e:
             print(f"   ⚠️  Document URL extraction error: {e}")
-            return None
+
+        return candidates
 
     def _extract_from_index(self, index_url: str, filing_type: Optional[str] = None) -> Optional[str]:
         """
@@ -528,9 +573,14 @@ class SECFilingFetcher:
         Returns:
             True if URL is valid, False otherwise
         """
+        # Already fetched successfully - no need for a HEAD round trip
+        if self.cache and self.cache.contains(url):
+            return True
+
         try:
             # Use HEAD request for efficiency (doesn't download content)
-            response = requests.head(url, headers=self.headers, timeout=5, allow_redirects=True)
+            self._rate_limit()
+            response = self.session.head(url, headers=self.headers, timeout=5, allow_redirects=True)
             return response.status_code == 200
         except:
             # If HEAD fails, don't invalidate - some servers don't support HEAD
@@ -592,16 +642,9 @@ class SECFilingFetcher:
         Returns:
             Clean plain text
         """
-        soup = self.parse_document(doc_content)
-
-        # Extract text and clean whitespace
-        text = soup.get_text(separator=' ', strip=True)
-
-        # Remove excessive whitespace
-        import re
-        text = re.sub(r'\s+', ' ', text)
-
-        return text
+        # Streaming tokenizer (no tree) - handles HTML and iXBRL alike and
+        # drops hidden <ix:header> facts
+        return html_to_text(doc_content, separator=' ')
 
     def extract_exhibits(self, filing_url: str) -> List[Dict]:
         """
@@ -632,6 +675,18 @@ class SECFilingFetcher:
         if not content:
             return []
 
+        return self.parse_exhibits(content)
+
+    def parse_exhibits(self, content: str) -> List[Dict]:
+        """
+        Parse exhibit links from an already-fetched filing index page
+
+        Args:
+            content: Index page HTML
+
+        Returns:
+            List of exhibit dicts (exhibit_number, description, url)
+        """
         try:
             soup = BeautifulSoup(content, 'html.parser')
             exhibits = []
@@ -709,11 +764,23 @@ class SECFilingFetcher:
         Returns:
             Dict with keys:
             - total_requests: Total number of requests made
-            - requests_per_second: Average requests per second
+            - cache_hits / cache_misses / cache_hit_rate: Document cache counters
+              (process-wide, shared by all fetchers)
+            - cache_size_bytes: Current on-disk cache size
         """
-        return {
+        stats = {
             'total_requests': self.request_count
         }
+        if self.cache:
+            cache_stats = self.cache.get_statistics()
+            stats.update({
+                'cache_hits': cache_stats['hits'],
+                'cache_misses': cache_stats['misses'],
+                'cache_hit_rate': cache_stats['hit_rate'],
+                'cache_evictions': cache_stats['evictions'],
+                'cache_size_bytes': cache_stats['size_bytes'],
+            })
+        return stats
 
 
 # Convenience functions for backward compatibility
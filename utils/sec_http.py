@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+SEC HTTP - Shared rate limiter and pooled session for all SEC EDGAR access
+
+SEC allows 10 requests/second per IP. Every module that talks to sec.gov
+(SECFilingFetcher, sec_text_extractor, SPACDataEnricher, CIKResolver,
+PreIPOSPACFinder, SECFilingMonitor) goes through one token bucket so the
+monitor, orchestrator and backfills can run at the same time without 429s.
+
+Limiter backends (SEC_RATE_LIMIT_BACKEND):
+- memory: token bucket shared by all threads in this process (default)
+- file:   token bucket shared by all processes on this host (fcntl lock)
+- redis:  token bucket shared by all processes using REDIS_URL
+
+Usage:
+    from utils.sec_http import sec_get
+
+    response = sec_get("https://www.sec.gov/cgi-bin/browse-edgar", params={...})
+"""
+
+import os
+import time
+import asyncio
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SEC_USER_AGENT = 'LEVP SPAC Platform fenil@legacyevp.com'
+SEC_MAX_REQUESTS_PER_SECOND = float(os.getenv('SEC_MAX_REQUESTS_PER_SECOND', '9'))
+SEC_RATE_LIMIT_BACKEND = os.getenv('SEC_RATE_LIMIT_BACKEND', 'memory').lower()
+SEC_RATE_LIMIT_FILE = os.getenv('SEC_RATE_LIMIT_FILE', '/tmp/spac_sec_rate_limit.bucket')
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+
+class SECRateLimiter:
+    """
+    Token bucket rate limiter (in-process)
+
+    Tokens refill at `rate` per second up to `burst`. acquire() blocks until a
+    token is available.
+    """
+
+    def __init__(self, rate: float = SEC_MAX_REQUESTS_PER_SECOND, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.wait_time_total = 0.0
+
+    def _take(self) -> float:
+        """Try to take a token; returns seconds to wait (0 if token taken)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request slot is available"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            self.wait_time_total += wait
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a request slot is available"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            self.wait_time_total += wait
+            await asyncio.sleep(wait)
+
+
+class FileLockRateLimiter(SECRateLimiter):
+    """
+    Token bucket shared across processes on one host via an fcntl-locked state file
+
+    State file holds "<tokens> <unix_timestamp>".
+    """
+
+    def __init__(self, path: str = SEC_RATE_LIMIT_FILE, **kwargs):
+        super().__init__(**kwargs)
+        import fcntl
+        self._fcntl = fcntl
+        self.path = path
+
+    def _take(self) -> float:
+        with self._lock, open(self.path, 'a+') as f:
+            self._fcntl.flock(f, self._fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                parts = f.read().split()
+                now = time.time()
+                try:
+                    tokens, last = float(parts[0]), float(parts[1])
+                except (IndexError, ValueError):
+                    tokens, last = self.burst, now
+
+                tokens = min(self.burst, tokens + max(0.0, now - last) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens} {now}")
+                f.flush()
+                return wait
+            finally:
+                self._fcntl.flock(f, self._fcntl.LOCK_UN)
+
+
+class RedisRateLimiter(SECRateLimiter):
+    """Token bucket shared across processes/hosts via an atomic Redis Lua script"""
+
+    _SCRIPT = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 60)
+return tostring(wait)
+"""
+
+    def __init__(self, redis_url: str = REDIS_URL, key: str = 'spac:sec_rate_limit', **kwargs):
+        super().__init__(**kwargs)
+        import redis
+        self._redis = redis.Redis.from_url(redis_url)
+        self._redis.ping()
+        self._script = self._redis.register_script(self._SCRIPT)
+        self.key = key
+
+    def _take(self) -> float:
+        return float(self._script(keys=[self.key], args=[self.rate, self.burst, time.time()]))
+
+
+_limiter: Optional[SECRateLimiter] = None
+_session: Optional[requests.Session] = None
+_init_lock = threading.Lock()
+
+
+def _create_limiter() -> SECRateLimiter:
+    """Create limiter for configured backend (falls back to in-process on error)"""
+    try:
+        if SEC_RATE_LIMIT_BACKEND == 'redis':
+            return RedisRateLimiter()
+        if SEC_RATE_LIMIT_BACKEND == 'file':
+            return FileLockRateLimiter()
+    except Exception as e:
+        print(f"⚠️  SEC rate limiter backend '{SEC_RATE_LIMIT_BACKEND}' unavailable ({e}) - using in-process limiter")
+    return SECRateLimiter()
+
+
+def get_sec_rate_limiter() -> SECRateLimiter:
+    """Get process-wide SEC rate limiter"""
+    global _limiter
+    if _limiter is None:
+        with _init_lock:
+            if _limiter is None:
+                _limiter = _create_limiter()
+    return _limiter
+
+
+def get_sec_session() -> requests.Session:
+    """
+    Get process-wide keep-alive session for sec.gov
+
+    Connection pooling avoids a TCP/TLS handshake per request; gzip is
+    negotiated by default (EDGAR HTML compresses ~5-10x).
+    """
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'User-Agent': SEC_USER_AGENT,
+                    'Accept-Encoding': 'gzip, deflate',
+                })
+                _session = session
+    return _session
+
+
+def sec_get(url: str, **kwargs) -> requests.Response:
+    """
+    Rate-limited GET against SEC through the shared session
+
+    Accepts the same keyword arguments as requests.get (params, headers, timeout, ...).
+    """
+    kwargs.setdefault('timeout', 30)
+    get_sec_rate_limiter().acquire()
+    return get_sec_session().get(url, **kwargs)
+
+
+def sec_head(url: str, **kwargs) -> requests.Response:
+    """Rate-limited HEAD against SEC through the shared session"""
+    kwargs.setdefault('timeout', 10)
+    get_sec_rate_limiter().acquire()
+    return get_sec_session().head(url, **kwargs)
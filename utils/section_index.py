@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Section Index - Cached marker offsets for large SEC documents
+
+Section extraction used to upper-case the whole document and str.find() a
+marker, once per section requested. A 424B4 or 10-K of several MB was copied
+and scanned dozens of times, and the 424B4 extractor ran a fresh regex over
+the full text for every heading variant. SectionIndex upper-cases the text
+once, records every offset of a marker the first time it is asked for, and
+answers later lookups (first match, match in a window, heading on its own
+line) with a bisect over those offsets.
+
+- Matching is case-insensitive; match_case=True filters offsets to the exact
+  spelling (for patterns like "SUMMARY" vs "Summary").
+- Offsets per marker are collected with str.find over the upper-cased copy.
+  A compiled alternation of all markers was measured ~25x slower in CPython's
+  re on a 5 MB filing, so markers are indexed one at a time, lazily.
+- get_section_index() keeps the last few indexes keyed by the text itself, so
+  every section requested from the same parsed document shares one index.
+
+Usage:
+    from utils.section_index import get_section_index
+
+    index = get_section_index(text)
+    balance_sheet = index.section(['CONDENSED BALANCE SHEET', 'BALANCE SHEET'], 15000)
+    pos = index.find_heading('DESCRIPTION OF SECURITIES', match_case=True)
+"""
+
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence
+
+
+class SectionIndex:
+    """Marker offsets for one document, computed once per marker"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._upper = self._upper_same_length(text)
+        self._offsets: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _upper_same_length(text: str) -> str:
+        """text.upper(), keeping characters whose upper case is longer ('ß' → 'SS') as-is"""
+        upper = text.upper()
+        if len(upper) == len(text):
+            return upper
+        return ''.join(c if len(c.upper()) != 1 else c.upper() for c in text)
+
+    def positions(self, marker: str) -> List[int]:
+        """All offsets of marker (case-insensitive), ascending"""
+        key = marker.upper()
+        offsets = self._offsets.get(key)
+        if offsets is None:
+            offsets = []
+            find = self._upper.find
+            pos = find(key)
+            while pos != -1:
+                offsets.append(pos)
+                pos = find(key, pos + 1)
+            with self._lock:
+                offsets = self._offsets.setdefault(key, offsets)
+        return offsets
+
+    def occurrences(self, marker: str, start: int = 0, end: Optional[int] = None,
+                    match_case: bool = False, whole_word: bool = False) -> Iterator[int]:
+        """Offsets of marker within [start, end), optionally exact-case / on word boundaries"""
+        text = self.text
+        end = len(text) if end is None else end
+        positions = self.positions(marker)
+        for i in range(bisect_left(positions, start), len(positions)):
+            pos = positions[i]
+            if pos + len(marker) > end:
+                break
+            if match_case and not text.startswith(marker, pos):
+                continue
+            if whole_word and not self._on_word_boundary(pos, pos + len(marker)):
+                continue
+            yield pos
+
+    def find(self, marker: str, start: int = 0, end: Optional[int] = None,
+             match_case: bool = False) -> int:
+        """First offset of marker within [start, end), or -1"""
+        return next(self.occurrences(marker, start, end, match_case), -1)
+
+    def find_heading(self, marker: str, start: int = 0, end: Optional[int] = None,
+                     match_case: bool = False, whole_line: bool = True) -> int:
+        """
+        First marker that starts a line, or -1
+
+        Equivalent to re.search(r'\\n\\s*MARKER\\s*\\n', text[start:end]) (or without
+        the trailing \\s*\\n when whole_line=False), but returns an absolute offset:
+        the newline opening the whitespace run before the marker.
+        """
+        text = self.text
+        end = len(text) if end is None else end
+        for pos in self.occurrences(marker, start, end, match_case):
+            line_start = self._heading_start(pos, start)
+            if line_start == -1:
+                continue
+            if whole_line and not self._line_ends_after(pos + len(marker), end):
+                continue
+            return line_start
+        return -1
+
+    def section(self, start_markers: Sequence[str], max_length: int) -> Optional[str]:
+        """Text from the first marker (in list order) that occurs, up to max_length chars"""
+        for marker in start_markers:
+            pos = self.find(marker)
+            if pos != -1:
+                return self.text[pos:pos + max_length]
+        return None
+
+    def _heading_start(self, pos: int, start: int) -> int:
+        """Leftmost newline in the whitespace run before pos (not before start), or -1"""
+        text = self.text
+        line_start = -1
+        i = pos
+        while i > start and text[i - 1].isspace():
+            i -= 1
+            if text[i] == '\n':
+                line_start = i
+        return line_start
+
+    def _line_ends_after(self, pos: int, end: int) -> bool:
+        """True when only whitespace separates pos from a newline before end"""
+        text = self.text
+        while pos < end and text[pos].isspace():
+            if text[pos] == '\n':
+                return True
+            pos += 1
+        return False
+
+    def _on_word_boundary(self, begin: int, finish: int) -> bool:
+        text = self.text
+        before = text[begin - 1] if begin > 0 else ' '
+        after = text[finish] if finish < len(text) else ' '
+        return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
+
+
+@lru_cache(maxsize=8)
+def get_section_index(text: str) -> SectionIndex:
+    """
+    Shared SectionIndex for a document
+
+    Keyed by the text itself: str caches its hash and compares identical objects
+    by identity, so repeated lookups for the same parsed document are O(1).
+    """
+    return SectionIndex(text)
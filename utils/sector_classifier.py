@@ -24,6 +24,7 @@ import re
 sys.path.append('/home/ubuntu/spac-research')
 from database import SessionLocal, SPAC
 from pre_ipo_database import SessionLocal as PreIPOSessionLocal, PreIPOSPAC
+from utils.keyword_matcher import KeywordMatcher
 
 try:
     from openai import OpenAI
@@ -116,6 +117,12 @@ BORING_SECTORS = {
     }
 }
 
+# Hot sectors first, then boring ones - first group with a keyword wins
+SECTOR_KEYWORD_MATCHER = KeywordMatcher(
+    [(name, data['keywords']) for name, data in HOT_SECTORS.items()] +
+    [(name, data['keywords']) for name, data in BORING_SECTORS.items()]
+)
+
 
 class SectorClassifier:
     """Classifies SPACs into hot narrative sectors vs boring sectors"""
@@ -279,29 +286,16 @@ IMPORTANT: Return the MOST SPECIFIC sector. If they mention AI, don't return "Te
 
         sector_lower = sector.lower() if sector else 'general'
 
-        # Check hot sectors
-        for hot_name, hot_data in HOT_SECTORS.items():
-            for keyword in hot_data['keywords']:
-                if keyword in sector_lower:
-                    return {
-                        'sector_classified': hot_name,
-                        'confidence': 70,  # Lower confidence (keyword match only)
-                        'reasoning': f'Matched keyword "{keyword}" in sector "{sector}"',
-                        'keywords_matched': [keyword],
-                        'is_hot_sector': True
-                    }
-
-        # Check boring sectors
-        for boring_name, boring_data in BORING_SECTORS.items():
-            for keyword in boring_data['keywords']:
-                if keyword in sector_lower:
-                    return {
-                        'sector_classified': boring_name,
-                        'confidence': 70,
-                        'reasoning': f'Matched keyword "{keyword}" in sector "{sector}"',
-                        'keywords_matched': [keyword],
-                        'is_hot_sector': False
-                    }
+        # Check hot sectors, then boring sectors (one pass over the sector text)
+        match = SECTOR_KEYWORD_MATCHER.first(sector_lower)
+        if match:
+            return {
+                'sector_classified': match.label,
+                'confidence': 70,  # Lower confidence (keyword match only)
+                'reasoning': f'Matched keyword "{match.keyword}" in sector "{sector}"',
+                'keywords_matched': [match.keyword],
+                'is_hot_sector': match.label in HOT_SECTORS
+            }
 
         # Default: General or Technology
         if 'tech' in sector_lower:
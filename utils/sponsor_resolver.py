@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Sponsor Resolver - In-memory sponsor name → sponsor_performance lookup
+
+phase1_scorer.score_sponsor used to run up to four queries per SPAC against
+sponsor_performance (LOWER(name) = ..., unnest(sponsor_aliases), and two
+leading-wildcard LIKE '%name%' scans that cannot use an index). Sponsor
+normalization was spread across populate_opportunity_data (Roman numerals /
+entity suffixes) and apply_sponsor_families (seed family variations).
+
+Instead, one resolver per process holds sponsor_performance in memory:
+
+- Exact index: lowercase sponsor_name / alias → row
+- Trigram index: trigram → entries containing it, so "name contains query"
+  only verifies entries holding every trigram of the query
+- Normalized + family index: normalize_sponsor_name() form and seed family
+  (data/sponsor_families_seed.json) of every name / alias → row
+- Token index: set of distinctive words (generic "sponsor", "llc",
+  "capital", ... dropped) → row, for reordered / padded names
+- Trigram key index: trigram → distinctive-word keys; trigram counts prune
+  candidates before an edit-distance check that catches typos
+
+Match order (first hit wins, earlier rows win ties like the old LIMIT 1):
+    exact name, exact alias, name contains, alias contains  (as score_sponsor)
+    normalized name/alias, distinctive words, sponsor family, fuzzy (edit distance)
+
+Refresh: at most every REFRESH_SECONDS a single md5 over the table is
+compared with the loaded fingerprint and the indexes are rebuilt on change
+(alias updates from ai_sponsor_mapper / update_sponsor_aliases_from_deals
+are picked up without restarting). Writers in the same process can call
+invalidate().
+
+Usage:
+    from utils.sponsor_resolver import get_sponsor_resolver
+
+    resolver = get_sponsor_resolver()
+    resolver.score("Churchill Sponsor IX LLC")      # → sponsor_score (0 if unknown)
+    match = resolver.resolve("Klein Sponsor LLC")   # → SponsorMatch or None
+    match.sponsor_name, match.family, match.match_type
+
+CLI:
+    python3 utils/sponsor_resolver.py "Gores Sponsor X LLC" "Klein Sponsor LLC"
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+FAMILY_SEED_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'sponsor_families_seed.json'
+)
+
+# How often resolve() checks sponsor_performance for changes
+REFRESH_SECONDS = float(os.getenv('SPONSOR_RESOLVER_REFRESH_SECONDS', '300'))
+
+# Minimum 1 - edit_distance / max_len for a fuzzy match
+FUZZY_MIN_SIMILARITY = 0.85
+
+# Words shared by most sponsor names - ignored by the token index
+GENERIC_TOKENS = {
+    'sponsor', 'sponsors', 'llc', 'lp', 'l', 'p', 'inc', 'corp', 'co', 'ltd', 'limited',
+    'the', 'and', 'of', 'group', 'capital', 'partners', 'holdings', 'acquisition',
+    'acquisitions', 'management', 'investment', 'investments', 'ventures', 'company',
+}
+
+MATCH_EXACT = 'exact'
+MATCH_ALIAS = 'alias'
+MATCH_CONTAINS = 'contains'
+MATCH_ALIAS_CONTAINS = 'alias_contains'
+MATCH_NORMALIZED = 'normalized'
+MATCH_TOKENS = 'tokens'
+MATCH_FAMILY = 'family'
+MATCH_FUZZY = 'fuzzy'
+
+_ROMAN_OR_NUMBER = [
+    r'\s+(II|III|IV|V|VI|VII|VIII|IX|X|XI|XII)\s*',  # Roman numerals anywhere
+    r'\s+(\d+)\s*',  # Arabic numerals (2, 3, 4, etc.)
+]
+_ENTITY_SUFFIX = r',?\s+(LLC|Corp\.?|Inc\.?|Ltd\.?|Limited|L\.P\.|LP)$'
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def normalize_sponsor_name(sponsor_name: Optional[str]) -> Optional[str]:
+    """
+    Strip series numbers and entity suffixes from a sponsor name
+
+    Examples: "Churchill Sponsor IX LLC" → "Churchill Sponsor"
+              "Live Oak Sponsor V, LLC" → "Live Oak Sponsor"
+    """
+    if not sponsor_name:
+        return None
+
+    normalized = sponsor_name
+    for pattern in _ROMAN_OR_NUMBER:
+        normalized = re.sub(pattern, ' ', normalized, flags=re.IGNORECASE)
+
+    # Standardize entity types at end
+    normalized = re.sub(_ENTITY_SUFFIX, '', normalized, flags=re.IGNORECASE)
+
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+
+def _normalized_key(name: str) -> str:
+    """normalize_sponsor_name() folded to lowercase alphanumeric words"""
+    return ' '.join(_TOKEN_RE.findall((normalize_sponsor_name(name) or '').lower()))
+
+
+def _distinctive_tokens(key: str) -> frozenset:
+    """Words of a normalized key minus GENERIC_TOKENS (order-insensitive)"""
+    return frozenset(t for t in key.split() if t not in GENERIC_TOKENS)
+
+
+def _fuzzy_key(key: str) -> str:
+    """Distinctive words of a normalized key in their original order"""
+    return ' '.join(t for t in key.split() if t not in GENERIC_TOKENS)
+
+
+def _trigrams(value: str) -> Set[str]:
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 once it is known to exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SponsorFamilies:
+    """Seed sponsor families (data/sponsor_families_seed.json)"""
+
+    def __init__(self, families: Optional[List[Dict]] = None, path: str = FAMILY_SEED_PATH):
+        if families is None:
+            try:
+                with open(path, 'r') as f:
+                    families = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Sponsor family seed not loaded: {e}")
+                families = []
+        self.families = families
+        # (family, lowercase patterns) in seed order: variations, principals, family core
+        self._patterns: List[Tuple[Dict, List[str]]] = []
+        for family in families:
+            family_core = family['family_name'].lower()
+            family_core = family_core.replace('the ', '').replace(' group', '').replace(' capital', '')
+            patterns = [v.lower() for v in family.get('sponsor_variations', [])]
+            patterns += [p.lower() for p in family.get('principals', [])]
+            patterns.append(family_core)
+            self._patterns.append((family, [p for p in patterns if p]))
+
+    def find(self, sponsor_name: Optional[str]) -> Optional[Dict]:
+        """First seed family whose variation / principal / core name occurs in sponsor_name"""
+        if not sponsor_name:
+            return None
+        sponsor_lower = sponsor_name.lower()
+        for family, patterns in self._patterns:
+            if any(pattern in sponsor_lower for pattern in patterns):
+                return family
+        return None
+
+    def family_name(self, sponsor_name: Optional[str]) -> Optional[str]:
+        family = self.find(sponsor_name)
+        return family['family_name'] if family else None
+
+
+_MISSING = object()
+
+
+@dataclass
+class SponsorMatch:
+    """sponsor_performance row a sponsor name resolved to"""
+    sponsor_name: str
+    sponsor_score: int
+    family: Optional[str]
+    match_type: str
+    similarity: float = 1.0
+
+
+class _SponsorIndex:
+    """
+    Every index over one set of sponsor_performance rows, never modified
+    after construction (apart from its lookup cache)
+
+    Lookup results are cached on the snapshot, so a refresh never mixes
+    results from the old rows into the new ones.
+    """
+
+    def __init__(self, rows: Iterable[Dict], families: SponsorFamilies):
+        self.families = families
+        self._cache: Dict[str, Optional[SponsorMatch]] = {}
+        self.rows: List[Tuple[str, int]] = []       # (sponsor_name, sponsor_score)
+        self._row_family: List[Optional[str]] = []
+        self._names: List[str] = []                 # lowercase name per row
+        self._aliases: List[Tuple[int, str]] = []   # (row, lowercase alias)
+        self._alias_values: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self._exact_alias: Dict[str, int] = {}
+        self._normalized: Dict[str, int] = {}
+        self._by_family: Dict[str, int] = {}
+        self._name_trigrams: Dict[str, Set[int]] = {}
+        self._alias_trigrams: Dict[str, Set[int]] = {}
+        self._by_tokens: Dict[frozenset, int] = {}
+        self._key_trigrams: Dict[str, Set[int]] = {}
+        self._fuzzy_keys: List[Tuple[int, str, int]] = []  # (row, key, trigram count)
+
+        for row in rows:
+            name = row.get('sponsor_name')
+            if not name:
+                continue
+            score = row.get('sponsor_score')
+            score = int(score) if score is not None and score == score else 0
+            aliases = row.get('sponsor_aliases')
+            aliases = [a for a in aliases if a] if isinstance(aliases, (list, tuple)) else []
+            i = len(self.rows)
+
+            family = families.family_name(name)
+            self.rows.append((name, score))
+            self._row_family.append(family)
+
+            lower = name.strip().lower()
+            self._names.append(lower)
+            self._exact.setdefault(lower, i)
+            for gram in _trigrams(lower):
+                self._name_trigrams.setdefault(gram, set()).add(i)
+
+            for alias in aliases:
+                alias_lower = alias.strip().lower()
+                self._exact_alias.setdefault(alias_lower, i)
+                for gram in _trigrams(alias_lower):
+                    self._alias_trigrams.setdefault(gram, set()).add(len(self._aliases))
+                self._aliases.append((i, alias_lower))
+                self._alias_values.append(alias_lower)
+
+            self._by_family.setdefault(name, i)
+            for label in [name] + aliases:
+                key = _normalized_key(label)
+                if not key:
+                    continue
+                self._normalized.setdefault(key, i)
+                label_family = families.family_name(label)
+                if label_family:
+                    self._by_family.setdefault(label_family, i)
+                tokens = _distinctive_tokens(key)
+                if not tokens:
+                    continue
+                self._by_tokens.setdefault(tokens, i)
+                fuzzy_key = _fuzzy_key(key)
+                grams = _trigrams(f' {fuzzy_key} ')
+                for gram in grams:
+                    self._key_trigrams.setdefault(gram, set()).add(len(self._fuzzy_keys))
+                self._fuzzy_keys.append((i, fuzzy_key, len(grams)))
+
+
+    def _match(self, i: int, match_type: str, similarity: float = 1.0) -> SponsorMatch:
+        name, score = self.rows[i]
+        return SponsorMatch(name, score, self._row_family[i], match_type, similarity)
+
+    @staticmethod
+    def _containing(query: str, trigram_index: Dict[str, Set[int]], values: List[str]) -> Optional[int]:
+        """Lowest position in values whose string contains query"""
+        grams = _trigrams(query)
+        if grams:
+            postings = sorted((trigram_index.get(g, set()) for g in grams), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            # Query shorter than a trigram - nothing to narrow by
+            candidates = range(len(values))
+        return min((c for c in candidates if query in values[c]), default=None)
+
+    def _fuzzy(self, key: str) -> Optional[Tuple[int, float]]:
+        """Closest distinctive-word key within FUZZY_MIN_SIMILARITY edit distance"""
+        grams = _trigrams(f' {key} ')
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for c in self._key_trigrams.get(gram, ()):
+                shared[c] = shared.get(c, 0) + 1
+
+        best = None
+        for c in sorted(shared):
+            row, candidate_key, candidate_grams = self._fuzzy_keys[c]
+            longest = max(len(key), len(candidate_key))
+            limit = int(longest * (1 - FUZZY_MIN_SIMILARITY))
+            # q-gram lemma: each edit destroys at most 3 trigrams
+            if shared[c] < max(len(grams), candidate_grams) - 3 * limit:
+                continue
+            distance = _edit_distance(key, candidate_key, limit)
+            if distance > limit:
+                continue
+            similarity = 1 - distance / longest
+            if best is None or similarity > best[1]:
+                best = (row, similarity)
+        return best
+
+    def _resolve(self, sponsor_name: str) -> Optional[SponsorMatch]:
+        name = sponsor_name.strip().lower()
+        if not name:
+            return None
+
+        if name in self._exact:
+            return self._match(self._exact[name], MATCH_EXACT)
+        if name in self._exact_alias:
+            return self._match(self._exact_alias[name], MATCH_ALIAS)
+
+        i = self._containing(name, self._name_trigrams, self._names)
+        if i is not None:
+            return self._match(i, MATCH_CONTAINS)
+        alias = self._containing(name, self._alias_trigrams, self._alias_values)
+        if alias is not None:
+            return self._match(self._aliases[alias][0], MATCH_ALIAS_CONTAINS)
+
+        key = _normalized_key(sponsor_name)
+        if key in self._normalized:
+            return self._match(self._normalized[key], MATCH_NORMALIZED)
+
+        tokens = _distinctive_tokens(key)
+        if tokens in self._by_tokens:
+            return self._match(self._by_tokens[tokens], MATCH_TOKENS)
+
+        family = self.families.family_name(sponsor_name)
+        if family and family in self._by_family:
+            return self._match(self._by_family[family], MATCH_FAMILY)
+
+        fuzzy = self._fuzzy(_fuzzy_key(key)) if tokens else None
+        if fuzzy:
+            return self._match(fuzzy[0], MATCH_FUZZY, fuzzy[1])
+        return None
+
+    def resolve(self, sponsor_name: str) -> Optional[SponsorMatch]:
+        cached = self._cache.get(sponsor_name, _MISSING)
+        if cached is _MISSING:
+            cached = self._cache[sponsor_name] = self._resolve(sponsor_name)
+        return cached
+
+
+class SponsorResolver:
+    """Exact / trigram / token indexes over sponsor_performance names and aliases"""
+
+    def __init__(self, rows: Optional[Iterable[Dict]] = None, families: Optional[SponsorFamilies] = None):
+        """
+        Args:
+            rows: sponsor_performance rows (sponsor_name, sponsor_aliases,
+                  sponsor_score) in id order; default: loaded from the database
+                  and kept fresh by refresh()
+            families: Seed families (default: data/sponsor_families_seed.json)
+        """
+        self.families = families or SponsorFamilies()
+        self._from_database = rows is None
+        self._fingerprint = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # Replaced as a whole by refresh(); readers take one reference per lookup
+        self._index = _SponsorIndex(rows or [], self.families)
+
+    @property
+    def rows(self) -> List[Tuple[str, int]]:
+        """(sponsor_name, sponsor_score) per loaded row"""
+        return self._index.rows
+
+    # ------------------------------------------------------------------
+    # Database refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rebuild from sponsor_performance if the table changed
+
+        Returns:
+            True if the indexes were rebuilt
+        """
+        if not self._from_database:
+            return False
+        now = time.time()
+        if not force and now - self._checked_at < REFRESH_SECONDS:
+            return False
+
+        from database import engine
+        from sqlalchemy import text
+
+        with self._lock:
+            if not force and now - self._checked_at < REFRESH_SECONDS:
+                return False
+            self._checked_at = now
+            try:
+                with engine.connect() as conn:
+                    fingerprint = conn.execute(text(
+                        "SELECT md5(COALESCE(string_agg(t::text, ',' ORDER BY t.id), '')) "
+                        "FROM sponsor_performance t"
+                    )).scalar()
+                    if fingerprint == self._fingerprint:
+                        return False
+                    result = conn.execute(text("SELECT * FROM sponsor_performance ORDER BY id"))
+                    rows = [dict(r._mapping) for r in result]
+            except Exception as e:
+                logger.warning(f"Sponsor resolver refresh failed: {e}")
+                return False
+
+            # Build off to the side, then swap: lookups see the old or the new
+            # snapshot, never a half-built one
+            index = _SponsorIndex(rows, self.families)
+            self._index = index
+            self._fingerprint = fingerprint
+            logger.info(f"Sponsor resolver loaded {len(index.rows)} sponsors, {len(index._aliases)} aliases")
+            return True
+
+    def invalidate(self):
+        """Force a reload on the next lookup (call after writing sponsor_performance)"""
+        self._checked_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def resolve(self, sponsor_name: Optional[str]) -> Optional[SponsorMatch]:
+        """sponsor_performance row for a sponsor name (None if unknown)"""
+        if not sponsor_name:
+            return None
+        self.refresh()
+        return self._index.resolve(sponsor_name)
+
+    def score(self, sponsor_name: Optional[str]) -> int:
+        """sponsor_score for a sponsor name (0 for first-time / unknown sponsors)"""
+        match = self.resolve(sponsor_name)
+        return match.sponsor_score if match else 0
+
+    def family(self, sponsor_name: Optional[str]) -> Optional[str]:
+        """Canonical family: seed family, else matched performance sponsor, else normalized name"""
+        if not sponsor_name:
+            return None
+        family = self.families.family_name(sponsor_name)
+        if family:
+            return family
+        match = self.resolve(sponsor_name)
+        if match:
+            return match.family or match.sponsor_name
+        return normalize_sponsor_name(sponsor_name)
+
+    def scores(self, sponsor_names: Iterable[str]) -> Dict[str, int]:
+        """sponsor_score for each distinct sponsor name"""
+        return {n: self.score(n) for n in set(sponsor_names) if isinstance(n, str) and n}
+
+
+_resolver: Optional[SponsorResolver] = None
+_families: Optional[SponsorFamilies] = None
+_singleton_lock = threading.Lock()
+
+
+def get_sponsor_families() -> SponsorFamilies:
+    """Get the process-wide seed sponsor families"""
+    global _families
+    with _singleton_lock:
+        if _families is None:
+            _families = SponsorFamilies()
+        return _families
+
+
+def get_sponsor_resolver() -> SponsorResolver:
+    """Get the process-wide sponsor resolver (loads sponsor_performance on first lookup)"""
+    families = get_sponsor_families()
+    global _resolver
+    with _singleton_lock:
+        if _resolver is None:
+            _resolver = SponsorResolver(families=families)
+        return _resolver
+
+
+if __name__ == '__main__':
+    import sys
+    import argparse
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description='Resolve sponsor names against sponsor_performance')
+    parser.add_argument('names', nargs='+', help='Sponsor names to resolve')
+    args = parser.parse_args()
+
+    resolver = get_sponsor_resolver()
+    resolver.refresh(force=True)
+    for sponsor in args.names:
+        started = time.perf_counter()
+        match = resolver.resolve(sponsor)
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        if match:
+            print(f"{sponsor!r} → {match.sponsor_name!r} (score {match.sponsor_score}, "
+                  f"family {match.family or '-'}, {match.match_type} {match.similarity:.2f}) [{elapsed_us:.0f}µs]")
+        else:
+            print(f"{sponsor!r} → no match (score 0, family {resolver.family(sponsor) or '-'}) [{elapsed_us:.0f}µs]")
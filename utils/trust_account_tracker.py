@@ -48,13 +48,45 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import SPAC
 
 
+def quarter_for_period(period_end: date, source: str) -> str:
+    """
+    Reporting period label for a balance sheet date
+
+    Args:
+        period_end: Balance sheet date (XBRL context period / 10-Q cover "period ended")
+        source: Filing type - 10-K periods are labelled "FY 2025", others "Q2 2025"
+
+    Returns:
+        Label stored in trust_account_history.quarter
+    """
+    if '10-K' in source.upper():
+        return f"FY {period_end.year}"
+    return f"Q{((period_end.month - 1) // 3) + 1} {period_end.year}"
+
+
+def latest_period_end(filing_date: date) -> date:
+    """
+    Last quarter end before a filing date
+
+    10-Qs and 10-Ks are filed after their period closes (within 40-90 days),
+    so this is the balance sheet date when the filing itself doesn't state it.
+    """
+    filing_date = filing_date.date() if isinstance(filing_date, datetime) else filing_date
+    for month, day in ((12, 31), (9, 30), (6, 30), (3, 31)):
+        candidate = date(filing_date.year, month, day)
+        if candidate < filing_date:
+            return candidate
+    return date(filing_date.year - 1, 12, 31)
+
+
 def update_trust_cash(
     db_session: Session,
     ticker: str,
     new_value: Optional[float],
     source: str,
     filing_date: date,
-    quarter: Optional[str] = None
+    quarter: Optional[str] = None,
+    period_end: Optional[date] = None
 ) -> bool:
     """
     Update trust_cash with date-based precedence and history tracking
@@ -66,6 +98,8 @@ def update_trust_cash(
         source: Filing type (e.g., "10-Q", "10-K", "8-K")
         filing_date: Date of the filing
         quarter: Optional quarter (e.g., "Q3 2025")
+        period_end: Optional balance sheet date the value is as of (quarter
+            derived from it when not given)
 
     Returns:
         True if updated, False if skipped (precedence rules)
@@ -81,6 +115,8 @@ def update_trust_cash(
 
     # Normalize source
     source = source.upper()
+    if period_end and not quarter:
+        quarter = quarter_for_period(period_end, source)
 
     # Get SPAC
     spac = db_session.query(SPAC).filter(SPAC.ticker == ticker).first()
@@ -118,6 +154,8 @@ def update_trust_cash(
     print(f"   ✓ Updating trust_cash: {old_str} → {new_str}")
     print(f"     Source: {old_source or 'None'} → {source}")
     print(f"     Filing date: {old_filing_date or 'None'} → {filing_date}")
+    if period_end:
+        print(f"     Period end: {period_end}")
     if quarter:
         print(f"     Quarter: {quarter}")
 
@@ -19,6 +19,9 @@ Usage:
     if is_suppressed('ISRL', 'Stale Announced Deal (18+ months)'):
         print("Issue is suppressed")
 
+    # Bulk runs: load every active suppression once
+    suppressed = load_active_suppressions()  # {(ticker, rule_name), ...}
+
     # List all suppressions
     suppressions = list_suppressions()
 """
@@ -28,7 +31,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple
 from sqlalchemy import text
 from database import SessionLocal
 
@@ -139,6 +142,31 @@ def is_suppressed(ticker: str, rule_name: str) -> bool:
         db.close()
 
 
+def load_active_suppressions() -> Set[Tuple[str, str]]:
+    """
+    Load all active suppressions in one query (for bulk validation runs)
+
+    Returns:
+        Set of (ticker, rule_name) pairs that are suppressed and not expired
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            text("""
+                SELECT ticker, rule_name FROM validation_suppressions
+                WHERE expires_at IS NULL OR expires_at > NOW()
+            """)
+        )
+        return {(row[0], row[1]) for row in result}
+
+    except Exception as e:
+        print(f"⚠️  Error loading suppressions: {e}")
+        return set()
+
+    finally:
+        db.close()
+
+
 def remove_suppression(ticker: str, rule_name: str) -> bool:
     """
     Remove a suppression (re-enable validation for this rule)
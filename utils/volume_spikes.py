@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Volume Spikes - Vectorized volume spike and turnover detection
+
+PriceUpdater.update_all_spacs, volume_tracker, VolumeTrackerAgent and
+DailyVolumeTracker each computed spike ratios per ticker in a Python loop,
+from different sources (spacs.volume vs a fresh 30-day download vs the
+daily_volume table) with their own thresholds. This module is the one
+definition they all share:
+
+- Input is a (date × ticker) volume frame from PriceBarStore.load_matrix;
+  detection runs on the (ticker × session) NumPy array in a single pass
+- Each ticker's latest session is its last non-null volume; the baseline is
+  the mean / standard deviation of the VOLUME_AVG_SESSIONS sessions before it
+- Metrics: spike ratio (latest / mean), z-score, turnover % of
+  shares_outstanding (latest and average)
+- Tiers: EXTREME (10x), HIGH (5x), MODERATE (3x) on the spike ratio; tickers
+  with fewer than MIN_SESSIONS sessions are never tiered
+- Alerts go to orchestrator_trigger.trigger_volume_spikes in one batch
+
+Usage:
+    from utils.volume_spikes import VolumeSpikeDetector
+
+    detector = VolumeSpikeDetector()
+    spikes = detector.detect(deal_statuses=['SEARCHING'])   # DataFrame by ticker
+    candidates = detector.candidates(min_spike_ratio=3.0)    # list of dicts
+    detector.close()
+
+CLI:
+    python3 utils/volume_spikes.py                  # Show spike candidates
+    python3 utils/volume_spikes.py --min-spike 5    # Only 5x+ spikes
+    python3 utils/volume_spikes.py --turnover       # Show high turnover SPACs
+"""
+
+import os
+import sys
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_bars import PriceBarStore, VOLUME_AVG_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+# (level, minimum spike ratio), highest first
+SPIKE_TIERS: Tuple[Tuple[str, float], ...] = (('EXTREME', 10.0), ('HIGH', 5.0), ('MODERATE', 3.0))
+# Sessions (latest included) required before a ticker can be tiered
+MIN_SESSIONS = 5
+# Daily turnover (% of shares outstanding) treated as high
+HIGH_TURNOVER_PCT = 5.0
+
+SPIKE_COLUMNS = [
+    'session_date', 'current_volume', 'avg_volume_30d', 'volume_std_30d', 'sessions',
+    'volume_spike_ratio', 'volume_zscore', 'turnover_pct', 'avg_turnover_pct',
+    'spike_level', 'is_volume_spike'
+]
+
+
+def spike_tier(spike_ratio: float, tiers: Sequence[Tuple[str, float]] = SPIKE_TIERS) -> str:
+    """Spike level for one ratio ('NORMAL' below the lowest tier)"""
+    for level, threshold in tiers:
+        if spike_ratio >= threshold:
+            return level
+    return 'NORMAL'
+
+
+def detect_volume_spikes(
+    volume: pd.DataFrame,
+    shares_outstanding: Optional[pd.Series] = None,
+    window: int = VOLUME_AVG_SESSIONS,
+    min_sessions: int = MIN_SESSIONS,
+    tiers: Sequence[Tuple[str, float]] = SPIKE_TIERS
+) -> pd.DataFrame:
+    """
+    Spike and turnover metrics for every ticker in a volume matrix
+
+    Args:
+        volume: (date × ticker) volume frame, dates ascending (see PriceBarStore.load_matrix)
+        shares_outstanding: Shares per ticker for turnover (missing → NaN turnover)
+        window: Sessions before the latest one that form the baseline
+        min_sessions: Fewer sessions than this → spike_level 'NORMAL'
+        tiers: (level, minimum ratio) pairs, highest first
+
+    Returns:
+        DataFrame indexed by ticker with SPIKE_COLUMNS (tickers with no volume omitted)
+    """
+    if volume.empty:
+        return pd.DataFrame(columns=SPIKE_COLUMNS)
+
+    values = volume.to_numpy(dtype=float).T          # ticker × session
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+
+    # 1 = latest session with volume, 2 = the one before, ...
+    sessions_from_end = np.where(valid, np.cumsum(valid[:, ::-1], axis=1)[:, ::-1], 0)
+    latest = sessions_from_end == 1
+    prior = (sessions_from_end >= 2) & (sessions_from_end <= window + 1)
+
+    has_volume = latest.any(axis=1)
+    current = np.where(has_volume, (filled * latest).sum(axis=1), np.nan)
+    session_dates = volume.index.to_numpy()[latest.argmax(axis=1)]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        count = prior.sum(axis=1)
+        total = (filled * prior).sum(axis=1)
+        mean = np.where(count > 0, total / count, np.nan)
+        deviations = np.where(prior, filled - mean[:, None], 0.0)
+        std = np.where(count > 1, np.sqrt((deviations ** 2).sum(axis=1) / (count - 1)), np.nan)
+
+        ratio = np.where(mean > 0, current / mean, 1.0)
+        zscore = np.where(std > 0, (current - mean) / std, np.nan)
+
+        if shares_outstanding is not None:
+            shares = shares_outstanding.reindex(volume.columns).to_numpy(dtype=float)
+            shares = np.where(shares > 0, shares, np.nan)
+        else:
+            shares = np.full(len(volume.columns), np.nan)
+        turnover = current / shares * 100
+        avg_turnover = mean / shares * 100
+
+    sessions = count + has_volume
+    eligible = sessions >= min_sessions
+    levels = np.select(
+        [eligible & (ratio >= threshold) for _, threshold in tiers],
+        [level for level, _ in tiers],
+        default='NORMAL'
+    )
+
+    spikes = pd.DataFrame({
+        'session_date': pd.to_datetime(session_dates).date,
+        'current_volume': current,
+        'avg_volume_30d': mean,
+        'volume_std_30d': std,
+        'sessions': sessions,
+        'volume_spike_ratio': ratio,
+        'volume_zscore': zscore,
+        'turnover_pct': turnover,
+        'avg_turnover_pct': avg_turnover,
+        'spike_level': levels,
+        'is_volume_spike': levels != 'NORMAL',
+    }, index=pd.Index(volume.columns, name='ticker'))
+    return spikes[has_volume]
+
+
+def spike_metrics(row: pd.Series) -> Dict:
+    """Per-ticker metrics dict (the calculate_volume_metrics format) from a detect_volume_spikes row"""
+    def number(value, digits=2):
+        return round(float(value), digits) if pd.notna(value) else None
+
+    return {
+        'avg_volume_30d': number(row['avg_volume_30d']),
+        'current_volume': int(row['current_volume']),
+        'volume_spike_ratio': number(row['volume_spike_ratio']),
+        'volume_zscore': number(row['volume_zscore']),
+        'turnover_pct': number(row['turnover_pct'], 4),
+        'is_volume_spike': bool(row['is_volume_spike']),
+        'spike_level': row['spike_level']
+    }
+
+
+class VolumeSpikeDetector:
+    """Runs detect_volume_spikes over the SPAC universe from the local bar store"""
+
+    def __init__(self, db=None, store: Optional[PriceBarStore] = None,
+                 tiers: Sequence[Tuple[str, float]] = SPIKE_TIERS):
+        """
+        Args:
+            db: Optional SQLAlchemy session to share (default: the store's session)
+            store: Bar store to read from (default: one on db)
+            tiers: (level, minimum ratio) pairs, highest first
+        """
+        self._owns_store = store is None
+        self.store = store or PriceBarStore(db=db)
+        self.db = db or self.store.db
+        self.tiers = tiers
+
+    def load_universe(self, deal_statuses: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """SPAC columns used by spike reports (one row per ticker)"""
+        query = """
+            SELECT ticker, company, deal_status, shares_outstanding, premium,
+                   ipo_proceeds, banker, sector
+            FROM spacs
+            WHERE ticker IS NOT NULL
+        """
+        params = {}
+        if deal_statuses:
+            query += " AND deal_status = ANY(:statuses)"
+            params['statuses'] = list(deal_statuses)
+
+        universe = pd.read_sql(text(query), self.db.bind, params=params)
+        return universe.drop_duplicates('ticker').set_index('ticker')
+
+    def detect(self, deal_statuses: Optional[Sequence[str]] = ('SEARCHING',),
+               tickers: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Spike metrics joined with SPAC info, strongest spikes first
+
+        Bars are read as stored; callers sync the store first (the price cycle
+        and volume trackers already do).
+
+        Args:
+            deal_statuses: Only SPACs with these deal statuses (None = all)
+            tickers: Further restrict to these tickers
+        """
+        universe = self.load_universe(deal_statuses)
+        if tickers is not None:
+            universe = universe[universe.index.isin(list(tickers))]
+        if universe.empty:
+            return pd.DataFrame(columns=SPIKE_COLUMNS + list(universe.columns))
+
+        volume = self.store.load_matrix('volume', universe.index.tolist(), sessions=VOLUME_AVG_SESSIONS + 1)
+        spikes = detect_volume_spikes(volume, universe['shares_outstanding'], tiers=self.tiers)
+        spikes = spikes.join(universe)
+        return spikes.sort_values('volume_spike_ratio', ascending=False)
+
+    def candidates(self, min_spike_ratio: float = 3.0,
+                   deal_statuses: Optional[Sequence[str]] = ('SEARCHING',)) -> List[Dict]:
+        """
+        SPACs whose latest volume is at least min_spike_ratio × their 30-session average
+
+        Returns:
+            List of dicts (ticker, company, volume, avg_volume_30d, spike_ratio,
+            spike_level, volume_zscore, turnover_pct, premium, ipo_proceeds,
+            banker, sector), highest ratio first
+        """
+        spikes = self.detect(deal_statuses)
+        spikes = spikes[(spikes['sessions'] >= MIN_SESSIONS) &
+                        (spikes['volume_spike_ratio'] >= min_spike_ratio)]
+        return [self._candidate(ticker, row) for ticker, row in spikes.iterrows()]
+
+    @staticmethod
+    def _candidate(ticker: str, row: pd.Series) -> Dict:
+        metrics = spike_metrics(row)
+        return {
+            'ticker': ticker,
+            'company': row['company'],
+            'deal_status': row['deal_status'],
+            'volume': metrics['current_volume'],
+            'avg_volume_30d': metrics['avg_volume_30d'],
+            'spike_ratio': metrics['volume_spike_ratio'],
+            'spike_level': metrics['spike_level'],
+            'volume_zscore': metrics['volume_zscore'],
+            'turnover_pct': metrics['turnover_pct'],
+            'session_date': row['session_date'],
+            'premium': row['premium'],
+            'ipo_proceeds': row['ipo_proceeds'],
+            'banker': row['banker'],
+            'sector': row['sector']
+        }
+
+    def trigger_alerts(self, spikes: pd.DataFrame) -> int:
+        """Send tiered spikes to the orchestrator in one batch → number of alerts sent"""
+        from orchestrator_trigger import trigger_volume_spikes
+
+        tiered = spikes[spikes['is_volume_spike']]
+        if tiered.empty:
+            return 0
+        return trigger_volume_spikes([
+            {
+                'ticker': ticker,
+                'current_volume': int(row['current_volume']),
+                'avg_volume_30d': float(row['avg_volume_30d']),
+                'spike_ratio': float(row['volume_spike_ratio']),
+                'deal_status': row['deal_status'],
+            }
+            for ticker, row in tiered.iterrows()
+        ])
+
+    def high_turnover(self, days: int = 1, min_turnover: float = HIGH_TURNOVER_PCT,
+                      deal_statuses: Optional[Sequence[str]] = None, limit: int = 20) -> List[Dict]:
+        """
+        Sessions in the last `days` calendar days where volume ≥ min_turnover % of shares outstanding
+
+        Returns:
+            List of dicts (ticker, date, volume, turnover_rate, price), highest turnover first
+        """
+        universe = self.load_universe(deal_statuses)
+        shares = universe['shares_outstanding'].where(universe['shares_outstanding'] > 0).dropna()
+        if shares.empty:
+            return []
+
+        start = date.today() - timedelta(days=days)
+        tickers = shares.index.tolist()
+        volume = self.store.load_matrix('volume', tickers, start=start)
+        if volume.empty:
+            return []
+        close = self.store.load_matrix('close', tickers, start=start).reindex_like(volume)
+
+        turnover = volume.to_numpy(dtype=float) / shares.reindex(volume.columns).to_numpy(dtype=float) * 100
+        with np.errstate(invalid='ignore'):
+            rows, cols = np.nonzero(turnover >= min_turnover)
+        order = np.argsort(-turnover[rows, cols], kind='stable')[:limit]
+
+        return [
+            {
+                'ticker': volume.columns[cols[i]],
+                'date': volume.index[rows[i]].date(),
+                'volume': int(volume.iat[rows[i], cols[i]]),
+                'turnover_rate': round(float(turnover[rows[i], cols[i]]), 4),
+                'price': float(close.iat[rows[i], cols[i]])
+            }
+            for i in order
+        ]
+
+    def close(self):
+        if self._owns_store:
+            self.store.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Detect volume spikes across the SPAC universe')
+    parser.add_argument('--min-spike', type=float, default=3.0, help='Minimum spike ratio')
+    parser.add_argument('--turnover', action='store_true', help='Show high turnover SPACs instead')
+    parser.add_argument('--days', type=int, default=1, help='Days of sessions for --turnover')
+    args = parser.parse_args()
+
+    detector = VolumeSpikeDetector()
+    try:
+        if args.turnover:
+            rows = detector.high_turnover(days=args.days)
+            print(f"\n🔥 High Turnover SPACs (Last {args.days} days):\n")
+            for row in rows:
+                print(f"  {row['ticker']}: {row['turnover_rate']:.2f}% on {row['date']} "
+                      f"(Vol: {row['volume']:,}, Price: ${row['price']:.2f})")
+        else:
+            candidates = detector.candidates(min_spike_ratio=args.min_spike)
+            print(f"\n🔥 Volume Spike Candidates ({args.min_spike}x+):\n")
+            for c in candidates:
+                zscore = f"z={c['volume_zscore']:.1f}" if c['volume_zscore'] is not None else "z=n/a"
+                print(f"  {c['ticker']}: {c['spike_level']} {c['spike_ratio']}x, {zscore} "
+                      f"({c['volume']:,} vs {c['avg_volume_30d']:,.0f} avg)")
+    finally:
+        detector.close()
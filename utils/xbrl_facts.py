@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+XBRL Facts - Trust account and share count facts from inline XBRL 10-Q / 10-K
+
+Modern 10-Qs and 10-Ks are inline XBRL: every balance sheet number is wrapped
+in an <ix:nonFraction> tag naming its concept, context (period + dimensions),
+scale and sign. Reading those tags gives the exact trust balance and share
+counts, with the balance sheet date, without slicing sections for an LLM.
+
+Facts used (first concept with a value wins):
+- trust_cash:         us-gaap:AssetsHeldInTrustNoncurrent / Current / AssetsHeldInTrust,
+                      then filer extensions such as spac:InvestmentsHeldInTrustAccount
+- shares_outstanding: us-gaap:TemporaryEquitySharesOutstanding (shares subject to
+                      redemption), then dei:EntityCommonStockSharesOutstanding (Class A)
+- nav_per_share:      us-gaap:TemporaryEquityRedemptionPricePerShare
+
+For each concept the latest period wins, and facts without dimensions are
+preferred over class / series members. Callers fall back to the AI extraction
+only when the document carries none of these tags (pre-2019 filings, paper
+exhibits, ...).
+
+Usage:
+    from utils.xbrl_facts import extract_trust_facts
+
+    facts = extract_trust_facts(doc_content)
+    if facts:
+        facts['trust_cash'], facts['shares_outstanding'], facts['period_end']
+"""
+
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+NON_FRACTION_PATTERN = re.compile(
+    r'<ix:nonFraction\b([^>]*)>(.*?)</ix:nonFraction>', re.IGNORECASE | re.DOTALL
+)
+CONTEXT_PATTERN = re.compile(
+    r'<(?:\w+:)?context\b[^>]*\bid\s*=\s*["\']([^"\']+)["\'][^>]*>(.*?)</(?:\w+:)?context>',
+    re.IGNORECASE | re.DOTALL
+)
+PERIOD_END_PATTERN = re.compile(
+    r'<(?:\w+:)?(?:instant|endDate)>\s*(\d{4}-\d{2}-\d{2})\s*</', re.IGNORECASE
+)
+MEMBER_PATTERN = re.compile(
+    r'<(?:\w+:)?explicitMember\b[^>]*>\s*([^<]+?)\s*</', re.IGNORECASE
+)
+ATTRIBUTE_PATTERN = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+TRUST_CONCEPTS = [
+    'us-gaap:AssetsHeldInTrustNoncurrent',
+    'us-gaap:AssetsHeldInTrustCurrent',
+    'us-gaap:AssetsHeldInTrust',
+]
+# Filer extension concepts (any prefix), e.g. spac:InvestmentsHeldInTrustAccount
+TRUST_EXTENSION_PATTERN = re.compile(
+    r'^(?:Investments|MarketableSecurities|CashAndInvestments|CashAndMarketableSecurities|'
+    r'InvestmentsAndCash|Cash|Assets)HeldInTrust(?:Account)?(?:Noncurrent|Current)?$',
+    re.IGNORECASE
+)
+
+SHARE_CONCEPTS = [
+    'us-gaap:TemporaryEquitySharesOutstanding',
+    'us-gaap:TemporaryEquitySharesIssued',
+    'dei:EntityCommonStockSharesOutstanding',
+]
+NAV_CONCEPTS = [
+    'us-gaap:TemporaryEquityRedemptionPricePerShare',
+]
+
+# Dimension members acceptable for public share counts when no plain fact exists
+PUBLIC_SHARE_MEMBER_PATTERN = re.compile(r'ClassA|Redeemable|Public|CommonClassA', re.IGNORECASE)
+
+# Text values that inline XBRL renders as zero (ixt:fixed-zero, dashes)
+ZERO_TEXT = {'', '-', '—', '–', 'nil', 'none'}
+
+
+def is_inline_xbrl(content: str) -> bool:
+    """True if the document is inline XBRL (same check as SECFilingFetcher.parse_document)"""
+    head = content[:20000] if content else ''
+    return 'xmlns:ix=' in head or '<ix:' in head
+
+
+def _attributes(raw: str) -> Dict[str, str]:
+    return {name.lower(): double or single for name, double, single in ATTRIBUTE_PATTERN.findall(raw)}
+
+
+def _parse_number(raw_text: str, number_format: str) -> Optional[float]:
+    """Number from the displayed text of an ix:nonFraction tag (before scale / sign)"""
+    value = TAG_PATTERN.sub('', raw_text).replace('&nbsp;', ' ').replace('&#160;', ' ').strip()
+    number_format = (number_format or '').lower()
+
+    if 'zero' in number_format or value.lower() in ZERO_TEXT:
+        return 0.0
+
+    value = value.replace(' ', '').replace('\xa0', '').replace('$', '').strip('()')
+    if 'comma-decimal' in number_format or 'numcommadecimal' in number_format:
+        value = value.replace('.', '').replace(',', '.')
+    else:
+        value = value.replace(',', '')
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_contexts(content: str) -> Dict[str, Dict]:
+    """
+    XBRL contexts of an inline XBRL document
+
+    Returns:
+        {context_id: {'period_end': date or None, 'members': [dimension member QNames]}}
+    """
+    contexts = {}
+    for context_id, body in CONTEXT_PATTERN.findall(content):
+        match = PERIOD_END_PATTERN.search(body)
+        period_end = None
+        if match:
+            try:
+                period_end = datetime.strptime(match.group(1), '%Y-%m-%d').date()
+            except ValueError:
+                period_end = None
+        contexts[context_id] = {
+            'period_end': period_end,
+            'members': MEMBER_PATTERN.findall(body),
+        }
+    return contexts
+
+
+def parse_facts(content: str) -> List[Dict]:
+    """
+    Numeric facts (ix:nonFraction) of an inline XBRL document
+
+    Returns:
+        List of {'concept', 'value', 'context', 'period_end', 'members', 'decimals'}
+        with scale and sign applied
+    """
+    if not content or not is_inline_xbrl(content):
+        return []
+
+    contexts = parse_contexts(content)
+    facts = []
+    for raw_attributes, raw_text in NON_FRACTION_PATTERN.findall(content):
+        attributes = _attributes(raw_attributes)
+        concept = attributes.get('name')
+        if not concept:
+            continue
+
+        value = _parse_number(raw_text, attributes.get('format'))
+        if value is None:
+            continue
+        try:
+            value *= 10 ** int(attributes.get('scale') or 0)
+        except ValueError:
+            pass
+        if attributes.get('sign') == '-':
+            value = -value
+
+        context_id = attributes.get('contextref')
+        context = contexts.get(context_id, {})
+        facts.append({
+            'concept': concept,
+            'value': value,
+            'context': context_id,
+            'period_end': context.get('period_end'),
+            'members': context.get('members', []),
+            'decimals': attributes.get('decimals'),
+        })
+    return facts
+
+
+def _best_fact(facts: List[Dict], accept_member=None) -> Optional[Dict]:
+    """
+    Latest-period fact, preferring facts without dimensions
+
+    Args:
+        facts: Facts of one concept
+        accept_member: Optional predicate - dimensioned facts are only used if
+            every member passes it (e.g. Class A for share counts)
+    """
+    plain = [fact for fact in facts if not fact['members']]
+    candidates = plain
+    if not candidates and accept_member:
+        candidates = [fact for fact in facts if all(accept_member(member) for member in fact['members'])]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda fact: fact['period_end'] or date.min)
+
+
+def _select(facts: List[Dict], concepts: List[str], accept_member=None,
+            extension_pattern=None) -> Optional[Dict]:
+    """First concept (in priority order) with a usable fact"""
+    by_concept: Dict[str, List[Dict]] = {}
+    for fact in facts:
+        by_concept.setdefault(fact['concept'], []).append(fact)
+
+    names = list(concepts)
+    if extension_pattern:
+        names += sorted(
+            name for name in by_concept
+            if name not in concepts and extension_pattern.match(name.split(':')[-1])
+        )
+
+    for name in names:
+        best = _best_fact(by_concept.get(name, []), accept_member)
+        if best:
+            return best
+    return None
+
+
+def extract_trust_facts(content: str) -> Optional[Dict]:
+    """
+    Trust balance, redeemable shares and redemption price from inline XBRL tags
+
+    Args:
+        content: Raw 10-Q / 10-K HTML (not extracted text - tags are needed)
+
+    Returns:
+        Dict with trust_cash, shares_outstanding, nav_per_share (each None if
+        not tagged), period_end (balance sheet date), concepts and
+        source='xbrl'; None if the document has no trust or share tags
+    """
+    facts = parse_facts(content)
+    if not facts:
+        return None
+
+    accept_public = lambda member: bool(PUBLIC_SHARE_MEMBER_PATTERN.search(member))
+    trust = _select(facts, TRUST_CONCEPTS, extension_pattern=TRUST_EXTENSION_PATTERN)
+    shares = _select(facts, SHARE_CONCEPTS, accept_member=accept_public)
+    nav = _select(facts, NAV_CONCEPTS, accept_member=accept_public)
+
+    if not trust and not shares:
+        return None
+
+    trust_cash = int(round(trust['value'])) if trust and trust['value'] > 0 else None
+    shares_outstanding = int(round(shares['value'])) if shares and shares['value'] > 0 else None
+    nav_per_share = round(nav['value'], 4) if nav and nav['value'] > 0 else None
+
+    # Balance sheet date: the trust fact's period (share counts on the cover page are later)
+    period_end = (trust or shares)['period_end']
+
+    return {
+        'trust_cash': trust_cash,
+        'shares_outstanding': shares_outstanding,
+        'nav_per_share': nav_per_share,
+        'period_end': period_end,
+        'concepts': {
+            'trust_cash': trust['concept'] if trust else None,
+            'shares_outstanding': shares['concept'] if shares else None,
+            'nav_per_share': nav['concept'] if nav else None,
+        },
+        'source': 'xbrl',
+    }
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Set-Based Validation Engine - Whole-table rule evaluation for LogicalConsistencyValidator
+
+Instead of loading every SPAC ORM object and calling 17 validate_* methods per
+row (several of which query the database per SPAC), each rule has a set-based
+predicate that selects candidate rows for the whole table at once:
+
+- where:     SQL WHERE clause, evaluated for every row in the single load query
+- predicate: vectorized function over a pandas DataFrame of the spacs table
+
+Only rows selected by a rule's predicate are passed to the rule's existing
+validate_* method, which still builds the issue dicts (same output format).
+Predicates must select a superset of the rows the method would flag - a few
+extra candidates only cost a Python call, a missed row is a missed issue.
+
+Per-run context (suppressions, previous prices, market activity) is loaded
+once by LogicalConsistencyValidator.preload_bulk_context().
+
+Usage:
+    from validation_rule_engine import SetBasedValidationEngine
+
+    engine = SetBasedValidationEngine(validator, db)
+    for spac, issues in engine.run():
+        ...
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+# Placeholder targets treated as "no target" by the deal status rules
+INVALID_TARGETS = ['-', '', 'Unknown', '[Unknown]', '[Unknown - requires validation]']
+
+
+class SetRule:
+    """
+    One set-based rule: candidate selection (SQL or pandas) + issue builder
+
+    Args:
+        method: Name of the LogicalConsistencyValidator method that builds issues
+        fields: spacs columns the rule reads (drives incremental re-validation)
+        where: SQL boolean expression over spacs columns
+        predicate: Callable(frame, validator) -> boolean Series aligned with frame
+        time_dependent: Result can change with the clock alone (ages, "days since")
+    """
+
+    def __init__(self, method: str, fields: Sequence[str], where: Optional[str] = None,
+                 predicate: Optional[Callable[[pd.DataFrame, object], pd.Series]] = None,
+                 time_dependent: bool = False):
+        if (where is None) == (predicate is None):
+            raise ValueError(f"Rule {method}: specify exactly one of where / predicate")
+        self.method = method
+        self.fields = list(fields)
+        self.where = where
+        self.predicate = predicate
+        self.time_dependent = time_dependent
+
+
+# ============================================================================
+# Column helpers (work for DATE and TIMESTAMP columns alike)
+# ============================================================================
+
+def _num(frame: pd.DataFrame, column: str) -> pd.Series:
+    return pd.to_numeric(frame[column], errors='coerce')
+
+
+def _dt(frame: pd.DataFrame, column: str) -> pd.Series:
+    return pd.to_datetime(frame[column], errors='coerce')
+
+
+def _truthy(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Python truthiness of each value (None/NaN/0/''/False → False)"""
+    values = frame[column]
+    return values.notna() & values.map(bool)
+
+
+def _parse_ipo_proceeds(value) -> Optional[float]:
+    """Parse "$300,000,000" / "$300M" / "$1.2B" (same rules as validate_trust_cash_vs_ipo)"""
+    if not value:
+        return None
+    ipo_str = str(value).replace('$', '').replace(',', '').strip()
+    try:
+        if 'M' in ipo_str or 'm' in ipo_str:
+            return float(ipo_str.replace('M', '').replace('m', '')) * 1_000_000
+        if 'B' in ipo_str or 'b' in ipo_str:
+            return float(ipo_str.replace('B', '').replace('b', '')) * 1_000_000_000
+        return float(ipo_str)
+    except ValueError:
+        return None
+
+
+# ============================================================================
+# Vectorized predicates (supersets of the rows each validate_* method flags)
+# ============================================================================
+
+def _data_types_and_formats(f: pd.DataFrame, v) -> pd.Series:
+    cik = f['cik'].astype(str)
+    flagged = _truthy(f, 'cik') & ((cik.str.len() > 10) | ~cik.str.fullmatch(r'\d*'))
+
+    for column in ['price', 'common_price', 'warrant_price', 'unit_price', 'trust_value',
+                   'shares_outstanding', 'shares_redeemed']:
+        values = _num(f, column)
+        flagged |= (values < 0) | (f[column].notna() & values.isna())
+
+    for column in ['ipo_date', 'announced_date', 'deadline_date', 'shareholder_vote_date',
+                   'redemption_deadline', 'expected_close']:
+        flagged |= f[column].map(
+            lambda value: value is not None and not pd.isna(value) and not isinstance(value, (datetime, str))
+        )
+
+    return flagged
+
+
+def _date_consistency(f: pd.DataFrame, v) -> pd.Series:
+    now = pd.Timestamp.now()
+    ipo, announced, vote = _dt(f, 'ipo_date'), _dt(f, 'announced_date'), _dt(f, 'shareholder_vote_date')
+    deadline, redemption = _dt(f, 'deadline_date'), _dt(f, 'redemption_deadline')
+
+    flagged = (announced < ipo) | (vote < announced) | (deadline < ipo)
+    # IPO → deadline outside 12-36 months (1 day margin for relativedelta rounding)
+    flagged |= deadline < ipo + pd.DateOffset(months=12) + pd.Timedelta(days=1)
+    flagged |= deadline > ipo + pd.DateOffset(months=37) - pd.Timedelta(days=1)
+    # Rule 33 (vote within deal timeline)
+    flagged |= vote.notna() & announced.notna() & _truthy(f, 'expected_close')
+    # Rule 34 (redemption deadline 2-10 days before vote)
+    gap = (vote.dt.normalize() - redemption.dt.normalize()).dt.days
+    flagged |= gap.notna() & ((gap < 3) | (gap > 9))
+    # Rule 76 (dates >5 days in future)
+    horizon = now + pd.Timedelta(days=4)
+    flagged |= (ipo > horizon) | (announced > horizon)
+
+    return flagged
+
+
+def _premium_calculation(f: pd.DataFrame, v) -> pd.Series:
+    price, trust, premium = _num(f, 'price'), _num(f, 'trust_value'), _num(f, 'premium')
+    expected = (price - trust) / trust * 100
+    return (_truthy(f, 'price') & _truthy(f, 'trust_value') & premium.notna()
+            & ((premium - expected).abs() > 0.49))
+
+
+def _trust_value(f: pd.DataFrame, v) -> pd.Series:
+    trust, ipo = _num(f, 'trust_value'), _dt(f, 'ipo_date')
+    years = (pd.Timestamp.now() - ipo).dt.days / 365.25
+    expected = 10.00 * (1.05 ** years)
+    aged = ipo.notna() & ((trust < expected * 0.95 * 1.001) | (trust > expected * 1.05 * 0.999))
+    unaged = ipo.isna() & ((trust < 9.50) | (trust > 10.50))
+    return _truthy(f, 'trust_value') & (aged | unaged)
+
+
+def _price_vs_nav(f: pd.DataFrame, v) -> pd.Series:
+    price, trust = _num(f, 'price'), _num(f, 'trust_value')
+    searching = f['deal_status'] == 'SEARCHING'
+    ipo_price, common = _num(f, 'ipo_price'), _num(f, 'common_price')
+    price_at_ann = _num(f, 'price_at_announcement')
+
+    flagged = price < trust * 0.95
+    flagged |= _truthy(f, 'ipo_price') & ((ipo_price < 9.50) | (ipo_price > 11.50))
+    flagged |= searching & (common > 13.0)
+    flagged |= _num(f, 'warrant_price') > 5.0
+    flagged |= _truthy(f, 'price_at_announcement') & ((price_at_ann < 9.50) | (price_at_ann > 15.0))
+    flagged |= _dt(f, 'last_updated') < pd.Timestamp.now() - pd.Timedelta(hours=48) + pd.Timedelta(minutes=1)
+    flagged |= searching & (price > trust * 1.5)
+
+    # Rule 20: >20% move vs historical_prices (preloaded once per run)
+    if v.prev_prices is None:
+        flagged |= searching
+    else:
+        prev = pd.to_numeric(f['ticker'].map(v.prev_prices), errors='coerce')
+        flagged |= searching & (prev > 0) & (((price - prev) / prev * 100).abs() > 20)
+
+    return _truthy(f, 'price') & _truthy(f, 'trust_value') & flagged
+
+
+def _trust_cash_vs_ipo(f: pd.DataFrame, v) -> pd.Series:
+    trust_cash = _num(f, 'trust_cash')
+    ipo_value = pd.to_numeric(f['ipo_proceeds'].map(_parse_ipo_proceeds), errors='coerce')
+    age_years = ((pd.Timestamp.now() - _dt(f, 'ipo_date')).dt.days / 365.25).fillna(0)
+    max_reasonable_trust = ipo_value * (1.15 + 0.04 * age_years)
+    return _truthy(f, 'trust_cash') & (trust_cash > max_reasonable_trust * 1.10 * 0.999)
+
+
+def _price_trading_status(f: pd.DataFrame, v) -> pd.Series:
+    last_update = _dt(f, 'last_price_update')
+    flagged = ((last_update >= pd.Timestamp.now() - pd.Timedelta(days=8))
+               & _truthy(f, 'price') & f['price_change_24h'].isna())
+    if v.market_active is not None and v.market_active <= 10:
+        flagged &= f['deal_status'] == 'ANNOUNCED'
+    return flagged
+
+
+def _redemption_data(f: pd.DataFrame, v) -> pd.Series:
+    now = pd.Timestamp.now()
+    market_cap, shares, price = _num(f, 'market_cap'), _num(f, 'shares_outstanding'), _num(f, 'price')
+    trust_cash, trust_value = _num(f, 'trust_cash'), _num(f, 'trust_value')
+    no_redemptions = ~_truthy(f, 'redemptions_occurred') & ~_truthy(f, 'shares_redeemed')
+
+    # Trigger 1: market cap variance >20%
+    expected_market_cap = shares * price / 1_000_000
+    flagged = (_truthy(f, 'market_cap') & _truthy(f, 'shares_outstanding') & _truthy(f, 'price')
+               & (market_cap > 0) & ((market_cap - expected_market_cap).abs() / market_cap * 100 > 19.99))
+
+    # Trigger 2: recent vote without redemption data
+    vote = _dt(f, 'shareholder_vote_date')
+    flagged |= vote.notna() & no_redemptions & ((now - vote).dt.days <= 91)
+
+    # Trigger 3: recent extension without redemption data
+    extension = _dt(f, 'extension_date')
+    flagged |= _truthy(f, 'is_extended') & extension.notna() & no_redemptions & ((now - extension).dt.days <= 181)
+
+    # Trigger 4: trust account math off >15%
+    expected_trust_cash = trust_value * shares
+    flagged |= (_truthy(f, 'trust_cash') & _truthy(f, 'trust_value') & _truthy(f, 'shares_outstanding')
+                & (expected_trust_cash > 0) & ~_truthy(f, 'shares_redeemed')
+                & ((trust_cash - expected_trust_cash).abs() / expected_trust_cash * 100 > 14.99))
+
+    return flagged
+
+
+def _price_component_consistency(f: pd.DataFrame, v) -> pd.Series:
+    difference = (_num(f, 'price') - _num(f, 'common_price')).abs()
+    return _truthy(f, 'price') & _truthy(f, 'common_price') & (difference > 0.0999)
+
+
+def _volume_float_calculation(f: pd.DataFrame, v) -> pd.Series:
+    shares = _num(f, 'shares_outstanding')
+    has_volume = _truthy(f, 'volume') | _truthy(f, 'volume_avg_30d')
+    has_shares = _truthy(f, 'shares_outstanding')
+    return (has_volume & ~has_shares) | (has_shares & ((shares < 1_000_000) | (shares > 100_000_000)))
+
+
+_invalid_targets_sql = ', '.join(f"'{t}'" for t in INVALID_TARGETS)
+
+# Same order as LogicalConsistencyValidator.validate_all (issue order drives deduplication)
+SET_RULES: List[SetRule] = [
+    SetRule(
+        'validate_data_types_and_formats',
+        fields=['cik', 'price', 'common_price', 'warrant_price', 'unit_price', 'trust_value',
+                'shares_outstanding', 'shares_redeemed', 'ipo_date', 'announced_date', 'deadline_date',
+                'shareholder_vote_date', 'redemption_deadline', 'expected_close'],
+        predicate=_data_types_and_formats,
+    ),
+    SetRule(
+        'validate_deal_status_consistency',
+        fields=['deal_status', 'target', 'announced_date'],
+        where=f"""
+            (deal_status = 'ANNOUNCED' AND (target IS NULL OR target IN ({_invalid_targets_sql})
+                                            OR announced_date IS NULL))
+            OR (deal_status = 'SEARCHING' AND length(target) > 3)
+        """,
+    ),
+    SetRule(
+        'validate_date_consistency',
+        fields=['ipo_date', 'announced_date', 'deadline_date', 'shareholder_vote_date',
+                'redemption_deadline', 'expected_close'],
+        predicate=_date_consistency,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_premium_calculation',
+        fields=['price', 'trust_value', 'premium'],
+        predicate=_premium_calculation,
+    ),
+    SetRule(
+        'validate_trust_value',
+        fields=['trust_value', 'ipo_date'],
+        predicate=_trust_value,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_price_vs_nav',
+        fields=['price', 'trust_value', 'deal_status', 'ipo_price', 'common_price', 'warrant_price',
+                'price_at_announcement', 'last_updated'],
+        predicate=_price_vs_nav,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_deal_status_lifecycle',
+        fields=['deal_status', 'target', 'expected_close', 'is_liquidating', 'deadline_date'],
+        where="""
+            (deal_status IN ('CLOSED', 'COMPLETED') AND (COALESCE(target, '') = '' OR COALESCE(expected_close, '') = ''))
+            OR (is_liquidating AND (deal_status IS NULL OR deal_status NOT IN ('LIQUIDATING', 'LIQUIDATED', 'CLOSED')))
+            OR (deadline_date < NOW() AND deal_status = 'SEARCHING' AND NOT COALESCE(is_liquidating, FALSE))
+        """,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_trust_cash_vs_ipo',
+        fields=['trust_cash', 'ipo_proceeds', 'ipo_date'],
+        predicate=_trust_cash_vs_ipo,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_false_positive_deals',
+        fields=['deal_status', 'target', 'announced_date', 'deal_filing_url', 'shareholder_vote_date',
+                'premium', 'price', 'trust_value'],
+        where="""
+            deal_status = 'ANNOUNCED' AND (
+                target IS NULL OR target IN ('-', '', 'Unknown')
+                OR (announced_date IS NULL AND COALESCE(deal_filing_url, '') = '')
+                OR (announced_date < NOW() - INTERVAL '364 days' AND shareholder_vote_date IS NULL)
+                OR premium < -5.0
+            )
+        """,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_price_trading_status',
+        fields=['last_price_update', 'price', 'price_change_24h', 'deal_status', 'target', 'cik',
+                'announced_date'],
+        predicate=_price_trading_status,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_stale_announced_deals',
+        fields=['deal_status', 'announced_date', 'deadline_date', 'last_price_update', 'target', 'cik'],
+        where="""
+            deal_status = 'ANNOUNCED' AND announced_date IS NOT NULL AND (
+                deadline_date < NOW() + INTERVAL '2 days'
+                OR (deadline_date IS NULL AND (
+                    announced_date < NOW() - INTERVAL '364 days'
+                    OR (last_price_update < NOW() - INTERVAL '7 days' AND announced_date < NOW() - INTERVAL '179 days')
+                ))
+            )
+        """,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_temporal_consistency',
+        fields=['ipo_date', 'announced_date', 'completion_date', 'merger_termination_date', 'deadline_date'],
+        where="""
+            ipo_date IS NOT NULL AND (
+                announced_date::date < ipo_date::date
+                OR completion_date::date < announced_date::date
+                OR completion_date::date < ipo_date::date
+                OR merger_termination_date::date < announced_date::date
+                OR deadline_date::date < ipo_date::date
+            )
+        """,
+    ),
+    SetRule(
+        'validate_data_freshness',
+        fields=['last_scraped_at', 'last_updated', 'deal_status', 'target', 'deal_filing_url'],
+        where="""
+            last_updated > last_scraped_at + INTERVAL '5 minutes' AND (
+                (deal_status = 'SEARCHING' AND COALESCE(target, '') = '' AND COALESCE(deal_filing_url, '') <> '')
+                OR (deal_status = 'ANNOUNCED' AND (strpos(target, 'AlphaVest Digital Holdings') > 0
+                                                  OR strpos(target, 'pomvom ltd.') > 0 OR strpos(target, 'TBD') > 0))
+            )
+        """,
+    ),
+    SetRule(
+        'validate_redemption_data',
+        fields=['market_cap', 'shares_outstanding', 'price', 'shareholder_vote_date', 'redemptions_occurred',
+                'shares_redeemed', 'is_extended', 'extension_date', 'trust_cash', 'trust_value'],
+        predicate=_redemption_data,
+        time_dependent=True,
+    ),
+    SetRule(
+        'validate_price_component_consistency',
+        fields=['price', 'common_price', 'trust_value'],
+        predicate=_price_component_consistency,
+    ),
+    SetRule(
+        'validate_volume_float_calculation',
+        fields=['volume', 'volume_avg_30d', 'shares_outstanding'],
+        predicate=_volume_float_calculation,
+    ),
+]
+
+
+class SetBasedValidationEngine:
+    """
+    Evaluates all SET_RULES over the whole spacs table
+
+    One SELECT loads every row plus one boolean column per SQL rule; pandas
+    predicates run over the same rows; validate_* methods run only on candidates.
+    """
+
+    def __init__(self, validator, db, rules: Sequence[SetRule] = SET_RULES):
+        """
+        Args:
+            validator: LogicalConsistencyValidator (provides validate_* methods + bulk context)
+            db: SQLAlchemy session
+            rules: Rules to evaluate (default: SET_RULES)
+        """
+        self.validator = validator
+        self.db = db
+        self.rules = list(rules)
+        self.timings: Dict[str, float] = {}
+
+    def load(self, where: Optional[str] = None,
+             params: Optional[Dict] = None) -> Tuple[List[SimpleNamespace], pd.DataFrame, Dict[str, Set[int]]]:
+        """
+        Load SPACs and evaluate SQL rules in the same query
+
+        Args:
+            where: Optional SQL filter on spacs (default: whole table)
+            params: Bind parameters for the filter
+
+        Returns:
+            (rows as attribute namespaces, DataFrame of rows, {method: candidate ids} for SQL rules)
+        """
+        sql_rules = [rule for rule in self.rules if rule.where]
+        rule_columns = ''.join(f',\n                ({rule.where}) AS __rule_{i}' for i, rule in enumerate(sql_rules))
+        row_filter = f" WHERE {where}" if where else ""
+
+        result = self.db.execute(
+            text(f"SELECT spacs.*{rule_columns} FROM spacs{row_filter}"), params or {}
+        ).mappings().all()
+
+        rows, records = [], []
+        candidates = {rule.method: set() for rule in sql_rules}
+        for mapping in result:
+            record = {key: value for key, value in mapping.items() if not key.startswith('__rule_')}
+            for i, rule in enumerate(sql_rules):
+                if mapping[f'__rule_{i}']:
+                    candidates[rule.method].add(record['id'])
+            records.append(record)
+            rows.append(SimpleNamespace(**record))
+
+        frame = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+        return rows, frame, candidates
+
+    def select_candidates(self, frame: pd.DataFrame, candidates: Dict[str, Set[int]]) -> Dict[str, Set[int]]:
+        """Evaluate pandas predicates and merge with SQL rule candidates"""
+        for rule in self.rules:
+            if rule.predicate is None:
+                continue
+            if frame.empty:
+                candidates[rule.method] = set()
+                continue
+            mask = rule.predicate(frame, self.validator).fillna(False).astype(bool)
+            candidates[rule.method] = set(frame.loc[mask, 'id'].tolist())
+        return candidates
+
+    def run(self) -> List[Tuple[SimpleNamespace, List[Dict]]]:
+        """
+        Validate every SPAC
+
+        Returns:
+            List of (spac row, issues) in table order; issues per SPAC are in
+            the same order as LogicalConsistencyValidator.validate_all
+        """
+        start = time.time()
+        rows, frame, candidates = self.load()
+        self.timings['load'] = time.time() - start
+
+        step = time.time()
+        self.validator.preload_bulk_context(rows)
+        self.timings['context'] = time.time() - step
+
+        step = time.time()
+        candidates = self.select_candidates(frame, candidates)
+        self.timings['predicates'] = time.time() - step
+
+        step = time.time()
+        results = []
+        for spac in rows:
+            issues = []
+            for rule in self.rules:
+                if spac.id in candidates[rule.method]:
+                    issues.extend(getattr(self.validator, rule.method)(spac))
+            results.append((spac, issues))
+        self.timings['issues'] = time.time() - step
+        self.timings['total'] = time.time() - start
+
+        self.candidate_counts = {method: len(ids) for method, ids in candidates.items()}
+        return results
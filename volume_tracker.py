@@ -11,73 +11,58 @@ Tracks:
 Used by Deal Spec Candidates screener to identify potential deal rumors
 """
 
-import yfinance as yf
 from datetime import datetime, timedelta
+from typing import Optional
 from database import SessionLocal, SPAC
+from utils.price_bars import PriceBarStore, VOLUME_AVG_SESSIONS
+from utils.volume_spikes import VolumeSpikeDetector, detect_volume_spikes, spike_metrics, MIN_SESSIONS
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def calculate_volume_metrics(ticker: str, period: str = "30d") -> dict:
+def calculate_volume_metrics(ticker: str, store: Optional[PriceBarStore] = None, refresh: bool = True) -> dict:
     """
-    Calculate volume metrics for a ticker
+    Calculate volume metrics for a ticker from the local bar store
+
+    Args:
+        ticker: SPAC ticker
+        store: Bar store to read from (default: a temporary one)
+        refresh: Sync the ticker's bars first (callers that already synced the
+                 whole universe pass False)
     
     Returns:
         {
             'avg_volume_30d': float,
             'current_volume': int,
             'volume_spike_ratio': float,  # current / 30d avg
+            'volume_zscore': float,       # (current - 30d avg) / 30d std
+            'turnover_pct': None,         # needs shares_outstanding (see VolumeSpikeDetector)
             'is_volume_spike': bool,       # True if 3x+ average
             'spike_level': str             # 'EXTREME' (10x), 'HIGH' (5x), 'MODERATE' (3x), 'NORMAL'
         }
     """
+    owns_store = store is None
+    store = store or PriceBarStore()
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
+        if refresh:
+            store.sync([ticker])
+        volume = store.load_matrix('volume', [ticker], sessions=VOLUME_AVG_SESSIONS + 1)
+        spikes = detect_volume_spikes(volume)
         
-        if hist.empty or len(hist) < 5:
+        if ticker not in spikes.index or spikes.at[ticker, 'sessions'] < MIN_SESSIONS:
             logger.warning(f"{ticker}: Insufficient data")
             return None
         
-        # Get current volume (most recent day)
-        current_volume = int(hist['Volume'].iloc[-1])
-        
-        # Calculate 30-day average (excluding today for comparison)
-        if len(hist) > 1:
-            avg_volume_30d = hist['Volume'].iloc[:-1].mean()
-        else:
-            avg_volume_30d = current_volume
-        
-        # Calculate spike ratio
-        spike_ratio = current_volume / avg_volume_30d if avg_volume_30d > 0 else 1.0
-        
-        # Classify spike level
-        if spike_ratio >= 10:
-            spike_level = 'EXTREME'
-            is_spike = True
-        elif spike_ratio >= 5:
-            spike_level = 'HIGH'
-            is_spike = True
-        elif spike_ratio >= 3:
-            spike_level = 'MODERATE'
-            is_spike = True
-        else:
-            spike_level = 'NORMAL'
-            is_spike = False
-        
-        return {
-            'avg_volume_30d': round(avg_volume_30d, 2),
-            'current_volume': current_volume,
-            'volume_spike_ratio': round(spike_ratio, 2),
-            'is_volume_spike': is_spike,
-            'spike_level': spike_level
-        }
+        return spike_metrics(spikes.loc[ticker])
     
     except Exception as e:
         logger.error(f"{ticker}: Error calculating volume metrics - {e}")
         return None
+    finally:
+        if owns_store:
+            store.close()
 
 
 def update_volume_tracking():
@@ -91,15 +76,20 @@ def update_volume_tracking():
         ).all()
         
         logger.info(f"Updating volume tracking for {len(spacs)} SPACs...")
+
+        # One batch download for the whole universe, then one vectorized pass
+        detector = VolumeSpikeDetector(db=db)
+        detector.store.sync([spac.ticker for spac in spacs])
+        spikes = detector.detect(deal_statuses=['SEARCHING', 'ANNOUNCED'])
+        spikes = spikes[spikes['sessions'] >= MIN_SESSIONS]
         
         updated = 0
         spikes_detected = 0
         
         for spac in spacs:
-            metrics = calculate_volume_metrics(spac.ticker)
-            
-            if not metrics:
+            if spac.ticker not in spikes.index:
                 continue
+            metrics = spike_metrics(spikes.loc[spac.ticker])
             
             # Update database
             spac.volume_avg_30d = metrics['avg_volume_30d']
@@ -114,10 +104,6 @@ def update_volume_tracking():
                 spikes_detected += 1
             
             updated += 1
-            
-            if updated % 20 == 0:
-                db.commit()
-                logger.info(f"   Processed {updated}/{len(spacs)}...")
         
         db.commit()
         logger.info(f"✅ Volume tracking updated: {updated} SPACs, {spikes_detected} spikes detected")
@@ -138,41 +124,13 @@ def get_volume_spike_candidates(min_spike_ratio: float = 3.0):
     Returns:
         List of dicts with SPAC info and volume metrics
     """
-    db = SessionLocal()
+    detector = VolumeSpikeDetector()
     
     try:
-        spacs = db.query(SPAC).filter(
-            SPAC.deal_status == 'SEARCHING',
-            SPAC.volume.isnot(None),
-            SPAC.volume_avg_30d.isnot(None)
-        ).all()
-        
-        candidates = []
-        
-        for spac in spacs:
-            if spac.volume_avg_30d > 0:
-                spike_ratio = spac.volume / spac.volume_avg_30d
-                
-                if spike_ratio >= min_spike_ratio:
-                    candidates.append({
-                        'ticker': spac.ticker,
-                        'company': spac.company,
-                        'volume': spac.volume,
-                        'avg_volume_30d': spac.volume_avg_30d,
-                        'spike_ratio': round(spike_ratio, 2),
-                        'premium': spac.premium,
-                        'ipo_proceeds': spac.ipo_proceeds,
-                        'banker': spac.banker,
-                        'sector': spac.sector
-                    })
-        
-        # Sort by spike ratio descending
-        candidates.sort(key=lambda x: x['spike_ratio'], reverse=True)
-        
-        return candidates
+        return detector.candidates(min_spike_ratio=min_spike_ratio)
     
     finally:
-        db.close()
+        detector.close()
 
 
 if __name__ == "__main__":